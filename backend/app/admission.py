@@ -0,0 +1,297 @@
+"""
+요청 수용 제어 (admission control)
+- 기간 조회, 다운로드, 통계처럼 비싼 엔드포인트의 비용을
+  "기간 일수 × 관측소 수 × 해상도(관측소 하루 행 수)" 로 추정합니다. (1,000 행 = 비용 1)
+  페이지네이션 응답은 offset + limit 행까지만, 요약 집계처럼 결과 행이 적은 엔드포인트는 고정 비용으로 셉니다.
+- 클라이언트(X-API-Key 헤더, 없으면 접속 IP)마다 토큰 버킷에서 비용을 차감하고,
+  부족하면 429 + Retry-After 를 반환합니다.
+- 동시에 실행되는 비싼 요청 수를 제한하고 초과분은 작은 대기열에서 잠시 기다리게 합니다.
+  대기열이 가득 찼거나 대기 시간이 지나면 즉시 503 을 반환하여,
+  과부하에서도 모든 요청이 pool_timeout(30초)까지 밀리는 대신 처리 중인 요청의 응답 시간을 유지합니다.
+- 조건부 GET(304)과 압축 캐시 적중은 이 미들웨어 바깥에서 처리되므로 비용을 차감하지 않습니다.
+"""
+
+import asyncio
+import json
+import math
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Optional
+from urllib.parse import parse_qsl
+
+from starlette.datastructures import Headers
+from starlette.routing import Match
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from .config import get_settings
+from .metrics import ADMISSION_QUEUE_WAIT, ADMISSION_REJECTED
+
+settings = get_settings()
+
+# 비용 1 단위에 해당하는 추정 조회 행 수
+ROWS_PER_UNIT = 1000
+
+# 관측소를 지정하지 않았을 때의 관측소 수 (대략값)
+ASOS_STATIONS = 100
+RDA_STATIONS = 200
+
+# 해상도별 관측소 하루 행 수
+ROWS_10MIN = 144
+ROWS_HOURLY = 24
+ROWS_DAILY = 1
+ROWS_MONTHLY = 1 / 30
+
+# 토큰 버킷을 유지하는 최대 클라이언트 수 (오래 쓰지 않은 클라이언트부터 제거)
+MAX_CLIENTS = 10_000
+
+
+@dataclass(frozen=True)
+class CostSpec:
+    """엔드포인트 비용 추정 규칙"""
+    rows_per_day: float                    # 관측소 하나의 하루 행 수 (해상도)
+    all_stations: int = 1                  # 관측소를 지정하지 않았을 때 관측소 수
+    station_param: Optional[str] = None    # 관측소를 지정하는 쿼리 파라미터 (콤마 구분 목록 가능)
+    default_days: int = 365                # 기간을 지정하지 않았을 때 가정하는 일수
+    default_limit: Optional[int] = None    # 페이지네이션 라우트의 limit 기본값 (None 이면 페이지네이션 없음)
+    fixed: Optional[float] = None          # 기간/관측소와 무관한 고정 비용 (요약 집계)
+
+
+# 라우트(경로 템플릿) → 비용 규칙 (없는 라우트는 수용 제어 대상이 아님)
+ROUTE_COSTS: dict[str, CostSpec] = {
+    "/api/kma/asos/range": CostSpec(ROWS_DAILY, ASOS_STATIONS, "stn_id", default_limit=20),
+    "/api/kma/realtime/region/{region_name}/range": CostSpec(ROWS_HOURLY, default_limit=20),
+    "/api/rda/weather/realtime/station/{stn_cd}": CostSpec(ROWS_10MIN, default_days=30, default_limit=20),
+    "/api/rda/weather/hourly/station/{stn_cd}": CostSpec(ROWS_HOURLY, default_days=30, default_limit=20),
+    "/api/rda/weather/daily/range": CostSpec(ROWS_DAILY, RDA_STATIONS, "stn_cd", default_limit=20),
+    "/api/rda/weather/monthly/range": CostSpec(ROWS_MONTHLY, RDA_STATIONS, "stn_cd", default_limit=20),
+    # 테이블별 집계 쿼리 두 번 (결과는 몇 행)
+    "/api/stats/summary": CostSpec(ROWS_DAILY, fixed=5.0),
+    "/api/stats/kma/asos/station/{stn_id}": CostSpec(ROWS_DAILY, default_days=3650),
+    "/api/stats/rda/station/{stn_cd}": CostSpec(ROWS_DAILY, default_days=3650),
+    "/api/stats/comparison": CostSpec(ROWS_DAILY, ASOS_STATIONS, "stn_ids"),
+    "/api/stats/windrose": CostSpec(ROWS_HOURLY, 1, "stations", default_days=30),
+}
+
+
+def _parse_day(value: Optional[str]) -> Optional[date]:
+    """YYYY-MM-DD, ISO 일시, YYYY-MM 중 하나를 날짜로 변환 (형식 오류는 None - 검증은 라우터가 함)"""
+    if not value:
+        return None
+    try:
+        if len(value) == 7:
+            return date.fromisoformat(value + "-01")
+        if len(value) == 10:
+            return date.fromisoformat(value)
+        return datetime.fromisoformat(value).date()
+    except ValueError:
+        return None
+
+
+def span_days(params: dict[str, str], default_days: int) -> float:
+    """쿼리 파라미터의 조회 기간 (일). 시작/종료 중 하나만 있으면 기본 기간으로 가정"""
+    for start_key, end_key in (("start_date", "end_date"),
+                               ("start_datetime", "end_datetime"),
+                               ("start_month", "end_month")):
+        start, end = _parse_day(params.get(start_key)), _parse_day(params.get(end_key))
+        if start and end:
+            days = (end - start).days + 1
+            if start_key == "start_month":
+                days += 30  # 종료 월 전체 포함
+            return max(days, 1)
+    return default_days
+
+
+def _int_param(params: dict[str, str], key: str, default: int) -> int:
+    """정수 쿼리 파라미터 (형식 오류는 기본값 - 검증은 라우터가 함)"""
+    try:
+        return max(int(params[key]), 0)
+    except (KeyError, ValueError):
+        return default
+
+
+def estimate_cost(spec: CostSpec, params: dict[str, str]) -> float:
+    """요청 비용 (추정 조회 행 수 / ROWS_PER_UNIT, 최소 1)"""
+    if spec.fixed is not None:
+        return spec.fixed
+    days = span_days(params, spec.default_days)
+
+    stations = spec.all_stations
+    if spec.station_param and params.get(spec.station_param):
+        stations = len([s for s in params[spec.station_param].split(",") if s.strip()])
+
+    rows_per_day = spec.rows_per_day
+    # 10분 자료는 긴 기간이면 시간별 집계로 응답 (app.rollup.use_hourly_tier)
+    if rows_per_day == ROWS_10MIN:
+        resolution = params.get("resolution", "auto")
+        if resolution == "hourly" or (resolution == "auto" and days > settings.HOURLY_TIER_MIN_DAYS):
+            rows_per_day = ROWS_HOURLY
+
+    rows = days * stations * rows_per_day
+    # 페이지네이션 응답은 offset + limit 행까지만 읽음 (컬럼형 다운로드와 결측 보완은 기간 전체)
+    if (spec.default_limit is not None and params.get("format", "json") == "json"
+            and params.get("fill", "none") == "none"):
+        rows = min(rows, _int_param(params, "offset", 0) + _int_param(params, "limit", spec.default_limit))
+    return max(rows / ROWS_PER_UNIT, 1.0)
+
+
+class TokenBucket:
+    """클라이언트별 비용 토큰 버킷"""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    def take(self, cost: float) -> float:
+        """비용을 차감하고 0 을 반환. 토큰이 부족하면 차감하지 않고 기다려야 할 초를 반환"""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        # 버킷보다 큰 요청은 버킷이 가득 찼을 때 한 번에 소진하도록 허용
+        cost = min(cost, self.capacity)
+        if self.tokens >= cost:
+            self.tokens -= cost
+            return 0.0
+        return (cost - self.tokens) / self.rate
+
+
+class ConcurrencyGate:
+    """동시 실행 수 제한 + 크기/대기 시간이 제한된 대기열"""
+
+    def __init__(self, limit: int, queue_size: int, timeout: float):
+        self.queue_size = queue_size
+        self.timeout = timeout
+        self._semaphore = asyncio.Semaphore(limit)
+        self._waiting = 0
+
+    @property
+    def waiting(self) -> int:
+        return self._waiting
+
+    async def acquire(self) -> bool:
+        """
+        실행 슬롯을 얻으면 True, 대기열이 가득 찼거나 시간이 지나면 False
+        대기 중인 요청이 있으면 방금 반납된 슬롯이라도 새 요청이 먼저 가져가지 않고 대기열 뒤에 섭니다. (FIFO)
+        """
+        if not self._semaphore.locked() and self._waiting == 0:
+            await self._semaphore.acquire()
+            return True
+        if self._waiting >= self.queue_size:
+            return False
+        self._waiting += 1
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), self.timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            self._waiting -= 1
+
+    def release(self) -> None:
+        self._semaphore.release()
+
+
+def client_key(scope: Scope) -> str:
+    """클라이언트 식별자 (X-API-Key 헤더, 없으면 접속 IP - 프록시 뒤에서는 uvicorn --proxy-headers 사용)"""
+    api_key = Headers(scope=scope).get("x-api-key")
+    if api_key:
+        return f"key:{api_key}"
+    client = scope.get("client")
+    return f"ip:{client[0]}" if client else "ip:unknown"
+
+
+def match_route(scope: Scope) -> Optional[str]:
+    """요청 경로에 일치하는 라우트 템플릿 (라우팅 전이므로 직접 매칭)"""
+    app = scope.get("app")
+    for route in getattr(getattr(app, "router", None), "routes", ()):
+        match, _ = route.matches(scope)
+        if match == Match.FULL:
+            return getattr(route, "path", None)
+    return None
+
+
+async def reject(send: Send, status: int, detail: str, retry_after: float) -> None:
+    body = json.dumps({"detail": detail}, ensure_ascii=False).encode("utf-8")
+    await send({
+        "type": "http.response.start",
+        "status": status,
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode("latin-1")),
+            (b"retry-after", str(max(math.ceil(retry_after), 1)).encode("latin-1")),
+        ],
+    })
+    await send({"type": "http.response.body", "body": body})
+
+
+class AdmissionMiddleware:
+    """비싼 엔드포인트의 요청 수용 제어 ASGI 미들웨어"""
+
+    def __init__(self, app: ASGIApp, rate: float, burst: float, max_concurrent: int,
+                 queue_size: int, queue_timeout: float, client_concurrency: int):
+        self.app = app
+        self.rate = rate
+        self.burst = burst
+        self.client_concurrency = client_concurrency
+        self.gate = ConcurrencyGate(max_concurrent, queue_size, queue_timeout)
+        self._buckets: OrderedDict[str, TokenBucket] = OrderedDict()
+        self._in_flight: dict[str, int] = {}
+
+    def _bucket(self, key: str) -> TokenBucket:
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = TokenBucket(self.rate, self.burst)
+            if len(self._buckets) > MAX_CLIENTS:
+                self._buckets.popitem(last=False)
+        else:
+            self._buckets.move_to_end(key)
+        return bucket
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] not in ("GET", "HEAD"):
+            await self.app(scope, receive, send)
+            return
+
+        route = match_route(scope)
+        spec = ROUTE_COSTS.get(route)
+        if spec is None:
+            await self.app(scope, receive, send)
+            return
+
+        params = dict(parse_qsl(scope.get("query_string", b"").decode("latin-1")))
+        cost = estimate_cost(spec, params)
+        key = client_key(scope)
+
+        # 클라이언트별 동시 실행 수
+        if self._in_flight.get(key, 0) >= self.client_concurrency:
+            ADMISSION_REJECTED.labels(route, "client_concurrency").inc()
+            await reject(send, 429, "동시에 실행 중인 요청이 너무 많습니다.", 1)
+            return
+
+        # 클라이언트별 비용 한도
+        wait = self._bucket(key).take(cost)
+        if wait > 0:
+            ADMISSION_REJECTED.labels(route, "rate").inc()
+            await reject(send, 429, f"요청 비용 한도를 초과했습니다. (비용 {cost:.0f})", wait)
+            return
+
+        # 서버 전체 동시 실행 수 (짧은 대기열)
+        self._in_flight[key] = self._in_flight.get(key, 0) + 1
+        try:
+            started = time.perf_counter()
+            if not await self.gate.acquire():
+                ADMISSION_REJECTED.labels(route, "overload").inc()
+                await reject(send, 503, "서버가 혼잡합니다. 잠시 후 다시 시도하세요.", self.gate.timeout)
+                return
+            ADMISSION_QUEUE_WAIT.observe(time.perf_counter() - started)
+            try:
+                await self.app(scope, receive, send)
+            finally:
+                self.gate.release()
+        finally:
+            self._in_flight[key] -= 1
+            if not self._in_flight[key]:
+                del self._in_flight[key]
@@ -0,0 +1,290 @@
+"""
+이상기상 알림 모듈 (폭염 / 늦서리 / 호우)
+- 규칙마다 관측소별 연속 구간(run) 상태를 alert_state 에 두고, 새로 들어온 관측만 읽어 이어갑니다.
+  * heat_wave: ASOS 일자료 최고기온(max_ta) 33℃ 이상 2일 이상 연속
+  * frost: RDA 10분 자료 최저기온(lowst_artmp, 없으면 temp) 0℃ 이하 30분 이상 (4~5월, 늦서리)
+  * heavy_rain: 초단기실황 1시간 강수량(RN1) 30mm 이상
+- 연속 수가 기준 이상이 되면 alert_events 에 알림을 만들고, 구간이 이어지는 동안 끝 시각/극값을 갱신합니다.
+  기준 미달 관측, 관측 간격 초과(결측), 마지막 관측 후 stale 경과(수신 중단) 시 알림을 종료합니다.
+- 스케줄러가 주기적으로 증분 처리하며, 조회(/api/alerts)는 alert_events 만 읽습니다.
+- 관측소별 마지막 처리 시각 이전의 관측은 다시 읽지 않으므로, 그보다 늦게 들어온 과거 자료는 rebuild 로 반영합니다.
+
+사용법:
+    cd backend
+    python -m app.alerts run                                        # 증분 처리
+    python -m app.alerts rebuild --rule heat_wave --start 2024-01-01  # 규칙 이력 재생성
+    python -m app.alerts active
+"""
+
+import argparse
+from dataclasses import dataclass
+from datetime import datetime, time, timedelta
+from typing import Callable, Iterable, Optional
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.orm import Session
+
+from .config import get_settings
+from .database import SessionLocal
+from .metrics import ALERTS_OPENED
+from .models.alerts import AlertEvent, AlertState
+from .models.kma import AsosDailyData, WeatherRealtime
+from .models.rda import WeatherData
+
+settings = get_settings()
+
+# 관측 행 (관측소, 관측소명, 관측 시각, 값) - 관측소, 시각 순
+Observation = tuple[str, Optional[str], datetime, Optional[float]]
+
+
+def _asos_max_ta(db: Session, start: datetime, end: datetime) -> Iterable[Observation]:
+    m = AsosDailyData
+    rows = db.execute(
+        select(m.stn_id, m.stn_nm, m.tm, m.max_ta)
+        .where(m.tm >= start.date(), m.tm <= end.date())
+        .order_by(m.stn_id, m.tm)
+    )
+    for stn_id, stn_nm, tm, value in rows:
+        yield str(stn_id), stn_nm, datetime.combine(tm, time.min), value
+
+
+def _rda_lowest_temp(db: Session, start: datetime, end: datetime) -> Iterable[Observation]:
+    m = WeatherData
+    yield from db.execute(
+        select(m.stn_cd, m.stn_name, m.datetime, func.coalesce(m.lowst_artmp, m.temp))
+        .where(m.datetime >= start, m.datetime < end, m.stn_cd.isnot(None))
+        .order_by(m.stn_cd, m.datetime)
+    )
+
+
+def _kma_rn1(db: Session, start: datetime, end: datetime) -> Iterable[Observation]:
+    m = WeatherRealtime
+    rows = db.execute(
+        select(m.region_name, m.base_date, m.base_time, m.obsrvalue)
+        .where(m.category == "RN1", m.base_date >= start.date(), m.base_date <= end.date(),
+               m.region_name.isnot(None))
+        .order_by(m.region_name, m.base_date, m.base_time)
+    )
+    skipped = 0
+    for region_name, base_date, base_time, value in rows:
+        # 형식이 깨진 발표시각은 건너뜀 (app.hotstore.slot_seconds 와 같은 기준, 2400 은 다음 날 0시)
+        if not base_time or len(base_time) != 4 or not base_time.isdigit():
+            skipped += 1
+            continue
+        when = datetime.combine(base_date, time.min) + timedelta(hours=int(base_time[:2]), minutes=int(base_time[2:]))
+        yield region_name, region_name, when, value
+    if skipped:
+        print(f"[ALERTS] heavy_rain: 발표시각 형식 오류 {skipped}행 제외")
+
+
+@dataclass(frozen=True)
+class AlertRule:
+    """알림 규칙 (값이 threshold 이상/이하인 관측이 max_gap 이내 간격으로 min_length 개 이상 이어지면 알림)"""
+    name: str
+    label: str
+    load: Callable[[Session, datetime, datetime], Iterable[Observation]]
+    threshold: float
+    above: bool                 # True: 값 >= threshold, False: 값 <= threshold
+    min_length: int             # 알림 발령 최소 연속 관측 수
+    max_gap: timedelta          # 이보다 떨어진 관측은 연속으로 보지 않음
+    stale: timedelta            # 마지막 관측 후 이 시간 동안 새 관측이 없으면 종료 (수신 중단)
+    backfill: timedelta         # 첫 실행 시 처리하는 기간
+    chunk: timedelta            # 한 번에 읽어 처리하는 구간 길이
+    months: tuple[int, ...] = ()  # 적용 월 (비어 있으면 연중)
+
+    def hit(self, when: datetime, value: float) -> bool:
+        if self.months and when.month not in self.months:
+            return False
+        return value >= self.threshold if self.above else value <= self.threshold
+
+    def peak(self, current: Optional[float], value: float) -> float:
+        if current is None:
+            return value
+        return max(current, value) if self.above else min(current, value)
+
+
+RULES = {
+    "heat_wave": AlertRule(
+        name="heat_wave", label="폭염", load=_asos_max_ta,
+        threshold=33.0, above=True, min_length=2,
+        max_gap=timedelta(days=1), stale=timedelta(days=3),
+        backfill=timedelta(days=30), chunk=timedelta(days=366),
+    ),
+    "frost": AlertRule(
+        name="frost", label="늦서리", load=_rda_lowest_temp,
+        threshold=0.0, above=False, min_length=3,
+        max_gap=timedelta(minutes=30), stale=timedelta(hours=1),
+        backfill=timedelta(days=2), chunk=timedelta(days=1), months=(4, 5),
+    ),
+    "heavy_rain": AlertRule(
+        name="heavy_rain", label="호우", load=_kma_rn1,
+        threshold=30.0, above=True, min_length=1,
+        max_gap=timedelta(hours=1), stale=timedelta(hours=3),
+        backfill=timedelta(days=2), chunk=timedelta(days=7),
+    ),
+}
+
+# rule 파라미터 허용 값
+RULE_PATTERN = f"^({'|'.join(RULES)})$"
+
+
+class _Tracker:
+    """한 규칙의 관측소 상태와 진행 중인 알림 (처리 중 메모리에 유지)"""
+
+    def __init__(self, db: Session, rule: AlertRule):
+        self.db = db
+        self.rule = rule
+        self.states = {s.station: s for s in db.scalars(select(AlertState).where(AlertState.rule == rule.name))}
+        self.events = {e.id: e for e in db.scalars(
+            select(AlertEvent).where(AlertEvent.rule == rule.name, AlertEvent.active)
+        )}
+        self.opened = 0
+
+    def observe(self, station: str, name: Optional[str], when: datetime, value: float) -> bool:
+        """관측 하나를 반영합니다. (이미 처리한 시각 이전이면 False)"""
+        state = self.states.get(station)
+        if state is None:
+            state = AlertState(rule=self.rule.name, station=station, last_time=when, run_length=0)
+            self.states[station] = state
+            self.db.add(state)
+        elif when <= state.last_time:
+            return False
+        state.station_name = name
+
+        if state.run_length and when - state.run_last > self.rule.max_gap:
+            self.close(state)
+        if self.rule.hit(when, value):
+            self.extend(state, when, value)
+        elif state.run_length:
+            self.close(state)
+        state.last_time = when
+        return True
+
+    def extend(self, state: AlertState, when: datetime, value: float) -> None:
+        if not state.run_length:
+            state.run_start, state.peak = when, None
+        state.run_last = when
+        state.run_length += 1
+        state.peak = self.rule.peak(state.peak, value)
+        if state.run_length < self.rule.min_length:
+            return
+
+        event = self.events.get(state.event_id)
+        if event is None:
+            event = AlertEvent(rule=self.rule.name, station=state.station, start_time=state.run_start, active=True)
+            self.db.add(event)
+            self.opened += 1
+        event.station_name = state.station_name
+        event.end_time = state.run_last
+        event.length = state.run_length
+        event.peak = state.peak
+        if event.id is None:
+            self.db.flush()
+            self.events[event.id] = event
+            state.event_id = event.id
+
+    def close(self, state: AlertState) -> None:
+        event = self.events.pop(state.event_id, None)
+        if event is not None:
+            event.active = False
+        state.run_start = state.run_last = state.peak = state.event_id = None
+        state.run_length = 0
+
+    def close_stale(self, now: datetime) -> None:
+        """마지막 관측 후 stale 이 지나도록 이어지지 않은 구간 종료 (관측소 수신 중단)"""
+        for state in self.states.values():
+            if state.run_length and now - state.run_last > self.rule.stale:
+                self.close(state)
+
+
+def process(db: Session, rule: AlertRule, start: datetime, end: datetime,
+            now: Optional[datetime] = None) -> tuple[int, int]:
+    """[start, end) 의 관측을 관측소별 마지막 처리 시각 이후만 반영합니다. (처리 관측 수, 새 알림 수)"""
+    tracker = _Tracker(db, rule)
+    processed = 0
+    chunk_start = start
+    while chunk_start < end:
+        chunk_end = min(chunk_start + rule.chunk, end)
+        for station, name, when, value in rule.load(db, chunk_start, chunk_end):
+            # 일자료/실황은 날짜 단위로 읽으므로 구간 밖 관측은 버림
+            if value is None or not chunk_start <= when < chunk_end:
+                continue
+            processed += tracker.observe(station, name, when, value)
+        db.commit()
+        chunk_start = chunk_end
+
+    tracker.close_stale(now or datetime.now())
+    db.commit()
+    if tracker.opened:
+        ALERTS_OPENED.labels(rule.name).inc(tracker.opened)
+    return processed, tracker.opened
+
+
+def run_incremental(db: Session, rule: AlertRule, now: Optional[datetime] = None) -> tuple[int, int]:
+    """가장 최근 처리 시각 - ALERT_LOOKBACK_HOURS 부터 현재까지 처리합니다. (첫 실행은 rule.backfill)"""
+    now = now or datetime.now()
+    last = db.execute(select(func.max(AlertState.last_time)).where(AlertState.rule == rule.name)).scalar()
+    if last is None:
+        start = now - rule.backfill
+    else:
+        # 다른 관측소보다 늦게 들어온 관측 (관측소별 마지막 처리 시각 이후만 반영됨)
+        start = last - timedelta(hours=settings.ALERT_LOOKBACK_HOURS)
+    return process(db, rule, start, now + timedelta(seconds=1), now)
+
+
+def rebuild(db: Session, rule: AlertRule, start: datetime, now: Optional[datetime] = None) -> tuple[int, int]:
+    """규칙의 상태와 알림 이력을 지우고 start 부터 다시 처리합니다."""
+    db.execute(delete(AlertState).where(AlertState.rule == rule.name))
+    db.execute(delete(AlertEvent).where(AlertEvent.rule == rule.name))
+    db.commit()
+    now = now or datetime.now()
+    return process(db, rule, start, now + timedelta(seconds=1), now)
+
+
+def run_all_incremental() -> str:
+    """모든 규칙 증분 처리 (스케줄러 작업)"""
+    if not settings.ALERTS_ENABLED:
+        return ""
+    db = SessionLocal()
+    try:
+        results = {name: run_incremental(db, rule) for name, rule in RULES.items()}
+    finally:
+        db.close()
+    return ", ".join(f"{name} 관측 {processed}건/새 알림 {opened}건"
+                     for name, (processed, opened) in results.items() if processed)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="이상기상 알림 (폭염/늦서리/호우)")
+    parser.add_argument("command", choices=["run", "rebuild", "active"])
+    parser.add_argument("--rule", choices=list(RULES), help="대상 규칙 (미입력시 전체)")
+    parser.add_argument("--start", type=datetime.fromisoformat, help="rebuild: 시작 (YYYY-MM-DD[THH:MM])")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        rules = [RULES[args.rule]] if args.rule else list(RULES.values())
+        if args.command == "active":
+            events = db.scalars(
+                select(AlertEvent).where(AlertEvent.active, AlertEvent.rule.in_([r.name for r in rules]))
+                .order_by(AlertEvent.rule, AlertEvent.start_time)
+            ).all()
+            for e in events:
+                print(f"[ALERTS] {RULES[e.rule].label} {e.station} {e.station_name or ''}: "
+                      f"{e.start_time} ~ {e.end_time} ({e.length}회, 극값 {e.peak})")
+            print(f"[ALERTS] {len(events)} active alert(s)")
+            return
+        for rule in rules:
+            if args.command == "rebuild":
+                if args.start is None:
+                    raise SystemExit("[ALERTS] rebuild 에는 --start 가 필요합니다.")
+                processed, opened = rebuild(db, rule, args.start)
+            else:
+                processed, opened = run_incremental(db, rule)
+            print(f"[ALERTS] {rule.name}: {processed} observations, {opened} new alert(s)")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
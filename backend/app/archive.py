@@ -0,0 +1,462 @@
+"""
+일자료 메모리 맵 컬럼 아카이브 (ASOS 일자료 / RDA 일별 자료)
+- 통계 엔드포인트는 수십 년치 asos_daily_data / weather_data_daily 를 반복해서 읽지만,
+  발표가 끝난 일자료는 바뀌지 않습니다.
+- 변수마다 관측소 × 날짜의 float32 행렬(결측 = NaN)을 파일로 내보내고 np.memmap 으로 읽습니다.
+  관측소 하나의 기간은 파일에서 연속된 구간이므로 복사 없이(zero-copy) 메모리 대역폭으로 집계합니다.
+  * <ARCHIVE_DIR>/<dataset>/<build>/meta.json  - 시작 날짜, 날짜 수, 관측소 색인, 원본 버전
+  * <ARCHIVE_DIR>/<dataset>/<build>/rows.u1    - 행 존재 여부 (uint8, 관측소 × 날짜)
+  * <ARCHIVE_DIR>/<dataset>/<build>/<var>.f32  - 변수 값 (float32, 관측소 × 날짜)
+  * <ARCHIVE_DIR>/<dataset>/CURRENT            - 사용 중인 build 이름 (새 build 를 다 쓴 뒤 교체)
+- 최근 ARCHIVE_SETTLE_DAYS 일은 정정될 수 있으므로 넣지 않습니다.
+  아카이브 이후 구간은 DB 에서 집계하여 합칩니다. (app.routers.stats)
+- 스케줄러가 매일 한 번 원본 버전(data_versions)이 바뀐 경우에만 다시 만듭니다.
+  같은 호스트의 워커들은 파일 잠금으로 한 워커만 만들고, 나머지는 CURRENT 가 바뀌면 새 파일을 엽니다.
+- numpy 가 없으면 비활성화되고 모든 통계를 DB 에서 집계합니다.
+
+사용법:
+    cd backend
+    python -m app.archive build               # 원본이 바뀐 데이터셋만 다시 만듦
+    python -m app.archive build --force
+    python -m app.archive verify --samples 20 # 무작위 관측소/기간 집계를 DB 와 비교 (불일치 시 exit 1)
+"""
+
+import argparse
+import fcntl
+import json
+import os
+import random
+import shutil
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, Optional, Sequence
+
+from sqlalchemy import func, select, text
+from sqlalchemy.orm import Session
+
+from .config import get_settings
+from .database import BULK, read_session
+from .metrics import ARCHIVE_REQUESTS
+from .models.kma import AsosDailyData
+from .models.rda import WeatherDataDaily
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+settings = get_settings()
+
+# 내보내기 시 서버 측 커서에서 한 번에 가져오는 행 수
+EXPORT_BATCH_ROWS = 50_000
+
+# 데이터셋별로 남겨 두는 build 수 (교체 직후 이전 파일을 열고 있는 워커 대비)
+KEEP_BUILDS = 2
+
+
+@dataclass(frozen=True)
+class Dataset:
+    """아카이브 대상 일자료 테이블"""
+    name: str
+    model: Any
+    key: str                     # 관측소 컬럼
+    label: str                   # 관측소명 컬럼
+    date: str                    # 날짜 컬럼
+    variables: tuple[str, ...]   # 보관하는 변수 컬럼
+
+    @property
+    def table(self) -> str:
+        return self.model.__tablename__
+
+    def column(self, name: str):
+        return getattr(self.model, name)
+
+
+DATASETS = {
+    "asos": Dataset(
+        "asos", AsosDailyData, "stn_id", "stn_nm", "tm",
+        ("avg_ta", "min_ta", "max_ta", "sum_rn", "avg_ws", "avg_rhm", "sum_ss_hr", "sum_gsr", "avg_tca"),
+    ),
+    "rda": Dataset(
+        "rda", WeatherDataDaily, "stn_cd", "stn_name", "date",
+        ("temp", "hghst_artmp", "lowst_artmp", "hum", "widdir", "wind", "max_wind",
+         "rn", "sun_time", "srqty", "condens_time", "gr_temp", "soil_temp", "soil_wt"),
+    ),
+}
+
+
+@dataclass
+class Aggregate:
+    """관측소 하나의 기간 집계 (DB 집계와 합칠 수 있는 형태)"""
+    count: int = 0                           # 행 수
+    first: Optional[date] = None             # 첫 날짜
+    last: Optional[date] = None              # 마지막 날짜
+    label: Optional[str] = None              # 관측소명
+    n: dict[str, int] = field(default_factory=dict)      # 변수별 NULL 이 아닌 값 수
+    sum: dict[str, float] = field(default_factory=dict)
+    min: dict[str, float] = field(default_factory=dict)
+    max: dict[str, float] = field(default_factory=dict)
+
+    def merge(self, other: "Aggregate") -> "Aggregate":
+        self.count += other.count
+        self.first = min(filter(None, (self.first, other.first)), default=None)
+        self.last = max(filter(None, (self.last, other.last)), default=None)
+        self.label = max(filter(None, (self.label, other.label)), default=None)
+        for name, n in other.n.items():
+            if not n:
+                continue
+            if self.n.get(name):
+                self.sum[name] += other.sum[name]
+                self.min[name] = min(self.min[name], other.min[name])
+                self.max[name] = max(self.max[name], other.max[name])
+            else:
+                self.sum[name], self.min[name], self.max[name] = other.sum[name], other.min[name], other.max[name]
+            self.n[name] = self.n.get(name, 0) + n
+        return self
+
+    def avg(self, name: str) -> Optional[float]:
+        return self.sum[name] / self.n[name] if self.n.get(name) else None
+
+    def total(self, name: str) -> Optional[float]:
+        return self.sum[name] if self.n.get(name) else None
+
+    def lowest(self, name: str) -> Optional[float]:
+        return self.min[name] if self.n.get(name) else None
+
+    def highest(self, name: str) -> Optional[float]:
+        return self.max[name] if self.n.get(name) else None
+
+
+def _float32(value) -> float:
+    """float32 값 → 원래 10진 표기의 float (35.2 → 35.20000076 이 아니라 35.2)"""
+    return float(str(value))
+
+
+class Archive:
+    """열린 build 하나 (메모리 맵, 읽기 전용)"""
+
+    def __init__(self, path: Path):
+        self.path = path
+        meta = json.loads((path / "meta.json").read_text(encoding="utf-8"))
+        self.meta = meta
+        self.start = date.fromisoformat(meta["start"])
+        self.days = meta["days"]
+        self.end = self.start + timedelta(days=self.days - 1)   # 아카이브에 포함된 마지막 날짜
+        self.keys = meta["keys"]
+        self.labels = meta["labels"]
+        self.index = {key: i for i, key in enumerate(self.keys)}
+        shape = (len(self.keys), self.days)
+        self.rows = self._map("rows.u1", np.uint8, shape)
+        self.values = {name: self._map(f"{name}.f32", np.float32, shape) for name in meta["variables"]}
+
+    def _map(self, filename: str, dtype, shape) -> "np.ndarray":
+        if not shape[0] or not shape[1]:
+            return np.zeros(shape, dtype=dtype)
+        return np.memmap(self.path / filename, dtype=dtype, mode="r", shape=shape)
+
+    def aggregate(self, keys: Sequence, start: Optional[date], end: Optional[date],
+                  variables: Sequence[str]) -> dict[Any, Aggregate]:
+        """[start, end] ∩ 아카이브 구간의 관측소별 집계 (자료가 없는 관측소는 제외)"""
+        lo = 0 if start is None else max((start - self.start).days, 0)
+        hi = self.days if end is None else min((end - self.start).days + 1, self.days)
+        result = {}
+        if lo >= hi:
+            return result
+        for key in keys:
+            row = self.index.get(key)
+            if row is None:
+                continue
+            present = self.rows[row, lo:hi]
+            days = np.flatnonzero(present)
+            if not len(days):
+                continue
+            agg = Aggregate(
+                count=len(days),
+                first=self.start + timedelta(days=lo + int(days[0])),
+                last=self.start + timedelta(days=lo + int(days[-1])),
+                label=self.labels[row],
+            )
+            for name in variables:
+                values = self.values[name][row, lo:hi]   # 메모리 맵 뷰 (복사 없음)
+                n = int(np.count_nonzero(~np.isnan(values)))
+                agg.n[name] = n
+                if n:
+                    agg.sum[name] = float(np.nansum(values, dtype=np.float64))
+                    agg.min[name] = _float32(np.fmin.reduce(values))
+                    agg.max[name] = _float32(np.fmax.reduce(values))
+            result[key] = agg
+        return result
+
+
+class ArchiveStore:
+    """데이터셋별 현재 build 를 열어 두고, CURRENT 가 바뀌면 다시 엽니다."""
+
+    def __init__(self, root: str, settle_days: int):
+        self.root = Path(root)
+        self.settle_days = settle_days
+        self._lock = threading.Lock()
+        self._open: dict[str, tuple[str, Archive]] = {}
+
+    def current(self, dataset: str) -> Optional[Archive]:
+        if np is None:
+            return None
+        try:
+            build = (self.root / dataset / "CURRENT").read_text().strip()
+        except OSError:
+            return None
+        with self._lock:
+            opened = self._open.get(dataset)
+            if opened is None or opened[0] != build:
+                try:
+                    opened = (build, Archive(self.root / dataset / build))
+                except (OSError, ValueError, KeyError) as exc:
+                    print(f"[ARCHIVE] {dataset}/{build} 열기 실패: {exc}")
+                    return None
+                self._open[dataset] = opened
+            return opened[1]
+
+    def aggregate(self, db: Session, dataset: str, keys: Sequence, start: Optional[date],
+                  end: Optional[date], variables: Sequence[str]) -> dict[Any, Aggregate]:
+        """
+        관측소별 기간 집계 - 아카이브 구간은 메모리 맵에서, 이후 구간(또는 아카이브가 없으면 전체)은 DB 에서
+        한 번의 GROUP BY 로 집계하여 합칩니다. 조회 범위가 아카이브 안이면 DB 를 사용하지 않습니다.
+        """
+        spec = DATASETS[dataset]
+        archive = self.current(dataset) if settings.ARCHIVE_ENABLED else None
+        result: dict[Any, Aggregate] = {}
+        db_start = start
+        if archive is not None:
+            ARCHIVE_REQUESTS.labels(dataset, "hit").inc()
+            result = archive.aggregate(keys, start, end, variables)
+            db_start = max(start, archive.end + timedelta(days=1)) if start else archive.end + timedelta(days=1)
+            if end is not None and db_start > end:
+                return result
+        else:
+            ARCHIVE_REQUESTS.labels(dataset, "miss").inc()
+
+        for key, agg in db_aggregate(db, spec, keys, db_start, end, variables).items():
+            result[key] = result[key].merge(agg) if key in result else agg
+        return result
+
+    # ===== 생성 =====
+
+    def build(self, db: Session, dataset: str, force: bool = False) -> int:
+        """원본 버전이 바뀌었으면 새 build 를 만들고 CURRENT 를 교체합니다. (기록한 행 수, 건너뛰면 0)"""
+        spec = DATASETS[dataset]
+        directory = self.root / dataset
+        directory.mkdir(parents=True, exist_ok=True)
+        with open(directory / ".lock", "w") as lock:
+            try:
+                fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                return 0   # 같은 호스트의 다른 워커가 만드는 중
+            version = db.execute(
+                text("SELECT version FROM data_versions WHERE table_name = :t"), {"t": spec.table}
+            ).scalar()
+            current = self.current(dataset)
+            covered_until = date.today() - timedelta(days=self.settle_days)
+            if not force and current is not None and current.meta.get("source_version") == version \
+                    and current.meta.get("covered_until") == covered_until.isoformat():
+                return 0
+            build = f"{datetime.now():%Y%m%d%H%M%S}-{version}"
+            rows = export(db, spec, directory / build, covered_until, version)
+            tmp = directory / "CURRENT.tmp"
+            tmp.write_text(build)
+            os.replace(tmp, directory / "CURRENT")
+            for old in sorted(p for p in directory.iterdir() if p.is_dir())[:-KEEP_BUILDS]:
+                shutil.rmtree(old, ignore_errors=True)
+            return rows
+
+    def refresh(self) -> int:
+        """모든 데이터셋의 아카이브를 필요하면 다시 만듭니다. (스케줄러 작업, 기록한 행 수)"""
+        if np is None or not settings.ARCHIVE_ENABLED:
+            return 0
+        db = read_session(BULK)
+        try:
+            return sum(self.build(db, name) for name in DATASETS)
+        finally:
+            db.close()
+
+
+def export(db: Session, spec: Dataset, path: Path, covered_until: date, version: Optional[int]) -> int:
+    """covered_until 까지의 일자료를 path 에 내보냅니다. (기록한 행 수)"""
+    key_column, date_column = spec.column(spec.key), spec.column(spec.date)
+    stations = db.execute(
+        select(key_column, func.max(spec.column(spec.label)), func.min(date_column))
+        .where(date_column <= covered_until, key_column.isnot(None))
+        .group_by(key_column).order_by(key_column)
+    ).all()
+    keys = [s[0] for s in stations]
+    start = min((s[2] for s in stations), default=covered_until)
+    days = (covered_until - start).days + 1
+    index = {key: i for i, key in enumerate(keys)}
+
+    tmp = path.with_name(path.name + ".tmp")
+    shutil.rmtree(tmp, ignore_errors=True)
+    tmp.mkdir(parents=True)
+    shape = (len(keys), days)
+    present = np.memmap(tmp / "rows.u1", dtype=np.uint8, mode="w+", shape=shape) if keys else None
+    matrices = {}
+    for name in spec.variables:
+        if keys:
+            matrices[name] = np.memmap(tmp / f"{name}.f32", dtype=np.float32, mode="w+", shape=shape)
+            matrices[name][:] = np.nan
+
+    total = 0
+    statement = select(key_column, date_column, *(spec.column(v) for v in spec.variables)) \
+        .where(date_column >= start, date_column <= covered_until, key_column.isnot(None))
+    result = db.execute(statement.execution_options(yield_per=EXPORT_BATCH_ROWS))
+    origin = start.toordinal()
+    for batch in result.partitions():
+        rows = np.fromiter((index[r[0]] for r in batch), dtype=np.int64, count=len(batch))
+        cols = np.fromiter((r[1].toordinal() - origin for r in batch), dtype=np.int64, count=len(batch))
+        present[rows, cols] = 1
+        for i, name in enumerate(spec.variables, start=2):
+            matrices[name][rows, cols] = np.array(
+                [np.nan if r[i] is None else r[i] for r in batch], dtype=np.float32
+            )
+        total += len(batch)
+
+    for matrix in (present, *matrices.values()):
+        if matrix is not None:
+            matrix.flush()
+    meta = {
+        "dataset": spec.name,
+        "table": spec.table,
+        "start": start.isoformat(),
+        "days": days,
+        "covered_until": covered_until.isoformat(),
+        "keys": keys,
+        "labels": [s[1] for s in stations],
+        "variables": list(spec.variables),
+        "rows": total,
+        "source_version": version,
+        "built_at": datetime.now().isoformat(timespec="seconds"),
+    }
+    (tmp / "meta.json").write_text(json.dumps(meta, ensure_ascii=False), encoding="utf-8")
+    os.replace(tmp, path)
+    return total
+
+
+def db_aggregate(db: Session, spec: Dataset, keys: Sequence, start: Optional[date], end: Optional[date],
+                 variables: Sequence[str]) -> dict[Any, Aggregate]:
+    """DB 에서 관측소별 기간 집계 (한 번의 GROUP BY)"""
+    key_column, date_column = spec.column(spec.key), spec.column(spec.date)
+    columns = []
+    for name in variables:
+        column = spec.column(name)
+        columns += [func.count(column), func.sum(column), func.min(column), func.max(column)]
+    query = select(
+        key_column, func.count(), func.min(date_column), func.max(date_column),
+        func.max(spec.column(spec.label)), *columns,
+    ).where(key_column.in_(list(keys))).group_by(key_column)
+    if start is not None:
+        query = query.where(date_column >= start)
+    if end is not None:
+        query = query.where(date_column <= end)
+
+    result = {}
+    for row in db.execute(query).all():
+        agg = Aggregate(count=row[1], first=row[2], last=row[3], label=row[4])
+        for i, name in enumerate(variables):
+            n, total, low, high = row[5 + 4 * i: 9 + 4 * i]
+            agg.n[name] = n
+            if n:
+                agg.sum[name], agg.min[name], agg.max[name] = float(total), low, high
+        result[row[0]] = agg
+    return result
+
+
+# 프로세스 공용 인스턴스
+archive_store = ArchiveStore(settings.ARCHIVE_DIR, settings.ARCHIVE_SETTLE_DAYS)
+
+
+def verify(db: Session, samples: int) -> int:
+    """무작위 관측소/기간의 아카이브 집계를 DB 집계와 비교합니다. (불일치 수)"""
+    failures = 0
+    for name, spec in DATASETS.items():
+        archive = archive_store.current(name)
+        if archive is None:
+            print(f"[ARCHIVE] {name}: 아카이브 없음 (python -m app.archive build)")
+            failures += 1
+            continue
+        print(f"[ARCHIVE] {name}: {len(archive.keys)} 관측소, {archive.start} ~ {archive.end}, "
+              f"{archive.meta['rows']} 행")
+        for _ in range(samples):
+            keys = random.sample(archive.keys, min(len(archive.keys), random.randint(1, 10)))
+            start = archive.start + timedelta(days=random.randint(0, max(archive.days - 1, 0)))
+            end = start + timedelta(days=random.randint(0, archive.days))
+            started = time.perf_counter()
+            cached = archive_store.aggregate(db, name, keys, start, end, spec.variables)
+            cached_ms = (time.perf_counter() - started) * 1000
+            started = time.perf_counter()
+            expected = db_aggregate(db, spec, keys, start, end, spec.variables)
+            db_ms = (time.perf_counter() - started) * 1000
+            problems = _compare(cached, expected, spec.variables)
+            status = "FAIL" if problems else "OK"
+            print(f"[{status}] {name} {len(keys)} 관측소 {start} ~ {end}: "
+                  f"아카이브 {cached_ms:.1f}ms / DB {db_ms:.1f}ms")
+            for problem in problems[:5]:
+                print(f"       {problem}")
+            failures += bool(problems)
+    return failures
+
+
+def _close(a: float, b: float, tolerance: float) -> bool:
+    """float32 저장 오차 허용 비교 (상대 오차)"""
+    return abs(a - b) <= tolerance * max(abs(b), 1.0)
+
+
+def _compare(cached: dict, expected: dict, variables: Sequence[str]) -> list[str]:
+    problems = []
+    for key in set(cached) | set(expected):
+        a, b = cached.get(key), expected.get(key)
+        if a is None or b is None:
+            problems.append(f"{key}: {'아카이브' if a is None else 'DB'} 에 자료 없음")
+            continue
+        if (a.count, a.first, a.last) != (b.count, b.first, b.last):
+            problems.append(f"{key}: 행 {a.count}/{b.count}, 기간 {a.first}~{a.last} / {b.first}~{b.last}")
+        for name in variables:
+            if a.n.get(name, 0) != b.n.get(name, 0):
+                problems.append(f"{key}.{name}: 값 수 {a.n.get(name)}/{b.n.get(name)}")
+            elif b.n.get(name) and not (
+                _close(a.sum[name], b.sum[name], 1e-4)
+                and _close(a.min[name], b.min[name], 1e-6) and _close(a.max[name], b.max[name], 1e-6)
+            ):
+                problems.append(f"{key}.{name}: 합계/최소/최대 불일치")
+    return problems
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="일자료 메모리 맵 아카이브")
+    parser.add_argument("command", choices=["build", "verify"])
+    parser.add_argument("--dataset", choices=list(DATASETS), help="대상 데이터셋 (미입력시 전체)")
+    parser.add_argument("--force", action="store_true", help="원본이 바뀌지 않았어도 다시 만듦")
+    parser.add_argument("--samples", type=int, default=20, help="verify: 데이터셋별 비교 횟수")
+    args = parser.parse_args()
+
+    if np is None:
+        print("[ARCHIVE] numpy 가 설치되어 있지 않습니다.")
+        sys.exit(1)
+
+    db = read_session(BULK)
+    try:
+        if args.command == "build":
+            for name in [args.dataset] if args.dataset else DATASETS:
+                started = time.perf_counter()
+                rows = archive_store.build(db, name, force=args.force)
+                print(f"[ARCHIVE] {name}: {rows} rows ({time.perf_counter() - started:.1f}초)")
+        else:
+            failures = verify(db, args.samples)
+            print(f"{failures} failure(s)")
+            sys.exit(1 if failures else 0)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
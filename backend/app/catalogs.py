@@ -0,0 +1,71 @@
+"""
+관측소 목록 스냅샷 (materialized view, migrations 0005)
+- /stations 엔드포인트는 요청마다 전체 테이블을 GROUP BY 하는 대신 미리 계산된 뷰를 읽습니다.
+- 스케줄러(app.scheduler)가 원본 테이블의 data_versions 가 바뀐 뷰만
+  REFRESH MATERIALIZED VIEW CONCURRENTLY 로 갱신하고 (갱신 중에도 읽기는 막히지 않음),
+  뷰의 data_versions 행을 증가시켜 ETag / 압축 캐시가 새 스냅샷 기준으로 바뀌게 합니다.
+"""
+
+from sqlalchemy import TIMESTAMP, BigInteger, Date, Integer, String, column, table, text
+
+from .database import engine
+from .watermark import watermarks
+
+# 뷰 정의는 마이그레이션에 있으므로 ORM 모델 대신 가벼운 table() 로 조회 (create_all 대상 아님)
+asos_station_catalog = table(
+    "asos_station_catalog",
+    column("stn_id", Integer), column("stn_nm", String), column("data_count", BigInteger),
+    column("first_date", Date), column("last_date", Date),
+)
+rda_station_catalog = table(
+    "rda_station_catalog",
+    column("stn_cd", String), column("stn_name", String), column("data_count", BigInteger),
+    column("first_date", Date), column("last_date", Date),
+)
+rda_realtime_station_catalog = table(
+    "rda_realtime_station_catalog",
+    column("province", String), column("stn_cd", String), column("stn_name", String),
+    column("data_count", BigInteger), column("first_datetime", TIMESTAMP), column("last_datetime", TIMESTAMP),
+)
+
+# 뷰 → 원본 테이블
+CATALOG_SOURCES: dict[str, str] = {
+    "asos_station_catalog": "asos_daily_data",
+    "rda_station_catalog": "weather_data_daily",
+    "rda_realtime_station_catalog": "weather_data",
+}
+
+
+class CatalogRefresher:
+    """원본 테이블 버전이 바뀐 관측소 목록 뷰만 갱신"""
+
+    def __init__(self):
+        # 뷰별 마지막 갱신 시점의 원본 버전 (프로세스 시작/리더 교체 후 첫 실행은 모두 갱신)
+        self._refreshed: dict[str, int] = {}
+
+    def refresh(self) -> list[str]:
+        """갱신한 뷰 이름 목록을 반환합니다. (primary 에서 실행)"""
+        watermarks.invalidate()
+        versions = watermarks.get_all()
+
+        refreshed = []
+        for view, source in CATALOG_SOURCES.items():
+            source_mark = versions.get(source)
+            if source_mark is None or view not in versions:
+                continue
+            # 버전은 갱신 전에 읽으므로, 갱신 도중의 변경은 다음 실행에서 다시 반영됨
+            if self._refreshed.get(view) == source_mark.version:
+                continue
+            with engine.begin() as conn:
+                conn.execute(text("SET LOCAL statement_timeout = 0"))
+                conn.execute(text(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {view}"))
+                conn.execute(text(
+                    "UPDATE data_versions SET version = version + 1, changed_at = now() "
+                    "WHERE table_name = :view"
+                ), {"view": view})
+            self._refreshed[view] = source_mark.version
+            refreshed.append(view)
+
+        if refreshed:
+            watermarks.invalidate()
+        return refreshed
@@ -0,0 +1,160 @@
+"""
+컬럼형 응답 모듈 (Arrow IPC / Parquet)
+- 기간 조회(다운로드) 엔드포인트의 format=arrow|parquet 응답을 만듭니다.
+- 서버 측 커서에서 BATCH_ROWS 행씩 읽어 RecordBatch 로 변환하고, 배치마다 바로 전송합니다.
+  (전체 결과를 메모리에 올리지 않습니다.)
+- pyarrow 는 선택 의존성입니다. 설치되지 않은 경우 columnar 형식 요청은 501 을 반환합니다.
+"""
+
+from typing import Iterable, Iterator, Sequence
+
+from fastapi import HTTPException
+from fastapi.responses import StreamingResponse
+from sqlalchemy import types as sa_types
+from sqlalchemy.sql import Select
+
+from .database import BULK, read_session
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - 선택 의존성
+    pa = None
+    pq = None
+
+# 서버 측 커서에서 한 번에 가져와 하나의 RecordBatch(Parquet row group)로 만드는 행 수
+BATCH_ROWS = 50_000
+
+# 버퍼 압축 코덱 (Arrow IPC / Parquet 모두 pyarrow 리더가 자동으로 해제)
+COMPRESSION = "zstd"
+
+# format 파라미터 허용 값
+FORMAT_PATTERN = "^(json|arrow|parquet)$"
+COLUMNAR_FORMATS = ("arrow", "parquet")
+
+MEDIA_TYPES = {
+    "arrow": "application/vnd.apache.arrow.stream",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+
+def arrow_type(column_type: sa_types.TypeEngine) -> "pa.DataType":
+    """SQLAlchemy 컬럼 타입 → Arrow 타입"""
+    if isinstance(column_type, sa_types.Integer):
+        return pa.int64()
+    if isinstance(column_type, (sa_types.Float, sa_types.Numeric)):
+        return pa.float64()
+    if isinstance(column_type, sa_types.DateTime):
+        return pa.timestamp("us")
+    if isinstance(column_type, sa_types.Date):
+        return pa.date32()
+    if isinstance(column_type, sa_types.Boolean):
+        return pa.bool_()
+    return pa.string()
+
+
+def statement_schema(statement: Select, keys: Sequence[str]) -> "pa.Schema":
+    """SELECT 문의 컬럼 타입으로 Arrow 스키마 생성"""
+    return pa.schema([
+        pa.field(key, arrow_type(column.type))
+        for key, column in zip(keys, statement.selected_columns)
+    ])
+
+
+class _ChunkSink:
+    """Writer 출력을 모아 두었다가 배치 단위로 꺼내는 쓰기 전용 스트림"""
+
+    def __init__(self):
+        self._chunks: list[bytes] = []
+        self._position = 0
+        self.closed = False
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self._chunks.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        # Parquet footer 의 오프셋 계산에 사용 (꺼낸 청크 포함 누적 위치)
+        return self._position
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+    def writable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return False
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def record_batch(schema: "pa.Schema", rows: Sequence[Sequence]) -> "pa.RecordBatch":
+    """행 튜플 목록 → RecordBatch (컬럼 단위 변환)"""
+    columns = list(zip(*rows)) if rows else [[] for _ in schema]
+    return pa.RecordBatch.from_arrays(
+        [pa.array(values, type=field.type) for values, field in zip(columns, schema)],
+        schema=schema,
+    )
+
+
+def encode_batches(fmt: str, schema: "pa.Schema", row_chunks: Iterable[Sequence[Sequence]]) -> Iterator[bytes]:
+    """행 묶음을 Arrow IPC 스트림 / Parquet 바이트 조각으로 인코딩"""
+    sink = _ChunkSink()
+    stream = pa.PythonFile(sink, mode="w")
+    if fmt == "parquet":
+        writer = pq.ParquetWriter(stream, schema, compression=COMPRESSION)
+
+        def write(batch):
+            writer.write_table(pa.Table.from_batches([batch]))
+    else:
+        options = pa.ipc.IpcWriteOptions(compression=COMPRESSION)
+        writer = pa.ipc.new_stream(stream, schema, options=options)
+        write = writer.write_batch
+
+    try:
+        for rows in row_chunks:
+            write(record_batch(schema, rows))
+            chunk = sink.drain()
+            if chunk:
+                yield chunk
+    finally:
+        writer.close()
+    yield sink.drain()
+
+
+def _stream_rows(statement: Select) -> Iterator[Sequence[Sequence]]:
+    """서버 측 커서로 BATCH_ROWS 행씩 조회
+
+    FastAPI 의 yield 의존성(get_db)은 응답 전송 전에 정리되므로
+    스트리밍 동안 사용할 세션을 여기서 직접 엽니다.
+    """
+    db = read_session(BULK)
+    try:
+        result = db.execute(statement.execution_options(yield_per=BATCH_ROWS))
+        for rows in result.partitions():
+            yield rows
+    finally:
+        db.close()
+
+
+def columnar_response(fmt: str, statement: Select, keys: Sequence[str], filename: str) -> StreamingResponse:
+    """SELECT 결과를 Arrow IPC / Parquet 스트리밍 응답으로 반환"""
+    if pa is None:
+        raise HTTPException(status_code=501, detail=f"format={fmt} 을 사용하려면 서버에 pyarrow 가 설치되어 있어야 합니다.")
+
+    schema = statement_schema(statement, keys)
+    extension = "arrows" if fmt == "arrow" else "parquet"
+    return StreamingResponse(
+        encode_batches(fmt, schema, _stream_rows(statement)),
+        media_type=MEDIA_TYPES[fmt],
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{extension}"'},
+    )
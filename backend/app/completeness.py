@@ -0,0 +1,307 @@
+"""
+RDA 10분 자료 수신 현황(완결성) 모듈
+- weather_data 를 (관측소, 날짜)별 수신 구간 수 + 144비트 수신 비트맵으로 요약하여
+  weather_data_completeness 에 저장합니다. (migrations 0008, 스케줄러가 최근 며칠을 증분 갱신)
+- 완결성 요약 / 결측 구간 조회는 이 요약 테이블만 읽으므로 원자료 행 수와 무관하게 빠르고,
+  원자료 보존 정리 이후의 기간도 조회할 수 있습니다.
+- 기대 구간은 관측소 첫 관측 이후 ~ 현재 - COMPLETENESS_LAG_MINUTES (수집 지연) 의 10분 구간입니다.
+
+사용법:
+    cd backend
+    python -m app.completeness refresh                         # 마지막 갱신일 - COMPLETENESS_LOOKBACK_DAYS 부터
+    python -m app.completeness refresh --start 2026-07-01 --end 2026-10-01
+    python -m app.completeness report --start 2026-10-01 --below 0.95
+"""
+
+import argparse
+import re
+from datetime import date, datetime, time, timedelta
+from typing import Optional
+
+from sqlalchemy import String, and_, case, cast, func, select, text
+from sqlalchemy.orm import Session
+
+from .catalogs import rda_realtime_station_catalog
+from .config import get_settings
+from .database import SessionLocal
+from .models.rda import WeatherDataCompleteness
+from .rollup import raw_cutoff
+
+settings = get_settings()
+
+SLOT_MINUTES = 10
+SLOTS_PER_DAY = 24 * 60 // SLOT_MINUTES
+
+# 한 트랜잭션에서 다시 계산하는 최대 일수 (초기 적재 시 긴 트랜잭션 방지)
+REFRESH_CHUNK_DAYS = 31
+
+DELETE_SQL = text("""
+    DELETE FROM weather_data_completeness
+    WHERE date >= :start_date AND date < :end_date
+""")
+
+# 구간 번호 slot = 시*6 + 분/10, 비트맵은 왼쪽 비트가 00:00
+REFRESH_SQL = text("""
+    INSERT INTO weather_data_completeness (
+        stn_cd, date, stn_name, province, received, slots, first_datetime, last_datetime
+    )
+    SELECT
+        stn_cd,
+        datetime::date,
+        max(stn_name),
+        max(province),
+        count(DISTINCT slot),
+        bit_or(B'1'::bit(144) >> slot),
+        min(datetime),
+        max(datetime)
+    FROM (
+        SELECT stn_cd, stn_name, province, datetime,
+               extract(hour FROM datetime)::int * 6 + extract(minute FROM datetime)::int / 10 AS slot
+        FROM weather_data
+        WHERE datetime >= :start AND datetime < :end
+          AND stn_cd IS NOT NULL
+    ) w
+    GROUP BY stn_cd, datetime::date
+""")
+
+
+def refresh(db: Session, start_date: date, end_date: date) -> int:
+    """
+    [start_date, end_date) 의 수신 현황을 다시 계산합니다. (멱등, 기록한 관측소-일 수)
+    - 보존 정리로 원자료가 일부/전부 삭제된 날은 기존 요약을 유지합니다.
+    """
+    cutoff = raw_cutoff()
+    if cutoff is not None:
+        start_date = max(start_date, cutoff.date() + timedelta(days=1))
+
+    written = 0
+    chunk_start = start_date
+    while chunk_start < end_date:
+        chunk_end = min(chunk_start + timedelta(days=REFRESH_CHUNK_DAYS), end_date)
+        # 삭제와 재계산을 한 트랜잭션으로 (정정으로 사라진 관측소-일도 반영)
+        db.execute(DELETE_SQL, {"start_date": chunk_start, "end_date": chunk_end})
+        result = db.execute(REFRESH_SQL, {
+            "start": datetime.combine(chunk_start, time.min),
+            "end": datetime.combine(chunk_end, time.min),
+        })
+        db.commit()
+        written += result.rowcount
+        chunk_start = chunk_end
+    return written
+
+
+def refresh_incremental(db: Session) -> int:
+    """마지막으로 계산된 날짜 - COMPLETENESS_LOOKBACK_DAYS 부터 오늘까지 다시 계산합니다."""
+    last = db.execute(text("SELECT max(date) FROM weather_data_completeness")).scalar()
+    if last is None:
+        first = db.execute(text("SELECT min(datetime) FROM weather_data")).scalar()
+        if first is None:
+            return 0
+        start = first.date()
+    else:
+        # 늦게 들어온 자료 반영
+        start = last - timedelta(days=settings.COMPLETENESS_LOOKBACK_DAYS)
+    return refresh(db, start, date.today() + timedelta(days=1))
+
+
+def run_refresh() -> int:
+    """스케줄러 작업 (기록한 관측소-일 수)"""
+    db = SessionLocal()
+    try:
+        return refresh_incremental(db)
+    finally:
+        db.close()
+
+
+def _floor_slot(value: datetime) -> datetime:
+    return value.replace(minute=value.minute - value.minute % SLOT_MINUTES, second=0, microsecond=0)
+
+
+def _expected_range(first_datetime: Optional[datetime], start_date: date, end_date: date,
+                    now: datetime) -> tuple[datetime, datetime]:
+    """
+    관측소의 기대 구간 [시작, 끝) - 조회 기간 ∩ [첫 관측, 현재 - 수집 지연)
+    (끝 <= 시작 이면 기대 구간 없음)
+    """
+    begin = datetime.combine(start_date, time.min)
+    if first_datetime is not None:
+        begin = max(begin, _floor_slot(first_datetime))
+    finish = min(
+        datetime.combine(end_date + timedelta(days=1), time.min),
+        _floor_slot(now - timedelta(minutes=settings.COMPLETENESS_LAG_MINUTES)),
+    )
+    return begin, finish
+
+
+def _slot_count(begin: datetime, finish: datetime) -> int:
+    return max(0, int((finish - begin).total_seconds()) // (SLOT_MINUTES * 60))
+
+
+def _stations(province: Optional[str], stn_cd: Optional[str]):
+    """
+    관측소 목록 (관측소 코드당 1행)
+    - 관측소와 첫/마지막 관측은 수신 현황 요약 기준 - 원자료 보존 정리 이후에도 유지되고,
+      수신이 끊긴 관측소도 남아 계속 결측으로 보고됩니다.
+    - 관측소명/도는 실시간 관측소 목록 스냅샷을 우선 사용합니다.
+    """
+    c = WeatherDataCompleteness
+    summary = select(
+        c.stn_cd,
+        func.max(c.stn_name).label("stn_name"),
+        func.max(c.province).label("province"),
+        func.min(c.first_datetime).label("first_datetime"),
+        func.max(c.last_datetime).label("last_datetime"),
+    ).group_by(c.stn_cd)
+    if stn_cd:
+        summary = summary.where(c.stn_cd == stn_cd)
+    summary = summary.subquery()
+
+    catalog = select(
+        rda_realtime_station_catalog.c.stn_cd,
+        func.max(rda_realtime_station_catalog.c.stn_name).label("stn_name"),
+        func.max(rda_realtime_station_catalog.c.province).label("province"),
+    ).group_by(rda_realtime_station_catalog.c.stn_cd).subquery()
+
+    province_column = func.coalesce(catalog.c.province, summary.c.province)
+    query = select(
+        summary.c.stn_cd,
+        func.coalesce(catalog.c.stn_name, summary.c.stn_name).label("stn_name"),
+        province_column.label("province"),
+        summary.c.first_datetime,
+        summary.c.last_datetime,
+    ).select_from(summary.outerjoin(catalog, catalog.c.stn_cd == summary.c.stn_cd))
+    if province:
+        query = query.where(province_column == province)
+    return query.subquery()
+
+
+def station_summary(db: Session, start_date: date, end_date: date, province: Optional[str] = None,
+                    stn_cd: Optional[str] = None, now: Optional[datetime] = None) -> list[dict]:
+    """
+    관측소별 기대/수신 10분 구간 수와 수신율 (수신율 낮은 순)
+    - end_date 포함
+    """
+    now = now or datetime.now()
+    # 기대 구간의 끝은 관측소와 무관 - 끝이 걸친 날은 비트맵에서 끝 이전 구간만 셈
+    _, finish = _expected_range(None, start_date, end_date, now)
+    partial_slots = _slot_count(datetime.combine(finish.date(), time.min), finish)
+
+    stations = _stations(province, stn_cd)
+    c = WeatherDataCompleteness
+    rows = db.execute(
+        select(
+            stations,
+            func.coalesce(func.sum(case((c.date < finish.date(), c.received))), 0).label("received"),
+            func.count(c.date).label("reporting_days"),
+        )
+        .select_from(stations.outerjoin(c, and_(
+            c.stn_cd == stations.c.stn_cd, c.date >= start_date, c.date <= end_date
+        )))
+        .group_by(*stations.c)
+    ).all()
+    partial: dict[str, int] = {}
+    if partial_slots and start_date <= finish.date():
+        query = select(c.stn_cd, cast(c.slots, String).label("slots")).where(c.date == finish.date())
+        if stn_cd:
+            query = query.where(c.stn_cd == stn_cd)
+        partial = {r.stn_cd: r.slots[:partial_slots].count("1") for r in db.execute(query)}
+
+    results = []
+    for r in rows:
+        expected = _slot_count(*_expected_range(r.first_datetime, start_date, end_date, now))
+        if expected == 0:
+            continue
+        received = int(r.received) + partial.get(r.stn_cd, 0)
+        results.append({
+            "stn_cd": r.stn_cd,
+            "stn_name": r.stn_name,
+            "province": r.province,
+            "expected": expected,
+            "received": received,
+            "missing": expected - received,
+            "ratio": round(received / expected, 4),
+            "reporting_days": r.reporting_days,
+            "last_datetime": r.last_datetime,
+        })
+    results.sort(key=lambda x: (x["ratio"], x["stn_cd"]))
+    return results
+
+
+def find_gaps(db: Session, start_date: date, end_date: date, province: Optional[str] = None,
+              stn_cd: Optional[str] = None, min_minutes: int = SLOT_MINUTES,
+              now: Optional[datetime] = None) -> list[dict]:
+    """
+    관측소별 연속 결측 구간 목록 (관측소, 시작 순)
+    - start: 첫 결측 구간 시각, end: 다음 수신 구간 시각 (미포함)
+    - ongoing: 기대 구간 끝까지 이어지는 결측 (수신 중단)
+    """
+    now = now or datetime.now()
+    stations = db.execute(select(_stations(province, stn_cd))).all()
+    c = WeatherDataCompleteness
+    query = select(c.stn_cd, c.date, cast(c.slots, String).label("slots"))\
+        .where(c.date >= start_date, c.date <= end_date)
+    if stn_cd:
+        query = query.where(c.stn_cd == stn_cd)
+    bitmaps: dict[str, dict[date, str]] = {}
+    for r in db.execute(query):
+        bitmaps.setdefault(r.stn_cd, {})[r.date] = r.slots
+
+    days = [start_date + timedelta(days=i) for i in range((end_date - start_date).days + 1)]
+    origin = datetime.combine(start_date, time.min)
+    empty = "0" * SLOTS_PER_DAY
+    min_slots = max(1, -(-min_minutes // SLOT_MINUTES))
+    pattern = re.compile(f"0{{{min_slots},}}")
+
+    gaps = []
+    for s in stations:
+        begin, finish = _expected_range(s.first_datetime, start_date, end_date, now)
+        first, last = _slot_count(origin, begin), _slot_count(origin, finish)
+        if last <= first:
+            continue
+        days_bits = bitmaps.get(s.stn_cd, {})
+        series = "".join(days_bits.get(d, empty) for d in days)[first:last]
+        for m in pattern.finditer(series):
+            gap_start = begin + timedelta(minutes=SLOT_MINUTES * m.start())
+            gap_end = begin + timedelta(minutes=SLOT_MINUTES * m.end())
+            gaps.append({
+                "stn_cd": s.stn_cd,
+                "stn_name": s.stn_name,
+                "start": gap_start,
+                "end": gap_end,
+                "minutes": SLOT_MINUTES * (m.end() - m.start()),
+                "ongoing": m.end() == len(series),
+            })
+    gaps.sort(key=lambda g: (g["stn_cd"], g["start"]))
+    return gaps
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="RDA 10분 자료 수신 현황")
+    parser.add_argument("command", choices=["refresh", "report"])
+    parser.add_argument("--start", type=date.fromisoformat, help="시작 날짜 (YYYY-MM-DD)")
+    parser.add_argument("--end", type=date.fromisoformat, help="종료 날짜 (refresh: 미포함, report: 포함)")
+    parser.add_argument("--below", type=float, default=1.0, help="report: 수신율이 이 값 미만인 관측소만")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        if args.command == "refresh":
+            if args.start and args.end:
+                count = refresh(db, args.start, args.end)
+            else:
+                count = refresh_incremental(db)
+            print(f"[COMPLETENESS] {count} station-days written")
+        else:
+            end = args.end or date.today()
+            start = args.start or end - timedelta(days=6)
+            rows = [r for r in station_summary(db, start, end) if r["ratio"] < args.below]
+            for r in rows:
+                print(f"[COMPLETENESS] {r['stn_cd']} {r['stn_name']}: {r['received']}/{r['expected']} "
+                      f"({r['ratio']:.1%}), last {r['last_datetime']}")
+            print(f"[COMPLETENESS] {len(rows)} station(s) below {args.below:.0%} in {start} ~ {end}")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,242 @@
+"""
+응답 압축 미들웨어 (zstd / Brotli / gzip)
+- Accept-Encoding 을 협상하여 zstd → br → gzip 순으로 선택합니다.
+  (zstandard, brotli 패키지는 선택 의존성이며, 없으면 gzip 만 사용합니다.)
+- COMPRESSION_MIN_SIZE 보다 작은 응답, 이미 압축된 형식(Parquet, Arrow 등), SSE 는 압축하지 않습니다.
+- 스트리밍 응답은 청크마다 flush 하여 압축하므로 전체를 모으지 않습니다.
+- 조건부 GET 미들웨어가 계산한 ETag 가 있는 응답은 (ETag, 인코딩) 키로 압축 결과를 캐시합니다.
+  같은 ETag 의 다음 요청은 라우터를 실행하지 않고 캐시된 압축 바이트를 그대로 반환합니다.
+"""
+
+import zlib
+from collections import OrderedDict
+from typing import Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .config import get_settings
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - 선택 의존성
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - 선택 의존성
+    zstandard = None
+
+settings = get_settings()
+
+# 압축하는 Content-Type (접두사 일치)
+COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/javascript",
+    "application/xml",
+    "text/html",
+    "text/plain",
+    "text/css",
+    "text/csv",
+    "image/svg+xml",
+)
+
+
+def available_encodings() -> list[str]:
+    """서버에서 사용 가능한 인코딩 (선호 순서)"""
+    encodings = []
+    if zstandard is not None:
+        encodings.append("zstd")
+    if brotli is not None:
+        encodings.append("br")
+    encodings.append("gzip")
+    return encodings
+
+
+def negotiate_encoding(accept_encoding: str, encodings: list[str]) -> Optional[str]:
+    """Accept-Encoding(q 값 포함)과 서버 선호 순서로 인코딩 선택"""
+    weights: dict[str, float] = {}
+    for item in accept_encoding.lower().split(","):
+        name, _, params = item.strip().partition(";")
+        if not name:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        weights[name.strip()] = q
+
+    best, best_q = None, 0.0
+    for encoding in encodings:
+        q = weights.get(encoding, weights.get("*", 0.0))
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+
+class StreamCompressor:
+    """인코딩별 증분 압축기 (compress 는 청크마다 flush)"""
+
+    def __init__(self, encoding: str):
+        self.encoding = encoding
+        if encoding == "zstd":
+            self._obj = zstandard.ZstdCompressor(level=settings.ZSTD_LEVEL).compressobj()
+        elif encoding == "br":
+            self._obj = brotli.Compressor(quality=settings.BROTLI_QUALITY)
+        else:
+            self._obj = zlib.compressobj(settings.GZIP_LEVEL, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes, flush: bool = True) -> bytes:
+        if self.encoding == "zstd":
+            out = self._obj.compress(data)
+            return out + self._obj.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK) if flush else out
+        if self.encoding == "br":
+            out = self._obj.process(data)
+            return out + self._obj.flush() if flush else out
+        out = self._obj.compress(data)
+        return out + self._obj.flush(zlib.Z_SYNC_FLUSH) if flush else out
+
+    def finish(self) -> bytes:
+        if self.encoding == "zstd":
+            return self._obj.flush()
+        if self.encoding == "br":
+            return self._obj.finish()
+        return self._obj.flush(zlib.Z_FINISH)
+
+
+def compress_bytes(encoding: str, data: bytes) -> bytes:
+    compressor = StreamCompressor(encoding)
+    return compressor.compress(data, flush=False) + compressor.finish()
+
+
+class CompressedCache:
+    """(ETag, 인코딩) → (응답 헤더, 압축 바이트) LRU 캐시 (총 바이트 상한)"""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._size = 0
+        self._entries: OrderedDict[tuple[str, str], tuple[list, bytes]] = OrderedDict()
+
+    def get(self, key: tuple[str, str]) -> Optional[tuple[list, bytes]]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def put(self, key: tuple[str, str], headers: list, body: bytes) -> None:
+        if len(body) > self.max_bytes:
+            return
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._size -= len(old[1])
+        self._entries[key] = (headers, body)
+        self._size += len(body)
+        while self._size > self.max_bytes:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self._size -= len(evicted)
+
+
+def is_compressible(headers: Headers) -> bool:
+    if "content-encoding" in headers:
+        return False
+    content_type = headers.get("content-type", "")
+    return content_type.startswith(COMPRESSIBLE_TYPES)
+
+
+class CompressionMiddleware:
+    """응답 압축 ASGI 미들웨어"""
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 1024, cache_bytes: int = 0):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.encodings = available_encodings()
+        self.cache = CompressedCache(cache_bytes) if cache_bytes > 0 else None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] != "GET":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""), self.encodings)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        # 조건부 GET 미들웨어가 scope 에 남긴 ETag (데이터가 같으면 압축 결과도 같음)
+        etag = scope.get("state", {}).get("etag")
+        cache_key = (etag, encoding) if etag and self.cache is not None else None
+        if cache_key is not None:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                headers, body = cached
+                await send({"type": "http.response.start", "status": 200, "headers": headers})
+                await send({"type": "http.response.body", "body": body})
+                return
+
+        responder = _CompressionResponder(send, encoding, self.minimum_size, self.cache, cache_key)
+        await self.app(scope, receive, responder)
+
+
+class _CompressionResponder:
+    """요청 하나의 응답 메시지를 받아 압축 여부를 결정하고 전달"""
+
+    def __init__(self, send: Send, encoding: str, minimum_size: int,
+                 cache: Optional[CompressedCache], cache_key: Optional[tuple[str, str]]):
+        self.send = send
+        self.encoding = encoding
+        self.minimum_size = minimum_size
+        self.cache = cache
+        self.cache_key = cache_key
+        self.start: Optional[Message] = None
+        self.compressor: Optional[StreamCompressor] = None
+        self.passthrough = False
+
+    async def __call__(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            # 첫 본문을 보고 결정하기 위해 보류
+            self.start = message
+            return
+
+        if message["type"] != "http.response.body" or self.passthrough:
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self.compressor is not None:
+            # 스트리밍 응답의 이후 청크
+            chunk = self.compressor.compress(body) if body else b""
+            if not more_body:
+                chunk += self.compressor.finish()
+            if chunk or not more_body:
+                await self.send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+            return
+
+        headers = MutableHeaders(scope=self.start)
+        if not is_compressible(headers) or self.start["status"] in (204, 304) \
+                or (not more_body and len(body) < self.minimum_size):
+            self.passthrough = True
+            await self.send(self.start)
+            await self.send(message)
+            return
+
+        headers["Content-Encoding"] = self.encoding
+        headers.add_vary_header("Accept-Encoding")
+
+        if not more_body:
+            compressed = compress_bytes(self.encoding, body)
+            headers["Content-Length"] = str(len(compressed))
+            if self.cache_key is not None and self.start["status"] == 200:
+                self.cache.put(self.cache_key, list(self.start["headers"]), compressed)
+            await self.send(self.start)
+            await self.send({"type": "http.response.body", "body": compressed})
+            return
+
+        del headers["Content-Length"]
+        self.compressor = StreamCompressor(self.encoding)
+        await self.send(self.start)
+        await self.send({"type": "http.response.body", "body": self.compressor.compress(body), "more_body": True})
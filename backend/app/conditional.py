@@ -0,0 +1,161 @@
+"""
+조건부 GET 미들웨어 (ETag / Last-Modified)
+- 경로별로 의존하는 테이블의 워터마크(data_versions)와 요청 파라미터로 ETag 를 계산합니다.
+- If-None-Match / If-Modified-Since 가 일치하면 라우터(무거운 쿼리, 직렬화)를 실행하지 않고
+  304 Not Modified 를 반환합니다.
+- 워터마크는 WatermarkCache 로 공유되므로 검증 비용은 주기당 작은 쿼리 한 번입니다.
+- 워터마크는 primary 기준이므로 본문은 그 변경까지 재생한 서버에서만 읽습니다. (database.require_replayed)
+"""
+
+import hashlib
+from datetime import date, datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Optional
+from urllib.parse import parse_qs
+
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .database import require_replayed, reset_replayed
+from .watermark import watermarks
+
+# 경로 접두사 → 응답이 의존하는 테이블 (먼저 일치하는 항목 사용)
+PATH_TABLES: list[tuple[str, tuple[str, ...]]] = [
+    # 관측소 목록은 원본 테이블이 아니라 스냅샷 뷰가 갱신될 때 바뀜 (app.catalogs)
+    ("/api/kma/asos/stations", ("asos_station_catalog",)),
+    ("/api/rda/weather/stations", ("rda_station_catalog",)),
+    ("/api/rda/weather/realtime/stations", ("rda_realtime_station_catalog",)),
+    ("/api/rda/weather/realtime/provinces", ("rda_realtime_station_catalog",)),
+    ("/api/kma/asos", ("asos_daily_data", "asos_daily_qc")),
+    ("/api/kma/realtime", ("weather_realtime",)),
+    ("/api/kma/forecast/short", ("weather_short_forecast",)),
+    ("/api/kma/forecast/mid", ("weather_mid_forecast",)),
+    ("/api/rda/weather/completeness", ("weather_data_completeness", "rda_realtime_station_catalog")),
+    ("/api/rda/weather/realtime", ("weather_data", "weather_data_hourly", "weather_data_qc")),
+    ("/api/rda/weather/hourly", ("weather_data_hourly",)),
+    ("/api/rda/weather/daily", ("weather_data_daily",)),
+    ("/api/rda/weather/monthly", ("weather_data_monthly",)),
+    # 바람장미는 10분/시간별 자료와 초단기실황을 읽음 (app.wind)
+    ("/api/stats/windrose", ("weather_data", "weather_data_hourly", "weather_realtime")),
+    ("/api/stats", ("asos_daily_data", "weather_data_daily")),
+    ("/api/alerts", ("alert_events",)),
+]
+
+# QC 플래그 테이블 - qc=strict 응답만 의존 (qc=none 응답의 ETag 가 QC 재검사로 바뀌지 않도록)
+QC_TABLES = ("asos_daily_qc", "weather_data_qc")
+
+# 검증 후에도 항상 재검증하도록 지시 (브라우저/nginx 가 조건부 요청을 보냄)
+CACHE_CONTROL = "no-cache"
+
+
+def tables_for_path(path: str, query_string: bytes = b"") -> Optional[tuple[str, ...]]:
+    for prefix, tables in PATH_TABLES:
+        if path.startswith(prefix):
+            if parse_qs(query_string.decode("latin-1")).get("qc") != ["strict"]:
+                tables = tuple(t for t in tables if t not in QC_TABLES)
+            return tables
+    return None
+
+
+def compute_validators(scope: Scope, tables: tuple[str, ...]) -> Optional[tuple[str, datetime, datetime]]:
+    """(ETag, Last-Modified, 최신 변경 시각) 계산. 워터마크가 없는 테이블이 있으면 None"""
+    versions = watermarks.get_all()
+    marks = [versions.get(t) for t in tables]
+    if any(m is None for m in marks):
+        return None
+
+    # 오늘 날짜 기준으로 결과가 달라지는 엔드포인트(/today 등)를 위해 날짜를 포함
+    key = "|".join([
+        scope["path"],
+        "&".join(sorted(scope.get("query_string", b"").decode("latin-1").split("&"))),
+        date.today().isoformat(),
+        *(f"{t}:{m.version}" for t, m in zip(tables, marks)),
+    ])
+    etag = 'W/"' + hashlib.sha1(key.encode("utf-8")).hexdigest()[:20] + '"'
+    changed_at = max(m.changed_at for m in marks)
+    last_modified = changed_at.astimezone(timezone.utc).replace(microsecond=0)
+    return etag, last_modified, changed_at
+
+
+def is_not_modified(headers: Headers, etag: str, last_modified: datetime) -> bool:
+    """요청의 검증자와 비교하여 변경되지 않았는지 판단합니다."""
+    if_none_match = headers.get("if-none-match")
+    if if_none_match is not None:
+        candidates = {tag.strip() for tag in if_none_match.split(",")}
+        # 약한 비교 (W/ 접두사 무시)
+        bare = etag.removeprefix("W/")
+        return "*" in candidates or any(c.removeprefix("W/") == bare for c in candidates)
+
+    if_modified_since = headers.get("if-modified-since")
+    if if_modified_since:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        return last_modified <= since
+    return False
+
+
+class ConditionalGetMiddleware:
+    """데이터 워터마크 기반 ETag / 304 처리 ASGI 미들웨어"""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] not in ("GET", "HEAD"):
+            await self.app(scope, receive, send)
+            return
+
+        tables = tables_for_path(scope["path"], scope.get("query_string", b""))
+        if tables is None:
+            await self.app(scope, receive, send)
+            return
+
+        try:
+            validators = await run_in_threadpool(compute_validators, scope, tables)
+        except Exception as exc:
+            # 워터마크 조회 실패 시 검증 없이 그대로 처리
+            print(f"[CONDITIONAL] 워터마크 조회 실패: {exc}")
+            validators = None
+
+        if validators is None:
+            await self.app(scope, receive, send)
+            return
+
+        etag, last_modified, changed_at = validators
+        last_modified_header = format_datetime(last_modified, usegmt=True)
+
+        # 안쪽 미들웨어(압축 캐시)가 같은 ETag 의 결과를 재사용할 수 있도록 전달
+        scope.setdefault("state", {})["etag"] = etag
+
+        if is_not_modified(Headers(scope=scope), etag, last_modified):
+            await send({
+                "type": "http.response.start",
+                "status": 304,
+                "headers": [
+                    (b"etag", etag.encode("latin-1")),
+                    (b"last-modified", last_modified_header.encode("latin-1")),
+                    (b"cache-control", CACHE_CONTROL.encode("latin-1")),
+                ],
+            })
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        async def send_with_validators(message: Message) -> None:
+            if message["type"] == "http.response.start" and message["status"] == 200:
+                headers = MutableHeaders(scope=message)
+                headers["ETag"] = etag
+                headers["Last-Modified"] = last_modified_header
+                headers.setdefault("Cache-Control", CACHE_CONTROL)
+            await send(message)
+
+        # ETag 의 데이터 버전을 아직 재생하지 못한 복제본에서 이전 본문을 읽지 않도록 함
+        token = require_replayed(changed_at)
+        try:
+            await self.app(scope, receive, send_with_validators)
+        finally:
+            reset_replayed(token)
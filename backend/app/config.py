@@ -24,6 +24,14 @@ class Settings(BaseSettings):
     DB_USER: str = "smartfarm"
     DB_PASSWORD: str = "smartfarm"
 
+    # 읽기 복제본 / 커넥션 풀 (app.database)
+    DB_REPLICA_HOSTS: str = ""                    # 읽기 복제본 (콤마 구분 host[:port], 비어 있으면 primary 에서 읽음)
+    REPLICA_HEALTH_INTERVAL_SECONDS: float = 5.0  # 복제본 상태 확인 주기
+    DB_POOL_SIZE: int = 10                        # 대화형 풀 (최신값, 목록 등 대시보드 조회)
+    DB_MAX_OVERFLOW: int = 20
+    BULK_POOL_SIZE: int = 5                       # 대량 풀 (기간 조회, 다운로드, 통계) - 대화형 풀과 분리
+    BULK_MAX_OVERFLOW: int = 0
+
     # CORS 설정 (콤마로 구분된 문자열 또는 "*")
     CORS_ORIGINS: str = "*"
 
@@ -38,10 +46,109 @@ class Settings(BaseSettings):
     DEFAULT_PAGE_SIZE: int = 20
     MAX_PAGE_SIZE: int = 100
 
+    # 데이터 보존 계층 (app.rollup)
+    RAW_RETENTION_DAYS: int = 90        # 10분 원자료 보존 기간 (0 = 무기한)
+    HOURLY_RETENTION_DAYS: int = 0      # 시간별 집계 보존 기간 (0 = 무기한)
+    HOURLY_TIER_MIN_DAYS: int = 7       # 조회 기간이 이보다 길면 시간별 집계 사용
+
+    # 10분 자료 수신 현황 (app.completeness)
+    COMPLETENESS_LOOKBACK_DAYS: int = 2     # 증분 갱신 시 마지막 갱신일보다 앞당겨 다시 계산하는 일수 (늦게 들어온 자료)
+    COMPLETENESS_LAG_MINUTES: int = 30      # 수집 지연 - 현재로부터 이 시간 이내의 구간은 아직 기대하지 않음
+
+    # 결측 보완 (app.gapfill, 조회 시 fill=interp|neighbor)
+    FILL_MAX_POINTS: int = 60000                # 한 번에 보완하는 최대 격자 수 (10분 자료 약 1년)
+    FILL_DEFAULT_DAYS: int = 30                 # 시작 일시를 지정하지 않은 보완 조회의 기간 (종료 시각 이전 일수)
+    FILL_NEIGHBORS: int = 8                     # 회귀 후보 이웃 관측소 수 (같은 도/광역시)
+    FILL_NEIGHBOR_MIN_CORRELATION: float = 0.8  # 이웃 회귀에 사용하는 최소 상관계수
+
+    # 데이터 워터마크 (data_versions) 캐시 유지 시간 - 조건부 GET 검증 비용 상한
+    WATERMARK_MAX_AGE_SECONDS: float = 1.0
+    WATERMARK_MAX_AGE_NOTIFY_SECONDS: float = 30.0  # 변경 알림 수신 중 유지 시간 (알림을 놓친 경우의 상한)
+
+    # 워커 간 변경 알림 (app.notify, PostgreSQL LISTEN/NOTIFY)
+    NOTIFY_ENABLED: bool = True
+    NOTIFY_RECONNECT_SECONDS: float = 5.0   # 연결이 끊겼을 때 재연결 간격
+    NOTIFY_KEEPALIVE_SECONDS: float = 30.0  # 알림이 없을 때 연결 상태 확인 간격
+
+    # 실시간 자료 핫 스토어 (app.hotstore) - 최근 자료를 메모리에서 응답
+    HOTSTORE_ENABLED: bool = True
+    HOTSTORE_WINDOW_HOURS: int = 48             # 메모리에 보관하는 기간
+    HOTSTORE_MAX_KEYS: int = 2000               # 스토어별 최대 지역/관측소 수 (넘으면 전체 조회는 DB 사용)
+    HOTSTORE_POLL_SECONDS: float = 10.0         # 변경 확인 주기 (변경 알림 수신 시 즉시)
+    HOTSTORE_REFRESH_HOURS: int = 3             # 변경 시 다시 읽는 최근 기간
+    HOTSTORE_FULL_RELOAD_MINUTES: float = 60.0  # 전체 기간을 다시 읽는 주기 (오래된 정정 반영)
+
+    # 일자료 메모리 맵 아카이브 (app.archive) - 통계 집계를 DB 대신 파일에서
+    ARCHIVE_ENABLED: bool = True
+    ARCHIVE_DIR: str = "data/archive"           # 아카이브 파일 위치 (워커들이 공유, 컨테이너 재시작 후에도 유지)
+    ARCHIVE_SETTLE_DAYS: int = 3                # 최근 이 일수는 정정될 수 있으므로 DB 에서 집계
+
+    # 데이터 품질 관리 (app.qc) - 범위/급변/지속/일관성 검사 플래그, 조회 시 qc=strict
+    QC_ENABLED: bool = True
+    QC_LOOKBACK_HOURS: int = 24                 # 증분 검사 시 이전 검사 위치보다 앞당겨 다시 검사하는 기간 (늦게 들어온 자료, 데이터셋별 최소 기간과 큰 값)
+
+    # 이상기상 알림 (app.alerts) - 폭염/늦서리/호우 연속 구간 증분 탐지
+    ALERTS_ENABLED: bool = True
+    ALERT_LOOKBACK_HOURS: int = 6               # 가장 최근 처리 시각보다 앞당겨 읽는 기간 (다른 관측소보다 늦게 들어온 관측)
+
+    # 실시간 스트림 (SSE)
+    STREAM_POLL_SECONDS: float = 10.0       # 변경 확인 주기 (프로세스당 1회)
+    STREAM_KEEPALIVE_SECONDS: float = 15.0  # 연결 유지용 주석 전송 간격
+
+    # 응답 압축 (app.compression)
+    COMPRESSION_MIN_SIZE: int = 1024        # 이보다 작은 응답은 압축하지 않음 (bytes)
+    COMPRESSION_CACHE_MB: int = 64          # ETag 별 압축 결과 캐시 크기 (0 = 사용 안 함)
+    GZIP_LEVEL: int = 6
+    BROTLI_QUALITY: int = 5
+    ZSTD_LEVEL: int = 3
+
+    # 요청 수용 제어 (app.admission) - 비용 1 = 추정 조회 행 1,000 행
+    ADMISSION_ENABLED: bool = True
+    ADMISSION_RATE: float = 50.0                  # 클라이언트별 초당 충전 비용
+    ADMISSION_BURST: float = 500.0                # 클라이언트별 버킷 크기
+    ADMISSION_MAX_CONCURRENT: int = 8             # 동시에 실행하는 비싼 요청 수 (대량 풀 크기 근처로 설정)
+    ADMISSION_QUEUE_SIZE: int = 16                # 실행 대기열 크기 (가득 차면 503)
+    ADMISSION_QUEUE_TIMEOUT_SECONDS: float = 2.0  # 대기열 최대 대기 시간 (지나면 503)
+    ADMISSION_CLIENT_CONCURRENCY: int = 2         # 클라이언트별 동시 실행 수 (넘으면 429)
+
+    # DB 장애 대응 (app.resilience)
+    STALE_TIMEOUT_SECONDS: float = 2.0        # 응답이 이보다 늦으면 보관된 마지막 정상 응답 반환
+    STALE_MAX_AGE_SECONDS: float = 86400.0    # 이보다 오래된 보관 응답은 사용하지 않음
+    STALE_CACHE_MB: int = 128                 # 보관 응답 캐시 크기
+    STALE_MAX_ENTRY_MB: int = 4               # 응답 하나의 최대 보관 크기
+    BREAKER_FAILURE_THRESHOLD: int = 5        # 연속 DB 오류가 이 횟수에 도달하면 서킷 열림
+    BREAKER_RESET_SECONDS: float = 10.0       # 서킷이 열린 뒤 다시 시험하기까지의 시간
+
+    # 백그라운드 사전 계산 스케줄러 (app.scheduler) - 롤업, 관측소 목록 갱신, 캐시 예열
+    SCHEDULER_ENABLED: bool = True
+    SCHEDULER_JITTER_SECONDS: float = 30.0  # 실행 시각에 더하는 무작위 지연 최대값
+    WARM_TOP_N: int = 20                    # 워커별로 예열할 인기 조회 수 (0 = 예열 안 함)
+    WARM_TIMEOUT_SECONDS: float = 30.0      # 예열 요청 하나의 최대 시간
+
+    # 느린 쿼리 기록 (app.slowlog, /api/admin/slow-queries)
+    SLOW_QUERY_MS: float = 500.0            # 이 시간을 넘긴 SQL 을 기록 (ms)
+    SLOW_QUERY_BUFFER: int = 200            # 보관할 최근 기록 수
+    SLOW_QUERY_EXPLAIN_SAMPLE: float = 0.1  # EXPLAIN (ANALYZE, BUFFERS) 수집 비율 (0 = 수집 안 함)
+    ADMIN_TOKEN: str = ""                   # 관리 API 토큰 (X-Admin-Token 헤더, 비어 있으면 관리 API 비활성)
+
     @property
     def database_url(self) -> str:
         """PostgreSQL 연결 URL 생성 (psycopg3 사용)"""
-        return f"postgresql+psycopg://{self.DB_USER}:{self.DB_PASSWORD}@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}"
+        return self.database_url_for(self.DB_HOST, self.DB_PORT)
+
+    def database_url_for(self, host: str, port: int) -> str:
+        """같은 계정/DB 이름으로 다른 서버(복제본)에 접속하는 URL"""
+        return f"postgresql+psycopg://{self.DB_USER}:{self.DB_PASSWORD}@{host}:{port}/{self.DB_NAME}"
+
+    @property
+    def replica_hosts_list(self) -> list[tuple[str, int]]:
+        """읽기 복제본 (host, port) 목록 반환"""
+        hosts = []
+        for item in self.DB_REPLICA_HOSTS.split(","):
+            host, _, port = item.strip().partition(":")
+            if host:
+                hosts.append((host, int(port) if port else self.DB_PORT))
+        return hosts
 
     class Config:
         env_file = ".env"
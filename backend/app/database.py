@@ -3,36 +3,187 @@
 데이터베이스 연결 모듈
 - PostgreSQL 연결을 관리합니다.
 - 읽기 전용으로 접근합니다.
+- 읽기는 DB_REPLICA_HOSTS 의 복제본에 라운드로빈으로 분배하며 (상태 확인 실패 시 제외),
+  요청이 검증한 데이터 버전을 아직 재생하지 못한 복제본은 건너뜁니다. (require_replayed)
+  대화형(get_db)과 대량(get_bulk_db) 조회는 서로 다른 커넥션 풀을 사용합니다.
 """
 
+import itertools
+import threading
+import time
+from contextvars import ContextVar, Token
+from datetime import datetime
 from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
-from typing import Generator
+from sqlalchemy.pool import QueuePool
+from typing import Callable, Generator, Optional
 
 from .config import get_settings
 
 settings = get_settings()
 
-# SQLAlchemy 엔진 생성 (읽기 전용 권장)
-engine = create_engine(
-    settings.database_url,
-    pool_pre_ping=True,      # 연결 상태 확인 (stale connection 방지)
-    pool_size=10,            # 커넥션 풀 크기 증가
-    max_overflow=20,         # 추가 연결 허용 수 증가
-    pool_recycle=300,        # 5분마다 연결 재활용 (stale connection 방지)
-    pool_timeout=30,         # 풀에서 연결 대기 최대 시간 (초)
-    echo=settings.DEBUG      # SQL 로깅 (디버그 모드에서만)
-)
+# 읽기 경로 (경로마다 별도 커넥션 풀을 사용하여 대량 조회가 대시보드 조회를 막지 않게 함)
+INTERACTIVE = "interactive"   # 최신값, 목록 등 짧은 조회
+BULK = "bulk"                 # 기간 조회, 다운로드, 통계 등 오래 걸리는 조회
+
+# 현재 요청이 읽어야 하는 최소 변경 시각 (ETag 를 계산한 워터마크의 changed_at, app.conditional)
+# 복제본의 마지막 재생 트랜잭션 시각이 이보다 이르면 primary 에서 읽어
+# 지연된 복제본의 이전 응답이 새 ETag 로 압축 캐시에 저장되지 않도록 합니다.
+_required_replay: ContextVar[Optional[datetime]] = ContextVar("required_replay", default=None)
+
+
+def require_replayed(changed_at: datetime) -> Token:
+    """이 요청의 읽기를 changed_at 이후까지 재생한 서버로 제한 (reset_replayed 로 해제)"""
+    return _required_replay.set(changed_at)
+
+
+def reset_replayed(token: Token) -> None:
+    _required_replay.reset(token)
+
+
+class TimedQueuePool(QueuePool):
+    """커넥션 획득(checkout) 대기 시간을 관찰자에게 전달하는 QueuePool (app.metrics)"""
+
+    on_checkout_wait: Optional[Callable[[str, float], None]] = None
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            return super().connect()
+        finally:
+            if TimedQueuePool.on_checkout_wait is not None:
+                TimedQueuePool.on_checkout_wait(self.logging_name, time.perf_counter() - started)
+
 
 # 쿼리 타임아웃 설정 (30초)
-@event.listens_for(engine, "connect")
 def set_query_timeout(dbapi_connection, connection_record):
     """각 연결에 쿼리 타임아웃 설정"""
     cursor = dbapi_connection.cursor()
     cursor.execute("SET statement_timeout = '30s'")
     cursor.close()
 
+
+def create_db_engine(url: str, pool_name: str, pool_size: int, max_overflow: int) -> Engine:
+    """SQLAlchemy 엔진 생성 (풀 이름은 메트릭 라벨로 사용)"""
+    db_engine = create_engine(
+        url,
+        poolclass=TimedQueuePool,
+        pool_logging_name=pool_name,
+        pool_pre_ping=True,          # 연결 상태 확인 (stale connection 방지)
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_recycle=300,            # 5분마다 연결 재활용 (stale connection 방지)
+        pool_timeout=30,             # 풀에서 연결 대기 최대 시간 (초)
+        echo=settings.DEBUG          # SQL 로깅 (디버그 모드에서만)
+    )
+    event.listen(db_engine, "connect", set_query_timeout)
+    return db_engine
+
+
+class ReadTarget:
+    """읽기 대상 서버 하나 (읽기 경로별 엔진)"""
+
+    def __init__(self, name: str, engines: dict[str, Engine]):
+        self.name = name
+        self.engines = engines
+        self.healthy = True
+        self.replayed_at: Optional[datetime] = None  # 마지막으로 재생한 트랜잭션의 커밋 시각
+
+
+class ReadRouter:
+    """
+    읽기 요청 분배기
+    - 상태 확인을 통과한 복제본에 라운드로빈으로 분배합니다.
+    - 복제본이 없거나 모두 비정상이면 primary 에서 읽습니다.
+    - 요청에 최소 변경 시각(require_replayed)이 있으면 그 시각까지 재생한 복제본만 사용합니다.
+      재생 시각은 상태 확인 주기마다 갱신되므로 변경 직후 잠시 동안은 primary 에서 읽습니다.
+    """
+
+    def __init__(self, primary: ReadTarget, replicas: list[ReadTarget]):
+        self.primary = primary
+        self.replicas = replicas
+        self._counter = itertools.count()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def engine_for(self, lane: str) -> Engine:
+        required = _required_replay.get()
+        healthy = [
+            target for target in self.replicas
+            if target.healthy and (required is None
+                                   or (target.replayed_at is not None and target.replayed_at >= required))
+        ]
+        target = healthy[next(self._counter) % len(healthy)] if healthy else self.primary
+        return target.engines[lane]
+
+    def all_engines(self) -> list[Engine]:
+        return [e for target in (self.primary, *self.replicas) for e in target.engines.values()]
+
+    def check_health(self) -> None:
+        """복제본마다 마지막 재생 트랜잭션 시각을 조회하여 상태와 재생 위치를 갱신합니다."""
+        for target in self.replicas:
+            try:
+                with target.engines[INTERACTIVE].connect() as conn:
+                    # 복구 모드가 아니면(승격된 서버) 모든 커밋을 반영한 상태
+                    replayed_at = conn.exec_driver_sql(
+                        "SELECT CASE WHEN pg_is_in_recovery() THEN pg_last_xact_replay_timestamp() ELSE now() END"
+                    ).scalar()
+                healthy, reason = True, ""
+            except Exception as exc:
+                healthy, reason = False, str(exc).splitlines()[0]
+                replayed_at = None
+            if healthy != target.healthy:
+                print(f"[DB] 복제본 {target.name} {'복구' if healthy else '제외: ' + reason}")
+            target.healthy = healthy
+            target.replayed_at = replayed_at
+
+    def start_health_checks(self, interval: float) -> None:
+        """백그라운드 스레드에서 주기적으로 상태 확인 (복제본이 있을 때만)"""
+        if not self.replicas or self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run_health_checks, args=(interval,), name="replica-health", daemon=True
+        )
+        self._thread.start()
+
+    def stop_health_checks(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def _run_health_checks(self, interval: float) -> None:
+        while not self._stop.wait(interval):
+            self.check_health()
+
+
+# SQLAlchemy 엔진 생성 - primary (쓰기/적재/롤업, 복제본이 없으면 대화형 읽기)
+engine = create_db_engine(settings.database_url, "primary", settings.DB_POOL_SIZE, settings.DB_MAX_OVERFLOW)
+
+
+def _create_read_router() -> ReadRouter:
+    primary = ReadTarget("primary", {
+        INTERACTIVE: engine,
+        BULK: create_db_engine(settings.database_url, "primary-bulk",
+                               settings.BULK_POOL_SIZE, settings.BULK_MAX_OVERFLOW),
+    })
+    replicas = []
+    for i, (host, port) in enumerate(settings.replica_hosts_list, start=1):
+        url = settings.database_url_for(host, port)
+        replicas.append(ReadTarget(f"{host}:{port}", {
+            INTERACTIVE: create_db_engine(url, f"replica{i}",
+                                          settings.DB_POOL_SIZE, settings.DB_MAX_OVERFLOW),
+            BULK: create_db_engine(url, f"replica{i}-bulk",
+                                   settings.BULK_POOL_SIZE, settings.BULK_MAX_OVERFLOW),
+        }))
+    return ReadRouter(primary, replicas)
+
+
+read_router = _create_read_router()
+
 # 세션 팩토리 생성
 SessionLocal = sessionmaker(
     autocommit=False,
@@ -44,13 +195,31 @@ SessionLocal = sessionmaker(
 Base = declarative_base()
 
 
+def read_session(lane: str = INTERACTIVE) -> Session:
+    """읽기 경로별 세션 (복제본이 있으면 라운드로빈)"""
+    return SessionLocal(bind=read_router.engine_for(lane))
+
+
 def get_db() -> Generator[Session, None, None]:
     """
-    데이터베이스 세션 의존성
+    데이터베이스 세션 의존성 (대화형 읽기)
     - FastAPI 의존성 주입에 사용됩니다.
     - 요청 완료 후 세션을 자동으로 닫습니다.
     """
-    db = SessionLocal()
+    db = read_session(INTERACTIVE)
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+def get_bulk_db() -> Generator[Session, None, None]:
+    """
+    데이터베이스 세션 의존성 (대량 읽기)
+    - 기간 조회, 다운로드, 통계처럼 연결을 오래 쓰는 엔드포인트에 사용합니다.
+    - 별도 풀(BULK_POOL_SIZE)을 사용하므로 대량 요청이 몰려도 대화형 풀은 비어 있습니다.
+    """
+    db = read_session(BULK)
     try:
         yield db
     finally:
@@ -0,0 +1,324 @@
+"""
+결측 보완(gap filling) 모듈
+- RDA 관측소 시계열을 규칙적인 시간 격자(10분 / 1시간 / 1일)에 올리고 결측을 NumPy 로 일괄 보완합니다.
+  * interp: 짧은 결측(격자 max_interp 개 이하, 앞뒤 관측 사이)을 시간 가중 선형 보간 (풍향은 벡터 성분으로 보간)
+  * neighbor: interp + 긴 결측을 같은 도/광역시 관측소 중 상관이 가장 높은 관측소의 선형 회귀로 보완
+- 누적량(강수량, 일조/일사, 응축시간)은 보간하지 않고 이웃 회귀만 적용하며, 보완 값은 QC 물리 범위로 자릅니다.
+- 값마다 출처를 fill 컬럼({변수: "interp" | "neighbor"})으로 반환합니다. 관측 값과 보완하지 못한 결측(null)은 생략합니다.
+- 원자료 행이 없는 격자 시각의 행은 id 가 null 입니다. (보완 응답의 행은 id 가 아니라 시각으로 식별)
+- 조회 엔드포인트의 fill= 파라미터가 사용합니다. (numpy 미설치 시 501)
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Optional, Sequence
+
+from fastapi import HTTPException
+from sqlalchemy import func, select
+from sqlalchemy.orm import Query, Session
+
+from .catalogs import rda_realtime_station_catalog
+from .config import get_settings
+from .models.rda import WeatherData, WeatherDataHourly, WeatherDataDaily
+from .qc import SPECS as QC_SPECS, qc_columns
+from .serialization import select_columns
+from .wind import from_components, to_components
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+settings = get_settings()
+
+# fill 파라미터 허용 값
+FILL_PATTERN = "^(none|interp|neighbor)$"
+
+OBSERVED, INTERPOLATED, NEIGHBOR = 0, 1, 2
+SOURCE_NAMES = {INTERPOLATED: "interp", NEIGHBOR: "neighbor"}
+
+# 보간 대상 (상태량) / 이웃 회귀만 적용하는 누적량 / 벡터 성분으로 보간하는 각도
+INTERP_VARIABLES = ("temp", "hghst_artmp", "lowst_artmp", "hum", "wind", "max_wind", "gr_temp", "soil_temp", "soil_wt")
+ACCUMULATED_VARIABLES = ("rn", "sun_time", "srqty", "condens_time")
+CIRCULAR_VARIABLES = ("widdir",)
+FILL_VARIABLES = INTERP_VARIABLES + CIRCULAR_VARIABLES + ACCUMULATED_VARIABLES
+
+# 이웃 회귀에 필요한 최소 겹치는 관측 수
+MIN_OVERLAP = 48
+
+
+@dataclass(frozen=True)
+class Grid:
+    """해상도별 시간 격자"""
+    name: str
+    model: Any
+    time: str
+    step: timedelta
+    max_interp: int   # 보간하는 최대 연속 결측 수 (10분 1시간, 1시간 3시간, 1일 2일)
+
+    def column(self, name: str):
+        return getattr(self.model, name)
+
+
+GRIDS = {
+    "10min": Grid("10min", WeatherData, "datetime", timedelta(minutes=10), 6),
+    "hourly": Grid("hourly", WeatherDataHourly, "datetime", timedelta(hours=1), 3),
+    "daily": Grid("daily", WeatherDataDaily, "date", timedelta(days=1), 2),
+}
+
+
+def _as_datetime(value) -> datetime:
+    return value if isinstance(value, datetime) else datetime.combine(value, datetime.min.time())
+
+
+def interpolate(data: "np.ndarray", max_gap: int) -> "np.ndarray":
+    """
+    변수별 격자 값 [V, n] (결측 NaN) 의 짧은 결측을 앞뒤 관측 사이 선형 보간한 배열
+    (max_gap 보다 긴 결측과 양끝 결측은 NaN 유지)
+    """
+    n = data.shape[1]
+    valid = ~np.isnan(data)
+    index = np.arange(n, dtype=np.int32)
+    prev = np.maximum.accumulate(np.where(valid, index, -1), axis=1)
+    following = np.minimum.accumulate(np.where(valid, index, n)[:, ::-1], axis=1)[:, ::-1]
+    short = ~valid & (prev >= 0) & (following < n) & (following - prev - 1 <= max_gap)
+
+    out = data.copy()
+    flat = np.flatnonzero(short)
+    position = flat % n
+    row = flat - position
+    before, after = prev.ravel()[flat], following.ravel()[flat]
+    low, high = data.ravel()[row + before], data.ravel()[row + after]
+    out.ravel()[flat] = low + (high - low) * ((position - before) / (after - before))
+    return out
+
+
+def regress(target: "np.ndarray", neighbors: "np.ndarray", min_r: float) -> list[tuple[int, float, float]]:
+    """
+    이웃 관측소별 [k, n] 로 target [n] = a + b * neighbor 를 한 번에 적합합니다.
+    상관계수가 min_r 이상인 이웃의 (순번, a, b) 를 상관이 높은 순으로 반환합니다.
+    """
+    both = ~np.isnan(neighbors) & ~np.isnan(target)
+    count = both.sum(axis=1)
+    x = np.where(both, neighbors, 0.0)
+    y = np.where(both, target, 0.0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean_x, mean_y = x.sum(axis=1) / count, y.sum(axis=1) / count
+        sxx = np.einsum("ij,ij->i", x, x) - count * mean_x ** 2
+        syy = np.einsum("ij,ij->i", y, y) - count * mean_y ** 2
+        sxy = np.einsum("ij,ij->i", x, y) - count * mean_x * mean_y
+        r = sxy / np.sqrt(sxx * syy)
+        b = sxy / sxx
+    usable = (count >= MIN_OVERLAP) & (sxx > 0) & (syy > 0) & (r >= min_r)
+    order = [int(i) for i in np.argsort(-np.where(usable, r, -np.inf)) if usable[i]]
+    return [(i, float(mean_y[i] - b[i] * mean_x[i]), float(b[i])) for i in order]
+
+
+def fill_values(values: "np.ndarray", variables: Sequence[str], grid: Grid, method: str,
+                neighbors: Optional["np.ndarray"] = None) -> tuple["np.ndarray", "np.ndarray"]:
+    """
+    변수별 격자 값 [V, n] 을 보완합니다. (보완된 값, 출처 코드 int8 [V, n])
+    - neighbors: 이웃 관측소별 격자 값 [V, k, n] (같은 변수 순서, method="neighbor" 일 때)
+    """
+    filled = values.copy()
+    linear = [j for j, name in enumerate(variables) if name in INTERP_VARIABLES]
+    if linear:
+        filled[linear] = interpolate(values[linear], grid.max_interp)
+    for j, name in enumerate(variables):
+        if name in CIRCULAR_VARIABLES:
+            # 각도는 단위 벡터 성분으로 보간 (350° 와 10° 사이는 0°)
+            parts = interpolate(np.stack(to_components(values[j], 1.0)), grid.max_interp)
+            filled[j] = from_components(parts[0], parts[1])[0]
+    source = np.where(np.isnan(values) & ~np.isnan(filled), INTERPOLATED, OBSERVED).astype(np.int8)
+
+    if method != "neighbor" or neighbors is None or not neighbors.shape[1]:
+        return filled, source
+    limits = QC_SPECS["rda"].limits
+    for j, name in enumerate(variables):
+        if name in CIRCULAR_VARIABLES:
+            continue
+        missing = np.isnan(filled[j])
+        if not missing.any():
+            continue
+        # 상관이 가장 높은 이웃부터 남은 결측을 채움
+        low, high = limits.get(name, (-np.inf, np.inf))
+        for i, a, b in regress(values[j], neighbors[j], settings.FILL_NEIGHBOR_MIN_CORRELATION):
+            x = neighbors[j, i]
+            usable = missing & ~np.isnan(x)
+            filled[j, usable] = np.clip(a + b * x[usable], low, high)
+            source[j, usable] = NEIGHBOR
+            missing &= ~usable
+            if not missing.any():
+                break
+    return filled, source
+
+
+@dataclass
+class FilledSeries:
+    """격자에 올려 보완한 관측소 시계열"""
+    grid: Grid
+    start: datetime             # 첫 격자 시각
+    rows: list                  # 격자 위치의 원자료 행 (없으면 None)
+    values: "np.ndarray"        # 보완된 값 [n, V] (격자 시각 순)
+    source: "np.ndarray"        # 출처 코드 [n, V]
+    variables: tuple[str, ...]
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def time_at(self, i: int):
+        value = self.start + self.grid.step * i
+        return value.date() if self.grid.time == "date" else value
+
+
+def _first_grid_time(grid: Grid, start: datetime) -> datetime:
+    step_seconds = int(grid.step.total_seconds())
+    offset = int((start - datetime(1970, 1, 1)).total_seconds()) % step_seconds
+    return start if offset == 0 else start + timedelta(seconds=step_seconds - offset)
+
+
+def _to_grid(grid: Grid, origin: datetime, count: int, times: Sequence, values: "np.ndarray"):
+    """(시각, 값 [m, V]) 을 격자 위치로 (격자 밖은 버림, 같은 위치는 나중 값) - (위치, 격자 안 여부, 격자 값 [V, count])"""
+    stamps = np.array(times, dtype="datetime64[s]").reshape(len(times))
+    seconds = (stamps - np.datetime64(origin, "s")).astype(np.int64)
+    position = seconds // int(grid.step.total_seconds())
+    inside = (position >= 0) & (position < count)
+    out = np.full((values.shape[1], count), np.nan)
+    out[:, position[inside]] = values[inside].T
+    return position, inside, out
+
+
+def _neighbor_codes(db: Session, stn_cd: str) -> list[str]:
+    """같은 도/광역시의 다른 관측소 (최근 관측 순 FILL_NEIGHBORS 개)"""
+    catalog = rda_realtime_station_catalog
+    province = select(catalog.c.province).where(catalog.c.stn_cd == stn_cd, catalog.c.province.isnot(None))\
+        .limit(1).scalar_subquery()
+    rows = db.execute(
+        select(catalog.c.stn_cd)
+        .where(catalog.c.province == province, catalog.c.stn_cd != stn_cd)
+        .group_by(catalog.c.stn_cd)
+        .order_by(func.max(catalog.c.last_datetime).desc())
+        .limit(settings.FILL_NEIGHBORS)
+    ).all()
+    return [r.stn_cd for r in rows]
+
+
+def load_filled(db: Session, grid: Grid, stn_cd: str, start: Optional[datetime], end: Optional[datetime],
+                keys: Sequence[str], method: str, qc: str = "none") -> Optional[FilledSeries]:
+    """
+    관측소의 [start, end] 구간을 격자에 올려 보완합니다. (구간에 관측이 없으면 None)
+    - end 미지정 시 관측소의 마지막 관측, start 미지정 시 end 이전 FILL_DEFAULT_DAYS 일 (첫 관측 이후)
+    - 보간 기준점을 위해 구간 앞뒤 max_interp 격자만큼 더 읽습니다.
+    - qc=strict 이면 QC 플래그가 선 값(10분 자료)도 결측으로 보고 보완합니다.
+    """
+    if np is None:
+        raise HTTPException(status_code=501, detail="fill 을 사용하려면 서버에 numpy 가 설치되어 있어야 합니다.")
+
+    time_column, key_column = grid.column(grid.time), grid.column("stn_cd")
+    if start is None or end is None:
+        first, last = db.execute(
+            select(func.min(time_column), func.max(time_column)).where(key_column == stn_cd)
+        ).one()
+        if first is None:
+            return None
+        end = end or _as_datetime(last)
+        start = start or max(_as_datetime(first), end - timedelta(days=settings.FILL_DEFAULT_DAYS))
+    if start > end:
+        return None
+
+    first_time = _first_grid_time(grid, start)
+    points = int((end - first_time) / grid.step) + 1 if end >= first_time else 0
+    if points > settings.FILL_MAX_POINTS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"fill 조회 구간은 격자 {settings.FILL_MAX_POINTS}개 이하여야 합니다. (요청 {points}개)"
+        )
+    if points == 0:
+        return None
+
+    margin = grid.max_interp + 1
+    origin = first_time - grid.step * margin
+    count = points + 2 * margin
+    lo, hi = origin, origin + grid.step * count
+    if grid.time == "date":
+        lo, hi = lo.date(), hi.date()
+
+    def station_query(codes) -> Query:
+        return db.query(grid.model).filter(key_column.in_(codes), time_column >= lo, time_column < hi)
+
+    def columns(query: Query, wanted: Sequence[str]) -> Query:
+        if grid.model is WeatherData:
+            return qc_columns(query, "rda", wanted, qc)
+        return select_columns(query, grid.model, wanted)
+
+    variables = tuple(k for k in keys if k in FILL_VARIABLES)
+    rows = columns(station_query([stn_cd]), keys).order_by(time_column).all()
+    time_index = keys.index(grid.time)
+    value_index = [keys.index(v) for v in variables]
+    raw = np.array([[np.nan if r[i] is None else r[i] for i in value_index] for r in rows],
+                   dtype=np.float64).reshape(len(rows), len(variables))
+    position, inside, values = _to_grid(grid, origin, count, [r[time_index] for r in rows], raw)
+    window = slice(margin, margin + points)
+    if not inside[(position >= window.start) & (position < window.stop)].any():
+        return None
+
+    neighbors = None
+    if method == "neighbor":
+        first_pass, _ = fill_values(values, variables, grid, "interp")
+        if np.isnan(first_pass[:, window]).any():
+            codes = _neighbor_codes(db, stn_cd)
+            if codes:
+                wanted = ("stn_cd", grid.time) + variables
+                by_code: dict[str, list] = {}
+                for r in columns(station_query(codes), wanted):
+                    by_code.setdefault(r[0], []).append(r)
+                series = []
+                for picked in by_code.values():
+                    data = np.array([[np.nan if v is None else v for v in r[2:]] for r in picked],
+                                    dtype=np.float64).reshape(len(picked), len(variables))
+                    _, _, grid_values = _to_grid(grid, origin, count, [r[1] for r in picked], data)
+                    # 이웃의 짧은 결측도 보간한 뒤 회귀에 사용
+                    series.append(fill_values(grid_values, variables, grid, "interp")[0])
+                neighbors = np.stack(series, axis=1) if series else None
+
+    filled, source = fill_values(values, variables, grid, method, neighbors)
+    by_position = {int(p): row for p, row, ok in zip(position, rows, inside) if ok}
+    return FilledSeries(
+        grid=grid,
+        start=first_time,
+        rows=[by_position.get(p) for p in range(window.start, window.stop)],
+        values=filled[:, window].T,
+        source=source[:, window].T,
+        variables=variables,
+    )
+
+
+def filled_rows(series: FilledSeries, keys: Sequence[str], descending: bool,
+                offset: int, limit: int) -> list[tuple]:
+    """격자 시계열 페이지를 keys + ("fill",) 순서의 튜플 목록으로 (원자료가 없는 격자 행의 id 는 None)"""
+    n = len(series)
+    page = [n - 1 - i for i in range(offset, min(offset + limit, n))] if descending \
+        else list(range(offset, min(offset + limit, n)))
+    # 원자료가 없는 격자 행의 관측소 정보는 가장 최근 원자료 행에서
+    template = next(r for r in reversed(series.rows) if r is not None)
+    shared = {key: template[k] for k, key in enumerate(keys) if key in ("stn_cd", "stn_name", "province")}
+    variable_index = {name: j for j, name in enumerate(series.variables)}
+    time_key = series.grid.time
+
+    out = []
+    for i in page:
+        row, values, sources = series.rows[i], series.values[i], series.source[i]
+        record = []
+        for k, key in enumerate(keys):
+            j = variable_index.get(key)
+            if j is not None and sources[j] != OBSERVED:
+                record.append(round(float(values[j]), 2))
+            elif key == time_key:
+                record.append(series.time_at(i))
+            elif row is not None:
+                record.append(row[k])
+            else:
+                record.append(shared.get(key))
+        record.append({name: SOURCE_NAMES[int(code)] for name, code in zip(series.variables, sources) if code})
+        out.append(tuple(record))
+    return out
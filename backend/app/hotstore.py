@@ -0,0 +1,454 @@
+"""
+실시간 자료 핫 스토어 (프로세스 메모리, 최근 HOTSTORE_WINDOW_HOURS 시간)
+- 대부분의 트래픽(현재 날씨 화면의 /api/kma/realtime/latest/pivot, /today/{region_name},
+  /api/rda/weather/realtime/latest)은 최근 하루 이틀의 weather_realtime / weather_data 만 읽습니다.
+- 지역/관측소마다 시각으로 슬롯이 정해지는 NumPy 링 버퍼(슬롯 × 변수)에 최근 자료를 보관하고,
+  위 엔드포인트는 DB 왕복 없이 메모리에서 응답합니다.
+- 시작 시 전체 구간을 읽고, 이후 data_versions 가 바뀌면(변경 알림 또는 HOTSTORE_POLL_SECONDS 폴링)
+  최근 HOTSTORE_REFRESH_HOURS 시간을 다시 읽어 덮어씁니다.
+  구간 안의 오래된 정정까지 반영하도록 HOTSTORE_FULL_RELOAD_MINUTES 마다 전체를 다시 읽습니다.
+- 갱신은 배열을 복사한 새 스냅샷을 만든 뒤 참조를 교체하므로, 요청 스레드는 잠금 없이 읽습니다.
+- 스냅샷 버전이 현재 워터마크(ETag 계산에 쓰는 값)와 다르거나, 요청한 개수만큼의 자료가 구간 안에 없으면
+  None 을 반환하여 라우터가 DB 로 조회합니다. 따라서 응답은 항상 DB 조회 결과와 같습니다.
+- 메모리는 지역/관측소 수(최대 HOTSTORE_MAX_KEYS) × 슬롯 수 × 변수 수 × 8 bytes 로 고정됩니다.
+- numpy 가 없으면 비활성화되고 모든 요청을 DB 로 조회합니다.
+"""
+
+import asyncio
+import contextvars
+import time
+from datetime import date, datetime, timedelta
+from typing import Any, Callable, Optional, Sequence
+
+from sqlalchemy import select
+
+from .config import get_settings
+from .database import SessionLocal
+from .metrics import HOTSTORE_BYTES, HOTSTORE_KEYS, HOTSTORE_REQUESTS
+from .models.kma import WeatherRealtime
+from .models.rda import WeatherData
+from .watermark import watermarks
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+settings = get_settings()
+
+EPOCH = datetime(1970, 1, 1)
+EMPTY = -1                  # 비어 있는 슬롯의 시각
+NULL_INT = -(2 ** 63)       # 정수 컬럼의 NULL
+
+# 보관하는 KMA 카테고리 (피벗 / 오늘 그래프 응답 컬럼)
+KMA_CATEGORIES = ("T1H", "RN1", "UUU", "VVV", "REH", "PTY", "VEC", "WSD")
+
+# 보관하는 RDA 10분 자료 컬럼
+RDA_VALUES = (
+    "temp", "hghst_artmp", "lowst_artmp", "hum", "widdir", "wind", "max_wind",
+    "rn", "sun_time", "srqty", "condens_time", "gr_temp", "soil_temp", "soil_wt",
+)
+RDA_INTS = ("id", "created_at")   # created_at 은 epoch 마이크로초
+
+
+def to_seconds(value: datetime) -> int:
+    """naive 일시 → epoch 초 (DB 의 TIMESTAMP 와 같은 로컬 기준, 시간대 변환 없음)"""
+    return (value - EPOCH) // timedelta(seconds=1)
+
+
+def from_seconds(seconds: int) -> datetime:
+    return EPOCH + timedelta(seconds=int(seconds))
+
+
+def slot_seconds(base_date: date, base_time: Optional[str]) -> Optional[int]:
+    """발표일자 + 발표시각(HHMM) → epoch 초 (형식 오류는 None)"""
+    if not base_time or len(base_time) != 4 or not base_time.isdigit():
+        return None
+    return (base_date.toordinal() - EPOCH.toordinal()) * 86400 \
+        + int(base_time[:2]) * 3600 + int(base_time[2:]) * 60
+
+
+class RingBuffers:
+    """
+    키(지역/관측소)별 링 버퍼 묶음
+    - times[k, s]: 슬롯 s 의 시각 (epoch 초, 비어 있으면 EMPTY). 슬롯 = (시각 // step) % capacity
+    - values[k, s, v]: 실수 변수 (NULL = NaN), ints[k, s, i]: 정수 변수 (NULL = NULL_INT)
+    - 스냅샷으로 공개된 뒤에는 바꾸지 않습니다. (갱신은 copy() 후 교체)
+    """
+
+    def __init__(self, step: int, capacity: int, columns: Sequence[str], int_columns: Sequence[str] = ()):
+        self.step = step
+        self.capacity = capacity
+        self.columns = tuple(columns)
+        self.int_columns = tuple(int_columns)
+        self.keys: list[str] = []
+        self.index: dict[str, int] = {}
+        self.attrs: dict[str, tuple] = {}       # 키별 부가 정보 (sido, 관측소명 등 - 최신 값)
+        self.rank = np.zeros(0, dtype=np.int64)  # 키 이름 정렬 순위 (동시각 정렬용)
+        self.times = np.full((0, capacity), EMPTY, dtype=np.int64)
+        self.values = np.full((0, capacity, len(self.columns)), np.nan)
+        self.ints = np.full((0, capacity, len(self.int_columns)), NULL_INT, dtype=np.int64)
+        self.version = -1          # 반영된 data_versions 버전
+        self.overflow = False      # HOTSTORE_MAX_KEYS 를 넘어 보관하지 못한 키가 있음
+        self.complete = True       # 구간 안의 자료를 모두 보관함 (먼 미래 시각 / 키 없는 행이 있으면 False)
+        self.loaded_at = 0.0       # 마지막 전체 적재 시각 (monotonic)
+
+    @property
+    def nbytes(self) -> int:
+        return self.times.nbytes + self.values.nbytes + self.ints.nbytes
+
+    def copy(self) -> "RingBuffers":
+        new = RingBuffers.__new__(RingBuffers)
+        new.__dict__.update(self.__dict__)
+        new.keys = list(self.keys)
+        new.index = dict(self.index)
+        new.attrs = dict(self.attrs)
+        new.times = self.times.copy()
+        new.values = self.values.copy()
+        new.ints = self.ints.copy()
+        return new
+
+    def ensure_keys(self, names: Sequence[str], max_keys: int) -> None:
+        """새 키를 한 번에 추가 (상한을 넘는 키는 버리고 overflow 표시)"""
+        new = [n for n in dict.fromkeys(names) if n not in self.index]
+        if len(self.keys) + len(new) > max_keys:
+            new = new[:max(max_keys - len(self.keys), 0)]
+            self.overflow = True
+        if not new:
+            return
+        for name in new:
+            self.index[name] = len(self.keys)
+            self.keys.append(name)
+        n = len(new)
+        self.times = np.concatenate([self.times, np.full((n, self.capacity), EMPTY, dtype=np.int64)])
+        self.values = np.concatenate([self.values, np.full((n, self.capacity, len(self.columns)), np.nan)])
+        self.ints = np.concatenate(
+            [self.ints, np.full((n, self.capacity, len(self.int_columns)), NULL_INT, dtype=np.int64)]
+        )
+        self.rank = np.argsort(np.argsort(np.array(self.keys, dtype=object))).astype(np.int64)
+
+    def clear_since(self, since: int) -> None:
+        """since 이후 슬롯을 비움 (구간을 다시 읽기 전 - 삭제된 행 반영)"""
+        stale = self.times >= since
+        self.times[stale] = EMPTY
+        self.values[stale] = np.nan
+        self.ints[stale] = NULL_INT
+
+    def slots(self, seconds: "np.ndarray") -> "np.ndarray":
+        return (seconds // self.step) % self.capacity
+
+    def window(self, key_rows: "np.ndarray", since: int) -> tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+        """key_rows 키들의 since 이후 슬롯 → (키 행 번호, 슬롯, 시각) 배열"""
+        times = self.times[key_rows]
+        k, s = np.nonzero(times >= since)
+        return key_rows[k], s, times[k, s]
+
+
+def _rows(values: "np.ndarray") -> list[list]:
+    """[행, 변수] 배열 → 파이썬 값 목록 (NaN → None)"""
+    return [[None if v != v else v for v in row] for row in values.tolist()]
+
+
+def _slot_labels(times: "np.ndarray") -> dict[int, tuple[date, str]]:
+    """시각(epoch 초) → (base_date, base_time) - 같은 시각은 한 번만 변환"""
+    labels = {}
+    for seconds in set(times.tolist()):
+        moment = from_seconds(seconds)
+        labels[seconds] = (moment.date(), moment.strftime("%H%M"))
+    return labels
+
+
+class HotStore:
+    """weather_realtime(KMA, 1시간 슬롯) / weather_data(RDA, 10분 슬롯) 링 버퍼와 갱신 태스크"""
+
+    def __init__(self, window_hours: int, refresh_hours: int, max_keys: int,
+                 poll_seconds: float, full_reload_minutes: float):
+        self.window = window_hours * 3600
+        self.refresh = refresh_hours * 3600
+        self.max_keys = max_keys
+        self.poll_seconds = poll_seconds
+        self.full_reload = full_reload_minutes * 60
+        self.kma: Optional[RingBuffers] = None
+        self.rda: Optional[RingBuffers] = None
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+
+    # ===== 적재 =====
+
+    def _new_buffers(self, step: int, columns: Sequence[str], int_columns: Sequence[str] = ()) -> RingBuffers:
+        # 구간 + 여유 2시간 (발표 지연, 시계 차이로 구간 경계의 슬롯이 덮이지 않도록)
+        capacity = (self.window + 2 * 3600) // step
+        return RingBuffers(step, capacity, columns, int_columns)
+
+    def _load_kma(self, db, current: Optional[RingBuffers], version: int, full: bool) -> RingBuffers:
+        now = to_seconds(datetime.now())
+        since = now - (self.window if full else self.refresh)
+        buffers = self._new_buffers(3600, KMA_CATEGORIES) if full or current is None else current.copy()
+
+        rows = db.execute(
+            select(
+                WeatherRealtime.sido, WeatherRealtime.region_name, WeatherRealtime.base_date,
+                WeatherRealtime.base_time, WeatherRealtime.category, WeatherRealtime.obsrvalue,
+            ).where(WeatherRealtime.base_date >= from_seconds(since).date())
+        ).all()
+
+        # 피벗하지 않는 카테고리도 발표 시각(행)은 만들므로 시각만 기록 (열 번호 -1)
+        column = {c: i for i, c in enumerate(KMA_CATEGORIES)}
+        parsed = []
+        for sido, region, base_date, base_time, category, value in rows:
+            seconds = slot_seconds(base_date, base_time) if region else None
+            if seconds is None or seconds > now + 3600:
+                buffers.complete = False
+            elif seconds >= since:
+                parsed.append((sido, region, seconds, column.get(category, -1), value))
+        parsed.sort(key=lambda r: r[2])
+
+        buffers.ensure_keys([r[1] for r in parsed], self.max_keys)
+        buffers.clear_since(since)
+        parsed = [r for r in parsed if r[1] in buffers.index]
+        if parsed:
+            k = np.array([buffers.index[r[1]] for r in parsed], dtype=np.int64)
+            seconds = np.array([r[2] for r in parsed], dtype=np.int64)
+            columns = np.array([r[3] for r in parsed], dtype=np.int64)
+            values = np.array([np.nan if r[4] is None else r[4] for r in parsed], dtype=np.float64)
+            s = buffers.slots(seconds)
+            # 다른 시각이 차지하던 슬롯은 먼저 비우고 카테고리 값을 채움
+            reused = buffers.times[k, s] != seconds
+            buffers.values[k[reused], s[reused]] = np.nan
+            buffers.times[k, s] = seconds
+            known = columns >= 0
+            buffers.values[k[known], s[known], columns[known]] = values[known]
+            for sido, region, *_ in parsed:  # 시각 오름차순이므로 최신 sido 가 남음
+                buffers.attrs[region] = (sido,)
+        buffers.version = version
+        if full:
+            buffers.loaded_at = time.monotonic()
+        return buffers
+
+    def _load_rda(self, db, current: Optional[RingBuffers], version: int, full: bool) -> RingBuffers:
+        now = to_seconds(datetime.now())
+        since = now - (self.window if full else self.refresh)
+        buffers = self._new_buffers(600, RDA_VALUES, RDA_INTS) if full or current is None else current.copy()
+
+        rows = db.execute(
+            select(
+                WeatherData.stn_cd, WeatherData.stn_name, WeatherData.province, WeatherData.datetime,
+                WeatherData.id, WeatherData.created_at, *(getattr(WeatherData, c) for c in RDA_VALUES),
+            ).where(WeatherData.datetime >= from_seconds(since)).order_by(WeatherData.datetime)
+        ).all()
+
+        if any(r[0] is None or to_seconds(r[3]) > now + 3600 for r in rows):
+            buffers.complete = False
+        rows = [r for r in rows if r[0] is not None and to_seconds(r[3]) <= now + 3600]
+
+        buffers.ensure_keys([r[0] for r in rows], self.max_keys)
+        buffers.clear_since(since)
+        rows = [r for r in rows if r[0] in buffers.index]
+        if rows:
+            k = np.array([buffers.index[r[0]] for r in rows], dtype=np.int64)
+            seconds = np.array([to_seconds(r[3]) for r in rows], dtype=np.int64)
+            s = buffers.slots(seconds)
+            buffers.times[k, s] = seconds
+            buffers.values[k, s] = np.array(
+                [[np.nan if v is None else v for v in r[6:]] for r in rows], dtype=np.float64
+            )
+            buffers.ints[k, s] = np.array([
+                (NULL_INT if r[4] is None else r[4],
+                 NULL_INT if r[5] is None else (r[5] - EPOCH) // timedelta(microseconds=1))
+                for r in rows
+            ], dtype=np.int64)
+            for r in rows:  # 시각 오름차순이므로 최신 관측소명/지역이 남음
+                buffers.attrs[r[0]] = (r[1], r[2])
+        buffers.version = version
+        if full:
+            buffers.loaded_at = time.monotonic()
+        return buffers
+
+    def refresh_once(self) -> list[str]:
+        """버전이 바뀐 스토어를 다시 읽습니다. (스레드에서 실행) 갱신한 스토어 이름 목록 반환"""
+        watermarks.invalidate()
+        versions = watermarks.get_all()
+        refreshed = []
+        db = SessionLocal()
+        try:
+            for name, table, loader in (("kma", "weather_realtime", self._load_kma),
+                                        ("rda", "weather_data", self._load_rda)):
+                mark = versions.get(table)
+                if mark is None:
+                    continue
+                current: Optional[RingBuffers] = getattr(self, name)
+                full = current is None or time.monotonic() - current.loaded_at > self.full_reload
+                if not full and current.version == mark.version:
+                    continue
+                buffers = loader(db, current, mark.version, full)
+                setattr(self, name, buffers)
+                HOTSTORE_KEYS.labels(name).set(len(buffers.keys))
+                HOTSTORE_BYTES.labels(name).set(buffers.nbytes)
+                refreshed.append(name)
+        finally:
+            db.close()
+        return refreshed
+
+    # ===== 갱신 태스크 =====
+
+    def start(self) -> None:
+        if np is None:
+            print("[HOTSTORE] numpy 가 설치되지 않아 비활성화 (DB 조회)")
+            return
+        if self._task is None:
+            self._wakeup = asyncio.Event()
+            # 요청 컨텍스트(요청별 메트릭 등)를 물려받지 않도록 빈 컨텍스트에서 실행
+            self._task = asyncio.create_task(self._run(), context=contextvars.Context())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    def on_tables_changed(self, tables: Optional[frozenset[str]]) -> None:
+        """변경 알림(app.notify) - 보관 중인 테이블이 바뀌었으면 폴링 주기를 기다리지 않고 갱신"""
+        if self._wakeup is not None and (tables is None or {"weather_realtime", "weather_data"} & tables):
+            self._wakeup.set()
+
+    async def _run(self) -> None:
+        while True:
+            started = time.perf_counter()
+            try:
+                refreshed = await asyncio.to_thread(self.refresh_once)
+            except Exception as exc:
+                print(f"[HOTSTORE] 갱신 실패: {exc}")
+            else:
+                if refreshed:
+                    print(f"[HOTSTORE] {', '.join(refreshed)} 갱신 ({time.perf_counter() - started:.2f}초)")
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_seconds)
+            except asyncio.TimeoutError:
+                pass
+
+    # ===== 조회 (None = DB 로 조회) =====
+
+    def _ready(self, buffers: Optional[RingBuffers], table: str) -> bool:
+        if buffers is None or not buffers.complete:
+            return False
+        mark = watermarks.get(table)
+        return mark is not None and mark.version == buffers.version
+
+    def _key_rows(self, buffers: RingBuffers, key: Optional[str],
+                  match: Optional[Callable[[str], bool]] = None) -> Optional["np.ndarray"]:
+        """조회 대상 키 행 번호 (구간 안에 자료가 없는 키는 빈 배열, 보관하지 못한 키가 있을 수 있으면 None)"""
+        if key is not None:
+            if key in buffers.index:
+                return np.array([buffers.index[key]], dtype=np.int64)
+            return None if buffers.overflow else np.zeros(0, dtype=np.int64)
+        if buffers.overflow:
+            return None
+        if match is None:
+            return np.arange(len(buffers.keys), dtype=np.int64)
+        return np.array([i for i, name in enumerate(buffers.keys) if match(name)], dtype=np.int64)
+
+    def kma_latest_pivot(self, sido: Optional[str], region_name: Optional[str], limit: int) -> Optional[list[tuple]]:
+        """/api/kma/realtime/latest/pivot - (sido, region_name, base_date, base_time, *KMA_CATEGORIES) 행"""
+        buffers = self.kma
+        if not self._ready(buffers, "weather_realtime"):
+            return self._miss("kma")
+        match = (lambda name: buffers.attrs[name][0] == sido) if sido else None
+        rows = self._key_rows(buffers, region_name, match)
+        if rows is None:
+            return self._miss("kma")
+        if sido and region_name and len(rows) and buffers.attrs[region_name][0] != sido:
+            rows = rows[:0]
+
+        since = to_seconds(datetime.now()) - self.window
+        k, s, t = buffers.window(rows, since)
+        # 구간 밖의 더 오래된 발표가 결과에 들어갈 수 있으면 DB 로 조회
+        if len(t) < limit:
+            return self._miss("kma")
+        order = np.lexsort((buffers.rank[k], -t))[:limit]
+        k, s, t = k[order], s[order], t[order]
+
+        labels = _slot_labels(t)
+        result = []
+        for key_row, seconds, values in zip(k.tolist(), t.tolist(), _rows(buffers.values[k, s])):
+            name = buffers.keys[key_row]
+            result.append((buffers.attrs[name][0], name, *labels[seconds], *values))
+        return self._hit("kma", result)
+
+    def kma_today(self, region_name: str, categories: Sequence[str]) -> Optional[list[tuple]]:
+        """/api/kma/realtime/today/{region_name} - (region_name, base_date, base_time, *categories) 행"""
+        buffers = self.kma
+        if not self._ready(buffers, "weather_realtime"):
+            return self._miss("kma")
+        rows = self._key_rows(buffers, region_name)
+        if rows is None:
+            return self._miss("kma")
+
+        today = to_seconds(datetime.combine(date.today(), datetime.min.time()))
+        k, s, t = buffers.window(rows, today)
+        keep = np.nonzero(t < today + 86400)[0]
+        order = keep[np.argsort(t[keep])]
+        k, s, t = k[order], s[order], t[order]
+        columns = [KMA_CATEGORIES.index(c) for c in categories]
+
+        labels = _slot_labels(t)
+        result = [
+            (region_name, *labels[seconds], *values)
+            for seconds, values in zip(t.tolist(), _rows(buffers.values[k, s][:, columns]))
+        ]
+        return self._hit("kma", result)
+
+    def rda_latest(self, stn_cd: Optional[str], limit: int, keys: Sequence[str]) -> Optional[list[tuple]]:
+        """/api/rda/weather/realtime/latest - keys 순서의 10분 자료 행 (최신순)"""
+        buffers = self.rda
+        if not self._ready(buffers, "weather_data"):
+            return self._miss("rda")
+        rows = self._key_rows(buffers, stn_cd)
+        if rows is None:
+            return self._miss("rda")
+
+        since = to_seconds(datetime.now()) - self.window
+        k, s, t = buffers.window(rows, since)
+        if len(t) < limit:
+            return self._miss("rda")
+        if len(t) > limit:
+            top = np.argpartition(-t, limit - 1)[:limit]
+            k, s, t = k[top], s[top], t[top]
+        order = np.lexsort((buffers.rank[k], -t))
+        k, s, t = k[order], s[order], t[order]
+
+        result = []
+        for key_row, seconds, values, (row_id, created) in zip(
+            k.tolist(), t.tolist(), _rows(buffers.values[k, s]), buffers.ints[k, s].tolist()
+        ):
+            name = buffers.keys[key_row]
+            stn_name, province = buffers.attrs[name]
+            row: dict[str, Any] = dict(zip(RDA_VALUES, values))
+            row.update(
+                id=None if row_id == NULL_INT else row_id,
+                stn_cd=name, stn_name=stn_name, province=province,
+                datetime=from_seconds(seconds),
+                created_at=None if created == NULL_INT else EPOCH + timedelta(microseconds=created),
+            )
+            result.append(tuple(row[key] for key in keys))
+        return self._hit("rda", result)
+
+    @staticmethod
+    def _hit(store: str, result: list[tuple]) -> list[tuple]:
+        HOTSTORE_REQUESTS.labels(store, "hit").inc()
+        return result
+
+    @staticmethod
+    def _miss(store: str) -> None:
+        HOTSTORE_REQUESTS.labels(store, "miss").inc()
+        return None
+
+
+# 프로세스 공용 인스턴스
+hot_store = HotStore(
+    window_hours=settings.HOTSTORE_WINDOW_HOURS,
+    refresh_hours=settings.HOTSTORE_REFRESH_HOURS,
+    max_keys=settings.HOTSTORE_MAX_KEYS,
+    poll_seconds=settings.HOTSTORE_POLL_SECONDS,
+    full_reload_minutes=settings.HOTSTORE_FULL_RELOAD_MINUTES,
+)
@@ -0,0 +1,313 @@
+"""
+대량 적재 CLI (COPY + upsert)
+- KMA/RDA API 덤프(CSV, JSON, JSON Lines)를 COPY 로 임시 스테이징 테이블에 적재한 뒤
+  자연키 기준 INSERT ... ON CONFLICT DO UPDATE 로 병합합니다.
+- 배치마다 파생 데이터(시간별 집계 등)를 갱신합니다.
+
+사용법:
+    cd backend
+    python -m app.ingest weather_data dump/rda_10min_*.csv
+    python -m app.ingest asos_daily_data asos.json --batch-size 50000
+    python -m app.ingest weather_realtime ncst.csv --encoding cp949
+
+필드명은 대소문자/밑줄을 무시하고 컬럼명과 매칭합니다. (예: stnId → stn_id, obsrValue → obsrvalue)
+컬럼과 매칭되지 않는 필드는 무시합니다.
+"""
+
+import argparse
+import csv
+import json
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Iterator, Optional
+
+from sqlalchemy.dialects import postgresql
+
+from .database import SessionLocal, engine
+from .models import (
+    AsosDailyData,
+    WeatherRealtime,
+    WeatherShortForecast,
+    WeatherMidForecast,
+    WeatherData,
+    WeatherDataDaily,
+    WeatherDataMonthly,
+)
+from .rollup import rollup_hourly
+
+# COPY 스트리밍 단위 (바이트)
+COPY_CHUNK_SIZE = 1 << 20
+
+# 파이썬 코덱 → PostgreSQL 인코딩명
+PG_ENCODINGS = {
+    "utf-8": "UTF8",
+    "utf-8-sig": "UTF8",
+    "cp949": "UHC",
+    "euc-kr": "EUC_KR",
+}
+
+# 적재 대상에서 제외할 컬럼 (DB 기본값 사용)
+SKIP_COLUMNS = {"id", "created_at"}
+
+
+@dataclass
+class TableSpec:
+    """적재 대상 테이블 정의"""
+    model: type
+    key: list[str]  # 자연키 (유니크 인덱스와 일치)
+
+    @property
+    def table(self) -> str:
+        return self.model.__tablename__
+
+    @property
+    def columns(self) -> dict[str, str]:
+        """적재 컬럼명 → PostgreSQL 타입"""
+        dialect = postgresql.dialect()
+        return {
+            c.name: c.type.compile(dialect=dialect)
+            for c in self.model.__table__.columns
+            if c.name not in SKIP_COLUMNS
+        }
+
+
+TABLES = {
+    spec.table: spec
+    for spec in (
+        TableSpec(AsosDailyData, ["stn_id", "tm"]),
+        TableSpec(WeatherRealtime, ["region_name", "base_date", "base_time", "category"]),
+        TableSpec(WeatherShortForecast, ["region_name", "base_date", "base_time", "fcst_date", "fcst_time", "category"]),
+        TableSpec(WeatherMidForecast, ["reg_id", "tm_fc", "forecast_date", "time_period"]),
+        TableSpec(WeatherData, ["stn_cd", "datetime"]),
+        TableSpec(WeatherDataDaily, ["stn_cd", "date"]),
+        TableSpec(WeatherDataMonthly, ["stn_cd", "date"]),
+    )
+}
+
+
+@dataclass
+class BatchResult:
+    """배치 적재 결과"""
+    table: str
+    staged: int
+    merged: int
+    # 배치에 포함된 시간 범위 (파생 데이터 갱신용, 시간 컬럼이 없으면 None)
+    min_time: Optional[datetime] = None
+    max_time: Optional[datetime] = None
+
+
+# ===== 배치 후처리 훅 =====
+
+def refresh_hourly_rollup(result: BatchResult) -> None:
+    """10분 자료 적재 구간의 시간별 집계를 다시 계산합니다."""
+    if result.min_time is None:
+        return
+    db = SessionLocal()
+    try:
+        rollup_hourly(db, result.min_time, result.max_time)
+    finally:
+        db.close()
+
+
+# 테이블별 배치 후처리 (파생 스냅샷 갱신)
+AFTER_BATCH: dict[str, list[Callable[[BatchResult], None]]] = {
+    "weather_data": [refresh_hourly_rollup],
+}
+
+# 배치 시간 범위를 기록할 컬럼
+TIME_COLUMNS = {
+    "weather_data": "datetime",
+}
+
+
+# ===== 필드명 매칭 =====
+
+def _normalize(name: str) -> str:
+    return name.strip().lower().replace("_", "")
+
+
+def map_fields(spec: TableSpec, fields: list[str]) -> list[Optional[str]]:
+    """입력 필드명 목록을 테이블 컬럼명 목록으로 변환합니다. (매칭 실패 시 None)"""
+    lookup = {_normalize(c): c for c in spec.columns}
+    mapped = [lookup.get(_normalize(f)) for f in fields]
+
+    missing = [k for k in spec.key if k not in mapped]
+    if missing:
+        raise ValueError(f"{spec.table}: 자연키 필드가 없습니다: {', '.join(missing)}")
+    return mapped
+
+
+# ===== 스테이징 / 병합 =====
+
+def _create_staging(cursor, width: int) -> None:
+    """입력 필드 수만큼 text 컬럼을 가진 임시 스테이징 테이블 생성"""
+    cols = ", ".join(f"c{i} text" for i in range(width))
+    cursor.execute(
+        f"CREATE TEMP TABLE _stage (_seq bigint GENERATED ALWAYS AS IDENTITY, {cols}) ON COMMIT DROP"
+    )
+
+
+def _merge(cursor, spec: TableSpec, mapped: list[Optional[str]]) -> BatchResult:
+    """스테이징 테이블을 자연키 기준으로 대상 테이블에 upsert 합니다."""
+    types = spec.columns
+    positions = {col: i for i, col in enumerate(mapped) if col is not None}
+    target = list(positions)
+
+    select_exprs = [
+        f"nullif(trim(c{positions[col]}), '')::{types[col]} AS {col}" for col in target
+    ]
+    key_list = ", ".join(spec.key)
+    updates = ", ".join(f"{col} = EXCLUDED.{col}" for col in target if col not in spec.key)
+    conflict_action = f"DO UPDATE SET {updates}" if updates else "DO NOTHING"
+
+    # 같은 배치 안의 중복 자연키는 마지막 행을 사용
+    cursor.execute(f"""
+        INSERT INTO {spec.table} ({", ".join(target)})
+        SELECT DISTINCT ON ({key_list}) {", ".join(target)}
+        FROM (SELECT _seq, {", ".join(select_exprs)} FROM _stage) s
+        WHERE {" AND ".join(f"{k} IS NOT NULL" for k in spec.key)}
+        ORDER BY {key_list}, _seq DESC
+        ON CONFLICT ({key_list}) {conflict_action}
+    """)
+    merged = cursor.rowcount
+
+    cursor.execute("SELECT count(*) FROM _stage")
+    staged = cursor.fetchone()[0]
+
+    result = BatchResult(table=spec.table, staged=staged, merged=merged)
+
+    time_col = TIME_COLUMNS.get(spec.table)
+    if time_col in positions:
+        cursor.execute(
+            f"SELECT min(c{positions[time_col]}::timestamp), max(c{positions[time_col]}::timestamp) "
+            f"FROM _stage WHERE nullif(trim(c{positions[time_col]}), '') IS NOT NULL"
+        )
+        result.min_time, result.max_time = cursor.fetchone()
+
+    return result
+
+
+def _run_batch(spec: TableSpec, fields: list[str], load: Callable) -> BatchResult:
+    """스테이징 생성 → COPY(load) → 병합 → 커밋을 하나의 트랜잭션으로 실행합니다."""
+    mapped = map_fields(spec, fields)
+    raw = engine.raw_connection()
+    try:
+        with raw.driver_connection.cursor() as cursor:
+            # 대량 적재는 API 쿼리 타임아웃(30초)을 적용하지 않음
+            cursor.execute("SET LOCAL statement_timeout = 0")
+            _create_staging(cursor, len(fields))
+            load(cursor)
+            result = _merge(cursor, spec, mapped)
+        raw.commit()
+    except Exception:
+        raw.rollback()
+        raise
+    finally:
+        raw.close()
+
+    for hook in AFTER_BATCH.get(spec.table, []):
+        hook(result)
+    return result
+
+
+def _copy_columns(width: int) -> str:
+    return ", ".join(f"c{i}" for i in range(width))
+
+
+# ===== 입력 형식별 적재 =====
+
+def ingest_csv(spec: TableSpec, path: Path, encoding: str = "utf-8") -> BatchResult:
+    """CSV 파일을 파싱 없이 그대로 COPY 로 스트리밍합니다. (가장 빠른 경로)"""
+    with open(path, encoding=encoding, newline="") as f:
+        fields = next(csv.reader(f))
+    fields[0] = fields[0].lstrip("\ufeff")
+
+    def load(cursor):
+        sql = (
+            f"COPY _stage ({_copy_columns(len(fields))}) FROM STDIN "
+            f"WITH (FORMAT csv, HEADER true, ENCODING '{PG_ENCODINGS.get(encoding.lower(), 'UTF8')}')"
+        )
+        with open(path, "rb") as f, cursor.copy(sql) as copy:
+            while chunk := f.read(COPY_CHUNK_SIZE):
+                copy.write(chunk)
+
+    return _run_batch(spec, fields, load)
+
+
+def _json_records(path: Path, encoding: str) -> list[dict]:
+    """JSON 배열, JSON Lines, 공공데이터포털 응답(response.body.items.item) 형식을 읽습니다."""
+    with open(path, encoding=encoding) as f:
+        if path.suffix in (".jsonl", ".ndjson"):
+            return [json.loads(line) for line in f if line.strip()]
+        data = json.load(f)
+
+    for key in ("response", "body", "items", "item"):
+        if isinstance(data, dict) and key in data:
+            data = data[key]
+    if isinstance(data, dict):
+        data = [data]
+    return data
+
+
+def _chunks(records: list[dict], size: int) -> Iterator[list[dict]]:
+    for i in range(0, len(records), size):
+        yield records[i:i + size]
+
+
+def ingest_json(spec: TableSpec, path: Path, batch_size: int, encoding: str = "utf-8") -> list[BatchResult]:
+    """JSON 레코드를 batch_size 단위로 COPY(write_row) 하여 적재합니다."""
+    records = _json_records(path, encoding)
+    results = []
+
+    for batch in _chunks(records, batch_size):
+        fields = list(dict.fromkeys(k for r in batch for k in r))
+
+        def load(cursor, batch=batch, fields=fields):
+            with cursor.copy(f"COPY _stage ({_copy_columns(len(fields))}) FROM STDIN") as copy:
+                for r in batch:
+                    copy.write_row([
+                        None if r.get(f) is None else str(r[f]) for f in fields
+                    ])
+
+        results.append(_run_batch(spec, fields, load))
+
+    return results
+
+
+def ingest_file(spec: TableSpec, path: Path, batch_size: int, encoding: str) -> list[BatchResult]:
+    """확장자에 따라 CSV/JSON 적재를 선택합니다."""
+    if path.suffix.lower() == ".csv":
+        return [ingest_csv(spec, path, encoding)]
+    if path.suffix.lower() in (".json", ".jsonl", ".ndjson"):
+        return ingest_json(spec, path, batch_size, encoding)
+    raise ValueError(f"지원하지 않는 파일 형식입니다: {path}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="KMA/RDA 덤프 대량 적재 (COPY + upsert)")
+    parser.add_argument("table", choices=sorted(TABLES), help="대상 테이블")
+    parser.add_argument("files", nargs="+", type=Path, help="CSV / JSON / JSON Lines 파일")
+    parser.add_argument("--batch-size", type=int, default=100000, help="JSON 배치 크기 (행)")
+    parser.add_argument("--encoding", default="utf-8", choices=sorted(PG_ENCODINGS), help="파일 인코딩")
+    args = parser.parse_args()
+
+    spec = TABLES[args.table]
+    total_staged = 0
+    started = time.perf_counter()
+
+    for path in args.files:
+        file_started = time.perf_counter()
+        for result in ingest_file(spec, path, args.batch_size, args.encoding):
+            total_staged += result.staged
+            print(f"[INGEST] {path.name}: staged={result.staged} merged={result.merged}")
+        print(f"[INGEST] {path.name} done in {time.perf_counter() - file_started:.2f}s")
+
+    elapsed = time.perf_counter() - started
+    rate = total_staged / elapsed if elapsed > 0 else 0
+    print(f"[INGEST] {spec.table}: {total_staged} rows in {elapsed:.2f}s ({rate:,.0f} rows/s)")
+
+
+if __name__ == "__main__":
+    main()
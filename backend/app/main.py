@@ -10,18 +10,36 @@ from fastapi.responses import JSONResponse
 from contextlib import asynccontextmanager
 import time
 
+from .admission import AdmissionMiddleware
+from .compression import CompressionMiddleware
+from .conditional import ConditionalGetMiddleware
 from .config import get_settings
-from .database import engine, Base
+from .database import read_router
+from .hotstore import hot_store
+from .metrics import MetricsMiddleware, instrument_engine, metrics_response
+from .notify import invalidation_bus
+from .resilience import ResilienceMiddleware, circuit_breaker
+from .scheduler import create_scheduler
+from .slowlog import slow_queries
+from .streaming import broadcaster
 from .routers import (
     kma_asos_router,
     kma_realtime_router,
     kma_forecast_router,
     rda_weather_router,
-    stats_router
+    stats_router,
+    stream_router,
+    admin_router,
+    alerts_router
 )
 
 settings = get_settings()
 
+# SQL / 커넥션 풀 계측, 느린 쿼리 기록 (primary, 복제본, 대화형/대량 풀 전체)
+for db_engine in read_router.all_engines():
+    instrument_engine(db_engine)
+    slow_queries.install(db_engine)
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -29,10 +47,34 @@ async def lifespan(app: FastAPI):
     # 시작 시 실행
     print(f"[START] {settings.APP_NAME} v{settings.APP_VERSION}")
     print(f"[DB] {settings.DB_HOST}:{settings.DB_PORT}/{settings.DB_NAME}")
+    if read_router.replicas:
+        print(f"[DB] 읽기 복제본: {', '.join(t.name for t in read_router.replicas)}")
+        read_router.check_health()
+        read_router.start_health_checks(settings.REPLICA_HEALTH_INTERVAL_SECONDS)
+
+    # 워커 간 변경 알림 - 워터마크 캐시 무효화, 실시간 스트림 즉시 확인 (app.notify)
+    if settings.NOTIFY_ENABLED:
+        invalidation_bus.subscribe(broadcaster.on_tables_changed)
+        invalidation_bus.start()
+
+    # 최근 실시간 자료 메모리 적재 및 갱신 (app.hotstore)
+    if settings.HOTSTORE_ENABLED:
+        invalidation_bus.subscribe(hot_store.on_tables_changed)
+        hot_store.start()
+
+    # 롤업, 관측소 목록 갱신, 캐시 예열 (app.scheduler)
+    scheduler = create_scheduler(app) if settings.SCHEDULER_ENABLED else None
+    if scheduler is not None:
+        scheduler.start()
 
     yield
 
     # 종료 시 실행
+    if scheduler is not None:
+        await scheduler.stop()
+    await hot_store.stop()
+    await invalidation_bus.stop()
+    read_router.stop_health_checks()
     print("[STOP] Server shutdown")
 
 
@@ -50,6 +92,7 @@ app = FastAPI(
 - **KMA 예보**: 단기예보 / 중기예보
 - **RDA 농업기상**: 10분 간격 / 일별 / 월별 데이터
 - **통계**: 관측소별 통계, 비교 분석
+- **실시간 스트림**: 실황 데이터 변경분 SSE 전달 (`/api/stream/realtime`)
 
 ### 참고사항
 - 모든 API는 읽기 전용입니다.
@@ -63,6 +106,38 @@ app = FastAPI(
     openapi_url="/openapi.json"
 )
 
+# 요청 수용 제어 - 가장 안쪽에 두어 304 / 압축 캐시 적중은 비용을 차감하지 않음
+if settings.ADMISSION_ENABLED:
+    app.add_middleware(
+        AdmissionMiddleware,
+        rate=settings.ADMISSION_RATE,
+        burst=settings.ADMISSION_BURST,
+        max_concurrent=settings.ADMISSION_MAX_CONCURRENT,
+        queue_size=settings.ADMISSION_QUEUE_SIZE,
+        queue_timeout=settings.ADMISSION_QUEUE_TIMEOUT_SECONDS,
+        client_concurrency=settings.ADMISSION_CLIENT_CONCURRENCY,
+    )
+
+# 응답 압축 - 조건부 GET 안쪽에 두어 ETag 별 압축 결과를 재사용
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=settings.COMPRESSION_MIN_SIZE,
+    cache_bytes=settings.COMPRESSION_CACHE_MB * 1024 * 1024,
+)
+
+# 조건부 GET (ETag / 304) - CORS 안쪽에 두어 304 응답에도 CORS 헤더가 붙도록 함
+app.add_middleware(ConditionalGetMiddleware)
+
+# DB 장애 대응 - 조건부 GET(워터마크 조회) 바깥, CORS 안쪽 (보관 응답에도 CORS 헤더가 붙도록 함)
+app.add_middleware(
+    ResilienceMiddleware,
+    breaker=circuit_breaker,
+    stale_timeout=settings.STALE_TIMEOUT_SECONDS,
+    max_age=settings.STALE_MAX_AGE_SECONDS,
+    cache_bytes=settings.STALE_CACHE_MB * 1024 * 1024,
+    max_entry_bytes=settings.STALE_MAX_ENTRY_MB * 1024 * 1024,
+)
+
 # CORS 미들웨어 설정
 app.add_middleware(
     CORSMiddleware,
@@ -85,6 +160,10 @@ async def add_process_time_header(request: Request, call_next):
     return response
 
 
+# 메트릭 수집 미들웨어 (가장 바깥 - 모든 미들웨어 비용과 압축 후 크기를 포함)
+app.add_middleware(MetricsMiddleware)
+
+
 # 전역 예외 처리
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
@@ -114,6 +193,9 @@ app.include_router(kma_realtime_router)
 app.include_router(kma_forecast_router)
 app.include_router(rda_weather_router)
 app.include_router(stats_router)
+app.include_router(stream_router)
+app.include_router(admin_router)
+app.include_router(alerts_router)
 
 
 # 루트 엔드포인트
@@ -128,10 +210,16 @@ def root():
     }
 
 
+@app.get("/metrics", include_in_schema=False)
+def metrics():
+    """Prometheus 메트릭 (라우트별 응답 시간, SQL 횟수/시간, 커넥션 풀)"""
+    return metrics_response()
+
+
 @app.get("/health", tags=["기본"])
 def health_check():
     """서버 상태를 확인합니다."""
-    return {"status": "healthy"}
+    return {"status": "healthy", "database": circuit_breaker.state}
 
 
 # 개발 서버 실행용
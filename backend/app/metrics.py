@@ -0,0 +1,251 @@
+"""
+Prometheus 메트릭 모듈
+- 라우트(경로 템플릿)별 응답 시간, 응답 크기, SQL 실행 횟수, DB 시간, 반환 행 수를 수집합니다.
+- SQL 은 SQLAlchemy before/after_cursor_execute 이벤트로 측정하며,
+  요청마다 contextvar 에 RequestStats 를 두어 같은 요청에서 실행된 문장을 모읍니다.
+  (동기 라우터는 스레드풀에서 실행되지만 contextvar 는 복사되어 전달됩니다.)
+- 커넥션 풀(primary, 복제본, 대화형/대량)별 checkout 대기 시간과 사용 중인 연결 수(포화도)를 함께 내보냅니다.
+- 자주 요청되는 JSON 조회(경로, 쿼리, Accept-Encoding)를 세어 두어 스케줄러의 캐시 예열에 사용합니다.
+- /metrics 에서 Prometheus 텍스트 형식으로 조회합니다.
+"""
+
+import threading
+import time
+from collections import Counter as CallCounter
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Optional
+
+from prometheus_client import CONTENT_TYPE_LATEST, Counter, Gauge, Histogram, generate_latest
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import QueuePool
+from starlette.datastructures import Headers
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .database import TimedQueuePool
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+STATEMENT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100, 250)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds", "요청 처리 시간",
+    ["method", "route", "status"], buckets=LATENCY_BUCKETS,
+)
+REQUEST_STATEMENTS = Histogram(
+    "http_request_db_statements", "요청당 SQL 실행 횟수",
+    ["route"], buckets=STATEMENT_BUCKETS,
+)
+REQUEST_DB_TIME = Histogram(
+    "http_request_db_seconds", "요청당 SQL 실행 시간 합계",
+    ["route"], buckets=LATENCY_BUCKETS,
+)
+RESPONSE_SIZE = Histogram(
+    "http_response_size_bytes", "응답 본문 크기 (압축 후)",
+    ["route"], buckets=SIZE_BUCKETS,
+)
+DB_STATEMENTS = Counter("db_statements_total", "SQL 실행 횟수", ["route"])
+DB_ROWS = Counter("db_rows_total", "SQL 반환/변경 행 수", ["route"])
+
+ADMISSION_REJECTED = Counter(
+    "admission_rejected_total", "수용 제어로 거절된 요청 수 (rate, client_concurrency: 429 / overload: 503)",
+    ["route", "reason"],
+)
+ADMISSION_QUEUE_WAIT = Histogram(
+    "admission_queue_wait_seconds", "비싼 요청의 실행 슬롯 대기 시간", buckets=LATENCY_BUCKETS,
+)
+
+STALE_RESPONSES = Counter(
+    "stale_responses_total", "DB 장애/지연으로 보관된 응답을 반환한 횟수 (timeout, error, circuit_open)",
+    ["reason"],
+)
+CIRCUIT_STATE = Gauge("db_circuit_state", "DB 서킷 브레이커 상태 (0: closed, 1: half-open, 2: open)")
+
+SCHEDULER_JOB_DURATION = Histogram(
+    "scheduler_job_duration_seconds", "스케줄러 작업 실행 시간 (status: ok, error)",
+    ["job", "status"], buckets=LATENCY_BUCKETS + (60, 120, 300),
+)
+SCHEDULER_JOB_LAST_SUCCESS = Gauge(
+    "scheduler_job_last_success_timestamp_seconds", "스케줄러 작업의 마지막 성공 시각 (unix time)", ["job"],
+)
+SCHEDULER_LEADER = Gauge("scheduler_leader", "이 워커가 스케줄러 리더인지 (advisory lock 보유 시 1)")
+
+NOTIFY_EVENTS = Counter("notify_events_total", "수신한 테이블 변경 알림 수 (LISTEN/NOTIFY)", ["table"])
+NOTIFY_LISTENING = Gauge("notify_listening", "변경 알림 수신 중인지 (1: LISTEN 연결 유지 중)")
+NOTIFY_LAST_EVENT = Gauge("notify_last_event_timestamp_seconds", "마지막으로 변경 알림을 받은 시각 (unix time)")
+
+HOTSTORE_REQUESTS = Counter(
+    "hotstore_requests_total", "핫 스토어 조회 수 (hit: 메모리 응답, miss: DB 조회)", ["store", "result"]
+)
+HOTSTORE_KEYS = Gauge("hotstore_keys", "핫 스토어에 보관 중인 지역/관측소 수", ["store"])
+HOTSTORE_BYTES = Gauge("hotstore_bytes", "핫 스토어 배열 크기 (bytes)", ["store"])
+ARCHIVE_REQUESTS = Counter(
+    "archive_requests_total", "일자료 통계 집계 수 (hit: 메모리 맵 아카이브 사용, miss: DB 만 사용)", ["dataset", "result"]
+)
+QC_FLAGGED = Counter("qc_flagged_total", "품질 검사에서 새로 걸리거나 결과가 바뀐 행 수 (검사 종류별)", ["dataset", "check"])
+ALERTS_OPENED = Counter("alerts_opened_total", "새로 발령된 이상기상 알림 수 (규칙별)", ["rule"])
+
+POOL_CHECKOUT_WAIT = Histogram(
+    "db_pool_checkout_wait_seconds", "커넥션 풀 checkout 대기 시간",
+    ["pool"], buckets=LATENCY_BUCKETS,
+)
+POOL_CHECKED_OUT = Gauge("db_pool_checked_out", "사용 중인 커넥션 수", ["pool"])
+POOL_CAPACITY = Gauge("db_pool_capacity", "커넥션 풀 최대 크기 (pool_size + max_overflow)", ["pool"])
+
+# 요청 밖(백그라운드 작업, CLI)에서 실행된 문장의 라우트 라벨
+BACKGROUND_ROUTE = "background"
+# 라우트에 매칭되지 않은 요청 (404 등) - 경로별 라벨 폭증 방지
+UNMATCHED_ROUTE = "unmatched"
+
+# 캐시 예열 요청 표시 헤더 (인기 요청 집계에서 제외)
+WARMUP_HEADER = "x-cache-warmup"
+
+# 인기 요청 집계에서 제외하는 경로 (스트림, 관리 API)
+UNTRACKED_PREFIXES = ("/api/stream", "/api/admin")
+
+
+@dataclass
+class RequestStats:
+    """요청 하나에서 실행된 SQL 통계"""
+    statements: int = 0
+    db_time: float = 0.0
+    rows: int = 0
+    scope: Optional[Scope] = field(default=None, repr=False)
+
+
+_request_stats: ContextVar[Optional[RequestStats]] = ContextVar("request_stats", default=None)
+
+
+def current_stats() -> Optional[RequestStats]:
+    """현재 요청의 SQL 통계 (요청 밖이면 None)"""
+    return _request_stats.get()
+
+
+def current_route() -> str:
+    """현재 실행 중인 요청의 라우트 템플릿 (요청 밖이면 background)"""
+    stats = _request_stats.get()
+    if stats is None:
+        return BACKGROUND_ROUTE
+    return route_label(stats.scope)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info["query_start"].pop()
+    rows = max(cursor.rowcount, 0)
+
+    stats = _request_stats.get()
+    if stats is None:
+        DB_STATEMENTS.labels(BACKGROUND_ROUTE).inc()
+        DB_ROWS.labels(BACKGROUND_ROUTE).inc(rows)
+        return
+    stats.statements += 1
+    stats.db_time += elapsed
+    stats.rows += rows
+
+
+def _observe_checkout_wait(pool_name: Optional[str], seconds: float) -> None:
+    POOL_CHECKOUT_WAIT.labels(pool_name or "default").observe(seconds)
+
+
+def instrument_engine(engine: Engine) -> None:
+    """엔진에 SQL / 커넥션 풀 계측 이벤트를 등록합니다."""
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+    pool = engine.pool
+    if isinstance(pool, QueuePool):
+        name = pool.logging_name or "default"
+        POOL_CHECKED_OUT.labels(name).set_function(lambda: engine.pool.checkedout())
+        POOL_CAPACITY.labels(name).set(pool.size() + max(pool._max_overflow, 0))
+        TimedQueuePool.on_checkout_wait = _observe_checkout_wait
+
+
+class PopularRequests:
+    """자주 요청되는 JSON 조회 집계 (예열 주기마다 횟수를 절반으로 줄여 최근 요청을 우선)"""
+
+    def __init__(self, max_entries: int = 5000):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._counts: CallCounter[tuple[str, str, str]] = CallCounter()
+
+    def record(self, scope: Scope) -> None:
+        headers = Headers(scope=scope)
+        if WARMUP_HEADER in headers:
+            return
+        key = (scope["path"], scope.get("query_string", b"").decode("latin-1"),
+               headers.get("accept-encoding", ""))
+        with self._lock:
+            self._counts[key] += 1
+            if len(self._counts) > self.max_entries:
+                # 상위 절반만 남김
+                self._counts = CallCounter(dict(self._counts.most_common(self.max_entries // 2)))
+
+    def top(self, n: int) -> list[tuple[str, str, str]]:
+        """상위 n 개 (경로, 쿼리 문자열, Accept-Encoding) 를 반환하고 횟수를 감쇠시킵니다."""
+        with self._lock:
+            top = [key for key, _ in self._counts.most_common(n)]
+            self._counts = CallCounter({k: c // 2 for k, c in self._counts.items() if c > 1})
+        return top
+
+
+popular_requests = PopularRequests()
+
+
+def route_label(scope: Optional[Scope]) -> str:
+    route = scope.get("route") if scope else None
+    return getattr(route, "path", None) or UNMATCHED_ROUTE
+
+
+class MetricsMiddleware:
+    """요청별 응답 시간 / 크기 / SQL 통계를 라우트 라벨로 기록하는 ASGI 미들웨어"""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats(scope=scope)
+        token = _request_stats.set(stats)
+        started = time.perf_counter()
+        status = 500
+        size = 0
+        content_type = ""
+
+        async def send_with_metrics(message: Message) -> None:
+            nonlocal status, size, content_type
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                content_type = Headers(raw=message.get("headers", [])).get("content-type", "")
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_metrics)
+        finally:
+            _request_stats.reset(token)
+            # 라우팅 후 scope 에 남는 경로 템플릿 사용 (/api/kma/asos/date/{target_date})
+            route = route_label(scope)
+            REQUEST_LATENCY.labels(scope["method"], route, str(status)).observe(time.perf_counter() - started)
+            RESPONSE_SIZE.labels(route).observe(size)
+            REQUEST_STATEMENTS.labels(route).observe(stats.statements)
+            REQUEST_DB_TIME.labels(route).observe(stats.db_time)
+            DB_STATEMENTS.labels(route).inc(stats.statements)
+            DB_ROWS.labels(route).inc(stats.rows)
+            if scope["method"] == "GET" and status == 200 and content_type.startswith("application/json") \
+                    and route != UNMATCHED_ROUTE and scope["path"].startswith("/api/") \
+                    and not scope["path"].startswith(UNTRACKED_PREFIXES):
+                popular_requests.record(scope)
+
+
+def metrics_response() -> Response:
+    return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
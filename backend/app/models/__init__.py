@@ -1,6 +1,9 @@
 # backend/app/models/__init__.py
 from .kma import AsosDailyData, WeatherRealtime, WeatherShortForecast, WeatherMidForecast
-from .rda import WeatherData, WeatherDataDaily, WeatherDataMonthly
+from .rda import WeatherData, WeatherDataHourly, WeatherDataCompleteness, WeatherDataDaily, WeatherDataMonthly
+from .meta import DataVersion
+from .qc import WeatherDataQc, AsosDailyQc, QcRun
+from .alerts import AlertState, AlertEvent
 
 __all__ = [
     "AsosDailyData",
@@ -8,6 +11,14 @@ __all__ = [
     "WeatherShortForecast",
     "WeatherMidForecast",
     "WeatherData",
+    "WeatherDataHourly",
+    "WeatherDataCompleteness",
     "WeatherDataDaily",
     "WeatherDataMonthly",
+    "DataVersion",
+    "WeatherDataQc",
+    "AsosDailyQc",
+    "QcRun",
+    "AlertState",
+    "AlertEvent",
 ]
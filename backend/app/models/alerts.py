@@ -0,0 +1,46 @@
+"""
+이상기상 알림 SQLAlchemy 모델
+- 규칙(폭염/늦서리/호우)별 관측소 연속 구간 상태와 발령된 알림 이력 (app.alerts)
+"""
+
+from sqlalchemy import Column, Integer, String, Float, Boolean, TIMESTAMP, Index
+from sqlalchemy.sql import func
+
+from ..database import Base
+
+
+class AlertState(Base):
+    """규칙별 관측소 진행 상태 (마지막으로 처리한 관측 + 진행 중인 연속 구간)"""
+    __tablename__ = "alert_state"
+
+    rule = Column(String(20), primary_key=True)  # 규칙 (heat_wave / frost / heavy_rain)
+    station = Column(String(100), primary_key=True)  # 관측소 코드 / 지점 ID / 지역명
+    station_name = Column(String(100))  # 관측소명
+    last_time = Column(TIMESTAMP, nullable=False)  # 마지막으로 처리한 관측 시각 (증분 처리 시작점)
+    run_start = Column(TIMESTAMP)  # 진행 중인 연속 구간 시작 (없으면 NULL)
+    run_last = Column(TIMESTAMP)  # 진행 중인 연속 구간의 마지막 관측 시각
+    run_length = Column(Integer, nullable=False, default=0)  # 연속 관측 수
+    peak = Column(Float)  # 구간 극값 (최고기온 최댓값, 최저기온 최솟값, 강수량 최댓값)
+    event_id = Column(Integer)  # 발령된 알림 (연속 수가 기준 이상이 된 뒤)
+
+
+class AlertEvent(Base):
+    """발령된 알림 (연속 구간 하나 = 1행, 구간이 이어지는 동안 갱신)"""
+    __tablename__ = "alert_events"
+
+    id = Column(Integer, primary_key=True)
+    rule = Column(String(20), nullable=False)  # 규칙
+    station = Column(String(100), nullable=False)  # 관측소 코드 / 지점 ID / 지역명
+    station_name = Column(String(100))  # 관측소명
+    start_time = Column(TIMESTAMP, nullable=False)  # 구간 시작 관측 시각
+    end_time = Column(TIMESTAMP, nullable=False)  # 구간 마지막 관측 시각
+    length = Column(Integer, nullable=False)  # 연속 관측 수
+    peak = Column(Float)  # 구간 극값
+    active = Column(Boolean, nullable=False, default=True)  # 진행 중 여부
+    updated_at = Column(TIMESTAMP, server_default=func.now(), onupdate=func.now())
+
+    # 인덱스 정의는 migrations/versions/ 의 리비전과 일치해야 합니다.
+    __table_args__ = (
+        Index("ix_alert_events_rule_start_time", rule, start_time.desc()),
+        Index("ix_alert_events_active", rule, postgresql_where=active),
+    )
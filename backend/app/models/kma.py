@@ -4,7 +4,7 @@ KMA(기상청) 데이터 SQLAlchemy 모델
 - ASOS 일자료, 초단기 실황, 단기예보, 중기예보 테이블
 """
 
-from sqlalchemy import Column, Integer, String, Float, Date, Text, TIMESTAMP
+from sqlalchemy import Column, Integer, String, Float, Date, Text, TIMESTAMP, Index
 from sqlalchemy.sql import func
 
 from ..database import Base
@@ -32,6 +32,12 @@ class AsosDailyData(Base):
     iscs = Column(Text)  # 일기현상
     created_at = Column(TIMESTAMP, server_default=func.now())
 
+    # 인덱스 정의는 migrations/versions/ 의 리비전과 일치해야 합니다.
+    __table_args__ = (
+        Index("uq_asos_daily_data_stn_id_tm", stn_id, tm, unique=True),
+        Index("brin_asos_daily_data_tm", tm, postgresql_using="brin"),
+    )
+
 
 class WeatherRealtime(Base):
     """초단기 실황 테이블 모델"""
@@ -48,6 +54,17 @@ class WeatherRealtime(Base):
     obsrvalue = Column(Float)  # 관측값
     created_at = Column(TIMESTAMP, server_default=func.now())
 
+    __table_args__ = (
+        Index("ix_weather_realtime_region_latest", region_name, base_date.desc(), base_time.desc()),
+        Index(
+            "uq_weather_realtime_region_slot_category",
+            region_name, base_date, base_time, category,
+            unique=True,
+            postgresql_include=["obsrvalue"]
+        ),
+        Index("brin_weather_realtime_base_date", base_date, postgresql_using="brin"),
+    )
+
 
 class WeatherShortForecast(Base):
     """단기예보 테이블 모델"""
@@ -65,6 +82,14 @@ class WeatherShortForecast(Base):
     fcst_value = Column(String(50))  # 예보값
     created_at = Column(TIMESTAMP, server_default=func.now())
 
+    __table_args__ = (
+        Index(
+            "uq_weather_short_forecast_natural_key",
+            region_name, base_date, base_time, fcst_date, fcst_time, category,
+            unique=True
+        ),
+    )
+
 
 class WeatherMidForecast(Base):
     """중기예보 테이블 모델"""
@@ -85,3 +110,7 @@ class WeatherMidForecast(Base):
     temp_max_low = Column(Float)  # 최고기온 하한
     temp_max_high = Column(Float)  # 최고기온 상한
     created_at = Column(TIMESTAMP, server_default=func.now())
+
+    __table_args__ = (
+        Index("uq_weather_mid_forecast_natural_key", reg_id, tm_fc, forecast_date, time_period, unique=True),
+    )
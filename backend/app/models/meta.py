@@ -0,0 +1,18 @@
+"""
+메타데이터 SQLAlchemy 모델
+- 테이블 변경 카운터 등 데이터 테이블을 보조하는 테이블
+"""
+
+from sqlalchemy import Column, String, BigInteger, TIMESTAMP
+from sqlalchemy.sql import func
+
+from ..database import Base
+
+
+class DataVersion(Base):
+    """테이블 변경 카운터 모델 (트리거가 문장 단위로 증가시킴)"""
+    __tablename__ = "data_versions"
+
+    table_name = Column(String(64), primary_key=True)  # 대상 테이블명
+    version = Column(BigInteger, nullable=False, server_default="0")  # 변경 횟수
+    changed_at = Column(TIMESTAMP(timezone=True), nullable=False, server_default=func.now())  # 마지막 변경 시각
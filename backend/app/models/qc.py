@@ -0,0 +1,38 @@
+"""
+품질 관리(QC) 플래그 SQLAlchemy 모델
+- 원자료 행마다 QC 검사에서 걸린 변수를 비트마스크로 저장하는 보조 테이블 (app.qc)
+- 플래그가 하나도 없는 행은 저장하지 않습니다.
+"""
+
+from sqlalchemy import Column, Integer, SmallInteger, BigInteger, String, ForeignKey, TIMESTAMP
+from sqlalchemy.sql import func
+
+from ..database import Base
+
+
+class WeatherDataQc(Base):
+    """10분 자료 QC 플래그 (weather_data.id 와 1:1)"""
+    __tablename__ = "weather_data_qc"
+
+    id = Column(Integer, ForeignKey("weather_data.id", ondelete="CASCADE"), primary_key=True)
+    flags = Column(BigInteger, nullable=False)  # 변수별 불량 비트 (app.qc 의 변수 순서)
+    checks = Column(SmallInteger, nullable=False)  # 걸린 검사 종류 비트 (범위/급변/지속/일관성)
+    checked_at = Column(TIMESTAMP, server_default=func.now())
+
+
+class AsosDailyQc(Base):
+    """ASOS 일자료 QC 플래그 (asos_daily_data.id 와 1:1)"""
+    __tablename__ = "asos_daily_qc"
+
+    id = Column(Integer, ForeignKey("asos_daily_data.id", ondelete="CASCADE"), primary_key=True)
+    flags = Column(BigInteger, nullable=False)
+    checks = Column(SmallInteger, nullable=False)
+    checked_at = Column(TIMESTAMP, server_default=func.now())
+
+
+class QcRun(Base):
+    """데이터셋별 QC 진행 위치 (증분 검사 시작점)"""
+    __tablename__ = "qc_runs"
+
+    dataset = Column(String(20), primary_key=True)  # rda / asos
+    checked_until = Column(TIMESTAMP, nullable=False)  # 이 시각까지 검사 완료
@@ -1,10 +1,11 @@
 # backend/app/models/rda.py
 """
 RDA(농촌진흥청) 데이터 SQLAlchemy 모델
-- 10분 간격 데이터, 일별 데이터, 월별 데이터 테이블
+- 10분 간격 데이터, 시간별 집계, 수신 현황, 일별 데이터, 월별 데이터 테이블
 """
 
-from sqlalchemy import Column, Integer, String, Float, Date, TIMESTAMP
+from sqlalchemy import Column, Integer, SmallInteger, String, Float, Date, TIMESTAMP, Index
+from sqlalchemy.dialects.postgresql import BIT
 from sqlalchemy.sql import func
 
 from ..database import Base
@@ -36,6 +37,59 @@ class WeatherData(Base):
     soil_wt = Column(Float)  # 토양습도
     created_at = Column(TIMESTAMP, server_default=func.now())
 
+    # 인덱스 정의는 migrations/versions/ 의 리비전과 일치해야 합니다.
+    __table_args__ = (
+        Index("uq_weather_data_stn_cd_datetime", stn_cd, datetime.desc(), unique=True),
+        Index("brin_weather_data_datetime", datetime, postgresql_using="brin"),
+    )
+
+
+class WeatherDataHourly(Base):
+    """시간별 집계 테이블 모델 (10분 데이터 롤업, app.rollup 에서 생성)"""
+    __tablename__ = "weather_data_hourly"
+
+    id = Column(Integer, primary_key=True)
+    stn_cd = Column(String(20), nullable=False)  # 관측소 코드
+    stn_name = Column(String(100))  # 관측소명
+    province = Column(String(50))  # 도/광역시
+    datetime = Column(TIMESTAMP, nullable=False)  # 집계 시각 (정시, 구간 시작)
+    temp = Column(Float)  # 평균기온
+    hghst_artmp = Column(Float)  # 최고기온
+    lowst_artmp = Column(Float)  # 최저기온
+    hum = Column(Float)  # 평균습도
+    widdir = Column(Float)  # 벡터평균 풍향
+    wind = Column(Float)  # 평균풍속
+    max_wind = Column(Float)  # 최대풍속
+    rn = Column(Float)  # 강수량 (합계)
+    sun_time = Column(Float)  # 일조시간 (합계)
+    srqty = Column(Float)  # 일사량 (합계)
+    condens_time = Column(Float)  # 응축시간 (합계)
+    gr_temp = Column(Float)  # 평균 지면온도
+    soil_temp = Column(Float)  # 평균 토양온도
+    soil_wt = Column(Float)  # 평균 토양습도
+    sample_count = Column(Integer, nullable=False)  # 집계에 사용된 10분 자료 수 (최대 6)
+    created_at = Column(TIMESTAMP, server_default=func.now())
+
+    __table_args__ = (
+        Index("uq_weather_data_hourly_stn_cd_datetime", stn_cd, datetime.desc(), unique=True),
+        Index("brin_weather_data_hourly_datetime", datetime, postgresql_using="brin"),
+    )
+
+
+class WeatherDataCompleteness(Base):
+    """관측소-일별 10분 자료 수신 현황 모델 (app.completeness 에서 생성, 자료가 하나라도 있는 날만)"""
+    __tablename__ = "weather_data_completeness"
+
+    stn_cd = Column(String(20), primary_key=True)  # 관측소 코드
+    date = Column(Date, primary_key=True, index=True)  # 관측일자
+    stn_name = Column(String(100))  # 관측소명
+    province = Column(String(50))  # 도/광역시
+    received = Column(SmallInteger, nullable=False)  # 수신한 10분 구간 수 (최대 144)
+    slots = Column(BIT(144), nullable=False)  # 10분 구간별 수신 여부 (왼쪽부터 00:00, 00:10, ...)
+    first_datetime = Column(TIMESTAMP, nullable=False)  # 그날 첫 관측일시
+    last_datetime = Column(TIMESTAMP, nullable=False)  # 그날 마지막 관측일시
+    updated_at = Column(TIMESTAMP, server_default=func.now())
+
 
 class WeatherDataDaily(Base):
     """일별 기상 데이터 테이블 모델"""
@@ -62,6 +116,11 @@ class WeatherDataDaily(Base):
     soil_wt = Column(Float)  # 토양습도
     created_at = Column(TIMESTAMP, server_default=func.now())
 
+    __table_args__ = (
+        Index("uq_weather_data_daily_stn_cd_date", stn_cd, date, unique=True),
+        Index("brin_weather_data_daily_date", date, postgresql_using="brin"),
+    )
+
 
 class WeatherDataMonthly(Base):
     """월별 기상 데이터 테이블 모델"""
@@ -87,3 +146,7 @@ class WeatherDataMonthly(Base):
     soil_temp = Column(Float)  # 토양온도
     soil_wt = Column(Float)  # 토양습도
     created_at = Column(TIMESTAMP, server_default=func.now())
+
+    __table_args__ = (
+        Index("uq_weather_data_monthly_stn_cd_date", stn_cd, date, unique=True),
+    )
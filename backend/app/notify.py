@@ -0,0 +1,114 @@
+"""
+워커 간 변경 알림 버스 (PostgreSQL LISTEN/NOTIFY)
+- data_versions 행이 바뀌면 트리거(migrations 0006)가 'data_versions' 채널로 테이블 이름을 NOTIFY 합니다.
+  적재 트리거와 스케줄러의 스냅샷 뷰 갱신이 모두 data_versions 를 거치므로 발행 측 코드는 필요 없습니다.
+- 워커마다 primary 에 전용 연결 하나로 LISTEN 하고, 알림을 받으면 즉시
+  워터마크 캐시를 비우고(→ ETag / 압축 캐시가 새 데이터 기준으로 바뀜) 구독자(실시간 브로드캐스터 등)를 호출합니다.
+- 수신 중에는 워터마크 캐시 유지 시간을 WATERMARK_MAX_AGE_NOTIFY_SECONDS 로 늘려 data_versions 조회를 줄입니다.
+  연결이 끊기면 유지 시간을 되돌리고, 재연결 직후에는 놓친 알림에 대비해 모든 구독자를 한 번 호출합니다.
+"""
+
+import asyncio
+import contextvars
+from typing import Callable, Optional
+
+import psycopg
+from sqlalchemy.engine import make_url
+
+from .config import get_settings
+from .metrics import NOTIFY_EVENTS, NOTIFY_LAST_EVENT, NOTIFY_LISTENING
+from .watermark import watermarks
+
+settings = get_settings()
+
+CHANNEL = "data_versions"
+
+# 구독자: 바뀐 테이블 이름 집합을 받음 (None = 알 수 없음, 모두 바뀐 것으로 처리)
+Listener = Callable[[Optional[frozenset[str]]], None]
+
+
+class InvalidationBus:
+    """data_versions 변경 알림을 받아 프로세스 캐시를 무효화하는 LISTEN 태스크"""
+
+    def __init__(self, conninfo: str, reconnect_seconds: float, keepalive_seconds: float):
+        self.conninfo = conninfo
+        self.reconnect_seconds = reconnect_seconds
+        self.keepalive_seconds = keepalive_seconds
+        self.listening = False
+        self._listeners: list[Listener] = []
+        self._task: Optional[asyncio.Task] = None
+
+    def subscribe(self, listener: Listener) -> None:
+        """구독자는 이벤트 루프에서 호출되므로 asyncio 객체(Event 등)를 바로 다뤄도 됩니다."""
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+
+    def start(self) -> None:
+        if self._task is not None:
+            return
+        # 시작한 요청/lifespan 의 컨텍스트를 물려받지 않도록 빈 컨텍스트에서 실행
+        self._task = asyncio.create_task(self._run(), context=contextvars.Context())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        self._set_listening(False)
+
+    def dispatch(self, tables: Optional[frozenset[str]]) -> None:
+        """알림 한 건 처리 (워터마크 캐시 비우기 + 구독자 호출)"""
+        watermarks.invalidate()
+        for listener in self._listeners:
+            try:
+                listener(tables)
+            except Exception as exc:
+                print(f"[NOTIFY] 구독자 오류: {exc}")
+
+    def _set_listening(self, listening: bool) -> None:
+        if listening != self.listening:
+            self.listening = listening
+            NOTIFY_LISTENING.set(1 if listening else 0)
+            watermarks.set_notified(listening)
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self._listen()
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                if self.listening:
+                    print(f"[NOTIFY] 연결 끊김: {str(exc).splitlines()[0] if str(exc) else type(exc).__name__}")
+            self._set_listening(False)
+            await asyncio.sleep(self.reconnect_seconds)
+
+    async def _listen(self) -> None:
+        async with await psycopg.AsyncConnection.connect(self.conninfo, autocommit=True) as conn:
+            await conn.execute(f"LISTEN {CHANNEL}")
+            self._set_listening(True)
+            print(f"[NOTIFY] '{CHANNEL}' 채널 수신 시작")
+            # 연결되지 않은 동안의 변경을 놓쳤을 수 있으므로 한 번 전체 갱신
+            self.dispatch(None)
+
+            while True:
+                async for notify in conn.notifies(timeout=self.keepalive_seconds):
+                    NOTIFY_EVENTS.labels(notify.payload).inc()
+                    NOTIFY_LAST_EVENT.set_to_current_time()
+                    self.dispatch(frozenset([notify.payload]))
+                # 알림이 없던 구간 - 연결이 살아 있는지 확인 (끊겼으면 예외 → 재연결)
+                await conn.execute("SELECT 1")
+
+
+def listen_conninfo() -> str:
+    """psycopg 접속 문자열 (SQLAlchemy URL 에서 드라이버 표기 제거, NOTIFY 는 복제되지 않으므로 primary)"""
+    url = make_url(settings.database_url).set(drivername="postgresql")
+    return url.render_as_string(hide_password=False)
+
+
+# 프로세스 공용 인스턴스
+invalidation_bus = InvalidationBus(
+    conninfo=listen_conninfo(),
+    reconnect_seconds=settings.NOTIFY_RECONNECT_SECONDS,
+    keepalive_seconds=settings.NOTIFY_KEEPALIVE_SECONDS,
+)
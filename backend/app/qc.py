@@ -0,0 +1,355 @@
+"""
+데이터 품질 관리(QC) 모듈
+- RDA 10분 자료(weather_data)와 ASOS 일자료(asos_daily_data)에 다음 검사를 NumPy 로 배치 단위 일괄 적용합니다.
+  * RANGE: 물리적 허용 범위 (습도 0~100, 강수량 >= 0 등)
+  * SPIKE: 앞뒤 값보다 한계 이상 튀었다가 되돌아오는 단발성 급변 (센서 스파이크)
+  * PERSISTENCE: 같은 값이 비정상적으로 오래 반복 (센서 고착, 범위 경계값은 제외 - 습도 100% 등)
+  * CONSISTENCY: 변수 간 일관성 (lowst_artmp <= temp <= hghst_artmp, wind <= max_wind 등)
+- 검사에 걸린 값은 보조 테이블(weather_data_qc / asos_daily_qc)에 행마다 변수 비트마스크로 저장합니다.
+  원자료는 바꾸지 않으며, 조회 엔드포인트의 qc=strict 는 쿼리에서 플래그가 선 값을 NULL 로 반환합니다.
+- 스케줄러가 마지막 검사 위치 이후(QC_LOOKBACK_HOURS 와 데이터셋별 lookback 중 긴 기간만큼 겹쳐서)를 증분 검사합니다.
+
+사용법:
+    cd backend
+    python -m app.qc run                                  # 증분 검사
+    python -m app.qc run --dataset asos --start 1990-01-01 --end 2025-01-01
+    python -m app.qc summary --dataset rda --start 2026-10-01 --end 2026-10-19
+"""
+
+import argparse
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Any, Optional, Sequence
+
+from sqlalchemy import case, delete, func, insert, select
+from sqlalchemy.orm import Query, Session
+
+from .config import get_settings
+from .database import SessionLocal
+from .metrics import QC_FLAGGED
+from .models.kma import AsosDailyData
+from .models.qc import AsosDailyQc, QcRun, WeatherDataQc
+from .models.rda import WeatherData
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+settings = get_settings()
+
+# qc 파라미터 허용 값 (none: 원자료 그대로, strict: 플래그가 선 값은 null)
+QC_PATTERN = "^(none|strict)$"
+
+# 검사 종류 비트 (checks 컬럼)
+RANGE, SPIKE, PERSISTENCE, CONSISTENCY = 1, 2, 4, 8
+CHECK_NAMES = {RANGE: "range", SPIKE: "spike", PERSISTENCE: "persistence", CONSISTENCY: "consistency"}
+
+# 일관성 검사 허용 오차 (반올림 차이)
+CONSISTENCY_TOLERANCE = 0.05
+
+
+@dataclass(frozen=True)
+class QcSpec:
+    """데이터셋별 QC 기준 (flags 의 비트 i = variables[i])"""
+    name: str
+    model: Any
+    flag_model: Any
+    key: str
+    time: str
+    variables: tuple[str, ...]
+    limits: dict[str, tuple[float, float]]          # RANGE: (최소, 최대)
+    spikes: dict[str, float]                        # SPIKE: 이웃 값과의 차이 한계
+    persistence: dict[str, int]                     # PERSISTENCE: 같은 값 연속 허용 개수 (이상이면 플래그)
+    consistency: tuple[tuple[str, str], ...]        # CONSISTENCY: (작아야 하는 변수, 커야 하는 변수)
+    max_gap: timedelta                              # 이보다 떨어진 이웃은 급변/지속 검사에서 비교하지 않음
+    context: timedelta                              # 검사 구간 앞에 함께 읽는 구간 (지속 검사 연속 판정용)
+    chunk: timedelta                                # 한 번에 읽어 검사하는 구간 길이
+    lookback: timedelta                             # 증분 검사 최소 재검사 기간 (뒤 이웃이 들어온 행을 다시 급변 검사)
+
+    def bit(self, variable: str) -> int:
+        return 1 << self.variables.index(variable)
+
+    def column(self, name: str):
+        return getattr(self.model, name)
+
+
+TEMPERATURE = (-40.0, 50.0)
+
+SPECS = {
+    "rda": QcSpec(
+        name="rda",
+        model=WeatherData,
+        flag_model=WeatherDataQc,
+        key="stn_cd",
+        time="datetime",
+        variables=(
+            "temp", "hghst_artmp", "lowst_artmp", "hum", "widdir", "wind", "max_wind",
+            "rn", "sun_time", "srqty", "condens_time", "gr_temp", "soil_temp", "soil_wt",
+        ),
+        limits={
+            "temp": TEMPERATURE, "hghst_artmp": TEMPERATURE, "lowst_artmp": TEMPERATURE,
+            "hum": (0.0, 100.0), "widdir": (0.0, 360.0), "wind": (0.0, 75.0), "max_wind": (0.0, 75.0),
+            "rn": (0.0, 500.0), "sun_time": (0.0, float("inf")), "srqty": (0.0, float("inf")),
+            "condens_time": (0.0, float("inf")), "gr_temp": (-50.0, 80.0), "soil_temp": (-40.0, 60.0),
+            "soil_wt": (0.0, 100.0),
+        },
+        spikes={"temp": 5.0, "hghst_artmp": 5.0, "lowst_artmp": 5.0, "hum": 30.0, "gr_temp": 10.0, "soil_temp": 5.0},
+        persistence={"temp": 36, "hum": 72},        # 6시간 / 12시간
+        consistency=(("lowst_artmp", "temp"), ("temp", "hghst_artmp"), ("lowst_artmp", "hghst_artmp"),
+                     ("wind", "max_wind")),
+        max_gap=timedelta(minutes=30),
+        context=timedelta(hours=24),
+        chunk=timedelta(days=7),
+        lookback=timedelta(hours=1),                # max_gap + 수집 지연
+    ),
+    "asos": QcSpec(
+        name="asos",
+        model=AsosDailyData,
+        flag_model=AsosDailyQc,
+        key="stn_id",
+        time="tm",
+        variables=("avg_ta", "min_ta", "max_ta", "sum_rn", "avg_ws", "avg_rhm", "sum_ss_hr", "sum_gsr", "avg_tca"),
+        limits={
+            "avg_ta": TEMPERATURE, "min_ta": TEMPERATURE, "max_ta": TEMPERATURE,
+            "sum_rn": (0.0, 1000.0), "avg_ws": (0.0, 75.0), "avg_rhm": (0.0, 100.0),
+            "sum_ss_hr": (0.0, 24.0), "sum_gsr": (0.0, 50.0), "avg_tca": (0.0, 10.0),
+        },
+        spikes={"avg_ta": 15.0, "min_ta": 20.0, "max_ta": 20.0},
+        persistence={"avg_ta": 5},
+        consistency=(("min_ta", "avg_ta"), ("avg_ta", "max_ta")),
+        max_gap=timedelta(days=1),
+        context=timedelta(days=10),
+        chunk=timedelta(days=3650),
+        lookback=timedelta(days=4),                 # max_gap(1일) + 일자료 발표 지연(약 3일)
+    ),
+}
+
+
+def check_batch(spec: QcSpec, keys: "np.ndarray", times: "np.ndarray",
+                values: "np.ndarray") -> tuple["np.ndarray", "np.ndarray"]:
+    """
+    (관측소, 시각) 순으로 정렬된 배치를 검사합니다.
+    - keys: 관측소 (n,), times: epoch 초 (n,), values: 변수 값 [n, V] (NULL = NaN)
+    - 반환: (변수별 불량 비트마스크 int64 (n,), 걸린 검사 종류 비트 int16 (n,))
+    """
+    n = len(times)
+    flags = np.zeros(n, dtype=np.int64)
+    checks = np.zeros(n, dtype=np.int16)
+    if n == 0:
+        return flags, checks
+
+    # 이웃 행이 같은 관측소이고 시간 간격이 max_gap 이내인지 (i 와 i+1)
+    linked = (keys[1:] == keys[:-1]) & (np.diff(times) <= spec.max_gap.total_seconds())
+
+    def mark(rows: "np.ndarray", variable: str, check: int) -> None:
+        flags[rows] |= spec.bit(variable)
+        checks[rows] |= check
+
+    with np.errstate(invalid="ignore"):
+        for name, (low, high) in spec.limits.items():
+            v = values[:, spec.variables.index(name)]
+            mark((v < low) | (v > high), name, RANGE)
+
+        for name, limit in spec.spikes.items():
+            v = values[:, spec.variables.index(name)]
+            before = v[1:-1] - v[:-2]    # i - (i-1)
+            after = v[2:] - v[1:-1]      # (i+1) - i
+            spike = np.zeros(n, dtype=bool)
+            spike[1:-1] = (linked[:-1] & linked[1:] & (np.abs(before) > limit) & (np.abs(after) > limit)
+                           & (np.sign(before) != np.sign(after)))
+            mark(spike, name, SPIKE)
+
+        for name, run_limit in spec.persistence.items():
+            v = values[:, spec.variables.index(name)]
+            # 같은 값이 이어지는 구간(run) 번호 → 구간 길이
+            same = linked & (v[1:] == v[:-1])
+            run = np.concatenate(([0], np.cumsum(~same)))
+            length = np.bincount(run)[run]
+            low, high = spec.limits.get(name, (-np.inf, np.inf))
+            mark((length >= run_limit) & ~np.isnan(v) & (v != low) & (v != high), name, PERSISTENCE)
+
+        for low_name, high_name in spec.consistency:
+            bad = (values[:, spec.variables.index(low_name)]
+                   > values[:, spec.variables.index(high_name)] + CONSISTENCY_TOLERANCE)
+            mark(bad, low_name, CONSISTENCY)
+            mark(bad, high_name, CONSISTENCY)
+
+    return flags, checks
+
+
+def _to_seconds(value) -> int:
+    if isinstance(value, datetime):
+        return int((value - datetime(1970, 1, 1)).total_seconds())
+    return (value.toordinal() - date(1970, 1, 1).toordinal()) * 86400
+
+
+def _bound(spec: QcSpec, value: datetime):
+    """시각 경계를 데이터셋의 시간 컬럼 타입으로 (일자료는 날짜)"""
+    return value.date() if spec.time == "tm" else value
+
+
+def run_qc(db: Session, spec: QcSpec, start: datetime, end: datetime) -> tuple[int, int]:
+    """
+    [start, end) 구간을 검사하여 플래그를 교체합니다. (검사 행 수, 플래그 행 수)
+    구간 앞 spec.context 와 뒤 spec.max_gap 을 함께 읽어 경계에 걸친 급변/지속 구간도 판정합니다.
+    """
+    model, flag_model = spec.model, spec.flag_model
+    key_column, time_column = spec.column(spec.key), spec.column(spec.time)
+    checked = flagged = 0
+    chunk_start = start
+    while chunk_start < end:
+        chunk_end = min(chunk_start + spec.chunk, end)
+        lo, hi = _bound(spec, chunk_start), _bound(spec, chunk_end)
+        rows = db.execute(
+            select(model.id, key_column, time_column, *(spec.column(v) for v in spec.variables))
+            .where(time_column >= _bound(spec, chunk_start - spec.context),
+                   time_column <= _bound(spec, chunk_end + spec.max_gap),
+                   key_column.isnot(None), time_column.isnot(None))
+            .order_by(key_column, time_column)
+        ).all()
+
+        ids = np.fromiter((r[0] for r in rows), dtype=np.int64, count=len(rows))
+        keys = np.array([r[1] for r in rows], dtype=object)
+        times = np.fromiter((_to_seconds(r[2]) for r in rows), dtype=np.int64, count=len(rows))
+        values = np.array(
+            [[np.nan if v is None else v for v in r[3:]] for r in rows], dtype=np.float64
+        ).reshape(len(rows), len(spec.variables))
+        flags, checks = check_batch(spec, keys, times, values)
+
+        # 검사 구간(앞뒤로 함께 읽은 행 제외)의 플래그 중 바뀐 행만 교체
+        # (변경이 없으면 문장을 실행하지 않음 - 문장 단위 트리거가 data_versions 를 올리지 않도록)
+        target = (times >= _to_seconds(lo)) & (times < _to_seconds(hi))
+        bad = target & (flags != 0)
+        existing = {
+            r.id: (r.flags, r.checks) for r in db.execute(
+                select(flag_model.id, flag_model.flags, flag_model.checks)
+                .join(model, model.id == flag_model.id)
+                .where(time_column >= lo, time_column < hi)
+            )
+        }
+        current = {int(i): (int(f), int(c)) for i, f, c in zip(ids[bad], flags[bad], checks[bad])}
+        changed = {i: v for i, v in current.items() if existing.get(i) != v}
+        stale = [i for i in existing if i not in current or i in changed]
+        if stale:
+            db.execute(delete(flag_model).where(flag_model.id.in_(stale)))
+        if changed:
+            db.execute(insert(flag_model), [
+                {"id": i, "flags": f, "checks": c} for i, (f, c) in changed.items()
+            ])
+        db.commit()
+
+        # 새로 걸렸거나 결과가 바뀐 행만 셈 (겹쳐서 다시 검사한 행은 제외)
+        for bit, check in CHECK_NAMES.items():
+            count = sum(1 for _, c in changed.values() if c & bit)
+            if count:
+                QC_FLAGGED.labels(spec.name, check).inc(count)
+        checked += int(target.sum())
+        flagged += int(bad.sum())
+        chunk_start = chunk_end
+    return checked, flagged
+
+
+def run_incremental(db: Session, spec: QcSpec) -> tuple[int, int]:
+    """
+    마지막 검사 위치 - max(QC_LOOKBACK_HOURS, spec.lookback) 부터 현재까지 검사하고 진행 위치를 기록합니다.
+    (일자료는 다음 날 자료가 들어온 뒤에야 급변 검사가 가능하므로 며칠을 겹쳐서 다시 검사)
+    """
+    progress = db.get(QcRun, spec.name)
+    now = datetime.now()
+    end = now + spec.max_gap  # 오늘 자료 / 현재 10분 자료까지 포함
+    if progress is not None:
+        start = progress.checked_until - max(timedelta(hours=settings.QC_LOOKBACK_HOURS), spec.lookback)
+    else:
+        # 처음 실행 - 전체 기간 (청크 단위)
+        first = db.execute(select(func.min(spec.column(spec.time)))).scalar()
+        if first is None:
+            return 0, 0
+        start = first if isinstance(first, datetime) else datetime.combine(first, datetime.min.time())
+    result = run_qc(db, spec, start, end)
+
+    progress = db.get(QcRun, spec.name) or QcRun(dataset=spec.name)
+    progress.checked_until = now
+    db.add(progress)
+    db.commit()
+    return result
+
+
+def run_all_incremental() -> str:
+    """모든 데이터셋 증분 검사 (스케줄러 작업)"""
+    if np is None or not settings.QC_ENABLED:
+        return ""
+    db = SessionLocal()
+    try:
+        results = {name: run_incremental(db, spec) for name, spec in SPECS.items()}
+    finally:
+        db.close()
+    return ", ".join(f"{name} {checked}행 검사/{flagged}행 플래그" for name, (checked, flagged) in results.items()
+                     if checked)
+
+
+def qc_columns(query: Query, spec_name: str, keys: Sequence[str], qc: str) -> Query:
+    """
+    select_columns 대신 사용 - keys 컬럼만 튜플로 조회합니다.
+    qc=strict 이면 플래그 테이블을 LEFT JOIN 하여 QC 에 걸린 변수 값을 NULL 로 반환합니다.
+    (필터링이 쿼리 안에서 일어나므로 페이지네이션/다운로드도 같은 결과)
+    """
+    spec = SPECS[spec_name]
+    if qc != "strict":
+        return query.with_entities(*(spec.column(k) for k in keys))
+
+    flag_model = spec.flag_model
+    flags = func.coalesce(flag_model.flags, 0)
+    columns = [
+        case((flags.op("&")(spec.bit(k)) == 0, spec.column(k))).label(k) if k in spec.variables else spec.column(k)
+        for k in keys
+    ]
+    return query.outerjoin(flag_model, flag_model.id == spec.model.id).with_entities(*columns)
+
+
+def summary(db: Session, spec: QcSpec, start: Optional[datetime], end: Optional[datetime]) -> dict[str, int]:
+    """구간의 변수별 플래그 수"""
+    time_column = spec.column(spec.time)
+    query = select(spec.flag_model.flags).join(spec.model, spec.model.id == spec.flag_model.id)
+    if start:
+        query = query.where(time_column >= _bound(spec, start))
+    if end:
+        query = query.where(time_column < _bound(spec, end))
+    counts = dict.fromkeys(spec.variables, 0)
+    for (flags,) in db.execute(query):
+        for name in spec.variables:
+            if flags & spec.bit(name):
+                counts[name] += 1
+    return counts
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="데이터 품질 관리(QC)")
+    parser.add_argument("command", choices=["run", "summary"])
+    parser.add_argument("--dataset", choices=list(SPECS), help="대상 데이터셋 (미입력시 전체)")
+    parser.add_argument("--start", type=datetime.fromisoformat, help="시작 (YYYY-MM-DD[THH:MM])")
+    parser.add_argument("--end", type=datetime.fromisoformat, help="종료 (미포함)")
+    args = parser.parse_args()
+
+    if np is None:
+        raise SystemExit("[QC] numpy 가 설치되어 있지 않습니다.")
+
+    db = SessionLocal()
+    try:
+        for name in [args.dataset] if args.dataset else SPECS:
+            spec = SPECS[name]
+            if args.command == "run":
+                if args.start and args.end:
+                    checked, flagged = run_qc(db, spec, args.start, args.end)
+                else:
+                    checked, flagged = run_incremental(db, spec)
+                print(f"[QC] {name}: {checked} rows checked, {flagged} rows flagged")
+            else:
+                counts = summary(db, spec, args.start, args.end)
+                print(f"[QC] {name}: " + ", ".join(f"{k}={v}" for k, v in counts.items() if v))
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
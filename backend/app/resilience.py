@@ -0,0 +1,285 @@
+"""
+DB 장애 대응 (stale-while-revalidate + 서킷 브레이커)
+- 읽기 엔드포인트의 마지막 정상(200) 응답을 (경로, 쿼리, Accept-Encoding) 별로 보관합니다.
+- DB 가 느려 STALE_TIMEOUT_SECONDS 안에 응답이 시작되지 않으면 보관된 응답을 즉시 반환하고,
+  원래 요청은 백그라운드에서 계속 실행하여 끝나면 보관 응답을 갱신합니다.
+- DB 오류(연결 실패, 풀 대기 초과, statement_timeout)가 BREAKER_FAILURE_THRESHOLD 번 연속되면
+  서킷을 열고 BREAKER_RESET_SECONDS 동안 DB 를 호출하지 않습니다.
+  이 동안 보관된 응답이 있으면 그대로, 없으면 503 을 바로 반환합니다.
+  이후 요청 하나만 시험 삼아 통과시켜(half-open) 성공하면 서킷을 닫습니다.
+- 보관된 응답에는 X-Cache: STALE, Age, Warning: 110 헤더를 붙입니다.
+"""
+
+import asyncio
+import json
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from sqlalchemy.exc import DBAPIError, TimeoutError as PoolTimeoutError
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .config import get_settings
+from .metrics import CIRCUIT_STATE, STALE_RESPONSES
+
+settings = get_settings()
+
+CLOSED, HALF_OPEN, OPEN = "closed", "half_open", "open"
+
+# 보관하지 않는 경로 (스트림, 관리 API)
+EXCLUDED_PREFIXES = ("/api/stream", "/api/admin")
+
+# 보관하는 응답 형식 (Arrow/Parquet 다운로드와 SSE 는 스트리밍이므로 제외)
+STORABLE_TYPES = ("application/json",)
+
+# DB 장애로 보는 예외 (그 외 예외는 서킷 상태에 영향 없음)
+DB_ERRORS = (DBAPIError, PoolTimeoutError)
+
+
+class CircuitBreaker:
+    """연속 DB 오류 횟수 기반 서킷 브레이커"""
+
+    def __init__(self, failure_threshold: int, reset_seconds: float):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        CIRCUIT_STATE.set(0)
+
+    def allow(self) -> bool:
+        """DB 를 호출해도 되는지 (open 이면 False, half-open 이면 시험 요청 하나만 True)"""
+        if self.state == CLOSED:
+            return True
+        if self.state == OPEN and time.monotonic() - self._opened_at >= self.reset_seconds:
+            self._set_state(HALF_OPEN)
+        if self.state == HALF_OPEN and not self._probing:
+            self._probing = True
+            return True
+        return False
+
+    def record_success(self) -> None:
+        self._failures = 0
+        self._probing = False
+        if self.state != CLOSED:
+            print("[CIRCUIT] DB 정상화 - 서킷 닫힘")
+            self._set_state(CLOSED)
+
+    def record_failure(self, exc: BaseException) -> None:
+        self._failures += 1
+        self._probing = False
+        if self.state == HALF_OPEN or (self.state == CLOSED and self._failures >= self.failure_threshold):
+            print(f"[CIRCUIT] DB 오류 {self._failures}회 - 서킷 열림 ({self.reset_seconds:g}초): "
+                  f"{str(exc).splitlines()[0] if str(exc) else type(exc).__name__}")
+            self._opened_at = time.monotonic()
+            self._set_state(OPEN)
+
+    def release_probe(self) -> None:
+        """시험 요청이 DB 와 무관한 이유로 끝난 경우 다음 요청이 다시 시험하도록 함"""
+        self._probing = False
+
+    def _set_state(self, state: str) -> None:
+        self.state = state
+        CIRCUIT_STATE.set({CLOSED: 0, HALF_OPEN: 1, OPEN: 2}[state])
+
+
+class LastGoodCache:
+    """요청 키 → (저장 시각, 응답 헤더, 본문) LRU 캐시 (총 바이트 상한)"""
+
+    def __init__(self, max_bytes: int, max_entry_bytes: int):
+        self.max_bytes = max_bytes
+        self.max_entry_bytes = max_entry_bytes
+        self._size = 0
+        self._entries: OrderedDict[str, tuple[float, list, bytes]] = OrderedDict()
+
+    def get(self, key: str, max_age: float) -> Optional[tuple[float, list, bytes]]:
+        entry = self._entries.get(key)
+        if entry is None or time.time() - entry[0] > max_age:
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def put(self, key: str, headers: list, body: bytes) -> None:
+        if len(body) > self.max_entry_bytes:
+            return
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._size -= len(old[2])
+        self._entries[key] = (time.time(), headers, body)
+        self._size += len(body)
+        while self._size > self.max_bytes:
+            _, (_, _, evicted) = self._entries.popitem(last=False)
+            self._size -= len(evicted)
+
+
+def request_key(scope: Scope) -> Optional[str]:
+    """보관 대상 요청의 키 (대상이 아니면 None)"""
+    path = scope["path"]
+    if not path.startswith("/api/") or path.startswith(EXCLUDED_PREFIXES):
+        return None
+    query = scope.get("query_string", b"").decode("latin-1")
+    params = sorted(query.split("&")) if query else []
+    if any(p in ("format=arrow", "format=parquet") for p in params):
+        return None
+    encoding = Headers(scope=scope).get("accept-encoding", "")
+    return f"{path}?{'&'.join(params)}#{encoding}"
+
+
+class _Capture:
+    """앱의 응답 메시지를 대기열로 받아 두고, 보관 가능한 200 응답이면 본문을 모음 (앱 종료 시 None)"""
+
+    def __init__(self, max_entry_bytes: int):
+        self.queue: asyncio.Queue[Optional[Message]] = asyncio.Queue()
+        self.max_entry_bytes = max_entry_bytes
+        self.status = 0
+        self.headers: list = []
+        self.body: Optional[bytearray] = None
+        self.complete = False
+
+    async def __call__(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            self.status = message["status"]
+            self.headers = list(message.get("headers", []))
+            content_type = Headers(raw=self.headers).get("content-type", "")
+            if self.status == 200 and content_type.startswith(STORABLE_TYPES):
+                self.body = bytearray()
+        elif message["type"] == "http.response.body":
+            if self.body is not None:
+                self.body.extend(message.get("body", b""))
+                if len(self.body) > self.max_entry_bytes:
+                    self.body = None
+            if not message.get("more_body", False):
+                self.complete = True
+        self.queue.put_nowait(message)
+
+
+def _consume_result(task: asyncio.Task) -> None:
+    """백그라운드로 넘긴 요청의 예외를 소비 (서킷에는 이미 기록됨)"""
+    if not task.cancelled():
+        task.exception()
+
+
+class ResilienceMiddleware:
+    """마지막 정상 응답 보관 + 서킷 브레이커 ASGI 미들웨어"""
+
+    def __init__(self, app: ASGIApp, breaker: CircuitBreaker, stale_timeout: float, max_age: float,
+                 cache_bytes: int, max_entry_bytes: int):
+        self.app = app
+        self.breaker = breaker
+        self.stale_timeout = stale_timeout
+        self.max_age = max_age
+        self.max_entry_bytes = max_entry_bytes
+        self.cache = LastGoodCache(cache_bytes, max_entry_bytes)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] not in ("GET", "HEAD") \
+                or not scope["path"].startswith("/api/"):
+            await self.app(scope, receive, send)
+            return
+
+        key = request_key(scope)
+        stale = self.cache.get(key, self.max_age) if key else None
+
+        if not self.breaker.allow():
+            if stale is not None:
+                STALE_RESPONSES.labels("circuit_open").inc()
+                await self._send_stale(send, stale)
+            else:
+                await self._send_unavailable(send)
+            return
+
+        if key is None:
+            await self._run_direct(scope, receive, send)
+            return
+
+        capture = _Capture(self.max_entry_bytes)
+        task = asyncio.create_task(self._run(scope, receive, capture, key))
+
+        # 응답 시작을 기다림 - 보관 응답이 있으면 STALE_TIMEOUT_SECONDS 까지만
+        first = asyncio.ensure_future(capture.queue.get())
+        done, _ = await asyncio.wait({first}, timeout=self.stale_timeout if stale is not None else None)
+        if not done:
+            # 느림: 보관 응답 반환, 원래 요청은 백그라운드에서 계속 (끝나면 보관 응답 갱신)
+            first.cancel()
+            task.add_done_callback(_consume_result)
+            STALE_RESPONSES.labels("timeout").inc()
+            await self._send_stale(send, stale)
+            return
+
+        message = first.result()
+        if message is None:
+            # 응답 없이 종료 = 예외. DB 오류이고 보관 응답이 있으면 그것으로 대신함
+            await asyncio.wait({task})
+            if stale is not None and isinstance(task.exception(), DB_ERRORS):
+                STALE_RESPONSES.labels("error").inc()
+                await self._send_stale(send, stale)
+                return
+            await task
+
+        while message is not None:
+            await send(message)
+            message = await capture.queue.get()
+        await task
+
+    async def _run_direct(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """보관 대상이 아닌 요청 (Arrow/Parquet 스트리밍 등) - 그대로 전달하고 서킷만 기록"""
+        try:
+            await self.app(scope, receive, send)
+        except DB_ERRORS as exc:
+            self.breaker.record_failure(exc)
+            raise
+        except BaseException:
+            self.breaker.release_probe()
+            raise
+        self.breaker.record_success()
+
+    async def _run(self, scope: Scope, receive: Receive, capture: _Capture, key: str) -> None:
+        """앱 실행 + 서킷 기록 + 정상 응답 보관"""
+        try:
+            await self.app(scope, receive, capture)
+        except DB_ERRORS as exc:
+            self.breaker.record_failure(exc)
+            raise
+        except BaseException:
+            self.breaker.release_probe()
+            raise
+        finally:
+            capture.queue.put_nowait(None)
+        self.breaker.record_success()
+        if capture.complete and capture.body is not None:
+            self.cache.put(key, capture.headers, bytes(capture.body))
+
+    async def _send_stale(self, send: Send, entry: tuple[float, list, bytes]) -> None:
+        stored_at, headers, body = entry
+        message = {"type": "http.response.start", "status": 200, "headers": list(headers)}
+        response_headers = MutableHeaders(scope=message)
+        response_headers["X-Cache"] = "STALE"
+        response_headers["Age"] = str(int(time.time() - stored_at))
+        response_headers["Warning"] = '110 - "Response is Stale"'
+        await send(message)
+        await send({"type": "http.response.body", "body": body})
+
+    async def _send_unavailable(self, send: Send) -> None:
+        body = json.dumps(
+            {"detail": "데이터베이스에 일시적으로 연결할 수 없습니다. 잠시 후 다시 시도하세요."},
+            ensure_ascii=False,
+        ).encode("utf-8")
+        await send({
+            "type": "http.response.start",
+            "status": 503,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode("latin-1")),
+                (b"retry-after", str(max(int(self.breaker.reset_seconds), 1)).encode("latin-1")),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
+
+
+# 프로세스 공용 서킷 브레이커 (/health 에서 상태 확인)
+circuit_breaker = CircuitBreaker(
+    failure_threshold=settings.BREAKER_FAILURE_THRESHOLD,
+    reset_seconds=settings.BREAKER_RESET_SECONDS,
+)
@@ -0,0 +1,287 @@
+"""
+RDA 10분 자료 롤업 / 보존 계층 모듈
+- weather_data(10분) → weather_data_hourly(시간별) 롤업
+- 시간별 집계와 weather_data_daily(일별) 교차 검증
+- 보존 기간이 지난 원자료 삭제 (롤업이 끝난 구간만)
+
+사용법:
+    cd backend
+    python -m app.rollup rollup                 # 마지막 롤업 이후 증분 롤업
+    python -m app.rollup rollup --start 2024-01-01 --end 2024-02-01
+    python -m app.rollup verify --start 2024-01-01 --end 2024-01-31
+    python -m app.rollup retention --vacuum
+"""
+
+import argparse
+from datetime import date, datetime, timedelta
+from typing import Optional
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from .config import get_settings
+from .database import SessionLocal, engine
+
+settings = get_settings()
+
+# 한 번에 삭제할 최대 행 수 (긴 트랜잭션/WAL 폭증 방지)
+DELETE_BATCH_SIZE = 50000
+
+ROLLUP_SQL = text("""
+    INSERT INTO weather_data_hourly (
+        stn_cd, stn_name, province, datetime,
+        temp, hghst_artmp, lowst_artmp, hum, widdir, wind, max_wind,
+        rn, sun_time, srqty, condens_time, gr_temp, soil_temp, soil_wt,
+        sample_count
+    )
+    SELECT
+        stn_cd,
+        max(stn_name),
+        max(province),
+        date_trunc('hour', datetime) AS hour,
+        avg(temp),
+        max(hghst_artmp),
+        min(lowst_artmp),
+        avg(hum),
+        -- 풍속 가중 벡터평균 풍향 (0~360)
+        mod(degrees(atan2(
+            avg(wind * sin(radians(widdir))),
+            avg(wind * cos(radians(widdir)))
+        ))::numeric + 360, 360)::float,
+        avg(wind),
+        max(max_wind),
+        sum(rn),
+        sum(sun_time),
+        sum(srqty),
+        sum(condens_time),
+        avg(gr_temp),
+        avg(soil_temp),
+        avg(soil_wt),
+        count(*)
+    FROM weather_data
+    WHERE datetime >= :start AND datetime < :end
+      AND stn_cd IS NOT NULL
+    GROUP BY stn_cd, date_trunc('hour', datetime)
+    ON CONFLICT (stn_cd, datetime) DO UPDATE SET
+        stn_name = EXCLUDED.stn_name,
+        province = EXCLUDED.province,
+        temp = EXCLUDED.temp,
+        hghst_artmp = EXCLUDED.hghst_artmp,
+        lowst_artmp = EXCLUDED.lowst_artmp,
+        hum = EXCLUDED.hum,
+        widdir = EXCLUDED.widdir,
+        wind = EXCLUDED.wind,
+        max_wind = EXCLUDED.max_wind,
+        rn = EXCLUDED.rn,
+        sun_time = EXCLUDED.sun_time,
+        srqty = EXCLUDED.srqty,
+        condens_time = EXCLUDED.condens_time,
+        gr_temp = EXCLUDED.gr_temp,
+        soil_temp = EXCLUDED.soil_temp,
+        soil_wt = EXCLUDED.soil_wt,
+        sample_count = EXCLUDED.sample_count
+""")
+
+VERIFY_SQL = text("""
+    WITH hourly AS (
+        SELECT
+            stn_cd,
+            datetime::date AS date,
+            sum(temp * sample_count) / nullif(sum(sample_count), 0) AS temp,
+            max(hghst_artmp) AS hghst_artmp,
+            min(lowst_artmp) AS lowst_artmp,
+            sum(rn) AS rn,
+            sum(sample_count) AS sample_count
+        FROM weather_data_hourly
+        WHERE datetime >= :start AND datetime < :end
+        GROUP BY stn_cd, datetime::date
+    )
+    SELECT
+        d.stn_cd, d.date, h.sample_count,
+        d.temp AS daily_temp, h.temp AS hourly_temp,
+        d.hghst_artmp AS daily_max, h.hghst_artmp AS hourly_max,
+        d.lowst_artmp AS daily_min, h.lowst_artmp AS hourly_min,
+        d.rn AS daily_rn, h.rn AS hourly_rn
+    FROM weather_data_daily d
+    JOIN hourly h ON h.stn_cd = d.stn_cd AND h.date = d.date
+    WHERE d.date >= :start_date AND d.date < :end_date
+      AND (
+        abs(coalesce(d.temp, 0) - coalesce(h.temp, 0)) > :temp_tol
+        OR abs(coalesce(d.hghst_artmp, 0) - coalesce(h.hghst_artmp, 0)) > :temp_tol
+        OR abs(coalesce(d.lowst_artmp, 0) - coalesce(h.lowst_artmp, 0)) > :temp_tol
+        OR abs(coalesce(d.rn, 0) - coalesce(h.rn, 0)) > :rn_tol
+      )
+    ORDER BY d.date, d.stn_cd
+""")
+
+
+def raw_cutoff(now: Optional[datetime] = None) -> Optional[datetime]:
+    """10분 원자료가 보존되는 가장 이른 시각 (무기한 보존이면 None)"""
+    if settings.RAW_RETENTION_DAYS <= 0:
+        return None
+    now = now or datetime.now()
+    return (now - timedelta(days=settings.RAW_RETENTION_DAYS)).replace(
+        minute=0, second=0, microsecond=0
+    )
+
+
+def use_hourly_tier(start: Optional[datetime], end: Optional[datetime]) -> bool:
+    """
+    조회 구간에 시간별 집계를 사용할지 판단합니다.
+    - 조회 기간이 HOURLY_TIER_MIN_DAYS 보다 긴 경우
+    - 시작 시각이 원자료 보존 기간 이전인 경우
+    """
+    if start is None:
+        return False
+    end = end or datetime.now()
+    if end - start > timedelta(days=settings.HOURLY_TIER_MIN_DAYS):
+        return True
+    cutoff = raw_cutoff()
+    return cutoff is not None and start < cutoff
+
+
+def rollup_hourly(db: Session, start: datetime, end: datetime) -> int:
+    """
+    [start, end) 구간의 10분 자료를 시간별로 롤업합니다. (멱등)
+    - 정시 경계로 확장하여 부분 집계를 방지합니다.
+    """
+    start = start.replace(minute=0, second=0, microsecond=0)
+    if end.minute or end.second or end.microsecond:
+        end = end.replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)
+
+    result = db.execute(ROLLUP_SQL, {"start": start, "end": end})
+    db.commit()
+    return result.rowcount
+
+
+def rollup_incremental(db: Session) -> int:
+    """마지막으로 롤업된 시각(1시간 겹침) 이후의 10분 자료를 롤업합니다."""
+    last = db.execute(text("SELECT max(datetime) FROM weather_data_hourly")).scalar()
+    if last is None:
+        last = db.execute(text("SELECT min(datetime) FROM weather_data")).scalar()
+        if last is None:
+            return 0
+    # 마지막 시간대는 롤업 당시 미완성이었을 수 있으므로 다시 집계
+    start = last - timedelta(hours=1)
+    end = datetime.now() + timedelta(hours=1)
+    return rollup_hourly(db, start, end)
+
+
+def verify_against_daily(
+    db: Session,
+    start_date: date,
+    end_date: date,
+    temp_tol: float = 0.5,
+    rn_tol: float = 1.0
+) -> list[dict]:
+    """
+    시간별 집계를 일별 테이블과 비교하여 허용 오차를 넘는 (관측소, 날짜) 목록을 반환합니다.
+    - end_date 는 포함하지 않습니다.
+    """
+    rows = db.execute(VERIFY_SQL, {
+        "start": datetime.combine(start_date, datetime.min.time()),
+        "end": datetime.combine(end_date, datetime.min.time()),
+        "start_date": start_date,
+        "end_date": end_date,
+        "temp_tol": temp_tol,
+        "rn_tol": rn_tol,
+    }).mappings().all()
+    return [dict(r) for r in rows]
+
+
+def _delete_in_batches(db: Session, sql: str, params: dict) -> int:
+    """id 기준으로 나누어 삭제하고, 배치마다 커밋합니다."""
+    total = 0
+    while True:
+        result = db.execute(text(sql), {**params, "batch": DELETE_BATCH_SIZE})
+        db.commit()
+        total += result.rowcount
+        if result.rowcount < DELETE_BATCH_SIZE:
+            return total
+
+
+def apply_retention(db: Session) -> dict:
+    """
+    보존 기간이 지난 자료를 삭제합니다.
+    - 10분 원자료: 해당 시간대가 시간별 집계에 존재하는 경우에만 삭제
+    - 시간별 집계: HOURLY_RETENTION_DAYS > 0 인 경우에만 삭제
+    """
+    deleted = {"weather_data": 0, "weather_data_hourly": 0}
+
+    cutoff = raw_cutoff()
+    if cutoff is not None:
+        deleted["weather_data"] = _delete_in_batches(db, """
+            DELETE FROM weather_data
+            WHERE id IN (
+                SELECT w.id FROM weather_data w
+                WHERE w.datetime < :cutoff
+                  AND EXISTS (
+                    SELECT 1 FROM weather_data_hourly h
+                    WHERE h.stn_cd = w.stn_cd
+                      AND h.datetime = date_trunc('hour', w.datetime)
+                  )
+                LIMIT :batch
+            )
+        """, {"cutoff": cutoff})
+
+    if settings.HOURLY_RETENTION_DAYS > 0:
+        hourly_cutoff = datetime.now() - timedelta(days=settings.HOURLY_RETENTION_DAYS)
+        deleted["weather_data_hourly"] = _delete_in_batches(db, """
+            DELETE FROM weather_data_hourly
+            WHERE id IN (
+                SELECT id FROM weather_data_hourly
+                WHERE datetime < :cutoff
+                LIMIT :batch
+            )
+        """, {"cutoff": hourly_cutoff})
+
+    return deleted
+
+
+def vacuum(tables: list[str]) -> None:
+    """삭제 후 공간 회수를 위해 VACUUM (ANALYZE) 를 실행합니다."""
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        for table in tables:
+            conn.execute(text(f"VACUUM (ANALYZE) {table}"))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="RDA 10분 자료 롤업 / 보존 관리")
+    parser.add_argument("command", choices=["rollup", "verify", "retention", "all"])
+    parser.add_argument("--start", type=date.fromisoformat, help="시작 날짜 (YYYY-MM-DD)")
+    parser.add_argument("--end", type=date.fromisoformat, help="종료 날짜 (YYYY-MM-DD, 미포함)")
+    parser.add_argument("--vacuum", action="store_true", help="보존 정리 후 VACUUM 실행")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        if args.command in ("rollup", "all"):
+            if args.start and args.end:
+                count = rollup_hourly(
+                    db,
+                    datetime.combine(args.start, datetime.min.time()),
+                    datetime.combine(args.end, datetime.min.time())
+                )
+            else:
+                count = rollup_incremental(db)
+            print(f"[ROLLUP] {count} hourly rows upserted")
+
+        if args.command in ("verify", "all"):
+            end = args.end or date.today()
+            start = args.start or end - timedelta(days=7)
+            mismatches = verify_against_daily(db, start, end)
+            for m in mismatches:
+                print(f"[VERIFY] {m['stn_cd']} {m['date']}: {m}")
+            print(f"[VERIFY] {len(mismatches)} mismatch(es) in {start} ~ {end}")
+
+        if args.command in ("retention", "all"):
+            deleted = apply_retention(db)
+            print(f"[RETENTION] deleted {deleted}")
+            if args.vacuum:
+                vacuum([t for t, n in deleted.items() if n])
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
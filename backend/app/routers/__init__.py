@@ -4,6 +4,9 @@ from .kma_realtime import router as kma_realtime_router
 from .kma_forecast import router as kma_forecast_router
 from .rda_weather import router as rda_weather_router
 from .stats import router as stats_router
+from .stream import router as stream_router
+from .admin import router as admin_router
+from .alerts import router as alerts_router
 
 __all__ = [
     "kma_asos_router",
@@ -11,4 +14,7 @@ __all__ = [
     "kma_forecast_router",
     "rda_weather_router",
     "stats_router",
+    "stream_router",
+    "admin_router",
+    "alerts_router",
 ]
@@ -0,0 +1,50 @@
+"""
+관리 API 라우터
+- 운영 진단용 엔드포인트 (느린 쿼리 기록 등)
+- ADMIN_TOKEN 이 설정된 경우에만 사용할 수 있으며, X-Admin-Token 헤더로 인증합니다.
+"""
+
+import secrets
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+
+from ..config import get_settings
+from ..slowlog import slow_queries
+
+settings = get_settings()
+
+
+def require_admin(x_admin_token: Optional[str] = Header(default=None)) -> None:
+    """관리 토큰 확인"""
+    if not settings.ADMIN_TOKEN:
+        raise HTTPException(status_code=404, detail="관리 API 가 비활성화되어 있습니다.")
+    if not x_admin_token or not secrets.compare_digest(x_admin_token, settings.ADMIN_TOKEN):
+        raise HTTPException(status_code=403, detail="관리 토큰이 올바르지 않습니다.")
+
+
+router = APIRouter(
+    prefix="/api/admin",
+    tags=["관리"],
+    dependencies=[Depends(require_admin)]
+)
+
+
+@router.get("/slow-queries", summary="느린 쿼리 기록 조회")
+def get_slow_queries(
+    route: Optional[str] = Query(default=None, description="라우트 템플릿으로 필터 (예: /api/kma/asos/range)"),
+    limit: int = Query(default=50, ge=1, le=1000, description="조회 개수")
+):
+    """
+    SLOW_QUERY_MS 를 넘긴 최근 SQL 기록을 최신순으로 반환합니다.
+    - sql: 정규화된 문장, params: 파라미터 이름/타입
+    - plan: 샘플링된 EXPLAIN (ANALYZE, BUFFERS) 결과 (없으면 null)
+    """
+    records = slow_queries.records()
+    if route:
+        records = [r for r in records if r["route"] == route]
+    return {
+        "threshold_ms": slow_queries.threshold_ms,
+        "explain_sample": slow_queries.explain_sample,
+        "data": records[:limit],
+    }
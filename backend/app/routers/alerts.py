@@ -0,0 +1,76 @@
+# backend/app/routers/alerts.py
+"""
+이상기상 알림 API 라우터
+- 폭염 / 늦서리 / 호우 알림 조회 (스케줄러가 증분 탐지한 alert_events 만 읽음, app.alerts)
+"""
+
+from typing import List, Optional
+from datetime import date, datetime, time, timedelta
+from fastapi import APIRouter, Depends, Query, HTTPException
+from sqlalchemy.orm import Session
+
+from ..alerts import RULE_PATTERN
+from ..database import get_db
+from ..models.alerts import AlertEvent
+from ..serialization import LAYOUT_PATTERN, select_columns, rows_response, paginated_response
+from ..schemas.common import PaginatedResponse
+
+router = APIRouter(
+    prefix="/api/alerts",
+    tags=["이상기상 알림"]
+)
+
+ALERT_KEYS = ("id", "rule", "station", "station_name", "start_time", "end_time", "length", "peak", "active")
+
+
+@router.get("/active", response_model=List[dict], summary="진행 중인 알림 조회")
+def get_active_alerts(
+    rule: Optional[str] = Query(default=None, pattern=RULE_PATTERN, description="규칙 (heat_wave, frost, heavy_rain)"),
+    station: Optional[str] = Query(default=None, description="관측소 코드 / 지점 ID / 지역명"),
+    db: Session = Depends(get_db)
+):
+    """
+    현재 이어지고 있는 알림을 조회합니다. (규칙, 시작 순)
+    - peak: 구간 극값 (폭염: 최고기온 최댓값, 늦서리: 최저기온 최솟값, 호우: 1시간 강수량 최댓값)
+    """
+    query = db.query(AlertEvent).filter(AlertEvent.active)
+    if rule:
+        query = query.filter(AlertEvent.rule == rule)
+    if station:
+        query = query.filter(AlertEvent.station == station)
+
+    query = query.order_by(AlertEvent.rule, AlertEvent.start_time)
+    return rows_response(ALERT_KEYS, select_columns(query, AlertEvent, ALERT_KEYS).all())
+
+
+@router.get("/history", response_model=PaginatedResponse, summary="알림 이력 조회")
+def get_alert_history(
+    rule: Optional[str] = Query(default=None, pattern=RULE_PATTERN, description="규칙 (heat_wave, frost, heavy_rain)"),
+    station: Optional[str] = Query(default=None, description="관측소 코드 / 지점 ID / 지역명"),
+    start_date: Optional[date] = Query(default=None, description="시작 날짜 (이 날 이후까지 이어진 알림)"),
+    end_date: Optional[date] = Query(default=None, description="종료 날짜 (포함, 이 날 이전에 시작한 알림)"),
+    offset: int = Query(default=0, ge=0, description="건너뛸 레코드 수"),
+    limit: int = Query(default=20, ge=1, le=100, description="조회할 레코드 수"),
+    layout: str = Query(default="rows", pattern=LAYOUT_PATTERN, description="data 형태 (rows: 레코드 배열, columns: 컬럼별 배열)"),
+    db: Session = Depends(get_db)
+):
+    """
+    기간과 겹치는 알림(종료된 알림 포함)을 최근 시작 순으로 조회합니다.
+    """
+    if start_date and end_date and start_date > end_date:
+        raise HTTPException(status_code=400, detail="시작 날짜가 종료 날짜보다 늦을 수 없습니다.")
+
+    query = db.query(AlertEvent)
+    if rule:
+        query = query.filter(AlertEvent.rule == rule)
+    if station:
+        query = query.filter(AlertEvent.station == station)
+    if start_date:
+        query = query.filter(AlertEvent.end_time >= datetime.combine(start_date, time.min))
+    if end_date:
+        query = query.filter(AlertEvent.start_time < datetime.combine(end_date + timedelta(days=1), time.min))
+
+    total = query.count()
+    query = query.order_by(AlertEvent.start_time.desc(), AlertEvent.id.desc()).offset(offset).limit(limit)
+    rows = select_columns(query, AlertEvent, ALERT_KEYS).all()
+    return paginated_response(total, offset, limit, ALERT_KEYS, rows, layout=layout)
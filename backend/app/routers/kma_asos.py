@@ -8,94 +8,76 @@ from typing import Optional, List
 from datetime import date
 from fastapi import APIRouter, Depends, Query, HTTPException
 from sqlalchemy.orm import Session
-from sqlalchemy import func, desc
+from sqlalchemy import desc, select
 
-from ..database import get_db
+from ..catalogs import asos_station_catalog
+from ..database import get_db, get_bulk_db
 from ..models.kma import AsosDailyData
+from ..qc import QC_PATTERN, qc_columns
 from ..schemas.kma import AsosDailyResponse
 from ..schemas.common import PaginatedResponse
+from ..serialization import LAYOUT_PATTERN, rows_response, paginated_response
+from ..columnar import FORMAT_PATTERN, COLUMNAR_FORMATS, columnar_response
 
 router = APIRouter(
     prefix="/api/kma/asos",
     tags=["KMA ASOS 일자료"]
 )
 
+# 목록/기간 조회에서 반환하는 ASOS 컬럼
+ASOS_KEYS = (
+    "id", "stn_id", "stn_nm", "tm", "avg_ta", "min_ta", "max_ta",
+    "sum_rn", "avg_ws", "avg_rhm", "sum_ss_hr", "sum_gsr",
+)
+
 
 @router.get("/latest", summary="최신 ASOS 일자료 조회")
 def get_latest_asos_data(
     stn_id: Optional[int] = Query(default=None, description="지점 ID (미입력시 전체)"),
     limit: int = Query(default=20, ge=1, le=100, description="조회 개수"),
+    qc: str = Query(default="none", pattern=QC_PATTERN, description="품질 관리 (strict: QC 에 걸린 값은 null)"),
     db: Session = Depends(get_db)
 ):
     """
     최신 ASOS 일자료를 조회합니다.
     - stn_id: 특정 지점만 조회 (선택)
     - limit: 조회할 데이터 개수 (기본 20, 최대 100)
+    - qc=strict: 품질 검사(app.qc)에서 걸린 값은 null 로 반환
     """
     query = db.query(AsosDailyData).order_by(desc(AsosDailyData.tm))
 
     if stn_id:
         query = query.filter(AsosDailyData.stn_id == stn_id)
 
-    results = query.limit(limit).all()
+    results = qc_columns(query, "asos", ASOS_KEYS, qc).limit(limit).all()
 
-    return [
-        {
-            "id": r.id,
-            "stn_id": r.stn_id,
-            "stn_nm": r.stn_nm,
-            "tm": r.tm.isoformat() if r.tm else None,
-            "avg_ta": r.avg_ta,
-            "min_ta": r.min_ta,
-            "max_ta": r.max_ta,
-            "sum_rn": r.sum_rn,
-            "avg_ws": r.avg_ws,
-            "avg_rhm": r.avg_rhm,
-            "sum_ss_hr": r.sum_ss_hr,
-            "sum_gsr": r.sum_gsr,
-        }
-        for r in results
-    ]
+    return rows_response(ASOS_KEYS, results)
 
 
 @router.get("/date/{target_date}", summary="특정 날짜 ASOS 데이터 조회")
 def get_asos_by_date(
     target_date: date,
     stn_id: Optional[int] = Query(default=None, description="지점 ID (미입력시 전체)"),
+    qc: str = Query(default="none", pattern=QC_PATTERN, description="품질 관리 (strict: QC 에 걸린 값은 null)"),
     db: Session = Depends(get_db)
 ):
     """
     특정 날짜의 ASOS 일자료를 조회합니다.
     - target_date: 조회할 날짜 (YYYY-MM-DD)
     - stn_id: 특정 지점만 조회 (선택)
+    - qc=strict: 품질 검사(app.qc)에서 걸린 값은 null 로 반환
     """
     query = db.query(AsosDailyData).filter(AsosDailyData.tm == target_date)
 
     if stn_id:
         query = query.filter(AsosDailyData.stn_id == stn_id)
 
-    results = query.order_by(AsosDailyData.stn_id).all()
+    results = qc_columns(query, "asos", ASOS_KEYS, qc).order_by(AsosDailyData.stn_id).all()
 
     if not results:
         raise HTTPException(status_code=404, detail=f"{target_date} 날짜의 데이터가 없습니다.")
 
-    return [
-        {
-            "id": r.id,
-            "stn_id": r.stn_id,
-            "stn_nm": r.stn_nm,
-            "tm": r.tm.isoformat() if r.tm else None,
-            "avg_ta": r.avg_ta,
-            "min_ta": r.min_ta,
-            "max_ta": r.max_ta,
-            "sum_rn": r.sum_rn,
-            "avg_ws": r.avg_ws,
-            "avg_rhm": r.avg_rhm,
-            "sum_ss_hr": r.sum_ss_hr,
-            "sum_gsr": r.sum_gsr,
-        }
-        for r in results
-    ]
+    return rows_response(ASOS_KEYS, results)
 
 
 @router.get("/range", summary="기간별 ASOS 데이터 조회")
@@ -105,7 +87,10 @@ def get_asos_by_range(
     stn_id: Optional[int] = Query(default=None, description="지점 ID (미입력시 전체)"),
     offset: int = Query(default=0, ge=0, description="건너뛸 레코드 수"),
     limit: int = Query(default=20, ge=1, le=10000, description="조회할 레코드 수 (다운로드 시 최대 10000)"),
-    db: Session = Depends(get_db)
+    output_format: str = Query(default="json", alias="format", pattern=FORMAT_PATTERN, description="응답 형식 (json, arrow, parquet)"),
+    layout: str = Query(default="rows", pattern=LAYOUT_PATTERN, description="data 형태 (rows: 레코드 배열, columns: 컬럼별 배열)"),
+    qc: str = Query(default="none", pattern=QC_PATTERN, description="품질 관리 (strict: QC 에 걸린 값은 null)"),
+    db: Session = Depends(get_bulk_db)
 ):
     """
     기간별 ASOS 일자료를 조회합니다.
@@ -113,6 +98,9 @@ def get_asos_by_range(
     - end_date: 종료 날짜
     - stn_id: 특정 지점만 조회 (선택)
     - 페이지네이션 지원 (offset, limit)
+    - format=arrow|parquet: 기간 전체를 컬럼형 파일로 스트리밍 (offset, limit 미적용)
+    - layout=columns: 컬럼별 배열로 반환 (stn_id 지정 시 지점 정보는 meta 에 포함)
+    - qc=strict: 품질 검사(app.qc)에서 걸린 값은 null 로 반환
     """
     if start_date > end_date:
         raise HTTPException(status_code=400, detail="시작 날짜가 종료 날짜보다 늦을 수 없습니다.")
@@ -125,33 +113,21 @@ def get_asos_by_range(
     if stn_id:
         query = query.filter(AsosDailyData.stn_id == stn_id)
 
+    if output_format in COLUMNAR_FORMATS:
+        statement = qc_columns(query, "asos", ASOS_KEYS, qc)\
+            .order_by(AsosDailyData.tm, AsosDailyData.stn_id).statement
+        return columnar_response(output_format, statement, ASOS_KEYS, f"asos_daily_{start_date}_{end_date}")
+
     # 전체 개수 조회
     total = query.count()
 
     # 페이지네이션 적용
-    results = query.order_by(AsosDailyData.tm, AsosDailyData.stn_id)\
+    results = qc_columns(query, "asos", ASOS_KEYS, qc)\
+        .order_by(AsosDailyData.tm, AsosDailyData.stn_id)\
         .offset(offset).limit(limit).all()
 
-    # SQLAlchemy 모델을 딕셔너리로 변환
-    data = [
-        {
-            "id": r.id,
-            "stn_id": r.stn_id,
-            "stn_nm": r.stn_nm,
-            "tm": r.tm.isoformat() if r.tm else None,
-            "avg_ta": r.avg_ta,
-            "min_ta": r.min_ta,
-            "max_ta": r.max_ta,
-            "sum_rn": r.sum_rn,
-            "avg_ws": r.avg_ws,
-            "avg_rhm": r.avg_rhm,
-            "sum_ss_hr": r.sum_ss_hr,
-            "sum_gsr": r.sum_gsr,
-        }
-        for r in results
-    ]
-
-    return {"total": total, "offset": offset, "limit": limit, "data": data}
+    shared = ("stn_id", "stn_nm") if stn_id else ()
+    return paginated_response(total, offset, limit, ASOS_KEYS, results, layout=layout, shared=shared)
 
 
 @router.get("/stations", summary="ASOS 관측소 목록 조회")
@@ -160,16 +136,10 @@ def get_asos_stations(db: Session = Depends(get_db)):
     ASOS 관측소 목록을 조회합니다.
     - 관측소 ID와 이름, 데이터 개수를 반환합니다.
     """
-    results = db.query(
-        AsosDailyData.stn_id,
-        AsosDailyData.stn_nm,
-        func.count(AsosDailyData.id).label("data_count"),
-        func.min(AsosDailyData.tm).label("first_date"),
-        func.max(AsosDailyData.tm).label("last_date")
-    ).group_by(
-        AsosDailyData.stn_id,
-        AsosDailyData.stn_nm
-    ).order_by(AsosDailyData.stn_id).all()
+    # 스케줄러가 갱신하는 관측소 목록 스냅샷 (app.catalogs)
+    results = db.execute(
+        select(asos_station_catalog).order_by(asos_station_catalog.c.stn_id)
+    ).all()
 
     return [
         {
@@ -14,6 +14,7 @@ from ..database import get_db
 from ..models.kma import WeatherShortForecast, WeatherMidForecast
 from ..schemas.kma import WeatherShortForecastResponse, WeatherMidForecastResponse
 from ..schemas.common import PaginatedResponse
+from ..serialization import schema_keys, select_columns, rows_response, paginated_response
 
 router = APIRouter(
     prefix="/api/kma/forecast",
@@ -47,8 +48,9 @@ def get_latest_short_forecast(
     if category:
         query = query.filter(WeatherShortForecast.category == category)
 
-    results = query.limit(limit).all()
-    return results
+    keys = schema_keys(WeatherShortForecast, WeatherShortForecastResponse)
+    results = select_columns(query, WeatherShortForecast, keys).limit(limit).all()
+    return rows_response(keys, results)
 
 
 @router.get("/short/region/{region_name}", response_model=PaginatedResponse, summary="지역별 단기예보 조회")
@@ -77,14 +79,15 @@ def get_short_forecast_by_region(
     if total == 0:
         raise HTTPException(status_code=404, detail=f"'{region_name}' 지역의 예보 데이터가 없습니다.")
 
-    results = query.order_by(
+    keys = schema_keys(WeatherShortForecast, WeatherShortForecastResponse)
+    results = select_columns(query, WeatherShortForecast, keys).order_by(
         desc(WeatherShortForecast.base_date),
         desc(WeatherShortForecast.base_time),
         WeatherShortForecast.fcst_date,
         WeatherShortForecast.fcst_time
     ).offset(offset).limit(limit).all()
 
-    return PaginatedResponse(total=total, offset=offset, limit=limit, data=results)
+    return paginated_response(total, offset, limit, keys, results)
 
 
 # ===== 단기예보 지역 목록 =====
@@ -130,8 +133,9 @@ def get_latest_mid_forecast(
     if region_name:
         query = query.filter(WeatherMidForecast.region_name == region_name)
 
-    results = query.limit(limit).all()
-    return results
+    keys = schema_keys(WeatherMidForecast, WeatherMidForecastResponse)
+    results = select_columns(query, WeatherMidForecast, keys).limit(limit).all()
+    return rows_response(keys, results)
 
 
 @router.get("/mid/region/{region_name}", response_model=PaginatedResponse, summary="지역별 중기예보 조회")
@@ -157,12 +161,13 @@ def get_mid_forecast_by_region(
     if total == 0:
         raise HTTPException(status_code=404, detail=f"'{region_name}' 지역의 중기예보 데이터가 없습니다.")
 
-    results = query.order_by(
+    keys = schema_keys(WeatherMidForecast, WeatherMidForecastResponse)
+    results = select_columns(query, WeatherMidForecast, keys).order_by(
         desc(WeatherMidForecast.tm_fc),
         WeatherMidForecast.forecast_date
     ).offset(offset).limit(limit).all()
 
-    return PaginatedResponse(total=total, offset=offset, limit=limit, data=results)
+    return paginated_response(total, offset, limit, keys, results)
 
 
 @router.get("/mid/regions", response_model=List[dict], summary="중기예보 지역 목록 조회")
@@ -5,15 +5,24 @@ KMA 초단기 실황 API 라우터
 """
 
 from typing import Optional, List
-from datetime import date, datetime
+from datetime import date
 from fastapi import APIRouter, Depends, Query, HTTPException
 from sqlalchemy.orm import Session
-from sqlalchemy import func, desc, String
+from sqlalchemy import func, desc, and_, literal
 
-from ..database import get_db
+from ..database import get_db, get_bulk_db
+from ..hotstore import hot_store
 from ..models.kma import WeatherRealtime
 from ..schemas.kma import WeatherRealtimeResponse, WeatherRealtimePivotResponse
 from ..schemas.common import PaginatedResponse
+from ..serialization import (
+    LAYOUT_PATTERN,
+    schema_keys,
+    select_columns,
+    rows_to_dicts,
+    rows_response,
+    paginated_response
+)
 
 router = APIRouter(
     prefix="/api/kma/realtime",
@@ -21,6 +30,21 @@ router = APIRouter(
 )
 
 
+# 피벗 조회에서 컬럼으로 펼치는 카테고리
+PIVOT_CATEGORIES = ("T1H", "RN1", "UUU", "VVV", "REH", "PTY", "VEC", "WSD")
+PIVOT_KEYS = ("sido", "region_name", "base_date", "base_time", *PIVOT_CATEGORIES)
+TODAY_CATEGORIES = ("T1H", "REH")
+TODAY_KEYS = ("region_name", "base_date", "base_time", *TODAY_CATEGORIES)
+
+
+def pivot_columns(categories):
+    """카테고리 행 → 컬럼 피벗 표현식 (GROUP BY 발표 시각과 함께 사용)"""
+    return [
+        func.max(WeatherRealtime.obsrvalue).filter(WeatherRealtime.category == c).label(c)
+        for c in categories
+    ]
+
+
 @router.get("/latest", response_model=List[WeatherRealtimeResponse], summary="최신 초단기 실황 조회")
 def get_latest_realtime(
     region_name: Optional[str] = Query(default=None, description="지역명 (미입력시 전체)"),
@@ -40,8 +64,9 @@ def get_latest_realtime(
     if region_name:
         query = query.filter(WeatherRealtime.region_name == region_name)
 
-    results = query.limit(limit).all()
-    return results
+    keys = schema_keys(WeatherRealtime, WeatherRealtimeResponse)
+    results = select_columns(query, WeatherRealtime, keys).limit(limit).all()
+    return rows_response(keys, results)
 
 
 @router.get("/latest/pivot", response_model=List[WeatherRealtimePivotResponse], summary="최신 초단기 실황 (피벗)")
@@ -55,6 +80,11 @@ def get_latest_realtime_pivot(
     최신 초단기 실황 데이터를 카테고리별 컬럼으로 피벗하여 조회합니다.
     - T1H: 기온, RN1: 강수량, REH: 습도, WSD: 풍속 등
     """
+    # 최근 자료는 메모리(app.hotstore)에서 응답
+    hot = hot_store.kma_latest_pivot(sido, region_name, limit)
+    if hot is not None:
+        return rows_response(PIVOT_KEYS, hot)
+
     # 최신 발표 시각 조회
     subquery = db.query(
         WeatherRealtime.sido,
@@ -71,34 +101,34 @@ def get_latest_realtime_pivot(
     if region_name:
         subquery = subquery.filter(WeatherRealtime.region_name == region_name)
 
-    latest_times = subquery.limit(limit).all()
-
-    results = []
-    for lt in latest_times:
-        # 해당 시각의 모든 카테고리 조회
-        records = db.query(WeatherRealtime).filter(
-            WeatherRealtime.region_name == lt.region_name,
-            WeatherRealtime.base_date == lt.base_date,
-            WeatherRealtime.base_time == lt.base_time
-        ).all()
-
-        # 피벗 변환
-        pivot_data = {
-            "sido": lt.sido,
-            "region_name": lt.region_name,
-            "base_date": lt.base_date,
-            "base_time": lt.base_time,
-            "T1H": None, "RN1": None, "UUU": None, "VVV": None,
-            "REH": None, "PTY": None, "VEC": None, "WSD": None
-        }
-
-        for r in records:
-            if r.category in pivot_data:
-                pivot_data[r.category] = r.obsrvalue
+    latest_times = subquery.limit(limit).subquery()
 
-        results.append(WeatherRealtimePivotResponse(**pivot_data))
-
-    return results
+    # 발표 시각별 카테고리 값을 한 번의 쿼리로 피벗
+    results = db.query(
+        latest_times.c.sido,
+        latest_times.c.region_name,
+        latest_times.c.base_date,
+        latest_times.c.base_time,
+        *pivot_columns(PIVOT_CATEGORIES)
+    ).join(
+        WeatherRealtime,
+        and_(
+            WeatherRealtime.region_name == latest_times.c.region_name,
+            WeatherRealtime.base_date == latest_times.c.base_date,
+            WeatherRealtime.base_time == latest_times.c.base_time
+        )
+    ).group_by(
+        latest_times.c.sido,
+        latest_times.c.region_name,
+        latest_times.c.base_date,
+        latest_times.c.base_time
+    ).order_by(
+        desc(latest_times.c.base_date),
+        desc(latest_times.c.base_time),
+        latest_times.c.region_name
+    ).all()
+
+    return rows_response(PIVOT_KEYS, results)
 
 
 @router.get("/today/{region_name}", summary="지역별 오늘 데이터 조회 (그래프용)")
@@ -112,52 +142,32 @@ def get_today_weather(
     - 시간순 오름차순 정렬 (그래프용)
     - T1H(기온), REH(습도) 값 반환
     """
-    # 오늘 날짜 (YYYY-MM-DD 형식 문자열)
-    today_str = datetime.now().strftime("%Y-%m-%d")
+    hot = hot_store.kma_today(region_name, TODAY_CATEGORIES)
+    if hot is not None:
+        return {"data": rows_to_dicts(TODAY_KEYS, hot)}
 
-    # 해당 지역의 오늘 데이터에서 고유 시간대 조회 (시간 오름차순)
-    subquery = db.query(
+    # 해당 지역의 오늘 시간대별 T1H, REH (시간 오름차순)
+    results = db.query(
+        literal(region_name).label("region_name"),
         WeatherRealtime.base_date,
-        WeatherRealtime.base_time
+        WeatherRealtime.base_time,
+        *pivot_columns(TODAY_CATEGORIES)
     ).filter(
         WeatherRealtime.region_name == region_name,
-        func.cast(WeatherRealtime.base_date, String) == today_str
-    ).distinct().order_by(
+        WeatherRealtime.base_date == date.today()
+    ).group_by(
+        WeatherRealtime.base_date,
+        WeatherRealtime.base_time
+    ).order_by(
         WeatherRealtime.base_time.asc()
-    )
+    ).all()
 
-    time_slots = subquery.all()
+    return {"data": rows_to_dicts(TODAY_KEYS, results)}
 
-    if not time_slots:
-        return {"data": []}
 
-    results = []
-    for ts in time_slots:
-        # 해당 시각의 모든 카테고리 조회
-        records = db.query(WeatherRealtime).filter(
-            WeatherRealtime.region_name == region_name,
-            WeatherRealtime.base_date == ts.base_date,
-            WeatherRealtime.base_time == ts.base_time
-        ).all()
-
-        # 피벗 변환
-        pivot_data = {
-            "region_name": region_name,
-            "base_date": ts.base_date.isoformat() if ts.base_date else None,
-            "base_time": ts.base_time,
-            "T1H": None,
-            "REH": None
-        }
-
-        for r in records:
-            if r.category == "T1H":
-                pivot_data["T1H"] = r.obsrvalue
-            elif r.category == "REH":
-                pivot_data["REH"] = r.obsrvalue
-
-        results.append(pivot_data)
-
-    return {"data": results}
+# 지역별 기간 조회(피벗)에서 반환하는 카테고리 / 컬럼
+REGION_RANGE_CATEGORIES = ("T1H", "RN1", "REH", "VEC", "WSD")
+REGION_RANGE_KEYS = ("region_name", "base_date", "base_time", *REGION_RANGE_CATEGORIES)
 
 
 @router.get("/region/{region_name}/range", summary="지역별 기간 조회 (피벗)")
@@ -167,10 +177,12 @@ def get_realtime_by_region_range(
     end_date: date = Query(description="종료 날짜"),
     offset: int = Query(default=0, ge=0, description="건너뛸 레코드 수"),
     limit: int = Query(default=20, ge=1, le=10000, description="조회할 레코드 수"),
-    db: Session = Depends(get_db)
+    layout: str = Query(default="rows", pattern=LAYOUT_PATTERN, description="data 형태 (rows: 레코드 배열, columns: 컬럼별 배열)"),
+    db: Session = Depends(get_bulk_db)
 ):
     """
     특정 지역의 기간별 초단기 실황 데이터를 피벗 형태로 조회합니다.
+    - layout=columns: 컬럼별 배열로 반환 (region_name 은 meta 에 포함)
     """
     if start_date > end_date:
         raise HTTPException(status_code=400, detail="시작 날짜가 종료 날짜보다 늦을 수 없습니다.")
@@ -189,32 +201,33 @@ def get_realtime_by_region_range(
     )
 
     total = subquery.count()
-    time_slots = subquery.offset(offset).limit(limit).all()
+    time_slots = subquery.offset(offset).limit(limit).subquery()
 
-    results = []
-    for ts in time_slots:
-        # 해당 시각의 모든 카테고리 조회
-        records = db.query(WeatherRealtime).filter(
+    # 페이지의 시간대별 카테고리 값을 한 번의 쿼리로 피벗
+    results = db.query(
+        literal(region_name).label("region_name"),
+        time_slots.c.base_date,
+        time_slots.c.base_time,
+        *pivot_columns(REGION_RANGE_CATEGORIES)
+    ).join(
+        WeatherRealtime,
+        and_(
             WeatherRealtime.region_name == region_name,
-            WeatherRealtime.base_date == ts.base_date,
-            WeatherRealtime.base_time == ts.base_time
-        ).all()
-
-        # 피벗 변환
-        pivot_data = {
-            "region_name": region_name,
-            "base_date": ts.base_date.isoformat() if ts.base_date else None,
-            "base_time": ts.base_time,
-            "T1H": None, "RN1": None, "REH": None, "VEC": None, "WSD": None
-        }
-
-        for r in records:
-            if r.category in pivot_data:
-                pivot_data[r.category] = r.obsrvalue
-
-        results.append(pivot_data)
-
-    return {"total": total, "offset": offset, "limit": limit, "data": results}
+            WeatherRealtime.base_date == time_slots.c.base_date,
+            WeatherRealtime.base_time == time_slots.c.base_time
+        )
+    ).group_by(
+        time_slots.c.base_date,
+        time_slots.c.base_time
+    ).order_by(
+        desc(time_slots.c.base_date),
+        desc(time_slots.c.base_time)
+    ).all()
+
+    return paginated_response(
+        total, offset, limit, REGION_RANGE_KEYS, results,
+        layout=layout, shared=("region_name",)
+    )
 
 
 @router.get("/region/{region_name}", summary="지역별 초단기 실황 조회")
@@ -242,25 +255,13 @@ def get_realtime_by_region(
     if total == 0:
         raise HTTPException(status_code=404, detail=f"'{region_name}' 지역의 데이터가 없습니다.")
 
-    results = query.order_by(
+    keys = ("id", "region_name", "base_date", "base_time", "category", "obsrvalue")
+    results = select_columns(query, WeatherRealtime, keys).order_by(
         desc(WeatherRealtime.base_date),
         desc(WeatherRealtime.base_time)
     ).offset(offset).limit(limit).all()
 
-    # 딕셔너리로 변환
-    data = [
-        {
-            "id": r.id,
-            "region_name": r.region_name,
-            "base_date": r.base_date.isoformat() if r.base_date else None,
-            "base_time": r.base_time,
-            "category": r.category,
-            "obsrvalue": r.obsrvalue
-        }
-        for r in results
-    ]
-
-    return {"total": total, "offset": offset, "limit": limit, "data": data}
+    return paginated_response(total, offset, limit, keys, results)
 
 
 @router.get("/regions", response_model=List[dict], summary="초단기 실황 지역 목록 조회")
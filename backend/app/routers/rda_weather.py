@@ -5,15 +5,24 @@ RDA 농업기상 API 라우터
 """
 
 from typing import Optional, List
-from datetime import date, datetime
+from datetime import date, datetime, timedelta
 from fastapi import APIRouter, Depends, Query, HTTPException
 from sqlalchemy.orm import Session
-from sqlalchemy import func, desc
-
-from ..database import get_db
-from ..models.rda import WeatherData, WeatherDataDaily, WeatherDataMonthly
+from sqlalchemy import desc, select
+
+from ..catalogs import rda_station_catalog, rda_realtime_station_catalog
+from ..completeness import station_summary, find_gaps
+from ..database import get_db, get_bulk_db
+from ..gapfill import FILL_PATTERN, GRIDS, load_filled, filled_rows
+from ..hotstore import hot_store
+from ..models.rda import WeatherData, WeatherDataHourly, WeatherDataDaily, WeatherDataMonthly
+from ..qc import QC_PATTERN, qc_columns
+from ..rollup import use_hourly_tier
+from ..serialization import LAYOUT_PATTERN, schema_keys, select_columns, rows_response, paginated_response
+from ..columnar import FORMAT_PATTERN, COLUMNAR_FORMATS, columnar_response
 from ..schemas.rda import (
     WeatherDataResponse,
+    WeatherDataHourlyResponse,
     WeatherDataDailyResponse,
     WeatherDataMonthlyResponse
 )
@@ -25,24 +34,45 @@ router = APIRouter(
 )
 
 
+def _filled_response(db: Session, resolution: str, stn_cd: str, start: Optional[datetime], end: Optional[datetime],
+                    keys: tuple[str, ...], fill: str, offset: int, limit: int, descending: bool = True,
+                    qc: str = "none", layout: str = "rows", shared: tuple[str, ...] = ()):
+    """fill= 조회 - 관측소 시계열을 격자에 올려 보완한 페이지 (total 은 격자 시각 수)"""
+    series = load_filled(db, GRIDS[resolution], stn_cd, start, end, keys, fill, qc)
+    if series is None:
+        raise HTTPException(status_code=404, detail=f"관측소 '{stn_cd}'의 데이터가 없습니다.")
+    rows = filled_rows(series, keys, descending, offset, limit)
+    return paginated_response(len(series), offset, limit, keys + ("fill",), rows, layout=layout, shared=shared)
+
+
 # ===== 10분 간격 데이터 =====
 
 @router.get("/realtime/latest", response_model=List[WeatherDataResponse], summary="최신 10분 간격 데이터 조회")
 def get_latest_realtime_data(
     stn_cd: Optional[str] = Query(default=None, description="관측소 코드"),
     limit: int = Query(default=20, ge=1, le=500, description="조회 개수"),
+    qc: str = Query(default="none", pattern=QC_PATTERN, description="품질 관리 (strict: QC 에 걸린 값은 null)"),
     db: Session = Depends(get_db)
 ):
     """
     최신 10분 간격 기상 데이터를 조회합니다.
+    - qc=strict: 품질 검사(app.qc)에서 걸린 값은 null 로 반환
     """
+    keys = schema_keys(WeatherData, WeatherDataResponse)
+
+    # 최근 자료는 메모리(app.hotstore)에서 응답 (QC 플래그는 DB 에만 있으므로 strict 는 DB 조회)
+    if qc != "strict":
+        hot = hot_store.rda_latest(stn_cd, limit, keys)
+        if hot is not None:
+            return rows_response(keys, hot)
+
     query = db.query(WeatherData).order_by(desc(WeatherData.datetime))
 
     if stn_cd:
         query = query.filter(WeatherData.stn_cd == stn_cd)
 
-    results = query.limit(limit).all()
-    return results
+    results = qc_columns(query, "rda", keys, qc).limit(limit).all()
+    return rows_response(keys, results)
 
 
 @router.get("/realtime/station/{stn_cd}", response_model=PaginatedResponse, summary="관측소별 10분 간격 데이터 조회")
@@ -50,13 +80,34 @@ def get_realtime_by_station(
     stn_cd: str,
     start_datetime: Optional[datetime] = Query(default=None, description="시작 일시"),
     end_datetime: Optional[datetime] = Query(default=None, description="종료 일시"),
+    resolution: str = Query(default="auto", pattern="^(auto|10min|hourly)$", description="해상도 (auto: 기간에 따라 자동 선택)"),
     offset: int = Query(default=0, ge=0),
     limit: int = Query(default=20, ge=1, le=100),
-    db: Session = Depends(get_db)
+    qc: str = Query(default="none", pattern=QC_PATTERN, description="품질 관리 (strict: QC 에 걸린 값은 null)"),
+    fill: str = Query(default="none", pattern=FILL_PATTERN, description="결측 보완 (interp: 짧은 결측 보간, neighbor: + 이웃 관측소 회귀)"),
+    db: Session = Depends(get_bulk_db)
 ):
     """
     특정 관측소의 10분 간격 데이터를 조회합니다.
+    - resolution=auto: 조회 기간이 길거나 원자료 보존 기간 이전이면 시간별 집계를 반환합니다.
+    - 실제 사용된 해상도는 X-Data-Resolution 헤더로 확인할 수 있습니다.
+    - qc=strict: 품질 검사(app.qc)에서 걸린 값은 null 로 반환 (10분 자료에만 적용, 시간별 집계는 그대로)
+    - fill=interp|neighbor: 10분 격자의 모든 시각을 반환하고 결측을 보완 (값 출처는 행의 fill, app.gapfill)
+      qc=strict 와 함께 사용하면 QC 에 걸린 값도 보완합니다.
     """
+    if resolution == "hourly" or (resolution == "auto" and use_hourly_tier(start_datetime, end_datetime)):
+        response = get_hourly_by_station(
+            stn_cd, start_datetime, end_datetime, offset=offset, limit=limit, fill=fill, db=db
+        )
+        response.headers["X-Data-Resolution"] = "hourly"
+        return response
+
+    if fill != "none":
+        keys = schema_keys(WeatherData, WeatherDataResponse)
+        response = _filled_response(db, "10min", stn_cd, start_datetime, end_datetime, keys, fill, offset, limit, qc=qc)
+        response.headers["X-Data-Resolution"] = "10min"
+        return response
+
     query = db.query(WeatherData).filter(WeatherData.stn_cd == stn_cd)
 
     if start_datetime:
@@ -69,9 +120,52 @@ def get_realtime_by_station(
     if total == 0:
         raise HTTPException(status_code=404, detail=f"관측소 '{stn_cd}'의 데이터가 없습니다.")
 
-    results = query.order_by(desc(WeatherData.datetime)).offset(offset).limit(limit).all()
+    keys = schema_keys(WeatherData, WeatherDataResponse)
+    results = qc_columns(query, "rda", keys, qc)\
+        .order_by(desc(WeatherData.datetime)).offset(offset).limit(limit).all()
+
+    response = paginated_response(total, offset, limit, keys, results)
+    response.headers["X-Data-Resolution"] = "10min"
+    return response
 
-    return PaginatedResponse(total=total, offset=offset, limit=limit, data=results)
+
+# ===== 시간별 집계 데이터 =====
+
+@router.get("/hourly/station/{stn_cd}", response_model=PaginatedResponse, summary="관측소별 시간별 집계 데이터 조회")
+def get_hourly_by_station(
+    stn_cd: str,
+    start_datetime: Optional[datetime] = Query(default=None, description="시작 일시"),
+    end_datetime: Optional[datetime] = Query(default=None, description="종료 일시"),
+    offset: int = Query(default=0, ge=0),
+    limit: int = Query(default=20, ge=1, le=100),
+    fill: str = Query(default="none", pattern=FILL_PATTERN, description="결측 보완 (interp: 짧은 결측 보간, neighbor: + 이웃 관측소 회귀)"),
+    db: Session = Depends(get_bulk_db)
+):
+    """
+    특정 관측소의 시간별 집계 데이터를 조회합니다. (10분 자료 롤업)
+    - fill=interp|neighbor: 1시간 격자의 모든 시각을 반환하고 결측을 보완 (값 출처는 행의 fill)
+    """
+    if fill != "none":
+        keys = schema_keys(WeatherDataHourly, WeatherDataHourlyResponse)
+        return _filled_response(db, "hourly", stn_cd, start_datetime, end_datetime, keys, fill, offset, limit)
+
+    query = db.query(WeatherDataHourly).filter(WeatherDataHourly.stn_cd == stn_cd)
+
+    if start_datetime:
+        query = query.filter(WeatherDataHourly.datetime >= start_datetime)
+    if end_datetime:
+        query = query.filter(WeatherDataHourly.datetime <= end_datetime)
+
+    total = query.count()
+
+    if total == 0:
+        raise HTTPException(status_code=404, detail=f"관측소 '{stn_cd}'의 시간별 데이터가 없습니다.")
+
+    keys = schema_keys(WeatherDataHourly, WeatherDataHourlyResponse)
+    results = select_columns(query, WeatherDataHourly, keys)\
+        .order_by(desc(WeatherDataHourly.datetime)).offset(offset).limit(limit).all()
+
+    return paginated_response(total, offset, limit, keys, results)
 
 
 # ===== 일별 데이터 =====
@@ -90,8 +184,9 @@ def get_latest_daily_data(
     if stn_cd:
         query = query.filter(WeatherDataDaily.stn_cd == stn_cd)
 
-    results = query.limit(limit).all()
-    return results
+    keys = schema_keys(WeatherDataDaily, WeatherDataDailyResponse)
+    results = select_columns(query, WeatherDataDaily, keys).limit(limit).all()
+    return rows_response(keys, results)
 
 
 @router.get("/daily/date/{target_date}", response_model=List[WeatherDataDailyResponse], summary="특정 날짜 일별 데이터 조회")
@@ -108,12 +203,20 @@ def get_daily_by_date(
     if stn_cd:
         query = query.filter(WeatherDataDaily.stn_cd == stn_cd)
 
-    results = query.order_by(WeatherDataDaily.stn_cd).all()
+    keys = schema_keys(WeatherDataDaily, WeatherDataDailyResponse)
+    results = select_columns(query, WeatherDataDaily, keys).order_by(WeatherDataDaily.stn_cd).all()
 
     if not results:
         raise HTTPException(status_code=404, detail=f"{target_date} 날짜의 데이터가 없습니다.")
 
-    return results
+    return rows_response(keys, results)
+
+
+# 기간 조회(다운로드)에서 반환하는 일별 컬럼
+DAILY_RANGE_KEYS = (
+    "id", "stn_cd", "stn_name", "date", "temp", "hghst_artmp", "lowst_artmp",
+    "hum", "wind", "rn", "srqty",
+)
 
 
 @router.get("/daily/range", summary="기간별 일별 데이터 조회")
@@ -123,14 +226,29 @@ def get_daily_by_range(
     stn_cd: Optional[str] = Query(default=None, description="관측소 코드"),
     offset: int = Query(default=0, ge=0),
     limit: int = Query(default=20, ge=1, le=10000, description="조회 개수 (다운로드 시 최대 10000)"),
-    db: Session = Depends(get_db)
+    output_format: str = Query(default="json", alias="format", pattern=FORMAT_PATTERN, description="응답 형식 (json, arrow, parquet)"),
+    layout: str = Query(default="rows", pattern=LAYOUT_PATTERN, description="data 형태 (rows: 레코드 배열, columns: 컬럼별 배열)"),
+    fill: str = Query(default="none", pattern=FILL_PATTERN, description="결측 보완 (interp: 짧은 결측 보간, neighbor: + 이웃 관측소 회귀)"),
+    db: Session = Depends(get_bulk_db)
 ):
     """
     기간별 일별 기상 데이터를 조회합니다.
+    - format=arrow|parquet: 기간 전체를 컬럼형 파일로 스트리밍 (offset, limit 미적용)
+    - layout=columns: 컬럼별 배열로 반환 (stn_cd 지정 시 관측소 정보는 meta 에 포함)
+    - fill=interp|neighbor: 기간의 모든 날짜를 반환하고 결측을 보완 (stn_cd 필수, JSON 응답만, 값 출처는 행의 fill)
     """
     if start_date > end_date:
         raise HTTPException(status_code=400, detail="시작 날짜가 종료 날짜보다 늦을 수 없습니다.")
 
+    if fill != "none":
+        if not stn_cd or output_format in COLUMNAR_FORMATS:
+            raise HTTPException(status_code=400, detail="fill 은 stn_cd 를 지정한 JSON 조회에서만 사용할 수 있습니다.")
+        return _filled_response(
+            db, "daily", stn_cd, datetime.combine(start_date, datetime.min.time()),
+            datetime.combine(end_date, datetime.min.time()), DAILY_RANGE_KEYS, fill, offset, limit,
+            descending=False, layout=layout, shared=("stn_cd", "stn_name"),
+        )
+
     query = db.query(WeatherDataDaily).filter(
         WeatherDataDaily.date >= start_date,
         WeatherDataDaily.date <= end_date
@@ -139,30 +257,19 @@ def get_daily_by_range(
     if stn_cd:
         query = query.filter(WeatherDataDaily.stn_cd == stn_cd)
 
+    if output_format in COLUMNAR_FORMATS:
+        statement = select_columns(query, WeatherDataDaily, DAILY_RANGE_KEYS)\
+            .order_by(WeatherDataDaily.date, WeatherDataDaily.stn_cd).statement
+        return columnar_response(output_format, statement, DAILY_RANGE_KEYS, f"rda_daily_{start_date}_{end_date}")
+
     total = query.count()
 
-    results = query.order_by(WeatherDataDaily.date, WeatherDataDaily.stn_cd)\
+    results = select_columns(query, WeatherDataDaily, DAILY_RANGE_KEYS)\
+        .order_by(WeatherDataDaily.date, WeatherDataDaily.stn_cd)\
         .offset(offset).limit(limit).all()
 
-    # SQLAlchemy 모델을 딕셔너리로 변환
-    data = [
-        {
-            "id": r.id,
-            "stn_cd": r.stn_cd,
-            "stn_name": r.stn_name,
-            "date": r.date.isoformat() if r.date else None,
-            "temp": r.temp,
-            "hghst_artmp": r.hghst_artmp,
-            "lowst_artmp": r.lowst_artmp,
-            "hum": r.hum,
-            "wind": r.wind,
-            "rn": r.rn,
-            "srqty": r.srqty,
-        }
-        for r in results
-    ]
-
-    return {"total": total, "offset": offset, "limit": limit, "data": data}
+    shared = ("stn_cd", "stn_name") if stn_cd else ()
+    return paginated_response(total, offset, limit, DAILY_RANGE_KEYS, results, layout=layout, shared=shared)
 
 
 # ===== 월별 데이터 =====
@@ -181,8 +288,9 @@ def get_latest_monthly_data(
     if stn_cd:
         query = query.filter(WeatherDataMonthly.stn_cd == stn_cd)
 
-    results = query.limit(limit).all()
-    return results
+    keys = schema_keys(WeatherDataMonthly, WeatherDataMonthlyResponse)
+    results = select_columns(query, WeatherDataMonthly, keys).limit(limit).all()
+    return rows_response(keys, results)
 
 
 @router.get("/monthly/year/{year}", response_model=List[WeatherDataMonthlyResponse], summary="연도별 월별 데이터 조회")
@@ -201,12 +309,14 @@ def get_monthly_by_year(
     if stn_cd:
         query = query.filter(WeatherDataMonthly.stn_cd == stn_cd)
 
-    results = query.order_by(WeatherDataMonthly.date, WeatherDataMonthly.stn_cd).all()
+    keys = schema_keys(WeatherDataMonthly, WeatherDataMonthlyResponse)
+    results = select_columns(query, WeatherDataMonthly, keys)\
+        .order_by(WeatherDataMonthly.date, WeatherDataMonthly.stn_cd).all()
 
     if not results:
         raise HTTPException(status_code=404, detail=f"{year}년의 데이터가 없습니다.")
 
-    return results
+    return rows_response(keys, results)
 
 
 @router.get("/monthly/range", response_model=PaginatedResponse, summary="기간별 월별 데이터 조회")
@@ -216,10 +326,12 @@ def get_monthly_by_range(
     stn_cd: Optional[str] = Query(default=None, description="관측소 코드"),
     offset: int = Query(default=0, ge=0),
     limit: int = Query(default=20, ge=1, le=100),
-    db: Session = Depends(get_db)
+    output_format: str = Query(default="json", alias="format", pattern=FORMAT_PATTERN, description="응답 형식 (json, arrow, parquet)"),
+    db: Session = Depends(get_bulk_db)
 ):
     """
     기간별 월별 기상 데이터를 조회합니다.
+    - format=arrow|parquet: 기간 전체를 컬럼형 파일로 스트리밍 (offset, limit 미적용)
     """
     if start_month > end_month:
         raise HTTPException(status_code=400, detail="시작 월이 종료 월보다 늦을 수 없습니다.")
@@ -232,12 +344,19 @@ def get_monthly_by_range(
     if stn_cd:
         query = query.filter(WeatherDataMonthly.stn_cd == stn_cd)
 
-    total = query.count()
+    keys = schema_keys(WeatherDataMonthly, WeatherDataMonthlyResponse)
 
-    results = query.order_by(WeatherDataMonthly.date, WeatherDataMonthly.stn_cd)\
+    if output_format in COLUMNAR_FORMATS:
+        statement = select_columns(query, WeatherDataMonthly, keys)\
+            .order_by(WeatherDataMonthly.date, WeatherDataMonthly.stn_cd).statement
+        return columnar_response(output_format, statement, keys, f"rda_monthly_{start_month}_{end_month}")
+
+    total = query.count()
+    results = select_columns(query, WeatherDataMonthly, keys)\
+        .order_by(WeatherDataMonthly.date, WeatherDataMonthly.stn_cd)\
         .offset(offset).limit(limit).all()
 
-    return PaginatedResponse(total=total, offset=offset, limit=limit, data=results)
+    return paginated_response(total, offset, limit, keys, results)
 
 
 # ===== 관측소 목록 =====
@@ -247,16 +366,10 @@ def get_rda_stations(db: Session = Depends(get_db)):
     """
     RDA 관측소 목록을 조회합니다. (일별 데이터 기준)
     """
-    results = db.query(
-        WeatherDataDaily.stn_cd,
-        WeatherDataDaily.stn_name,
-        func.count(WeatherDataDaily.id).label("data_count"),
-        func.min(WeatherDataDaily.date).label("first_date"),
-        func.max(WeatherDataDaily.date).label("last_date")
-    ).group_by(
-        WeatherDataDaily.stn_cd,
-        WeatherDataDaily.stn_name
-    ).order_by(WeatherDataDaily.stn_cd).all()
+    # 스케줄러가 갱신하는 관측소 목록 스냅샷 (app.catalogs)
+    results = db.execute(
+        select(rda_station_catalog).order_by(rda_station_catalog.c.stn_cd)
+    ).all()
 
     return [
         {
@@ -278,23 +391,14 @@ def get_rda_realtime_stations(
     """
     RDA 실시간 데이터가 있는 관측소 목록을 조회합니다. (10분 데이터 기준)
     """
-    query = db.query(
-        WeatherData.province,
-        WeatherData.stn_cd,
-        WeatherData.stn_name,
-        func.count(WeatherData.id).label("data_count"),
-        func.min(WeatherData.datetime).label("first_datetime"),
-        func.max(WeatherData.datetime).label("last_datetime")
-    )
+    # 스케줄러가 갱신하는 관측소 목록 스냅샷 (app.catalogs)
+    catalog = rda_realtime_station_catalog
+    query = select(catalog)
 
     if province:
-        query = query.filter(WeatherData.province == province)
+        query = query.where(catalog.c.province == province)
 
-    results = query.group_by(
-        WeatherData.province,
-        WeatherData.stn_cd,
-        WeatherData.stn_name
-    ).order_by(WeatherData.province, WeatherData.stn_cd).all()
+    results = db.execute(query.order_by(catalog.c.province, catalog.c.stn_cd)).all()
 
     return [
         {
@@ -314,10 +418,67 @@ def get_rda_realtime_provinces(db: Session = Depends(get_db)):
     """
     RDA 실시간 데이터가 있는 도/광역시 목록을 조회합니다.
     """
-    results = db.query(
-        WeatherData.province
-    ).filter(
-        WeatherData.province.isnot(None)
-    ).distinct().order_by(WeatherData.province).all()
+    catalog = rda_realtime_station_catalog
+    results = db.execute(
+        select(catalog.c.province)
+        .where(catalog.c.province.isnot(None))
+        .distinct()
+        .order_by(catalog.c.province)
+    ).all()
 
     return [r.province for r in results if r.province]
+
+
+# ===== 10분 자료 수신 현황 =====
+
+# 결측 구간 조회 최대 기간 (관측소당 일수 × 144 구간을 메모리에서 처리)
+GAPS_MAX_DAYS = 92
+
+
+@router.get("/completeness", response_model=List[dict], summary="관측소별 10분 자료 수신율 조회")
+def get_realtime_completeness(
+    start_date: Optional[date] = Query(default=None, description="시작 날짜 (미입력시 종료 날짜 - 6일)"),
+    end_date: Optional[date] = Query(default=None, description="종료 날짜 (포함, 미입력시 오늘)"),
+    province: Optional[str] = Query(default=None, description="도/광역시로 필터링"),
+    stn_cd: Optional[str] = Query(default=None, description="관측소 코드"),
+    below: Optional[float] = Query(default=None, ge=0, le=1, description="수신율이 이 값 미만인 관측소만"),
+    db: Session = Depends(get_db)
+):
+    """
+    관측소별 기대 10분 구간 수 대비 수신 구간 수를 조회합니다. (수신율 낮은 순)
+    - 기대 구간: 조회 기간 중 관측소 첫 관측 이후 ~ 현재 - 수집 지연
+    - 스케줄러가 갱신하는 수신 현황 요약(app.completeness)을 읽으므로 원자료를 훑지 않습니다.
+    """
+    end_date = end_date or date.today()
+    start_date = start_date or end_date - timedelta(days=6)
+    if start_date > end_date:
+        raise HTTPException(status_code=400, detail="시작 날짜가 종료 날짜보다 늦을 수 없습니다.")
+
+    results = station_summary(db, start_date, end_date, province, stn_cd)
+    if below is not None:
+        results = [r for r in results if r["ratio"] < below]
+    return results
+
+
+@router.get("/completeness/gaps", response_model=List[dict], summary="관측소별 10분 자료 결측 구간 조회")
+def get_realtime_gaps(
+    start_date: Optional[date] = Query(default=None, description="시작 날짜 (미입력시 종료 날짜 - 6일)"),
+    end_date: Optional[date] = Query(default=None, description="종료 날짜 (포함, 미입력시 오늘)"),
+    province: Optional[str] = Query(default=None, description="도/광역시로 필터링"),
+    stn_cd: Optional[str] = Query(default=None, description="관측소 코드"),
+    min_minutes: int = Query(default=10, ge=10, le=1440 * GAPS_MAX_DAYS, description="이 시간(분) 이상 이어진 결측만"),
+    db: Session = Depends(get_db)
+):
+    """
+    연속 결측 구간(시작, 끝, 분)을 조회합니다.
+    - end 는 다음 수신 구간 시각이며, ongoing=true 는 현재까지 수신이 끊긴 구간입니다.
+    - 조회 기간은 최대 92일입니다.
+    """
+    end_date = end_date or date.today()
+    start_date = start_date or end_date - timedelta(days=6)
+    if start_date > end_date:
+        raise HTTPException(status_code=400, detail="시작 날짜가 종료 날짜보다 늦을 수 없습니다.")
+    if (end_date - start_date).days >= GAPS_MAX_DAYS:
+        raise HTTPException(status_code=400, detail=f"결측 구간 조회 기간은 최대 {GAPS_MAX_DAYS}일입니다.")
+
+    return find_gaps(db, start_date, end_date, province, stn_cd, min_minutes)
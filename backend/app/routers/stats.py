@@ -5,14 +5,16 @@
 """
 
 from typing import Optional
-from datetime import date
+from datetime import date, timedelta
 from fastapi import APIRouter, Depends, Query, HTTPException
 from sqlalchemy.orm import Session
 from sqlalchemy import func
 
-from ..database import get_db
+from ..archive import Aggregate, archive_store
+from ..database import get_bulk_db
 from ..models.kma import AsosDailyData
 from ..models.rda import WeatherDataDaily
+from ..wind import MAX_SPEED_BINS, SECTOR_COUNTS, SPEED_BINS, WIND_SOURCE_PATTERN, sector_names, windrose
 
 router = APIRouter(
     prefix="/api/stats",
@@ -21,7 +23,7 @@ router = APIRouter(
 
 
 @router.get("/summary", summary="전체 데이터 통계 요약")
-def get_stats_summary(db: Session = Depends(get_db)):
+def get_stats_summary(db: Session = Depends(get_bulk_db)):
     """
     전체 데이터베이스의 통계 요약을 조회합니다.
     - 각 테이블별 데이터 개수
@@ -59,12 +61,41 @@ def get_stats_summary(db: Session = Depends(get_db)):
     }
 
 
+def _round(value: Optional[float], digits: int) -> Optional[float]:
+    return round(value, digits) if value else None
+
+
+def _station_stats(agg: Aggregate, variables: dict[str, str]) -> dict:
+    """관측소 기간 집계 → statistics 응답 (variables: 응답 항목 → 컬럼)"""
+    return {
+        "data_count": agg.count,
+        "avg_temp": _round(agg.avg(variables["avg_temp"]), 2),
+        "max_temp": agg.highest(variables["max_temp"]),
+        "min_temp": agg.lowest(variables["min_temp"]),
+        "total_rainfall": _round(agg.total(variables["total_rainfall"]), 2),
+        "avg_humidity": _round(agg.avg(variables["avg_humidity"]), 1),
+        "avg_wind_speed": _round(agg.avg(variables["avg_wind_speed"]), 2),
+        "total_sunshine": _round(agg.total(variables["total_sunshine"]), 1)
+    }
+
+
+# 통계 항목별 컬럼
+ASOS_STAT_COLUMNS = {
+    "avg_temp": "avg_ta", "max_temp": "max_ta", "min_temp": "min_ta", "total_rainfall": "sum_rn",
+    "avg_humidity": "avg_rhm", "avg_wind_speed": "avg_ws", "total_sunshine": "sum_ss_hr",
+}
+RDA_STAT_COLUMNS = {
+    "avg_temp": "temp", "max_temp": "hghst_artmp", "min_temp": "lowst_artmp", "total_rainfall": "rn",
+    "avg_humidity": "hum", "avg_wind_speed": "wind", "total_sunshine": "sun_time",
+}
+
+
 @router.get("/kma/asos/station/{stn_id}", summary="ASOS 관측소별 통계")
 def get_asos_station_stats(
     stn_id: int,
     start_date: Optional[date] = Query(default=None, description="시작 날짜"),
     end_date: Optional[date] = Query(default=None, description="종료 날짜"),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_bulk_db)
 ):
     """
     특정 ASOS 관측소의 통계를 조회합니다.
@@ -72,51 +103,22 @@ def get_asos_station_stats(
     - 총 강수량
     - 평균 습도
     """
-    query = db.query(
-        func.count(AsosDailyData.id).label("count"),
-        func.avg(AsosDailyData.avg_ta).label("avg_temp"),
-        func.max(AsosDailyData.max_ta).label("max_temp"),
-        func.min(AsosDailyData.min_ta).label("min_temp"),
-        func.sum(AsosDailyData.sum_rn).label("total_rainfall"),
-        func.avg(AsosDailyData.avg_rhm).label("avg_humidity"),
-        func.avg(AsosDailyData.avg_ws).label("avg_wind_speed"),
-        func.sum(AsosDailyData.sum_ss_hr).label("total_sunshine")
-    ).filter(AsosDailyData.stn_id == stn_id)
-
-    if start_date:
-        query = query.filter(AsosDailyData.tm >= start_date)
-    if end_date:
-        query = query.filter(AsosDailyData.tm <= end_date)
-
-    result = query.first()
-
-    if result.count == 0:
-        raise HTTPException(status_code=404, detail=f"지점 {stn_id}의 데이터가 없습니다.")
+    # 발표가 끝난 구간은 메모리 맵 아카이브, 최근 구간만 DB 에서 집계 (app.archive)
+    agg = archive_store.aggregate(
+        db, "asos", [stn_id], start_date, end_date, list(ASOS_STAT_COLUMNS.values())
+    ).get(stn_id)
 
-    # 지점 정보 조회
-    station_info = db.query(
-        AsosDailyData.stn_nm,
-        func.min(AsosDailyData.tm).label("first_date"),
-        func.max(AsosDailyData.tm).label("last_date")
-    ).filter(AsosDailyData.stn_id == stn_id).group_by(AsosDailyData.stn_nm).first()
+    if agg is None or agg.count == 0:
+        raise HTTPException(status_code=404, detail=f"지점 {stn_id}의 데이터가 없습니다.")
 
     return {
         "stn_id": stn_id,
-        "stn_nm": station_info.stn_nm if station_info else None,
+        "stn_nm": agg.label,
         "period": {
-            "start_date": start_date or station_info.first_date,
-            "end_date": end_date or station_info.last_date
+            "start_date": start_date or agg.first,
+            "end_date": end_date or agg.last
         },
-        "statistics": {
-            "data_count": result.count,
-            "avg_temp": round(result.avg_temp, 2) if result.avg_temp else None,
-            "max_temp": result.max_temp,
-            "min_temp": result.min_temp,
-            "total_rainfall": round(result.total_rainfall, 2) if result.total_rainfall else None,
-            "avg_humidity": round(result.avg_humidity, 1) if result.avg_humidity else None,
-            "avg_wind_speed": round(result.avg_wind_speed, 2) if result.avg_wind_speed else None,
-            "total_sunshine": round(result.total_sunshine, 1) if result.total_sunshine else None
-        }
+        "statistics": _station_stats(agg, ASOS_STAT_COLUMNS)
     }
 
 
@@ -125,56 +127,26 @@ def get_rda_station_stats(
     stn_cd: str,
     start_date: Optional[date] = Query(default=None, description="시작 날짜"),
     end_date: Optional[date] = Query(default=None, description="종료 날짜"),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_bulk_db)
 ):
     """
     특정 RDA 관측소의 통계를 조회합니다.
     """
-    query = db.query(
-        func.count(WeatherDataDaily.id).label("count"),
-        func.avg(WeatherDataDaily.temp).label("avg_temp"),
-        func.max(WeatherDataDaily.hghst_artmp).label("max_temp"),
-        func.min(WeatherDataDaily.lowst_artmp).label("min_temp"),
-        func.sum(WeatherDataDaily.rn).label("total_rainfall"),
-        func.avg(WeatherDataDaily.hum).label("avg_humidity"),
-        func.avg(WeatherDataDaily.wind).label("avg_wind_speed"),
-        func.sum(WeatherDataDaily.sun_time).label("total_sunshine")
-    ).filter(WeatherDataDaily.stn_cd == stn_cd)
-
-    if start_date:
-        query = query.filter(WeatherDataDaily.date >= start_date)
-    if end_date:
-        query = query.filter(WeatherDataDaily.date <= end_date)
-
-    result = query.first()
-
-    if result.count == 0:
-        raise HTTPException(status_code=404, detail=f"관측소 '{stn_cd}'의 데이터가 없습니다.")
+    agg = archive_store.aggregate(
+        db, "rda", [stn_cd], start_date, end_date, list(RDA_STAT_COLUMNS.values())
+    ).get(stn_cd)
 
-    # 관측소 정보 조회
-    station_info = db.query(
-        WeatherDataDaily.stn_name,
-        func.min(WeatherDataDaily.date).label("first_date"),
-        func.max(WeatherDataDaily.date).label("last_date")
-    ).filter(WeatherDataDaily.stn_cd == stn_cd).group_by(WeatherDataDaily.stn_name).first()
+    if agg is None or agg.count == 0:
+        raise HTTPException(status_code=404, detail=f"관측소 '{stn_cd}'의 데이터가 없습니다.")
 
     return {
         "stn_cd": stn_cd,
-        "stn_name": station_info.stn_name if station_info else None,
+        "stn_name": agg.label,
         "period": {
-            "start_date": start_date or station_info.first_date,
-            "end_date": end_date or station_info.last_date
+            "start_date": start_date or agg.first,
+            "end_date": end_date or agg.last
         },
-        "statistics": {
-            "data_count": result.count,
-            "avg_temp": round(result.avg_temp, 2) if result.avg_temp else None,
-            "max_temp": result.max_temp,
-            "min_temp": result.min_temp,
-            "total_rainfall": round(result.total_rainfall, 2) if result.total_rainfall else None,
-            "avg_humidity": round(result.avg_humidity, 1) if result.avg_humidity else None,
-            "avg_wind_speed": round(result.avg_wind_speed, 2) if result.avg_wind_speed else None,
-            "total_sunshine": round(result.total_sunshine, 1) if result.total_sunshine else None
-        }
+        "statistics": _station_stats(agg, RDA_STAT_COLUMNS)
     }
 
 
@@ -183,7 +155,7 @@ def get_comparison_stats(
     stn_ids: str = Query(description="비교할 ASOS 지점 ID (콤마 구분, 예: 108,133,159)"),
     start_date: date = Query(description="시작 날짜"),
     end_date: date = Query(description="종료 날짜"),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_bulk_db)
 ):
     """
     여러 ASOS 관측소의 통계를 비교합니다.
@@ -196,32 +168,23 @@ def get_comparison_stats(
     if len(station_list) > 10:
         raise HTTPException(status_code=400, detail="최대 10개 지점까지 비교 가능합니다.")
 
+    # 지점별 통계 (아카이브 + 최근 구간 한 번의 GROUP BY)
+    by_station = archive_store.aggregate(
+        db, "asos", station_list, start_date, end_date, ["avg_ta", "max_ta", "min_ta", "sum_rn", "avg_rhm"]
+    )
     results = []
     for stn_id in station_list:
-        stats = db.query(
-            AsosDailyData.stn_nm,
-            func.count(AsosDailyData.id).label("count"),
-            func.avg(AsosDailyData.avg_ta).label("avg_temp"),
-            func.max(AsosDailyData.max_ta).label("max_temp"),
-            func.min(AsosDailyData.min_ta).label("min_temp"),
-            func.sum(AsosDailyData.sum_rn).label("total_rainfall"),
-            func.avg(AsosDailyData.avg_rhm).label("avg_humidity")
-        ).filter(
-            AsosDailyData.stn_id == stn_id,
-            AsosDailyData.tm >= start_date,
-            AsosDailyData.tm <= end_date
-        ).group_by(AsosDailyData.stn_nm).first()
-
+        stats = by_station.get(stn_id)
         if stats and stats.count > 0:
             results.append({
                 "stn_id": stn_id,
-                "stn_nm": stats.stn_nm,
+                "stn_nm": stats.label,
                 "data_count": stats.count,
-                "avg_temp": round(stats.avg_temp, 2) if stats.avg_temp else None,
-                "max_temp": stats.max_temp,
-                "min_temp": stats.min_temp,
-                "total_rainfall": round(stats.total_rainfall, 2) if stats.total_rainfall else None,
-                "avg_humidity": round(stats.avg_humidity, 1) if stats.avg_humidity else None
+                "avg_temp": _round(stats.avg("avg_ta"), 2),
+                "max_temp": stats.highest("max_ta"),
+                "min_temp": stats.lowest("min_ta"),
+                "total_rainfall": _round(stats.total("sum_rn"), 2),
+                "avg_humidity": _round(stats.avg("avg_rhm"), 1)
             })
 
     return {
@@ -231,3 +194,52 @@ def get_comparison_stats(
         },
         "stations": results
     }
+
+
+@router.get("/windrose", summary="관측소별 바람장미")
+def get_windrose(
+    stations: str = Query(description="관측소 코드 (rda) / 지역명 (kma), 콤마 구분 최대 10개"),
+    source: str = Query(default="rda", pattern=WIND_SOURCE_PATTERN, description="자료 (rda: 10분/시간별 자료, kma: 초단기실황)"),
+    start_date: Optional[date] = Query(default=None, description="시작 날짜 (미입력시 종료 날짜 - 29일)"),
+    end_date: Optional[date] = Query(default=None, description="종료 날짜 (포함, 미입력시 오늘)"),
+    sectors: int = Query(default=16, description="풍향 구간 수 (8, 16, 36)"),
+    speed_bins: Optional[str] = Query(default=None, description="풍속 계급 하한 (m/s, 콤마 구분 오름차순, 첫 값 미만은 정온)"),
+    db: Session = Depends(get_bulk_db)
+):
+    """
+    관측소별 풍향 구간 × 풍속 계급 빈도(%)와 벡터 평균 풍향/풍속을 조회합니다.
+    - frequency[i][j]: sector_names[i] 방향에서 불어온 speed_bins[j] 계급 바람의 비율 (정온 포함 전체 대비)
+    - mean.direction: u/v 성분 평균 풍향, steadiness: 벡터 평균 풍속 / 스칼라 평균 풍속
+    - rda 는 조회 기간이 길면 시간별 집계(벡터 평균 풍향, 평균 풍속)로 계산합니다. (resolution)
+    """
+    station_list = [s.strip() for s in stations.split(",") if s.strip()]
+    if not station_list or len(station_list) > 10:
+        raise HTTPException(status_code=400, detail="관측소는 1~10개까지 지정할 수 있습니다.")
+    if sectors not in SECTOR_COUNTS:
+        raise HTTPException(status_code=400, detail=f"풍향 구간 수는 {', '.join(map(str, SECTOR_COUNTS))} 중 하나여야 합니다.")
+    bins = SPEED_BINS
+    if speed_bins:
+        try:
+            bins = tuple(float(v) for v in speed_bins.split(","))
+        except ValueError:
+            raise HTTPException(status_code=400, detail="풍속 계급은 숫자여야 합니다.")
+        if not 1 <= len(bins) <= MAX_SPEED_BINS or any(b < 0 for b in bins) or list(bins) != sorted(set(bins)):
+            raise HTTPException(status_code=400, detail=f"풍속 계급은 0 이상 오름차순 최대 {MAX_SPEED_BINS}개입니다.")
+
+    end_date = end_date or date.today()
+    start_date = start_date or end_date - timedelta(days=29)
+    if start_date > end_date:
+        raise HTTPException(status_code=400, detail="시작 날짜가 종료 날짜보다 늦을 수 없습니다.")
+
+    resolution, results = windrose(db, source, station_list, start_date, end_date, sectors, bins)
+    return {
+        "source": source,
+        "resolution": resolution,
+        "period": {
+            "start_date": start_date,
+            "end_date": end_date
+        },
+        "sector_names": sector_names(sectors),
+        "speed_bins": list(bins),
+        "stations": results
+    }
@@ -0,0 +1,68 @@
+"""
+실시간 스트림 API 라우터
+- Server-Sent Events 로 실시간 데이터 변경분을 전달합니다.
+"""
+
+import asyncio
+import json
+from datetime import date, datetime
+
+from fastapi import APIRouter, Request
+from fastapi.responses import StreamingResponse
+
+from ..config import get_settings
+from ..streaming import broadcaster
+
+settings = get_settings()
+
+router = APIRouter(
+    prefix="/api/stream",
+    tags=["실시간 스트림"]
+)
+
+
+def _json_default(value):
+    """날짜/시각을 ISO 문자열로 변환"""
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def format_event(event: dict) -> str:
+    """SSE 메시지 형식으로 변환"""
+    data = json.dumps(event["data"], ensure_ascii=False, default=_json_default)
+    return f"event: {event['event']}\ndata: {data}\n\n"
+
+
+@router.get("/realtime", summary="실시간 데이터 변경 스트림 (SSE)")
+async def stream_realtime(request: Request):
+    """
+    실시간 데이터 변경분을 Server-Sent Events 로 전달합니다.
+    - snapshot: 접속 직후 전체 최신값 ({"kma": [...], "rda": [...]})
+    - kma: 변경된 지역의 최신 초단기 실황 (피벗 형식, /api/kma/realtime/latest/pivot 과 동일)
+    - rda: 변경된 관측소의 최신 10분 자료 (/api/rda/weather/realtime/latest 와 동일)
+    - 서버는 프로세스당 한 번만 변경 여부를 확인하므로 연결 수와 무관하게 DB 부하가 일정합니다.
+    """
+    queue = broadcaster.subscribe()
+
+    async def event_stream():
+        try:
+            yield "retry: 5000\n\n"
+            while not await request.is_disconnected():
+                try:
+                    event = await asyncio.wait_for(queue.get(), timeout=settings.STREAM_KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+                    continue
+                yield format_event(event)
+        finally:
+            broadcaster.unsubscribe(queue)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",  # nginx 프록시 버퍼링 비활성화
+        }
+    )
@@ -0,0 +1,263 @@
+"""
+백그라운드 사전 계산 스케줄러 (앱 lifespan 에서 실행)
+- 파생 데이터를 사용자가 요청하기 전에 미리 준비합니다.
+  * rollup: 10분 자료 → 시간별 집계 증분 롤업 (app.rollup)
+  * station_catalogs: 관측소 목록 스냅샷 뷰 갱신 (app.catalogs)
+  * qc / alerts: 품질 검사(app.qc), 폭염/늦서리/호우 알림 증분 탐지(app.alerts)
+  * daily_archive: 일자료 메모리 맵 아카이브 재생성 (app.archive, 매일 04:30, 호스트별 한 워커)
+  * warm_cache: 자주 요청되는 조회 상위 WARM_TOP_N 개를 앱 안에서 다시 호출하여
+    압축 캐시와 마지막 정상 응답(app.resilience)을 새 데이터 기준으로 채움
+- 실행 시각은 자료 제공 주기에 맞춥니다. 매 10분 경계(RDA 10분 자료 적재 직후)에 작업별 오프셋을 더하고
+  무작위 지연(jitter)을 붙여 워커들이 동시에 DB 를 두드리지 않게 합니다.
+  (KMA 초단기실황 매시 40분 이후, ASOS 일자료 오전 제공도 10분 경계에 포함됨)
+- DB 를 변경하는 작업(롤업, 뷰 갱신)은 PostgreSQL advisory lock 을 가진 uvicorn 워커(리더) 하나만 실행합니다.
+  리더가 종료되면 lock 연결이 끊겨 풀리고, 다른 워커가 다음 실행 시각에 리더가 됩니다.
+  캐시 예열은 캐시가 프로세스별이므로 모든 워커에서 실행합니다.
+- 작업별 실행 시간, 마지막 성공 시각, 리더 여부는 /metrics 로 내보냅니다.
+"""
+
+import asyncio
+import contextvars
+import math
+import os
+import random
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Callable, Optional
+
+import httpx
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.pool import NullPool
+from starlette.types import ASGIApp
+
+from .alerts import run_all_incremental as run_alerts
+from .archive import archive_store
+from .catalogs import CatalogRefresher
+from .completeness import run_refresh as run_completeness
+from .config import get_settings
+from .database import SessionLocal
+from .metrics import (
+    SCHEDULER_JOB_DURATION, SCHEDULER_JOB_LAST_SUCCESS, SCHEDULER_LEADER, WARMUP_HEADER, popular_requests,
+)
+from .qc import run_all_incremental as run_quality_checks
+from .rollup import rollup_incremental
+
+settings = get_settings()
+
+# 스케줄러 리더 advisory lock 키 (DB 전체에서 이 앱만 사용하는 값)
+LEADER_LOCK_KEY = 0x41475753  # "AGWS"
+
+# 시작 직후 실행 시 최대 지연 (초) - 여러 워커가 동시에 시작하는 경우 분산
+STARTUP_JITTER_SECONDS = 5.0
+
+
+@dataclass(frozen=True)
+class Schedule:
+    """자정 기준 period_minutes 간격 + offset_minutes 시각에 실행 (period 는 1440 의 약수)"""
+    period_minutes: int
+    offset_minutes: int = 0
+
+    def next_run(self, now: datetime) -> datetime:
+        """now 이후의 다음 실행 시각"""
+        midnight = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        elapsed = (now - midnight).total_seconds() / 60
+        slot = math.floor((elapsed - self.offset_minutes) / self.period_minutes) + 1
+        return midnight + timedelta(minutes=slot * self.period_minutes + self.offset_minutes)
+
+
+@dataclass(frozen=True)
+class Job:
+    """주기 작업 (동기 함수는 스레드에서, 코루틴 함수는 이벤트 루프에서 실행)"""
+    name: str
+    func: Callable[[], Any]
+    schedule: Schedule
+    leader_only: bool = True     # 리더 워커에서만 실행 (DB 변경 작업)
+    run_at_startup: bool = True  # 앱 시작 직후 한 번 실행
+
+
+def _first_line(exc: BaseException) -> str:
+    return str(exc).splitlines()[0] if str(exc) else type(exc).__name__
+
+
+class LeaderLease:
+    """
+    advisory lock 기반 리더 선출
+    - lock 을 잡은 전용 연결을 유지하는 동안 리더입니다. (세션 lock 이므로 연결이 끊기면 자동 해제)
+    - 커넥션 풀 대신 NullPool 엔진을 사용하여, 연결을 닫으면 lock 이 반드시 풀리도록 합니다.
+    """
+
+    def __init__(self, db_engine: Engine, key: int):
+        self.engine = db_engine
+        self.key = key
+        self._lock = threading.Lock()
+        self._conn: Optional[Connection] = None
+
+    def acquire(self) -> bool:
+        """리더이면 True. 리더가 아니면 lock 획득을 한 번 시도합니다."""
+        with self._lock:
+            if self._conn is not None:
+                try:
+                    self._conn.exec_driver_sql("SELECT 1")
+                    self._conn.commit()
+                    return True
+                except Exception as exc:
+                    print(f"[SCHEDULER] 리더 연결 끊김: {_first_line(exc)}")
+                    self._close()
+
+            try:
+                conn = self.engine.connect()
+            except Exception as exc:
+                print(f"[SCHEDULER] 리더 선출 실패: {_first_line(exc)}")
+                return False
+            try:
+                acquired = conn.execute(text("SELECT pg_try_advisory_lock(:key)"), {"key": self.key}).scalar()
+                conn.commit()
+            except Exception as exc:
+                conn.close()
+                print(f"[SCHEDULER] 리더 선출 실패: {_first_line(exc)}")
+                return False
+            if not acquired:
+                conn.close()
+                return False
+
+            self._conn = conn
+            SCHEDULER_LEADER.set(1)
+            print(f"[SCHEDULER] 리더 워커 (pid {os.getpid()})")
+            return True
+
+    def release(self) -> None:
+        with self._lock:
+            self._close()
+
+    def _close(self) -> None:
+        if self._conn is not None:
+            try:
+                self._conn.close()
+            except Exception:
+                pass
+            self._conn = None
+        SCHEDULER_LEADER.set(0)
+
+
+class CacheWarmer:
+    """자주 요청되는 조회를 앱 안에서(ASGI) 다시 호출하여 프로세스 캐시를 채움"""
+
+    def __init__(self, app: ASGIApp, top_n: int, timeout: float):
+        self.app = app
+        self.top_n = top_n
+        self.timeout = timeout
+        # 요청별 마지막 ETag - 데이터가 바뀌지 않았으면 304 로 끝나 라우터를 실행하지 않음
+        self._etags: dict[tuple[str, str, str], str] = {}
+
+    async def warm(self) -> int:
+        """새로 채운(200) 요청 수를 반환합니다."""
+        keys = popular_requests.top(self.top_n)
+        warmed = 0
+        transport = httpx.ASGITransport(app=self.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://scheduler", timeout=self.timeout) as client:
+            for key in keys:
+                path, query, encoding = key
+                headers = {WARMUP_HEADER: "1", "accept-encoding": encoding}
+                if key in self._etags:
+                    headers["if-none-match"] = self._etags[key]
+                try:
+                    async with client.stream("GET", f"{path}?{query}" if query else path, headers=headers) as response:
+                        # 압축된 본문을 그대로 소비 (압축 캐시에 저장되는 것이 목적)
+                        async for _ in response.aiter_raw():
+                            pass
+                except httpx.HTTPError as exc:
+                    print(f"[SCHEDULER] 예열 실패 {path}: {exc!r}")
+                    continue
+                if response.status_code == 200:
+                    warmed += 1
+                    if "etag" in response.headers:
+                        self._etags[key] = response.headers["etag"]
+        # 상위 목록에서 빠진 요청의 ETag 는 버림
+        self._etags = {k: v for k, v in self._etags.items() if k in keys}
+        return warmed
+
+
+class Scheduler:
+    """작업별 asyncio 태스크로 주기 작업을 실행"""
+
+    def __init__(self, jobs: list[Job], lease: LeaderLease, jitter: float):
+        self.jobs = jobs
+        self.lease = lease
+        self.jitter = jitter
+        self._tasks: list[asyncio.Task] = []
+
+    def start(self) -> None:
+        for job in self.jobs:
+            # 요청 컨텍스트(요청별 메트릭 등)를 물려받지 않도록 빈 컨텍스트에서 실행
+            self._tasks.append(asyncio.create_task(self._run(job), context=contextvars.Context()))
+        print(f"[SCHEDULER] 작업 {len(self.jobs)}개 시작: {', '.join(job.name for job in self.jobs)}")
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        await asyncio.to_thread(self.lease.release)
+
+    async def _run(self, job: Job) -> None:
+        if job.run_at_startup:
+            await asyncio.sleep(random.uniform(0, min(self.jitter, STARTUP_JITTER_SECONDS)))
+            await self.run_once(job)
+        while True:
+            now = datetime.now()
+            delay = (job.schedule.next_run(now) - now).total_seconds()
+            await asyncio.sleep(delay + random.uniform(0, self.jitter))
+            await self.run_once(job)
+
+    async def run_once(self, job: Job) -> None:
+        """작업을 한 번 실행하고 실행 시간을 기록합니다. (리더 전용 작업은 리더가 아니면 건너뜀)"""
+        if job.leader_only and not await asyncio.to_thread(self.lease.acquire):
+            return
+
+        started = time.perf_counter()
+        try:
+            if asyncio.iscoroutinefunction(job.func):
+                result = await job.func()
+            else:
+                result = await asyncio.to_thread(job.func)
+        except Exception as exc:
+            SCHEDULER_JOB_DURATION.labels(job.name, "error").observe(time.perf_counter() - started)
+            print(f"[SCHEDULER] {job.name} 실패: {exc}")
+            return
+
+        elapsed = time.perf_counter() - started
+        SCHEDULER_JOB_DURATION.labels(job.name, "ok").observe(elapsed)
+        SCHEDULER_JOB_LAST_SUCCESS.labels(job.name).set_to_current_time()
+        if result:
+            print(f"[SCHEDULER] {job.name}: {result} ({elapsed:.1f}초)")
+
+
+def run_rollup() -> int:
+    """마지막 롤업 이후의 10분 자료를 시간별로 롤업 (upsert 행 수)"""
+    db = SessionLocal()
+    try:
+        return rollup_incremental(db)
+    finally:
+        db.close()
+
+
+def create_scheduler(app: ASGIApp) -> Scheduler:
+    """기본 작업 구성 (매 10분 경계 + 오프셋: 롤업/수신 현황 → 관측소 목록 → 품질 검사/알림 → 캐시 예열 순)"""
+    catalogs = CatalogRefresher()
+    warmer = CacheWarmer(app, settings.WARM_TOP_N, settings.WARM_TIMEOUT_SECONDS)
+    jobs = [
+        Job("rollup", run_rollup, Schedule(10, 2)),
+        Job("completeness", run_completeness, Schedule(10, 2)),
+        Job("station_catalogs", catalogs.refresh, Schedule(10, 3)),
+        Job("qc", run_quality_checks, Schedule(10, 4)),
+        Job("alerts", run_alerts, Schedule(10, 4)),
+        # 아카이브는 호스트의 파일이므로 모든 워커에서 실행 (파일 잠금으로 호스트당 하나만 생성)
+        Job("daily_archive", archive_store.refresh, Schedule(1440, 270), leader_only=False),
+    ]
+    if settings.WARM_TOP_N > 0:
+        jobs.append(Job("warm_cache", warmer.warm, Schedule(10, 5), leader_only=False, run_at_startup=False))
+    lease_engine = create_engine(settings.database_url, poolclass=NullPool)
+    return Scheduler(jobs, LeaderLease(lease_engine, LEADER_LOCK_KEY), settings.SCHEDULER_JITTER_SECONDS)
@@ -8,6 +8,7 @@ from .kma import (
 )
 from .rda import (
     WeatherDataResponse,
+    WeatherDataHourlyResponse,
     WeatherDataDailyResponse,
     WeatherDataMonthlyResponse,
 )
@@ -20,6 +21,7 @@ __all__ = [
     "WeatherShortForecastResponse",
     "WeatherMidForecastResponse",
     "WeatherDataResponse",
+    "WeatherDataHourlyResponse",
     "WeatherDataDailyResponse",
     "WeatherDataMonthlyResponse",
 ]
@@ -36,6 +36,33 @@ class WeatherDataResponse(BaseModel):
         from_attributes = True
 
 
+class WeatherDataHourlyResponse(BaseModel):
+    """시간별 집계 기상 데이터 응답 스키마"""
+    id: int
+    stn_cd: Optional[str] = Field(default=None, description="관측소 코드")
+    stn_name: Optional[str] = Field(default=None, description="관측소명")
+    province: Optional[str] = Field(default=None, description="도/광역시")
+    datetime: Optional[dt.datetime] = Field(default=None, description="집계 시각 (정시)")
+    temp: Optional[float] = Field(default=None, description="평균기온 (°C)")
+    hghst_artmp: Optional[float] = Field(default=None, description="최고기온 (°C)")
+    lowst_artmp: Optional[float] = Field(default=None, description="최저기온 (°C)")
+    hum: Optional[float] = Field(default=None, description="평균습도 (%)")
+    widdir: Optional[float] = Field(default=None, description="벡터평균 풍향 (deg)")
+    wind: Optional[float] = Field(default=None, description="평균풍속 (m/s)")
+    max_wind: Optional[float] = Field(default=None, description="최대풍속 (m/s)")
+    rn: Optional[float] = Field(default=None, description="강수량 (mm)")
+    sun_time: Optional[float] = Field(default=None, description="일조시간 (min)")
+    srqty: Optional[float] = Field(default=None, description="일사량 (MJ/m²)")
+    condens_time: Optional[float] = Field(default=None, description="응축시간 (min)")
+    gr_temp: Optional[float] = Field(default=None, description="지면온도 (°C)")
+    soil_temp: Optional[float] = Field(default=None, description="토양온도 (°C)")
+    soil_wt: Optional[float] = Field(default=None, description="토양습도 (%)")
+    sample_count: Optional[int] = Field(default=None, description="집계된 10분 자료 수")
+
+    class Config:
+        from_attributes = True
+
+
 class WeatherDataDailyResponse(BaseModel):
     """일별 기상 데이터 응답 스키마"""
     id: int
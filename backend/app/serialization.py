@@ -0,0 +1,94 @@
+"""
+대량 행 직렬화 모듈
+- ORM 객체 → Pydantic 검증 → JSON 경로를 거치지 않고,
+  필요한 컬럼만 튜플(Row)로 조회하여 orjson 으로 바로 bytes 를 만듭니다.
+- 라우터의 response_model 은 그대로 두므로 OpenAPI 스키마는 바뀌지 않습니다.
+  (Response 객체를 반환하면 FastAPI 는 응답 검증/직렬화를 건너뜁니다.)
+"""
+
+from functools import lru_cache
+from typing import Any, Iterable, Sequence
+
+import orjson
+from fastapi.responses import Response
+from pydantic import BaseModel
+from sqlalchemy.orm import Query
+
+
+class FastJSONResponse(Response):
+    """orjson 으로 렌더링하는 JSON 응답"""
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        return orjson.dumps(content)
+
+
+@lru_cache(maxsize=None)
+def schema_keys(model: type, schema: type[BaseModel]) -> tuple[str, ...]:
+    """응답 스키마 필드 중 모델에 존재하는 컬럼명 (스키마 필드 순서)"""
+    columns = set(model.__table__.columns.keys())
+    return tuple(name for name in schema.model_fields if name in columns)
+
+
+def select_columns(query: Query, model: type, keys: Sequence[str]) -> Query:
+    """ORM 엔티티 대신 지정한 컬럼만 튜플로 조회하도록 변경"""
+    return query.with_entities(*(getattr(model, k) for k in keys))
+
+
+# layout 파라미터 허용 값 (rows: 레코드 배열, columns: 컬럼별 배열)
+LAYOUT_PATTERN = "^(rows|columns)$"
+
+
+def rows_to_dicts(keys: Sequence[str], rows: Iterable[Sequence[Any]]) -> list[dict]:
+    return [dict(zip(keys, row)) for row in rows]
+
+
+def rows_to_columns(keys: Sequence[str], rows: Sequence[Sequence[Any]]) -> dict[str, list]:
+    """행 튜플 → {컬럼명: 값 배열} (행마다 dict 를 만들지 않고 전치만 수행)"""
+    if not rows:
+        return {key: [] for key in keys}
+    return {key: list(values) for key, values in zip(keys, zip(*rows))}
+
+
+def rows_response(keys: Sequence[str], rows: Iterable[Sequence[Any]]) -> FastJSONResponse:
+    """행 목록을 JSON 배열 응답으로 변환"""
+    return FastJSONResponse(orjson.dumps(rows_to_dicts(keys, rows)))
+
+
+def paginated_response(
+    total: int,
+    offset: int,
+    limit: int,
+    keys: Sequence[str],
+    rows: Sequence[Sequence[Any]],
+    layout: str = "rows",
+    shared: Sequence[str] = ()
+) -> FastJSONResponse:
+    """행 목록을 PaginatedResponse 형식 응답으로 변환
+
+    layout="columns" 이면 data 를 {컬럼명: 값 배열} 로 반환하고,
+    shared 로 지정한 컬럼(필터로 고정된 관측소/지역 등)은 meta 에 한 번만 담습니다.
+    """
+    if layout != "columns":
+        return FastJSONResponse(orjson.dumps({
+            "total": total,
+            "offset": offset,
+            "limit": limit,
+            "data": rows_to_dicts(keys, rows),
+        }))
+
+    data = rows_to_columns(keys, rows)
+    meta = {key: (data[key][0] if rows else None) for key in shared}
+    for key in shared:
+        del data[key]
+
+    return FastJSONResponse(orjson.dumps({
+        "total": total,
+        "offset": offset,
+        "limit": limit,
+        "layout": "columns",
+        "meta": meta,
+        "data": data,
+    }))
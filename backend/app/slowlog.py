@@ -0,0 +1,160 @@
+"""
+느린 쿼리 기록 모듈
+- SLOW_QUERY_MS 를 넘긴 SQL 을 정규화된 문장, 파라미터 형태(값은 저장하지 않음),
+  호출 라우트, 실행 시간과 함께 메모리 링 버퍼(SLOW_QUERY_BUFFER 건)에 기록합니다.
+- SELECT 문은 SLOW_QUERY_EXPLAIN_SAMPLE 비율로 EXPLAIN (ANALYZE, BUFFERS) 실행 계획을
+  별도 스레드/연결에서 수집하여 기록에 덧붙입니다. (요청 응답 시간에는 영향 없음)
+- 기록은 /api/admin/slow-queries 에서 조회합니다.
+"""
+
+import random
+import re
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import Any, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from .config import get_settings
+from .metrics import current_route
+
+settings = get_settings()
+
+# 동시에 대기할 수 있는 EXPLAIN 작업 수 (넘치면 계획 수집을 건너뜀)
+MAX_PENDING_EXPLAINS = 4
+
+# 확장된 IN 목록 (IN (%(p_1_1)s, %(p_1_2)s, ...)) → IN (...)
+_IN_LIST = re.compile(r"\bIN \((?:\s*%\([^)]+\)s\s*,?)+\)", re.IGNORECASE)
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"(?<![\w%)])\d+(?:\.\d+)?\b")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_sql(statement: str) -> str:
+    """리터럴/IN 목록/공백을 정규화하여 같은 형태의 쿼리를 묶을 수 있게 합니다."""
+    sql = _IN_LIST.sub("IN (...)", statement)
+    sql = _STRING_LITERAL.sub("?", sql)
+    sql = _NUMBER_LITERAL.sub("?", sql)
+    return _WHITESPACE.sub(" ", sql).strip()
+
+
+def parameter_shape(parameters: Any) -> Any:
+    """바인딩 파라미터의 이름과 타입만 추출 (값은 기록하지 않음)"""
+    if isinstance(parameters, dict):
+        return {key: type(value).__name__ for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        if parameters and isinstance(parameters[0], (dict, list, tuple)):
+            return f"{len(parameters)} rows x {parameter_shape(parameters[0])}"
+        return [type(value).__name__ for value in parameters]
+    return None
+
+
+@dataclass
+class SlowQuery:
+    """느린 쿼리 기록"""
+    recorded_at: datetime
+    route: str
+    duration_ms: float
+    rows: int
+    sql: str
+    params: Any
+    plan: Optional[str] = None
+
+
+class SlowQueryLog:
+    """느린 쿼리 링 버퍼 + 샘플링 EXPLAIN 수집기"""
+
+    def __init__(self, threshold_ms: float, capacity: int, explain_sample: float):
+        self.threshold_ms = threshold_ms
+        self.explain_sample = explain_sample
+        self._records: deque[SlowQuery] = deque(maxlen=capacity)
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="slowlog-explain")
+        self._pending = 0
+        self._local = threading.local()
+
+    def install(self, engine: Engine) -> None:
+        """엔진에 실행 시간 측정 이벤트를 등록합니다. (엔진마다 호출)"""
+        event.listen(engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", self._after_cursor_execute)
+
+    def records(self, limit: Optional[int] = None) -> list[dict]:
+        """최근 기록부터 반환"""
+        with self._lock:
+            items = list(reversed(self._records))
+        return [asdict(r) for r in items[:limit]]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._records.clear()
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        if context is not None:
+            context._slowlog_started = time.perf_counter()
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        started = getattr(context, "_slowlog_started", None)
+        if started is None or getattr(self._local, "explaining", False):
+            return
+        duration_ms = (time.perf_counter() - started) * 1000
+        if duration_ms < self.threshold_ms:
+            return
+
+        record = SlowQuery(
+            recorded_at=datetime.now(),
+            route=current_route(),
+            duration_ms=round(duration_ms, 1),
+            rows=max(cursor.rowcount, 0),
+            sql=normalize_sql(statement),
+            params=parameter_shape(parameters),
+        )
+        with self._lock:
+            self._records.append(record)
+            explain = not executemany and self._should_explain(statement)
+            if explain:
+                self._pending += 1
+        print(f"[SLOW] {record.duration_ms:.0f}ms {record.route} {record.sql[:200]}")
+
+        if explain:
+            # 쿼리를 실행한 서버(복제본 포함)에서 실행 계획 수집
+            self._executor.submit(self._explain, conn.engine, record, statement, parameters)
+
+    def _should_explain(self, statement: str) -> bool:
+        # 첫 키워드 (WITH 는 4글자라 앞 6글자로 자르면 "WITH X" 가 됨)
+        words = statement.split(None, 1)
+        return (
+            bool(words) and words[0].upper() in ("SELECT", "WITH")
+            and self._pending < MAX_PENDING_EXPLAINS
+            and random.random() < self.explain_sample
+        )
+
+    def _explain(self, engine: Engine, record: SlowQuery, statement: str, parameters: Any) -> None:
+        """별도 연결에서 EXPLAIN (ANALYZE, BUFFERS) 실행 (읽기 전용 트랜잭션, 결과는 롤백)"""
+        self._local.explaining = True
+        try:
+            with engine.connect() as conn:
+                conn.exec_driver_sql("SET TRANSACTION READ ONLY")
+                rows = conn.exec_driver_sql(
+                    "EXPLAIN (ANALYZE, BUFFERS) " + statement, parameters or {}
+                ).all()
+                conn.rollback()
+            record.plan = "\n".join(r[0] for r in rows)
+        except Exception as exc:
+            record.plan = f"EXPLAIN 실패: {exc}"
+        finally:
+            self._local.explaining = False
+            with self._lock:
+                self._pending -= 1
+
+
+# 프로세스 공용 인스턴스
+slow_queries = SlowQueryLog(
+    threshold_ms=settings.SLOW_QUERY_MS,
+    capacity=settings.SLOW_QUERY_BUFFER,
+    explain_sample=settings.SLOW_QUERY_EXPLAIN_SAMPLE,
+)
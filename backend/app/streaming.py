@@ -0,0 +1,183 @@
+"""
+실시간 데이터 변경 브로드캐스터
+- 프로세스당 하나의 폴러가 STREAM_POLL_SECONDS 마다 data_versions 만 확인합니다.
+- 변경이 감지된 경우에만 최신 스냅샷(KMA 지역별 피벗, RDA 관측소별 최신값)을 한 번 조회하고,
+  이전 스냅샷과 달라진 행만 모든 구독자(SSE 연결)에게 전달합니다.
+- 구독자가 없으면 폴러는 멈춥니다.
+- 변경 알림(app.notify)을 수신 중이면 감시 테이블이 바뀌는 즉시 확인하므로, 폴링은 알림을 놓친 경우의 대비입니다.
+"""
+
+import asyncio
+import contextvars
+from datetime import date, datetime, timedelta
+from typing import Callable, Optional
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from .config import get_settings
+from .database import SessionLocal
+from .watermark import watermarks
+
+settings = get_settings()
+
+# 구독자별 대기 이벤트 최대 개수 (넘치면 전체 스냅샷으로 재동기화)
+SUBSCRIBER_QUEUE_SIZE = 32
+
+KMA_CATEGORIES = ["T1H", "RN1", "UUU", "VVV", "REH", "PTY", "VEC", "WSD"]
+
+# 카테고리 행 → 컬럼 피벗 표현식
+KMA_PIVOT_COLUMNS = ", ".join(
+    f"max(w.obsrvalue) FILTER (WHERE w.category = '{c}') AS \"{c}\"" for c in KMA_CATEGORIES
+)
+
+KMA_LATEST_SQL = text(f"""
+    WITH latest AS (
+        SELECT DISTINCT ON (region_name) region_name, sido, base_date, base_time
+        FROM weather_realtime
+        WHERE base_date >= :since
+        ORDER BY region_name, base_date DESC, base_time DESC
+    )
+    SELECT
+        l.sido, l.region_name, l.base_date, l.base_time,
+        {KMA_PIVOT_COLUMNS}
+    FROM latest l
+    JOIN weather_realtime w
+      ON w.region_name = l.region_name
+     AND w.base_date = l.base_date
+     AND w.base_time = l.base_time
+    GROUP BY l.sido, l.region_name, l.base_date, l.base_time
+""")
+
+RDA_LATEST_SQL = text("""
+    SELECT DISTINCT ON (stn_cd)
+        id, stn_cd, stn_name, province, datetime,
+        temp, hghst_artmp, lowst_artmp, hum, widdir, wind, max_wind,
+        rn, sun_time, srqty, condens_time, gr_temp, soil_temp, soil_wt, created_at
+    FROM weather_data
+    WHERE datetime >= :since
+    ORDER BY stn_cd, datetime DESC
+""")
+
+
+def load_kma_latest(db: Session) -> dict[str, dict]:
+    """지역별 최신 초단기 실황 (피벗) - 키: region_name"""
+    since = date.today() - timedelta(days=1)
+    rows = db.execute(KMA_LATEST_SQL, {"since": since}).mappings().all()
+    return {r["region_name"]: dict(r) for r in rows}
+
+
+def load_rda_latest(db: Session) -> dict[str, dict]:
+    """관측소별 최신 10분 자료 - 키: stn_cd"""
+    since = datetime.now() - timedelta(days=1)
+    rows = db.execute(RDA_LATEST_SQL, {"since": since}).mappings().all()
+    return {r["stn_cd"]: dict(r) for r in rows}
+
+
+# (이벤트명, 감시 테이블, 스냅샷 로더)
+SOURCES: list[tuple[str, str, Callable[[Session], dict[str, dict]]]] = [
+    ("kma", "weather_realtime", load_kma_latest),
+    ("rda", "weather_data", load_rda_latest),
+]
+
+
+class RealtimeBroadcaster:
+    """data_versions 폴링 기반 변경분 브로드캐스터"""
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._subscribers: set[asyncio.Queue] = set()
+        self._task: Optional[asyncio.Task] = None
+        self._versions: dict[str, int] = {}
+        self._snapshots: dict[str, dict[str, dict]] = {}
+        self._wakeup = asyncio.Event()
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def subscribe(self) -> asyncio.Queue:
+        """구독 큐를 만들고, 이미 스냅샷이 있으면 전체 스냅샷을 먼저 넣어 둡니다."""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        if self._snapshots:
+            queue.put_nowait(self._snapshot_event())
+        self._subscribers.add(queue)
+
+        if self._task is None or self._task.done():
+            # 첫 구독 요청의 컨텍스트(요청별 메트릭 등)를 물려받지 않도록 빈 컨텍스트에서 실행
+            self._task = asyncio.create_task(self._run(), context=contextvars.Context())
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        self._subscribers.discard(queue)
+
+    def wakeup(self) -> None:
+        """다음 주기를 기다리지 않고 즉시 변경 여부를 확인합니다."""
+        self._wakeup.set()
+
+    def on_tables_changed(self, tables: Optional[frozenset[str]]) -> None:
+        """변경 알림(app.notify) - 감시 테이블이 바뀌었으면 폴링 주기를 기다리지 않고 확인"""
+        if tables is None or any(table in tables for _, table, _ in SOURCES):
+            self.wakeup()
+
+    def _snapshot_event(self) -> dict:
+        return {
+            "event": "snapshot",
+            "data": {source: list(rows.values()) for source, rows in self._snapshots.items()},
+        }
+
+    def _publish(self, event: dict) -> None:
+        for queue in list(self._subscribers):
+            try:
+                queue.put_nowait(event)
+            except asyncio.QueueFull:
+                # 느린 구독자: 밀린 이벤트를 버리고 전체 스냅샷으로 재동기화
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait(self._snapshot_event())
+
+    def _load_changed(self, known: dict[str, int]) -> dict[str, tuple[int, dict[str, dict]]]:
+        """버전이 바뀐 소스만 스냅샷을 다시 조회합니다. (스레드에서 실행)"""
+        watermarks.invalidate()
+        versions = watermarks.get_all()
+
+        changed = {}
+        db = SessionLocal()
+        try:
+            for source, table, loader in SOURCES:
+                wm = versions.get(table)
+                version = wm.version if wm else -1
+                if source in known and known[source] == version:
+                    continue
+                changed[source] = (version, loader(db))
+        finally:
+            db.close()
+        return changed
+
+    async def _run(self) -> None:
+        while self._subscribers:
+            try:
+                changed = await asyncio.to_thread(self._load_changed, dict(self._versions))
+            except Exception as exc:
+                print(f"[STREAM] 변경 확인 실패: {exc}")
+                changed = {}
+
+            for source, (version, rows) in changed.items():
+                previous = self._snapshots.get(source, {})
+                diff = [row for key, row in rows.items() if previous.get(key) != row]
+                self._versions[source] = version
+                self._snapshots[source] = rows
+                if diff:
+                    self._publish({"event": source, "data": diff})
+
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.interval)
+            except asyncio.TimeoutError:
+                pass
+
+        self._task = None
+
+
+# 프로세스 공용 인스턴스
+broadcaster = RealtimeBroadcaster(interval=settings.STREAM_POLL_SECONDS)
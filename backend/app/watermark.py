@@ -0,0 +1,78 @@
+"""
+데이터 워터마크 모듈
+- data_versions 테이블(트리거가 관리하는 테이블별 변경 카운터)을 읽어
+  "마지막 확인 이후 데이터가 바뀌었는지"를 한 번의 작은 쿼리로 판단합니다.
+- 프로세스 안에서 짧은 기간 캐시하여, 동시 요청이 많아도 DB 확인은 주기당 한 번입니다.
+- 변경 알림(app.notify)을 수신하는 동안은 알림이 올 때 캐시를 비우므로 유지 시간을 길게 둡니다.
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import text
+
+from .config import get_settings
+from .database import SessionLocal
+
+settings = get_settings()
+
+
+@dataclass(frozen=True)
+class Watermark:
+    """테이블 변경 카운터 스냅샷"""
+    version: int
+    changed_at: datetime
+
+
+class WatermarkCache:
+    """data_versions 조회 결과를 max_age 초 동안 공유하는 캐시"""
+
+    def __init__(self, max_age: float = 1.0, notified_max_age: float = 0.0):
+        self.max_age = max_age
+        self.poll_max_age = max_age
+        self.notified_max_age = notified_max_age
+        self._lock = threading.Lock()
+        self._loaded_at = 0.0
+        self._values: dict[str, Watermark] = {}
+
+    def get_all(self) -> dict[str, Watermark]:
+        """모든 테이블의 워터마크 (캐시가 오래되었으면 다시 조회)"""
+        with self._lock:
+            if time.monotonic() - self._loaded_at > self.max_age:
+                self._values = self._load()
+                self._loaded_at = time.monotonic()
+            return self._values
+
+    def get(self, table: str) -> Optional[Watermark]:
+        return self.get_all().get(table)
+
+    def invalidate(self) -> None:
+        """다음 조회 시 DB에서 다시 읽도록 캐시를 비웁니다."""
+        with self._lock:
+            self._loaded_at = 0.0
+
+    def set_notified(self, listening: bool) -> None:
+        """변경 알림 수신 여부에 따라 유지 시간을 바꾸고 캐시를 비웁니다. (끊긴 동안 놓친 알림 대비)"""
+        self.max_age = max(self.notified_max_age, self.poll_max_age) if listening else self.poll_max_age
+        self.invalidate()
+
+    @staticmethod
+    def _load() -> dict[str, Watermark]:
+        db = SessionLocal()
+        try:
+            rows = db.execute(text(
+                "SELECT table_name, version, changed_at FROM data_versions"
+            )).all()
+        finally:
+            db.close()
+        return {r.table_name: Watermark(r.version, r.changed_at) for r in rows}
+
+
+# 프로세스 공용 인스턴스
+watermarks = WatermarkCache(
+    max_age=settings.WATERMARK_MAX_AGE_SECONDS,
+    notified_max_age=settings.WATERMARK_MAX_AGE_NOTIFY_SECONDS,
+)
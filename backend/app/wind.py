@@ -0,0 +1,218 @@
+"""
+바람 벡터 처리 모듈
+- 풍향(기상 풍향: 바람이 불어오는 방향, 북=0°, 시계 방향)/풍속과 u/v 성분(UUU: 동쪽 +, VVV: 북쪽 +) 변환
+  u = -풍속·sin(풍향), v = -풍속·cos(풍향), 풍향 = atan2(-u, -v)
+- 풍향은 각도 평균이 아니라 u/v 성분 합으로 평균합니다. (350° 와 10° 의 평균은 0°, app.gapfill 의 풍향 보간도 같은 변환 사용)
+- 바람장미(windrose): 관측소 × 풍향 구간 × 풍속 계급 빈도를 SQL GROUP BY 한 번으로 집계하고,
+  같은 쿼리의 u/v 성분 합으로 벡터 평균 풍향/풍속을 계산합니다. (/api/stats/windrose)
+  * rda: 10분 자료 widdir / wind (조회 기간이 길거나 보존 기간 이전이면 시간별 집계)
+  * kma: 초단기실황 UUU / VVV (없으면 VEC / WSD)
+"""
+
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from typing import Any, Optional, Sequence
+
+from fastapi import HTTPException
+from sqlalchemy import Integer, Interval, and_, case, cast, func, literal, or_, select
+from sqlalchemy.orm import Session
+
+from .models.kma import WeatherRealtime
+from .models.rda import WeatherData, WeatherDataHourly
+from .rollup import use_hourly_tier
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# 기본 풍속 계급 하한 (m/s, 보퍼트 풍력 계급 1~6 경계) - 마지막 계급은 상한 없음
+# 첫 하한 미만은 풍향 없이 정온(calm)으로 셈
+SPEED_BINS = (0.5, 1.6, 3.4, 5.5, 8.0, 10.8)
+MAX_SPEED_BINS = 10
+
+# 허용 풍향 구간 수
+SECTOR_COUNTS = (8, 16, 36)
+SECTOR_NAMES = {
+    8: ("N", "NE", "E", "SE", "S", "SW", "W", "NW"),
+    16: ("N", "NNE", "NE", "ENE", "E", "ESE", "SE", "SSE", "S", "SSW", "SW", "WSW", "W", "WNW", "NW", "NNW"),
+}
+
+# source 파라미터 허용 값
+WIND_SOURCE_PATTERN = "^(rda|kma)$"
+
+
+def to_components(direction: "np.ndarray", speed: "np.ndarray") -> tuple["np.ndarray", "np.ndarray"]:
+    """기상 풍향/풍속 → (u, v)"""
+    radians = np.radians(direction)
+    return -speed * np.sin(radians), -speed * np.cos(radians)
+
+
+def from_components(u: "np.ndarray", v: "np.ndarray") -> tuple["np.ndarray", "np.ndarray"]:
+    """(u, v) → 기상 풍향(0~360)/풍속"""
+    return np.degrees(np.arctan2(-u, -v)) % 360, np.hypot(u, v)
+
+
+def sector_names(sectors: int) -> list[str]:
+    """풍향 구간 이름 (8/16방위, 36구간은 중심 각도)"""
+    if sectors in SECTOR_NAMES:
+        return list(SECTOR_NAMES[sectors])
+    return [f"{i * 360 // sectors:03d}" for i in range(sectors)]
+
+
+@dataclass(frozen=True)
+class _Source:
+    """바람장미 집계 원본 (관측소, 관측소명, 시각, 풍향, 풍속 컬럼식과 FROM)"""
+    resolution: str
+    station: Any
+    station_name: Any
+    time: Any
+    direction: Any
+    speed: Any
+    table: Any
+
+
+def _rda_source(start: datetime, end: datetime) -> _Source:
+    model = WeatherDataHourly if use_hourly_tier(start, end) else WeatherData
+    return _Source(
+        resolution="hourly" if model is WeatherDataHourly else "10min",
+        station=model.stn_cd, station_name=model.stn_name, time=model.datetime,
+        direction=model.widdir, speed=model.wind, table=model.__table__,
+    )
+
+
+def _kma_source(stations: Sequence[str], start: datetime, end: datetime) -> _Source:
+    """
+    카테고리 행을 (지역, 시각) 한 행으로 펼친 서브쿼리 (UUU/VVV 우선, 없으면 VEC/WSD)
+    - 시각은 base_date + base_time(HHMM) 을 합친 timestamp (rda 와 같은 first/last 형태)
+    """
+    m = WeatherRealtime
+
+    def pick(category: str):
+        return func.max(case((m.category == category, m.obsrvalue))).label(category.lower())
+
+    offset = func.make_interval(0, 0, 0, 0, cast(func.substr(m.base_time, 1, 2), Integer),
+                                cast(func.substr(m.base_time, 3, 2), Integer), type_=Interval)
+    pivot = (
+        select(m.region_name, (m.base_date + offset).label("slot"),
+               pick("UUU"), pick("VVV"), pick("VEC"), pick("WSD"))
+        .where(m.category.in_(("UUU", "VVV", "VEC", "WSD")), m.region_name.in_(stations),
+               m.base_date >= start.date(), m.base_date < end.date(),
+               m.base_time.regexp_match("^[0-9]{4}$"))  # 형식이 깨진 발표시각 제외
+        .group_by(m.region_name, m.base_date, m.base_time)
+        .subquery()
+    )
+    has_components = and_(pivot.c.uuu.isnot(None), pivot.c.vvv.isnot(None))
+    return _Source(
+        resolution="hourly",
+        station=pivot.c.region_name, station_name=pivot.c.region_name, time=pivot.c.slot,
+        direction=case((has_components, func.degrees(func.atan2(-pivot.c.uuu, -pivot.c.vvv))), else_=pivot.c.vec),
+        speed=case((has_components, func.sqrt(pivot.c.uuu * pivot.c.uuu + pivot.c.vvv * pivot.c.vvv)),
+                   else_=pivot.c.wsd),
+        table=pivot,
+    )
+
+
+def windrose(db: Session, source: str, stations: Sequence[str], start_date: date, end_date: date,
+             sectors: int = 16, speed_bins: Sequence[float] = SPEED_BINS) -> tuple[str, list[dict]]:
+    """
+    관측소별 바람장미 (해상도, 관측소 순 결과)
+    - frequency[i][j]: 풍향 구간 i, 풍속 계급 j 의 비율 (%, 정온 포함 전체 관측 수 기준)
+    - 풍향 구간 0 은 북(0°)을 중심으로 ±(180 / sectors)°
+    - speed_bins: 풍속 계급 하한 (오름차순), 첫 하한 미만은 정온
+    """
+    if np is None:
+        raise HTTPException(status_code=501, detail="바람장미를 계산하려면 서버에 numpy 가 설치되어 있어야 합니다.")
+    start = datetime.combine(start_date, time.min)
+    end = datetime.combine(end_date + timedelta(days=1), time.min)
+    if source == "kma":
+        src = _kma_source(stations, start, end)
+        period = []
+    else:
+        src = _rda_source(start, end)
+        period = [src.time >= start, src.time < end, src.station.in_(stations)]
+
+    width = 360.0 / sectors
+    # 풍향 구간 (음수/360 이상 각도도 floor 로 0~360 으로 접음)
+    shifted = src.direction + width / 2
+    sector = func.floor((shifted - 360 * func.floor(shifted / 360)) / width)
+    calm = src.speed < speed_bins[0]
+    speed_class = case(
+        (calm, literal(-1)),
+        *((src.speed < edge, literal(i - 1)) for i, edge in enumerate(speed_bins) if i > 0),
+        else_=literal(len(speed_bins) - 1),
+    )
+    radians = func.radians(src.direction)
+
+    rows = db.execute(
+        select(
+            src.station.label("station"),
+            func.max(src.station_name).label("station_name"),
+            case((calm, literal(0)), else_=sector).label("sector"),
+            speed_class.label("speed_class"),
+            func.count().label("count"),
+            func.sum(case((calm, literal(0.0)), else_=-src.speed * func.sin(radians))).label("sum_u"),
+            func.sum(case((calm, literal(0.0)), else_=-src.speed * func.cos(radians))).label("sum_v"),
+            func.sum(src.speed).label("sum_speed"),
+            func.min(src.time).label("first"),
+            func.max(src.time).label("last"),
+        )
+        .select_from(src.table)
+        .where(*period, src.speed.isnot(None), src.speed >= 0,
+               or_(calm, src.direction.isnot(None)))
+        .group_by(src.station, case((calm, literal(0)), else_=sector), speed_class)
+    ).all()
+    return src.resolution, _assemble(rows, stations, sectors, len(speed_bins))
+
+
+def _assemble(rows: Sequence[Any], stations: Sequence[str], sectors: int, classes: int) -> list[dict]:
+    """GROUP BY 결과 → 관측소별 [풍향 구간, 풍속 계급] 빈도 행렬과 벡터 평균"""
+    index = {station: i for i, station in enumerate(stations)}
+    n = len(rows)
+    station_idx = np.fromiter((index[r.station] for r in rows), dtype=np.int64, count=n)
+    sector_idx = np.fromiter((int(r.sector) for r in rows), dtype=np.int64, count=n) % sectors
+    class_idx = np.fromiter((int(r.speed_class) for r in rows), dtype=np.int64, count=n)
+    counts_by_row = np.fromiter((r.count for r in rows), dtype=np.float64, count=n)
+    sums = np.array([[r.sum_u or 0.0, r.sum_v or 0.0, r.sum_speed or 0.0] for r in rows],
+                    dtype=np.float64).reshape(n, 3)
+
+    # 정온(계급 -1)은 행렬 밖 별도 칸
+    windy = class_idx >= 0
+    matrix = np.zeros((len(stations), sectors, classes))
+    np.add.at(matrix, (station_idx[windy], sector_idx[windy], class_idx[windy]), counts_by_row[windy])
+    calm = np.bincount(station_idx[~windy], weights=counts_by_row[~windy], minlength=len(stations))
+    totals = np.bincount(station_idx, weights=counts_by_row, minlength=len(stations))
+    station_sums = np.zeros((len(stations), 3))
+    np.add.at(station_sums, station_idx, sums)
+
+    names: dict[str, Optional[str]] = {}
+    firsts: dict[str, Any] = {}
+    lasts: dict[str, Any] = {}
+    for r in rows:
+        names[r.station] = r.station_name
+        firsts[r.station] = min(firsts.get(r.station, r.first), r.first)
+        lasts[r.station] = max(lasts.get(r.station, r.last), r.last)
+
+    results = []
+    for i, station in enumerate(stations):
+        total = totals[i]
+        if total == 0:
+            continue
+        u, v, speed = station_sums[i] / total
+        direction, vector_speed = from_components(u, v)
+        results.append({
+            "station": station,
+            "station_name": names[station],
+            "first": firsts[station],
+            "last": lasts[station],
+            "count": int(total),
+            "calm": round(100 * calm[i] / total, 2),
+            "frequency": np.round(100 * matrix[i] / total, 2).tolist(),
+            "mean": {
+                "direction": round(float(direction), 1) if vector_speed > 0 else None,
+                "vector_speed": round(float(vector_speed), 2),
+                "scalar_speed": round(float(speed), 2),
+                "steadiness": round(float(vector_speed / speed), 3) if speed > 0 else None,
+            },
+        })
+    return results
@@ -0,0 +1,80 @@
+"""
+컬럼형 응답 벤치마크 (JSON vs Arrow IPC vs Parquet)
+- 기간 조회 응답과 같은 컬럼(ASOS 일자료)의 합성 데이터로
+  응답 크기와 클라이언트 파싱 시간을 비교합니다. DB 없이 실행됩니다.
+
+사용법:
+    cd backend
+    python -m benchmarks.bench_columnar
+"""
+
+import io
+import json
+import random
+import time
+from datetime import date, timedelta
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from app.columnar import BATCH_ROWS, encode_batches, statement_schema
+from app.database import SessionLocal
+from app.models.kma import AsosDailyData
+from app.routers.kma_asos import ASOS_KEYS
+from app.serialization import paginated_response, select_columns
+
+SIZES = [100_000, 1_000_000]
+STATIONS = 100
+
+
+def make_rows(n: int) -> list[tuple]:
+    """ASOS_KEYS 순서의 합성 일자료 (관측소 × 날짜)"""
+    rng = random.Random(42)
+    start = date(2000, 1, 1)
+    rows = []
+    for i in range(n):
+        stn_id = 90 + i % STATIONS
+        ta = round(rng.uniform(-15, 30), 1)
+        rows.append((
+            i + 1, stn_id, f"지점{stn_id}", start + timedelta(days=i // STATIONS),
+            ta, round(ta - rng.uniform(0, 10), 1), round(ta + rng.uniform(0, 10), 1),
+            round(rng.expovariate(0.5), 1) if rng.random() < 0.3 else None,
+            round(rng.uniform(0, 8), 1), rng.randint(20, 100),
+            round(rng.uniform(0, 12), 1), round(rng.uniform(0, 30), 2),
+        ))
+    return rows
+
+
+def timed(func, *args) -> tuple[float, object]:
+    started = time.perf_counter()
+    value = func(*args)
+    return (time.perf_counter() - started) * 1000, value
+
+
+def main() -> None:
+    db = SessionLocal()
+    statement = select_columns(db.query(AsosDailyData), AsosDailyData, ASOS_KEYS).statement
+    db.close()
+    schema = statement_schema(statement, ASOS_KEYS)
+
+    print(f"{'rows':>9} {'format':>8} {'size(MB)':>9} {'encode(ms)':>11} {'parse(ms)':>10}")
+    for n in SIZES:
+        rows = make_rows(n)
+        chunks = [rows[i:i + BATCH_ROWS] for i in range(0, n, BATCH_ROWS)]
+
+        encode_ms, body = timed(lambda: paginated_response(n, 0, n, ASOS_KEYS, rows).body)
+        parse_ms, _ = timed(json.loads, body)
+        print(f"{n:>9} {'json':>8} {len(body) / 1e6:>9.1f} {encode_ms:>11.0f} {parse_ms:>10.0f}")
+
+        for fmt, read in (
+            ("arrow", lambda b: pa.ipc.open_stream(b).read_all()),
+            ("parquet", lambda b: pq.read_table(io.BytesIO(b))),
+        ):
+            encode_ms, body = timed(lambda: b"".join(encode_batches(fmt, schema, chunks)))
+            parse_ms, table = timed(read, body)
+            assert table.num_rows == n
+            print(f"{n:>9} {fmt:>8} {len(body) / 1e6:>9.1f} {encode_ms:>11.0f} {parse_ms:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
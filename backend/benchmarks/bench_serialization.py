@@ -0,0 +1,82 @@
+"""
+직렬화 마이크로벤치마크
+- 기존 경로: ORM 객체 → Pydantic(response_model) 검증 → jsonable_encoder → json.dumps
+- 빠른 경로: 컬럼 튜플(Row) → orjson (app.serialization)
+- DB 없이 합성 데이터로 1k / 10k / 100k 행을 측정합니다.
+
+사용법:
+    cd backend
+    python -m benchmarks.bench_serialization
+"""
+
+import random
+import time
+from datetime import datetime, timedelta
+from typing import List
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+
+from app.models.rda import WeatherData
+from app.schemas.rda import WeatherDataResponse
+from app.serialization import schema_keys, rows_response
+
+SIZES = [1_000, 10_000, 100_000]
+REPEAT = 3
+
+
+def make_rows(n: int) -> list[tuple]:
+    """WeatherDataResponse 컬럼 순서의 합성 튜플"""
+    rng = random.Random(42)
+    keys = schema_keys(WeatherData, WeatherDataResponse)
+    base = datetime(2024, 1, 1)
+    rows = []
+    for i in range(n):
+        values = {
+            "id": i,
+            "stn_cd": f"{477000 + i % 200}",
+            "stn_name": f"관측소{i % 200}",
+            "province": "경기도",
+            "datetime": base + timedelta(minutes=10 * i),
+            "created_at": base,
+        }
+        rows.append(tuple(values.get(k, round(rng.uniform(-10, 35), 1)) for k in keys))
+    return rows
+
+
+def pydantic_path(objects: list) -> bytes:
+    adapter = TypeAdapter(List[WeatherDataResponse])
+    validated = adapter.validate_python(objects, from_attributes=True)
+    content = jsonable_encoder(adapter.dump_python(validated, mode="json"))
+    return JSONResponse(content).body
+
+
+def fast_path(keys, rows: list[tuple]) -> bytes:
+    return rows_response(keys, rows).body
+
+
+def best_of(func, *args) -> float:
+    timings = []
+    for _ in range(REPEAT):
+        started = time.perf_counter()
+        func(*args)
+        timings.append(time.perf_counter() - started)
+    return min(timings) * 1000
+
+
+def main() -> None:
+    keys = schema_keys(WeatherData, WeatherDataResponse)
+    print(f"{'rows':>8} {'pydantic(ms)':>14} {'orjson rows(ms)':>16} {'speedup':>8}")
+    for n in SIZES:
+        rows = make_rows(n)
+        objects = [WeatherData(**dict(zip(keys, r))) for r in rows]
+
+        assert len(pydantic_path(objects[:10])) > 0
+        slow = best_of(pydantic_path, objects)
+        fast = best_of(fast_path, keys, rows)
+        print(f"{n:>8} {slow:>14.1f} {fast:>16.1f} {slow / fast:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
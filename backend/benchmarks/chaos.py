@@ -0,0 +1,156 @@
+"""
+DB 장애 주입 테스트 (stale-while-revalidate / 서킷 브레이커 검증)
+- 모든 GET 시나리오(benchmarks.load 와 동일)를 한 번씩 호출하여 마지막 정상 응답을 채운 뒤 (200 인 시나리오만 사용),
+  동시 요청을 보내는 도중 --kill-cmd 로 PostgreSQL 을 중지하고 --down-for 초 뒤 --start-cmd 로 재시작합니다.
+- 장애 전 / 장애 중 / 복구 후 구간별로 상태 코드, 보관 응답(X-Cache: STALE) 비율, p50/p99 지연을 출력합니다.
+- 다음 중 하나라도 해당하면 실패(exit 1)합니다.
+  * 장애 중 5xx 응답 (워밍업한 요청은 모두 보관 응답으로 처리되어야 함)
+  * 장애 중 p99 지연이 --max-p99-ms 초과
+  * 복구 후 마지막 --recovery-window 초 동안 보관 응답이 남아 있음 (서킷이 닫히지 않음)
+
+사용법:
+    cd backend
+    ADMISSION_ENABLED=false uvicorn app.main:app --port 8001     # 별도 터미널 (benchmarks.datagen 으로 채운 DB)
+    python -m benchmarks.chaos --kill-cmd "docker stop postgres" --start-cmd "docker start postgres"
+    python -m benchmarks.chaos --kill-cmd "pg_ctl -D /var/lib/postgresql/data stop -m immediate" \\
+        --start-cmd "pg_ctl -D /var/lib/postgresql/data start"
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+import httpx
+
+from benchmarks.load import build_scenarios, discover_samples, percentile
+
+PHASES = ("before", "outage", "recovery")
+
+
+@dataclass
+class Sample:
+    at: float        # 시작 후 경과 시간 (초)
+    status: str
+    stale: bool
+    latency_ms: float
+
+
+async def run_command(command: str) -> None:
+    print(f"[CHAOS] {time.strftime('%H:%M:%S')} $ {command}")
+    process = await asyncio.create_subprocess_shell(command)
+    await process.wait()
+
+
+def phase_of(at: float, args: argparse.Namespace) -> str:
+    if at < args.kill_after:
+        return "before"
+    if at < args.kill_after + args.down_for:
+        return "outage"
+    return "recovery"
+
+
+def summarize(samples: list[Sample]) -> dict:
+    latencies = sorted(s.latency_ms for s in samples)
+    statuses: dict[str, int] = {}
+    for s in samples:
+        statuses[s.status] = statuses.get(s.status, 0) + 1
+    return {
+        "requests": len(samples),
+        "statuses": statuses,
+        "stale_ratio": round(sum(s.stale for s in samples) / max(len(samples), 1), 3),
+        "p50_ms": round(percentile(latencies, 0.50), 1),
+        "p99_ms": round(percentile(latencies, 0.99), 1),
+    }
+
+
+async def run(args: argparse.Namespace) -> int:
+    limits = httpx.Limits(max_connections=args.concurrency * 2)
+    async with httpx.AsyncClient(base_url=args.base_url, timeout=args.timeout, limits=limits) as client:
+        openapi = (await client.get("/openapi.json")).json()
+        samples = await discover_samples(client)
+
+        # 워밍업: 시나리오별 마지막 정상 응답을 서버에 보관 (200 이 아닌 시나리오는 제외)
+        warmed = []
+        for scenario in build_scenarios(openapi, samples):
+            response = await client.get(scenario.path, params=scenario.params)
+            if response.status_code == 200:
+                warmed.append(scenario)
+        scenarios = warmed
+
+        results: list[Sample] = []
+        started = time.perf_counter()
+        deadline = started + args.kill_after + args.down_for + args.recover_for
+
+        async def worker(offset: int) -> None:
+            i = offset
+            while time.perf_counter() < deadline:
+                scenario = scenarios[i % len(scenarios)]
+                i += 1
+                t = time.perf_counter()
+                try:
+                    response = await client.get(scenario.path, params=scenario.params)
+                    status = str(response.status_code)
+                    stale = response.headers.get("x-cache") == "STALE"
+                except httpx.HTTPError as exc:
+                    status, stale = type(exc).__name__, False
+                results.append(Sample(t - started, status, stale, (time.perf_counter() - t) * 1000))
+
+        async def chaos() -> None:
+            await asyncio.sleep(args.kill_after)
+            await run_command(args.kill_cmd)
+            await asyncio.sleep(args.down_for)
+            await run_command(args.start_cmd)
+
+        await asyncio.gather(chaos(), *(worker(n) for n in range(args.concurrency)))
+
+    report = {phase: summarize([s for s in results if phase_of(s.at, args) == phase]) for phase in PHASES}
+    for phase in PHASES:
+        r = report[phase]
+        print(f"{phase:<9} n={r['requests']:>6} p50={r['p50_ms']:>8}ms p99={r['p99_ms']:>8}ms "
+              f"stale={r['stale_ratio']:.1%} {r['statuses']}")
+
+    failures = []
+    outage = report["outage"]
+    server_errors = sum(n for status, n in outage["statuses"].items() if not status[0].isdigit() or status[0] == "5")
+    if server_errors:
+        failures.append(f"장애 중 5xx/연결 오류 {server_errors}건")
+    if outage["p99_ms"] > args.max_p99_ms:
+        failures.append(f"장애 중 p99 {outage['p99_ms']}ms > {args.max_p99_ms}ms")
+    total = args.kill_after + args.down_for + args.recover_for
+    tail = [s for s in results if s.at >= total - args.recovery_window]
+    if any(s.stale for s in tail):
+        failures.append(f"복구 후 마지막 {args.recovery_window:g}초에도 보관 응답 반환")
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+
+    for failure in failures:
+        print(f"[FAIL] {failure}")
+    if not failures:
+        print("[OK] 장애 중 보관 응답으로 처리, 복구 후 정상 응답")
+    return 1 if failures else 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="DB 장애 주입 테스트")
+    parser.add_argument("--base-url", default="http://localhost:8001")
+    parser.add_argument("--kill-cmd", required=True, help="PostgreSQL 중지 명령")
+    parser.add_argument("--start-cmd", required=True, help="PostgreSQL 재시작 명령")
+    parser.add_argument("--kill-after", type=float, default=10.0, help="시작 후 중지까지 (초)")
+    parser.add_argument("--down-for", type=float, default=20.0, help="중지 상태 유지 시간 (초)")
+    parser.add_argument("--recover-for", type=float, default=30.0, help="재시작 후 측정 시간 (초)")
+    parser.add_argument("--recovery-window", type=float, default=5.0, help="복구 판정 구간 (마지막 N초)")
+    parser.add_argument("--concurrency", type=int, default=16, help="동시 요청 수")
+    parser.add_argument("--timeout", type=float, default=60.0, help="요청 타임아웃 (초)")
+    parser.add_argument("--max-p99-ms", type=float, default=2500.0, help="장애 중 허용 p99 지연 (ms)")
+    parser.add_argument("--output", type=Path, help="결과 JSON 경로")
+    args = parser.parse_args()
+    raise SystemExit(asyncio.run(run(args)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,420 @@
+"""
+벤치마크용 합성 데이터 생성기
+- app.models 의 데이터 테이블을 운영 규모로 채웁니다. (같은 인자 → 항상 같은 데이터)
+    asos_daily_data        : ASOS 100개 지점 × 30년 일자료
+    weather_data           : RDA 200개 관측소 × 10분(144회/일) × 2년
+    weather_data_daily     : RDA 200개 관측소 × 10년 일자료
+    weather_data_monthly   : RDA 200개 관측소 × 10년 월자료
+    weather_realtime       : 250개 지역 × 매시 × 8개 자료구분 × 90일
+    weather_short_forecast : 250개 지역 × 최근 2일 발표 × +72시간 × 6개 자료구분
+    weather_mid_forecast   : 40개 예보구역 × 30일 발표(06/18시) × +3~10일
+  weather_data_hourly 는 적재 후 app.rollup 으로 만듭니다.
+- COPY 로 적재하며, --scale 로 기간을 줄여 빠르게 돌려 볼 수 있습니다. (예: --scale 0.05)
+
+로컬 PostgreSQL 또는 일회용 컨테이너에서 실행합니다. (운영 DB 에 실행하지 마세요)
+    docker run --rm -d --name agweather-bench -p 55432:5432 \\
+        -e POSTGRES_USER=bench -e POSTGRES_PASSWORD=bench -e POSTGRES_DB=ag_weather_bench postgres:16
+    cd backend
+    export DB_HOST=localhost DB_PORT=55432 DB_USER=bench DB_PASSWORD=bench DB_NAME=ag_weather_bench
+    alembic upgrade head        # 빈 DB 라면 먼저 python -m benchmarks.datagen --create-schema
+    python -m benchmarks.datagen --truncate
+"""
+
+import argparse
+import math
+import random
+import time
+from datetime import date, datetime, timedelta
+from typing import Callable, Iterator
+
+from sqlalchemy import text
+
+from app.database import Base, SessionLocal, engine
+from app.rollup import rollup_hourly
+
+SEED = 20240101
+
+ASOS_STATIONS = 100
+ASOS_YEARS = 30
+RDA_STATIONS = 200
+RDA_RAW_DAYS = 730
+RDA_DAILY_YEARS = 10
+REALTIME_REGIONS = 250
+REALTIME_DAYS = 90
+SHORT_FORECAST_DAYS = 2
+MID_REGIONS = 40
+MID_DAYS = 30
+
+SIDOS = [
+    "서울특별시", "부산광역시", "대구광역시", "인천광역시", "광주광역시", "대전광역시",
+    "울산광역시", "세종특별자치시", "경기도", "강원도", "충청북도", "충청남도",
+    "전라북도", "전라남도", "경상북도", "경상남도", "제주특별자치도",
+]
+REALTIME_CATEGORIES = ["T1H", "RN1", "UUU", "VVV", "REH", "PTY", "VEC", "WSD"]
+SHORT_CATEGORIES = ["TMP", "SKY", "PTY", "POP", "REH", "WSD"]
+SHORT_BASE_TIMES = ["0200", "0500", "0800", "1100", "1400", "1700", "2000", "2300"]
+MID_CONDITIONS = ["맑음", "구름많음", "흐림", "구름많고 비", "흐리고 비", "흐리고 비/눈"]
+
+# 적재 순서 (--tables 로 일부만 선택 가능)
+TABLE_ORDER = [
+    "asos_daily_data",
+    "weather_data",
+    "weather_data_daily",
+    "weather_data_monthly",
+    "weather_realtime",
+    "weather_short_forecast",
+    "weather_mid_forecast",
+]
+
+
+# ===== 기후 모델 =====
+
+def seasonal_temp(day: date, offset: float) -> float:
+    """일 평균기온 기준값 (1월 중순 최저, 7월 중순 최고)"""
+    doy = day.timetuple().tm_yday
+    return 12.5 - 14.0 * math.cos(2 * math.pi * (doy - 15) / 365.25) + offset
+
+
+def wet_probability(day: date) -> float:
+    """강수 확률 (장마철에 높음)"""
+    doy = day.timetuple().tm_yday
+    return 0.2 + 0.3 * max(0.0, math.cos(2 * math.pi * (doy - 200) / 365.25))
+
+
+class DayWeather:
+    """관측소 하루의 날씨 (같은 시드 → 같은 값)"""
+
+    def __init__(self, rng: random.Random, day: date, offset: float):
+        self.mean = seasonal_temp(day, offset) + rng.gauss(0, 2.5)
+        self.range = rng.uniform(6, 12)
+        self.wet = rng.random() < wet_probability(day)
+        self.rain = round(rng.expovariate(1 / 12), 1) if self.wet else 0.0
+        self.hum = min(98.0, max(15.0, rng.gauss(80 if self.wet else 60, 10)))
+        self.wind = abs(rng.gauss(2.2, 1.0))
+        self.wind_dir = rng.uniform(0, 360)
+        self.sun = 0.0 if self.wet else round(rng.uniform(4, 11), 1)
+
+    def temp_at(self, hour: float) -> float:
+        """일변화 (14시 최고, 05시 부근 최저)"""
+        return self.mean + self.range / 2 * math.sin(2 * math.pi * (hour - 8) / 24)
+
+
+def station_offsets(rng: random.Random, count: int) -> list[float]:
+    return [rng.uniform(-4, 3) for _ in range(count)]
+
+
+def days(start: date, count: int) -> Iterator[date]:
+    for i in range(count):
+        yield start + timedelta(days=i)
+
+
+# ===== 테이블별 생성기 =====
+
+def gen_asos(end: date, scale: float) -> tuple[list[str], Iterator[tuple]]:
+    columns = ["stn_id", "stn_nm", "tm", "avg_ta", "min_ta", "min_ta_hrmt", "max_ta", "max_ta_hrmt",
+               "sum_rn", "avg_ws", "avg_rhm", "sum_ss_hr", "sum_gsr", "avg_tca", "iscs"]
+    n_days = max(1, int(ASOS_YEARS * 365.25 * scale))
+    start = end - timedelta(days=n_days - 1)
+
+    def rows():
+        rng = random.Random(SEED + 1)
+        offsets = station_offsets(rng, ASOS_STATIONS)
+        for day in days(start, n_days):
+            for i in range(ASOS_STATIONS):
+                w = DayWeather(rng, day, offsets[i])
+                yield (
+                    90 + i, f"ASOS{90 + i}", day,
+                    round(w.mean, 1), round(w.mean - w.range / 2, 1), "0530",
+                    round(w.mean + w.range / 2, 1), "1430",
+                    w.rain or None, round(w.wind, 1), int(w.hum), w.sun,
+                    round(w.sun * 2.1 + 3, 2), round(8 if w.wet else rng.uniform(0, 6), 1),
+                    "비" if w.wet else None,
+                )
+    return columns, rows()
+
+
+def rda_station(i: int) -> tuple[str, str, str]:
+    """(관측소 코드, 관측소명, 도)"""
+    return f"{470000 + i * 7}", f"RDA관측소{i:03d}", SIDOS[8 + i % 9]
+
+
+def gen_rda_raw(end: date, scale: float) -> tuple[list[str], Iterator[tuple]]:
+    columns = ["no", "stn_cd", "stn_name", "province", "datetime", "temp", "hghst_artmp", "lowst_artmp",
+               "hum", "widdir", "wind", "max_wind", "rn", "sun_time", "srqty", "condens_time",
+               "gr_temp", "soil_temp", "soil_wt"]
+    n_days = max(1, int(RDA_RAW_DAYS * scale))
+    start = end - timedelta(days=n_days - 1)
+
+    def rows():
+        rng = random.Random(SEED + 2)
+        offsets = station_offsets(rng, RDA_STATIONS)
+        stations = [rda_station(i) for i in range(RDA_STATIONS)]
+        no = 0
+        for day in days(start, n_days):
+            base = datetime.combine(day, datetime.min.time())
+            for i, (stn_cd, stn_name, province) in enumerate(stations):
+                w = DayWeather(rng, day, offsets[i])
+                rain_slots = set(rng.sample(range(144), 18)) if w.wet else ()
+                for slot in range(144):
+                    hour = slot / 6
+                    temp = round(w.temp_at(hour) + rng.gauss(0, 0.3), 1)
+                    daylight = 6 <= hour < 19
+                    no += 1
+                    yield (
+                        no, stn_cd, stn_name, province, base + timedelta(minutes=10 * slot),
+                        temp, round(temp + 0.2, 1), round(temp - 0.2, 1),
+                        round(w.hum, 1), round((w.wind_dir + rng.gauss(0, 20)) % 360, 1),
+                        round(w.wind * rng.uniform(0.6, 1.4), 1), round(w.wind * 1.8, 1),
+                        round(w.rain / 18, 1) if slot in rain_slots else 0.0,
+                        (10.0 if not w.wet else 0.0) if daylight else 0.0,
+                        round(rng.uniform(0.1, 0.3), 2) if daylight and not w.wet else 0.0,
+                        10.0 if w.hum > 90 else 0.0,
+                        round(temp + (3 if daylight else -1), 1), round(w.mean, 1), round(w.hum / 3, 1),
+                    )
+    return columns, rows()
+
+
+DAILY_COLUMNS = ["no", "stn_cd", "stn_name", "date", "temp", "hghst_artmp", "lowst_artmp", "hum",
+                 "widdir", "wind", "max_wind", "rn", "sun_time", "srqty", "condens_time",
+                 "gr_temp", "soil_temp", "soil_wt"]
+
+
+def rda_daily_values(rng: random.Random, day: date, offset: float) -> tuple:
+    w = DayWeather(rng, day, offset)
+    return (
+        round(w.mean, 1), round(w.mean + w.range / 2, 1), round(w.mean - w.range / 2, 1),
+        round(w.hum, 1), round(w.wind_dir, 1), round(w.wind, 1), round(w.wind * 2.5, 1),
+        w.rain, w.sun, round(w.sun * 2.1 + 3, 2), 120.0 if w.hum > 85 else 0.0,
+        round(w.mean + 1.5, 1), round(w.mean + 0.5, 1), round(w.hum / 3, 1),
+    )
+
+
+def gen_rda_daily(end: date, scale: float) -> tuple[list[str], Iterator[tuple]]:
+    n_days = max(1, int(RDA_DAILY_YEARS * 365.25 * scale))
+    start = end - timedelta(days=n_days - 1)
+
+    def rows():
+        rng = random.Random(SEED + 3)
+        offsets = station_offsets(rng, RDA_STATIONS)
+        no = 0
+        for day in days(start, n_days):
+            for i in range(RDA_STATIONS):
+                stn_cd, stn_name, _ = rda_station(i)
+                no += 1
+                yield (no, stn_cd, stn_name, day, *rda_daily_values(rng, day, offsets[i]))
+    return DAILY_COLUMNS, rows()
+
+
+def gen_rda_monthly(end: date, scale: float) -> tuple[list[str], Iterator[tuple]]:
+    n_months = max(1, int(RDA_DAILY_YEARS * 12 * scale))
+
+    def rows():
+        rng = random.Random(SEED + 4)
+        offsets = station_offsets(rng, RDA_STATIONS)
+        no = 0
+        for k in range(n_months - 1, -1, -1):
+            year, month = divmod(end.year * 12 + end.month - 1 - k, 12)
+            mid = date(year, month + 1, 15)
+            for i in range(RDA_STATIONS):
+                stn_cd, stn_name, _ = rda_station(i)
+                values = list(rda_daily_values(rng, mid, offsets[i]))
+                values[7] = round(values[7] * 30 * wet_probability(mid), 1)  # 월 강수량
+                values[8] = round(values[8] * 30, 1)                         # 월 일조시간
+                no += 1
+                yield (no, stn_cd, stn_name, f"{year}-{month + 1:02d}", *values)
+    return DAILY_COLUMNS, rows()
+
+
+def region(i: int) -> tuple[str, str, int, int]:
+    """(시도, 지역명, nx, ny)"""
+    sido = SIDOS[i % len(SIDOS)]
+    return sido, f"{sido[:2]}지역{i:03d}", 50 + i % 60, 60 + i % 70
+
+
+def gen_realtime(end: date, scale: float) -> tuple[list[str], Iterator[tuple]]:
+    columns = ["sido", "region_name", "nx", "ny", "base_date", "base_time", "category", "obsrvalue"]
+    n_days = max(1, int(REALTIME_DAYS * scale))
+    start = end - timedelta(days=n_days - 1)
+
+    def rows():
+        rng = random.Random(SEED + 5)
+        offsets = station_offsets(rng, REALTIME_REGIONS)
+        regions = [region(i) for i in range(REALTIME_REGIONS)]
+        for day in days(start, n_days):
+            weather = [DayWeather(rng, day, offsets[i]) for i in range(REALTIME_REGIONS)]
+            for hour in range(24):
+                base_time = f"{hour:02d}00"
+                for (sido, name, nx, ny), w in zip(regions, weather):
+                    speed = round(w.wind * rng.uniform(0.6, 1.4), 1)
+                    rad = math.radians(w.wind_dir)
+                    raining = w.wet and rng.random() < 0.5
+                    values = {
+                        "T1H": round(w.temp_at(hour) + rng.gauss(0, 0.3), 1),
+                        "RN1": round(w.rain / 12, 1) if raining else 0.0,
+                        "UUU": round(-speed * math.sin(rad), 1),
+                        "VVV": round(-speed * math.cos(rad), 1),
+                        "REH": round(w.hum),
+                        "PTY": 1.0 if raining else 0.0,
+                        "VEC": round(w.wind_dir),
+                        "WSD": speed,
+                    }
+                    for category in REALTIME_CATEGORIES:
+                        yield (sido, name, nx, ny, day, base_time, category, values[category])
+    return columns, rows()
+
+
+def gen_short_forecast(end: date, scale: float) -> tuple[list[str], Iterator[tuple]]:
+    columns = ["region_name", "nx", "ny", "base_date", "base_time", "fcst_date", "fcst_time",
+               "category", "fcst_value"]
+    n_days = max(1, int(math.ceil(SHORT_FORECAST_DAYS * scale)))
+    start = end - timedelta(days=n_days - 1)
+
+    def rows():
+        rng = random.Random(SEED + 6)
+        offsets = station_offsets(rng, REALTIME_REGIONS)
+        for day in days(start, n_days):
+            for base_time in SHORT_BASE_TIMES:
+                issued = datetime.combine(day, datetime.min.time()) + timedelta(hours=int(base_time[:2]))
+                for i in range(REALTIME_REGIONS):
+                    _, name, nx, ny = region(i)
+                    for h in range(1, 73):
+                        at = issued + timedelta(hours=h)
+                        w_mean = seasonal_temp(at.date(), offsets[i])
+                        pop = rng.choice([0, 0, 10, 20, 30, 60, 80])
+                        values = {
+                            "TMP": f"{w_mean + 5 * math.sin(2 * math.pi * (at.hour - 8) / 24):.0f}",
+                            "SKY": str(rng.choice([1, 3, 4])),
+                            "PTY": "1" if pop >= 60 else "0",
+                            "POP": str(pop),
+                            "REH": str(rng.randint(30, 95)),
+                            "WSD": f"{abs(rng.gauss(2.2, 1.0)):.1f}",
+                        }
+                        for category in SHORT_CATEGORIES:
+                            yield (name, nx, ny, day, base_time, at.date(), at.strftime("%H00"),
+                                   category, values[category])
+    return columns, rows()
+
+
+def gen_mid_forecast(end: date, scale: float) -> tuple[list[str], Iterator[tuple]]:
+    columns = ["reg_id", "region_name", "tm_fc", "forecast_date", "time_period", "rain_prob",
+               "weather_condition", "temp_min", "temp_min_low", "temp_min_high",
+               "temp_max", "temp_max_low", "temp_max_high"]
+    n_days = max(1, int(MID_DAYS * scale))
+    start = end - timedelta(days=n_days - 1)
+
+    def rows():
+        rng = random.Random(SEED + 7)
+        offsets = station_offsets(rng, MID_REGIONS)
+        for day in days(start, n_days):
+            for issued_hour in ("0600", "1800"):
+                tm_fc = day.strftime("%Y%m%d") + issued_hour
+                for i in range(MID_REGIONS):
+                    reg_id = f"11B{i:05d}"
+                    name = f"{SIDOS[i % len(SIDOS)][:2]}예보구역{i:02d}"
+                    for ahead in range(3, 11):
+                        target = day + timedelta(days=ahead)
+                        mean = seasonal_temp(target, offsets[i])
+                        periods = ("Am", "Pm") if ahead <= 7 else ("All",)
+                        for period in periods:
+                            t_min, t_max = round(mean - 4), round(mean + 4)
+                            yield (
+                                reg_id, name, tm_fc, target, period,
+                                rng.choice([0, 10, 20, 30, 40, 60, 70]), rng.choice(MID_CONDITIONS),
+                                t_min, t_min - 2, t_min + 2, t_max, t_max - 2, t_max + 2,
+                            )
+    return columns, rows()
+
+
+GENERATORS: dict[str, Callable[[date, float], tuple[list[str], Iterator[tuple]]]] = {
+    "asos_daily_data": gen_asos,
+    "weather_data": gen_rda_raw,
+    "weather_data_daily": gen_rda_daily,
+    "weather_data_monthly": gen_rda_monthly,
+    "weather_realtime": gen_realtime,
+    "weather_short_forecast": gen_short_forecast,
+    "weather_mid_forecast": gen_mid_forecast,
+}
+
+
+# ===== 적재 =====
+
+def copy_rows(table: str, columns: list[str], rows: Iterator[tuple]) -> int:
+    """COPY FROM STDIN 으로 적재"""
+    raw = engine.raw_connection()
+    count = 0
+    try:
+        conn = raw.driver_connection
+        with conn.cursor() as cursor:
+            cursor.execute("SET LOCAL statement_timeout = 0")
+            with cursor.copy(f"COPY {table} ({', '.join(columns)}) FROM STDIN") as copy:
+                for row in rows:
+                    copy.write_row(row)
+                    count += 1
+        conn.commit()
+    finally:
+        raw.close()
+    return count
+
+
+def rollup_all(end: date, scale: float) -> int:
+    """weather_data 전체 기간을 월 단위로 시간별 롤업 (statement_timeout 회피)"""
+    n_days = max(1, int(RDA_RAW_DAYS * scale))
+    cursor = datetime.combine(end - timedelta(days=n_days - 1), datetime.min.time())
+    stop = datetime.combine(end + timedelta(days=1), datetime.min.time())
+    total = 0
+    db = SessionLocal()
+    try:
+        while cursor < stop:
+            window_end = min(cursor + timedelta(days=31), stop)
+            total += rollup_hourly(db, cursor, window_end)
+            cursor = window_end
+    finally:
+        db.close()
+    return total
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="벤치마크용 합성 데이터 생성")
+    parser.add_argument("--end", type=date.fromisoformat, default=date(2024, 12, 31),
+                        help="데이터 마지막 날짜 (기본 2024-12-31, 오늘 기준 엔드포인트는 --end 오늘날짜)")
+    parser.add_argument("--scale", type=float, default=1.0, help="기간 배율 (1.0 = 운영 규모)")
+    parser.add_argument("--tables", nargs="+", choices=TABLE_ORDER, default=TABLE_ORDER, help="생성할 테이블")
+    parser.add_argument("--truncate", action="store_true", help="생성 전 대상 테이블 비우기")
+    parser.add_argument("--create-schema", action="store_true",
+                        help="마이그레이션 없이 모델 기준으로 테이블 생성 (빈 DB 용)")
+    args = parser.parse_args()
+
+    print(f"[DATAGEN] 대상 DB: {engine.url.render_as_string(hide_password=True)}")
+
+    if args.create_schema:
+        Base.metadata.create_all(engine)
+
+    with engine.begin() as conn:
+        for table in args.tables:
+            if args.truncate:
+                conn.execute(text(f"TRUNCATE {table} RESTART IDENTITY"))
+            elif conn.execute(text(f"SELECT EXISTS (SELECT 1 FROM {table})")).scalar():
+                raise SystemExit(f"[DATAGEN] {table} 에 데이터가 있습니다. --truncate 를 지정하세요.")
+        if "weather_data" in args.tables and args.truncate:
+            conn.execute(text("TRUNCATE weather_data_hourly RESTART IDENTITY"))
+
+    for table in args.tables:
+        started = time.time()
+        columns, rows = GENERATORS[table](args.end, args.scale)
+        count = copy_rows(table, columns, rows)
+        print(f"[DATAGEN] {table}: {count:,}행 ({time.time() - started:.1f}초)")
+
+    if "weather_data" in args.tables:
+        started = time.time()
+        count = rollup_all(args.end, args.scale)
+        print(f"[DATAGEN] weather_data_hourly: {count:,}행 ({time.time() - started:.1f}초)")
+
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.execute(text("SET statement_timeout = 0"))
+        for table in [*args.tables, "weather_data_hourly"]:
+            conn.execute(text(f"VACUUM ANALYZE {table}"))
+    print("[DATAGEN] 완료")
+
+
+if __name__ == "__main__":
+    main()
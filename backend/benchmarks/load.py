@@ -0,0 +1,329 @@
+"""
+API 부하 벤치마크
+- 실행 중인 서버의 /openapi.json 에서 모든 GET 엔드포인트를 찾아
+  시나리오별로 일정 시간 동시 요청을 보내고 p50/p95/p99 지연, QPS, 오류 수를 측정합니다.
+- 서버의 /metrics (http_request_db_statements, http_request_db_seconds) 를 시나리오 전후로 읽어
+  요청당 SQL 실행 횟수와 DB 시간을 함께 기록합니다.
+- 같은 경로/파라미터를 반복하므로 압축 캐시(app.compression)가 응답하지 않도록
+  Accept-Encoding: identity 로 요청합니다. (지연과 SQL 횟수가 라우터 처리를 측정하도록)
+- 결과는 JSON 으로 저장하며, --baseline 으로 이전 결과와 비교합니다.
+
+사용법:
+    cd backend
+    uvicorn app.main:app --port 8001            # 별도 터미널 (benchmarks.datagen 으로 채운 DB)
+    python -m benchmarks.load --output benchmarks/results/baseline.json
+    python -m benchmarks.load --baseline benchmarks/results/baseline.json --output benchmarks/results/after.json
+"""
+
+import argparse
+import asyncio
+import json
+import re
+import subprocess
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Optional
+
+import httpx
+
+# 압축 캐시를 거치지 않는 요청 헤더 (scripts/check_query_count.py 와 같음)
+NO_CACHE_HEADERS = {"Accept-Encoding": "identity"}
+
+# 부하 대상에서 제외하는 경로 (스트림, 관리, 기본 정보)
+EXCLUDED_PREFIXES = ("/api/stream", "/api/admin", "/metrics", "/health")
+
+# 자동 생성 시나리오 외에 추가로 측정하는 변형 (이름, 경로, 파라미터 - {샘플} 치환)
+EXTRA_SCENARIOS = [
+    ("asos_range_10y_station", "/api/kma/asos/range",
+     {"start_date": "{asos_start_10y}", "end_date": "{asos_end}", "stn_id": "{stn_id}", "limit": "10000"}),
+    ("rda_daily_range_download", "/api/rda/weather/daily/range",
+     {"start_date": "{rda_start_1y}", "end_date": "{rda_end}", "stn_cd": "{stn_cd}", "limit": "10000"}),
+    ("rda_daily_range_columns", "/api/rda/weather/daily/range",
+     {"start_date": "{rda_start_1y}", "end_date": "{rda_end}", "stn_cd": "{stn_cd}", "limit": "10000",
+      "layout": "columns"}),
+    ("rda_realtime_station_30d", "/api/rda/weather/realtime/station/{stn_cd}",
+     {"start_datetime": "{raw_start_30d}", "end_datetime": "{raw_end}"}),
+]
+
+METRIC_LINE = re.compile(r'^(http_request_db_statements|http_request_db_seconds)_(sum|count)\{route="([^"]*)"\} (\S+)$')
+
+
+@dataclass
+class Scenario:
+    name: str
+    path: str
+    params: dict = field(default_factory=dict)
+
+
+@dataclass
+class ScenarioResult:
+    path: str
+    params: dict
+    requests: int
+    errors: int
+    statuses: dict
+    qps: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    mean_bytes: float
+    sql_per_request: Optional[float]
+    db_ms_per_request: Optional[float]
+
+
+def percentile(sorted_values: list[float], q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, round(q * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+async def discover_samples(client: httpx.AsyncClient) -> dict:
+    """목록 엔드포인트에서 파라미터 샘플 값 (지점, 지역, 날짜 범위) 수집"""
+    asos = (await client.get("/api/kma/asos/stations")).json()
+    rda = (await client.get("/api/rda/weather/stations")).json()
+    rda_raw = (await client.get("/api/rda/weather/realtime/stations")).json()
+    regions = (await client.get("/api/kma/realtime/regions")).json()
+    short_regions = (await client.get("/api/kma/forecast/short/regions")).json()
+    mid_regions = (await client.get("/api/kma/forecast/mid/regions")).json()
+
+    def first(items, key, default=None):
+        return items[0][key] if items else default
+
+    asos_end = date.fromisoformat(str(first(asos, "last_date", date.today())))
+    rda_end = date.fromisoformat(str(first(rda, "last_date", date.today())))
+    raw_end = datetime.fromisoformat(str(first(rda_raw, "last_datetime", datetime.now())))
+    region = first(regions, "region_name", "서울")
+    return {
+        "stn_id": first(asos, "stn_id", 108),
+        "stn_ids": ",".join(str(s["stn_id"]) for s in asos[:3]) or "108",
+        "stn_cd": first(rda, "stn_cd", ""),
+        "raw_stn_cd": first(rda_raw, "stn_cd", ""),
+        "region_name": region,
+        "short_region": first(short_regions, "region_name", region),
+        "mid_region": first(mid_regions, "region_name", region),
+        "asos_end": asos_end.isoformat(),
+        "asos_start_1y": (asos_end - timedelta(days=365)).isoformat(),
+        "asos_start_10y": (asos_end - timedelta(days=3652)).isoformat(),
+        "rda_end": rda_end.isoformat(),
+        "rda_start_1y": (rda_end - timedelta(days=365)).isoformat(),
+        "rda_month_end": rda_end.strftime("%Y-%m"),
+        "rda_month_start": (rda_end - timedelta(days=365)).strftime("%Y-%m"),
+        "raw_end": raw_end.isoformat(),
+        "raw_start_30d": (raw_end - timedelta(days=30)).isoformat(),
+        "today": date.today().isoformat(),
+    }
+
+
+def path_value(path: str, name: str, samples: dict) -> str:
+    """경로 파라미터 값 선택"""
+    if name == "stn_cd":
+        return samples["raw_stn_cd"] if "/realtime/" in path or "/hourly/" in path else samples["stn_cd"]
+    if name == "region_name":
+        if "/forecast/short" in path:
+            return samples["short_region"]
+        if "/forecast/mid" in path:
+            return samples["mid_region"]
+        return samples["region_name"]
+    if name == "target_date":
+        return samples["asos_end"] if "/kma/" in path else samples["rda_end"]
+    if name == "year":
+        return samples["rda_end"][:4]
+    return str(samples[name])
+
+
+def query_value(path: str, name: str, samples: dict) -> Optional[str]:
+    """필수 쿼리 파라미터 값 선택 (기간은 최근 1년)"""
+    kma = "/kma/" in path
+    values = {
+        "start_date": samples["asos_start_1y"] if kma else samples["rda_start_1y"],
+        "end_date": samples["asos_end"] if kma else samples["rda_end"],
+        "start_month": samples["rda_month_start"],
+        "end_month": samples["rda_month_end"],
+        "stn_ids": samples["stn_ids"],
+    }
+    return values.get(name)
+
+
+def build_scenarios(openapi: dict, samples: dict) -> list[Scenario]:
+    scenarios = []
+    for path, methods in openapi["paths"].items():
+        operation = methods.get("get")
+        if operation is None or path == "/" or path.startswith(EXCLUDED_PREFIXES):
+            continue
+        url = path
+        params = {}
+        for p in operation.get("parameters", []):
+            if p["in"] == "path":
+                url = url.replace("{" + p["name"] + "}", path_value(path, p["name"], samples))
+            elif p.get("required"):
+                params[p["name"]] = query_value(path, p["name"], samples)
+        scenarios.append(Scenario(name=path, path=url, params=params))
+
+    for name, path, params in EXTRA_SCENARIOS:
+        scenarios.append(Scenario(
+            name=name,
+            path=path.format(**samples),
+            params={k: v.format(**samples) for k, v in params.items()},
+        ))
+    return scenarios
+
+
+async def read_db_metrics(client: httpx.AsyncClient) -> dict[tuple[str, str, str], float]:
+    """/metrics 에서 라우트별 SQL 횟수/시간 합계 읽기"""
+    try:
+        response = await client.get("/metrics")
+    except httpx.HTTPError:
+        return {}
+    values = {}
+    for line in response.text.splitlines():
+        match = METRIC_LINE.match(line)
+        if match:
+            metric, kind, route, value = match.groups()
+            values[(metric, kind, route)] = float(value)
+    return values
+
+
+def db_delta(before: dict, after: dict) -> tuple[Optional[float], Optional[float]]:
+    """시나리오 동안 증가한 SQL 횟수 / DB 시간의 요청당 평균 (모든 라우트 합산)"""
+    def total(values: dict, metric: str, kind: str) -> float:
+        return sum(v for (m, k, route), v in values.items()
+                   if m == metric and k == kind and route not in ("/metrics", "unmatched"))
+
+    requests = total(after, "http_request_db_statements", "count") - total(before, "http_request_db_statements", "count")
+    if requests <= 0:
+        return None, None
+    statements = total(after, "http_request_db_statements", "sum") - total(before, "http_request_db_statements", "sum")
+    db_seconds = total(after, "http_request_db_seconds", "sum") - total(before, "http_request_db_seconds", "sum")
+    return round(statements / requests, 2), round(db_seconds * 1000 / requests, 2)
+
+
+async def run_scenario(client: httpx.AsyncClient, scenario: Scenario, duration: float, concurrency: int) -> ScenarioResult:
+    latencies: list[float] = []
+    statuses: dict[str, int] = {}
+    sizes = 0
+    deadline = time.perf_counter() + duration
+
+    async def worker() -> None:
+        nonlocal sizes
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            try:
+                response = await client.get(scenario.path, params=scenario.params, headers=NO_CACHE_HEADERS)
+                status = str(response.status_code)
+                sizes += len(response.content)
+            except httpx.HTTPError as exc:
+                status = type(exc).__name__
+            latencies.append((time.perf_counter() - started) * 1000)
+            statuses[status] = statuses.get(status, 0) + 1
+
+    before = await read_db_metrics(client)
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    after = await read_db_metrics(client)
+
+    latencies.sort()
+    sql_per_request, db_ms = db_delta(before, after)
+    errors = sum(n for status, n in statuses.items() if not status.startswith(("2", "3", "404")))
+    return ScenarioResult(
+        path=scenario.path,
+        params=scenario.params,
+        requests=len(latencies),
+        errors=errors,
+        statuses=statuses,
+        qps=round(len(latencies) / elapsed, 1),
+        p50_ms=round(percentile(latencies, 0.50), 1),
+        p95_ms=round(percentile(latencies, 0.95), 1),
+        p99_ms=round(percentile(latencies, 0.99), 1),
+        mean_bytes=round(sizes / max(len(latencies), 1)),
+        sql_per_request=sql_per_request,
+        db_ms_per_request=db_ms,
+    )
+
+
+def git_revision() -> Optional[str]:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list[str]:
+    """기준 결과 대비 p95 / QPS / SQL 횟수 변화 출력, 회귀 목록 반환"""
+    regressions = []
+    print(f"\n{'scenario':<55} {'p95(ms)':>16} {'qps':>16} {'sql/req':>14}")
+    for name, current in results.items():
+        base = baseline.get("results", {}).get(name)
+        if base is None:
+            continue
+        p95_change = (current["p95_ms"] - base["p95_ms"]) / max(base["p95_ms"], 0.1)
+        qps_change = (current["qps"] - base["qps"]) / max(base["qps"], 0.1)
+        sql = f"{base['sql_per_request']}→{current['sql_per_request']}"
+        print(f"{name:<55} {base['p95_ms']:>7}→{current['p95_ms']:<7} {base['qps']:>7}→{current['qps']:<7} {sql:>14}")
+        if p95_change > threshold or qps_change < -threshold or \
+                (current["sql_per_request"] or 0) > (base["sql_per_request"] or 0):
+            regressions.append(name)
+    return regressions
+
+
+async def run(args: argparse.Namespace) -> int:
+    limits = httpx.Limits(max_connections=args.concurrency * 2)
+    async with httpx.AsyncClient(base_url=args.base_url, timeout=args.timeout, limits=limits) as client:
+        openapi = (await client.get("/openapi.json")).json()
+        samples = await discover_samples(client)
+        scenarios = [s for s in build_scenarios(openapi, samples) if not args.only or args.only in s.name]
+
+        results = {}
+        for scenario in scenarios:
+            # 워밍업 (캐시/커넥션) 후 측정
+            await client.get(scenario.path, params=scenario.params)
+            result = await run_scenario(client, scenario, args.duration, args.concurrency)
+            results[scenario.name] = asdict(result)
+            print(f"{scenario.name:<55} p50={result.p50_ms:>7}ms p95={result.p95_ms:>7}ms "
+                  f"p99={result.p99_ms:>7}ms qps={result.qps:>7} sql/req={result.sql_per_request} "
+                  f"err={result.errors}")
+
+    report = {
+        "meta": {
+            "recorded_at": datetime.now().isoformat(timespec="seconds"),
+            "git_revision": git_revision(),
+            "base_url": args.base_url,
+            "duration_seconds": args.duration,
+            "concurrency": args.concurrency,
+            "samples": samples,
+        },
+        "results": results,
+    }
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+        print(f"\n[BENCH] 결과 저장: {args.output}")
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n[BENCH] 회귀 {len(regressions)}건: {', '.join(regressions)}")
+            return 1
+    return 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="API 부하 벤치마크")
+    parser.add_argument("--base-url", default="http://localhost:8001")
+    parser.add_argument("--duration", type=float, default=10.0, help="시나리오별 측정 시간 (초)")
+    parser.add_argument("--concurrency", type=int, default=8, help="동시 요청 수")
+    parser.add_argument("--timeout", type=float, default=60.0, help="요청 타임아웃 (초)")
+    parser.add_argument("--only", help="이름에 이 문자열이 포함된 시나리오만 실행")
+    parser.add_argument("--output", type=Path, help="결과 JSON 경로")
+    parser.add_argument("--baseline", type=Path, help="비교할 기준 결과 JSON")
+    parser.add_argument("--threshold", type=float, default=0.2, help="회귀로 판단할 p95/QPS 변화율")
+    args = parser.parse_args()
+    raise SystemExit(asyncio.run(run(args)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""복합 인덱스 및 BRIN 인덱스 추가
+
+- 조회 패턴(키 필터 + 시간 정렬)에 맞춘 복합 B-tree 인덱스
+- 추가 전용(append-only) 시간 컬럼에 대한 BRIN 인덱스
+
+운영 테이블 잠금을 피하기 위해 CREATE INDEX CONCURRENTLY 로 생성합니다.
+기존 테이블은 외부 적재 프로세스가 만든 것이므로 이 리비전이 최초 리비전입니다.
+
+Revision ID: 0001_composite_brin_indexes
+Revises:
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0001_composite_brin_indexes"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+# (인덱스명, 테이블, 컬럼 목록, 추가 옵션)
+BTREE_INDEXES = [
+    # ASOS: 지점 필터 + 날짜 범위/정렬 (/api/kma/asos/range, /latest, 통계)
+    ("ix_asos_daily_data_stn_id_tm", "asos_daily_data",
+     [sa.text("stn_id"), sa.text("tm")], {}),
+    # RDA 10분: 관측소 필터 + 최신순 정렬 (/api/rda/weather/realtime/...)
+    ("ix_weather_data_stn_cd_datetime", "weather_data",
+     [sa.text("stn_cd"), sa.text("datetime DESC")], {}),
+    # RDA 일별: 관측소 필터 + 날짜 범위 (/api/rda/weather/daily/range, 통계)
+    ("ix_weather_data_daily_stn_cd_date", "weather_data_daily",
+     [sa.text("stn_cd"), sa.text("date")], {}),
+    # KMA 실황: 지역 필터 + 최신 발표시각 정렬 (/latest, /region/...)
+    ("ix_weather_realtime_region_latest", "weather_realtime",
+     [sa.text("region_name"), sa.text("base_date DESC"), sa.text("base_time DESC")], {}),
+    # KMA 실황 피벗: 발표시각별 카테고리 값 조회 (index-only scan)
+    ("ix_weather_realtime_region_slot_category", "weather_realtime",
+     [sa.text("region_name"), sa.text("base_date"), sa.text("base_time"), sa.text("category")],
+     {"postgresql_include": ["obsrvalue"]}),
+]
+
+BRIN_INDEXES = [
+    ("brin_asos_daily_data_tm", "asos_daily_data", "tm"),
+    ("brin_weather_data_datetime", "weather_data", "datetime"),
+    ("brin_weather_data_daily_date", "weather_data_daily", "date"),
+    ("brin_weather_realtime_base_date", "weather_realtime", "base_date"),
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns, options in BTREE_INDEXES:
+            op.create_index(
+                name, table, columns,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+                **options
+            )
+
+        for name, table, column in BRIN_INDEXES:
+            op.create_index(
+                name, table, [column],
+                postgresql_using="brin",
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(BRIN_INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
+
+        for name, table, _, _ in reversed(BTREE_INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
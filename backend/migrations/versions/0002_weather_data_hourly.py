@@ -0,0 +1,57 @@
+"""시간별 집계 테이블(weather_data_hourly) 추가
+
+- 10분 간격 weather_data 를 정시 단위로 롤업한 압축 계층
+- (stn_cd, datetime) 유니크 인덱스: 롤업 upsert 의 충돌 키 겸 조회 인덱스
+
+Revision ID: 0002_weather_data_hourly
+Revises: 0001_composite_brin_indexes
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0002_weather_data_hourly"
+down_revision = "0001_composite_brin_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "weather_data_hourly",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("stn_cd", sa.String(20), nullable=False),
+        sa.Column("stn_name", sa.String(100)),
+        sa.Column("province", sa.String(50)),
+        sa.Column("datetime", sa.TIMESTAMP(), nullable=False),
+        sa.Column("temp", sa.Float()),
+        sa.Column("hghst_artmp", sa.Float()),
+        sa.Column("lowst_artmp", sa.Float()),
+        sa.Column("hum", sa.Float()),
+        sa.Column("widdir", sa.Float()),
+        sa.Column("wind", sa.Float()),
+        sa.Column("max_wind", sa.Float()),
+        sa.Column("rn", sa.Float()),
+        sa.Column("sun_time", sa.Float()),
+        sa.Column("srqty", sa.Float()),
+        sa.Column("condens_time", sa.Float()),
+        sa.Column("gr_temp", sa.Float()),
+        sa.Column("soil_temp", sa.Float()),
+        sa.Column("soil_wt", sa.Float()),
+        sa.Column("sample_count", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.TIMESTAMP(), server_default=sa.func.now()),
+    )
+    op.create_index(
+        "uq_weather_data_hourly_stn_cd_datetime", "weather_data_hourly",
+        ["stn_cd", sa.text("datetime DESC")], unique=True
+    )
+    op.create_index(
+        "brin_weather_data_hourly_datetime", "weather_data_hourly",
+        ["datetime"], postgresql_using="brin"
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("weather_data_hourly")
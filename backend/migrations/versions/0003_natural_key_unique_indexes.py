@@ -0,0 +1,86 @@
+"""자연키 유니크 인덱스 추가 (적재 upsert 충돌 키)
+
+- app.ingest 의 INSERT ... ON CONFLICT 에 사용할 자연키 유니크 인덱스
+- 기존 중복 행은 가장 최근 id 만 남기고 삭제한 뒤 인덱스를 생성합니다.
+- 0001 의 복합 인덱스 중 자연키와 같은 컬럼 구성은 유니크 인덱스로 대체합니다.
+
+Revision ID: 0003_natural_key_unique_indexes
+Revises: 0002_weather_data_hourly
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0003_natural_key_unique_indexes"
+down_revision = "0002_weather_data_hourly"
+branch_labels = None
+depends_on = None
+
+
+# (인덱스명, 테이블, 자연키 컬럼, 인덱스 컬럼 표현식, 추가 옵션, 대체되는 0001 인덱스)
+UNIQUE_INDEXES = [
+    ("uq_asos_daily_data_stn_id_tm", "asos_daily_data",
+     ["stn_id", "tm"],
+     [sa.text("stn_id"), sa.text("tm")], {},
+     "ix_asos_daily_data_stn_id_tm"),
+    ("uq_weather_data_stn_cd_datetime", "weather_data",
+     ["stn_cd", "datetime"],
+     [sa.text("stn_cd"), sa.text("datetime DESC")], {},
+     "ix_weather_data_stn_cd_datetime"),
+    ("uq_weather_data_daily_stn_cd_date", "weather_data_daily",
+     ["stn_cd", "date"],
+     [sa.text("stn_cd"), sa.text("date")], {},
+     "ix_weather_data_daily_stn_cd_date"),
+    ("uq_weather_data_monthly_stn_cd_date", "weather_data_monthly",
+     ["stn_cd", "date"],
+     [sa.text("stn_cd"), sa.text("date")], {},
+     None),
+    ("uq_weather_realtime_region_slot_category", "weather_realtime",
+     ["region_name", "base_date", "base_time", "category"],
+     [sa.text("region_name"), sa.text("base_date"), sa.text("base_time"), sa.text("category")],
+     {"postgresql_include": ["obsrvalue"]},
+     "ix_weather_realtime_region_slot_category"),
+    ("uq_weather_short_forecast_natural_key", "weather_short_forecast",
+     ["region_name", "base_date", "base_time", "fcst_date", "fcst_time", "category"],
+     [sa.text(c) for c in ("region_name", "base_date", "base_time", "fcst_date", "fcst_time", "category")], {},
+     None),
+    ("uq_weather_mid_forecast_natural_key", "weather_mid_forecast",
+     ["reg_id", "tm_fc", "forecast_date", "time_period"],
+     [sa.text(c) for c in ("reg_id", "tm_fc", "forecast_date", "time_period")], {},
+     None),
+]
+
+
+def upgrade() -> None:
+    # 중복 제거 (같은 자연키 중 가장 큰 id 만 유지)
+    for _, table, keys, _, _, _ in UNIQUE_INDEXES:
+        condition = " AND ".join(f"a.{k} = b.{k}" for k in keys)
+        op.execute(f"DELETE FROM {table} a USING {table} b WHERE {condition} AND a.id < b.id")
+
+    with op.get_context().autocommit_block():
+        for name, table, _, columns, options, replaces in UNIQUE_INDEXES:
+            op.create_index(
+                name, table, columns,
+                unique=True,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+                **options
+            )
+            if replaces:
+                op.drop_index(replaces, table_name=table, postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    # 0001 의 비유니크 인덱스를 복원합니다. (삭제된 중복 행은 복구되지 않습니다.)
+    with op.get_context().autocommit_block():
+        for name, table, _, columns, options, replaces in reversed(UNIQUE_INDEXES):
+            if replaces:
+                op.create_index(
+                    replaces, table, columns,
+                    postgresql_concurrently=True,
+                    if_not_exists=True,
+                    **options
+                )
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,71 @@
+"""테이블 변경 카운터(data_versions) 추가
+
+- 각 데이터 테이블에 문장 단위 트리거를 달아 INSERT/UPDATE/DELETE/TRUNCATE 마다
+  data_versions.version 을 1 증가시킵니다.
+- 외부 적재 프로세스가 쓴 변경도 감지되므로, 변경 여부 확인은
+  data_versions 한 번 조회(수 행)로 끝납니다. (SSE, 조건부 GET 등)
+
+Revision ID: 0004_data_versions
+Revises: 0003_natural_key_unique_indexes
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0004_data_versions"
+down_revision = "0003_natural_key_unique_indexes"
+branch_labels = None
+depends_on = None
+
+
+TRACKED_TABLES = [
+    "asos_daily_data",
+    "weather_realtime",
+    "weather_short_forecast",
+    "weather_mid_forecast",
+    "weather_data",
+    "weather_data_hourly",
+    "weather_data_daily",
+    "weather_data_monthly",
+]
+
+
+def upgrade() -> None:
+    op.create_table(
+        "data_versions",
+        sa.Column("table_name", sa.String(64), primary_key=True),
+        sa.Column("version", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("changed_at", sa.TIMESTAMP(timezone=True), nullable=False, server_default=sa.func.now()),
+    )
+    op.execute(
+        "INSERT INTO data_versions (table_name) VALUES "
+        + ", ".join(f"('{t}')" for t in TRACKED_TABLES)
+    )
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION bump_data_version() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            UPDATE data_versions
+            SET version = version + 1, changed_at = now()
+            WHERE table_name = TG_TABLE_NAME;
+            RETURN NULL;
+        END
+        $$
+    """)
+
+    for table in TRACKED_TABLES:
+        op.execute(f"""
+            CREATE TRIGGER trg_{table}_data_version
+            AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON {table}
+            FOR EACH STATEMENT EXECUTE FUNCTION bump_data_version()
+        """)
+
+
+def downgrade() -> None:
+    for table in reversed(TRACKED_TABLES):
+        op.execute(f"DROP TRIGGER IF EXISTS trg_{table}_data_version ON {table}")
+    op.execute("DROP FUNCTION IF EXISTS bump_data_version()")
+    op.drop_table("data_versions")
@@ -0,0 +1,74 @@
+"""관측소 목록 스냅샷(materialized view) 추가
+
+- /stations 엔드포인트가 요청마다 전체 테이블을 GROUP BY 하던 집계를 미리 계산해 둡니다.
+- 앱의 스케줄러(app.scheduler)가 원본 테이블 변경 후 REFRESH MATERIALIZED VIEW CONCURRENTLY 로 갱신하고,
+  data_versions 의 뷰 행을 증가시켜 조건부 GET / 압축 캐시가 새 스냅샷 기준으로 검증되도록 합니다.
+- CONCURRENTLY 갱신에 필요한 유니크 인덱스를 함께 만듭니다.
+
+Revision ID: 0005_station_catalogs
+Revises: 0004_data_versions
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+
+
+revision = "0005_station_catalogs"
+down_revision = "0004_data_versions"
+branch_labels = None
+depends_on = None
+
+
+# (뷰 이름, 정의, 유니크 인덱스 컬럼)
+CATALOG_VIEWS = [
+    (
+        "asos_station_catalog",
+        """
+        SELECT stn_id, stn_nm, count(id) AS data_count, min(tm) AS first_date, max(tm) AS last_date
+        FROM asos_daily_data
+        GROUP BY stn_id, stn_nm
+        """,
+        "stn_id, stn_nm",
+    ),
+    (
+        "rda_station_catalog",
+        """
+        SELECT stn_cd, stn_name, count(id) AS data_count, min(date) AS first_date, max(date) AS last_date
+        FROM weather_data_daily
+        GROUP BY stn_cd, stn_name
+        """,
+        "stn_cd, stn_name",
+    ),
+    (
+        "rda_realtime_station_catalog",
+        """
+        SELECT province, stn_cd, stn_name, count(id) AS data_count,
+               min(datetime) AS first_datetime, max(datetime) AS last_datetime
+        FROM weather_data
+        GROUP BY province, stn_cd, stn_name
+        """,
+        "province, stn_cd, stn_name",
+    ),
+]
+
+
+def upgrade() -> None:
+    for view, definition, unique_columns in CATALOG_VIEWS:
+        op.execute(f"CREATE MATERIALIZED VIEW {view} AS {definition} WITH DATA")
+        op.execute(f"CREATE UNIQUE INDEX ux_{view} ON {view} ({unique_columns})")
+
+    # 뷰는 트리거 대신 스케줄러가 갱신할 때 버전을 올림
+    op.execute(
+        "INSERT INTO data_versions (table_name) VALUES "
+        + ", ".join(f"('{view}')" for view, _, _ in CATALOG_VIEWS)
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        "DELETE FROM data_versions WHERE table_name IN ("
+        + ", ".join(f"'{view}'" for view, _, _ in CATALOG_VIEWS)
+        + ")"
+    )
+    for view, _, _ in reversed(CATALOG_VIEWS):
+        op.execute(f"DROP MATERIALIZED VIEW IF EXISTS {view}")
@@ -0,0 +1,44 @@
+"""data_versions 변경 알림 (LISTEN/NOTIFY) 추가
+
+- data_versions 행이 바뀌면 'data_versions' 채널로 테이블 이름을 NOTIFY 합니다.
+- 데이터 테이블 트리거(0004)와 스케줄러의 스냅샷 뷰 갱신(0005) 모두 data_versions 를 거치므로,
+  적재/갱신 코드는 알림을 따로 보내지 않아도 됩니다.
+- NOTIFY 는 커밋 시점에 전달되며, 같은 트랜잭션의 같은 페이로드는 한 번만 전달됩니다.
+
+Revision ID: 0006_data_versions_notify
+Revises: 0005_station_catalogs
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+
+
+revision = "0006_data_versions_notify"
+down_revision = "0005_station_catalogs"
+branch_labels = None
+depends_on = None
+
+
+CHANNEL = "data_versions"
+
+
+def upgrade() -> None:
+    op.execute(f"""
+        CREATE OR REPLACE FUNCTION notify_data_version() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            PERFORM pg_notify('{CHANNEL}', NEW.table_name);
+            RETURN NULL;
+        END
+        $$
+    """)
+    op.execute("""
+        CREATE TRIGGER trg_data_versions_notify
+        AFTER INSERT OR UPDATE ON data_versions
+        FOR EACH ROW EXECUTE FUNCTION notify_data_version()
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS trg_data_versions_notify ON data_versions")
+    op.execute("DROP FUNCTION IF EXISTS notify_data_version()")
@@ -0,0 +1,66 @@
+"""품질 관리(QC) 플래그 테이블 추가
+
+- weather_data_qc / asos_daily_qc: 원자료 행(id)마다 QC 에 걸린 변수 비트마스크 (플래그가 있는 행만)
+  원자료 행이 삭제되면(보존 정리 등) 함께 삭제됩니다.
+- qc_runs: 데이터셋별 증분 검사 진행 위치
+- 플래그 테이블도 data_versions 로 추적하여 qc=strict 응답의 ETag 가 QC 결과를 반영하도록 합니다.
+  (트리거 함수는 0004 의 bump_data_version, 변경 알림은 0006 트리거가 전달)
+
+Revision ID: 0007_qc_flags
+Revises: 0006_data_versions_notify
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0007_qc_flags"
+down_revision = "0006_data_versions_notify"
+branch_labels = None
+depends_on = None
+
+
+# (플래그 테이블, 원자료 테이블)
+FLAG_TABLES = [
+    ("weather_data_qc", "weather_data"),
+    ("asos_daily_qc", "asos_daily_data"),
+]
+
+
+def upgrade() -> None:
+    for table, source in FLAG_TABLES:
+        op.create_table(
+            table,
+            sa.Column("id", sa.Integer(), sa.ForeignKey(f"{source}.id", ondelete="CASCADE"), primary_key=True),
+            sa.Column("flags", sa.BigInteger(), nullable=False),
+            sa.Column("checks", sa.SmallInteger(), nullable=False),
+            sa.Column("checked_at", sa.TIMESTAMP(), server_default=sa.func.now()),
+        )
+        op.execute(f"""
+            CREATE TRIGGER trg_{table}_data_version
+            AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON {table}
+            FOR EACH STATEMENT EXECUTE FUNCTION bump_data_version()
+        """)
+
+    op.create_table(
+        "qc_runs",
+        sa.Column("dataset", sa.String(20), primary_key=True),
+        sa.Column("checked_until", sa.TIMESTAMP(), nullable=False),
+    )
+
+    op.execute(
+        "INSERT INTO data_versions (table_name) VALUES "
+        + ", ".join(f"('{table}')" for table, _ in FLAG_TABLES)
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        "DELETE FROM data_versions WHERE table_name IN ("
+        + ", ".join(f"'{table}'" for table, _ in FLAG_TABLES)
+        + ")"
+    )
+    op.drop_table("qc_runs")
+    for table, _ in reversed(FLAG_TABLES):
+        op.drop_table(table)
@@ -0,0 +1,49 @@
+"""10분 자료 수신 현황 테이블(weather_data_completeness) 추가
+
+- (관측소, 날짜)마다 수신한 10분 구간 수와 144비트 수신 비트맵 (app.completeness 가 증분 갱신)
+- 완결성/결측 구간 조회가 weather_data 를 훑지 않도록 하는 요약 계층
+  원자료 보존 정리 이후에도 남아 과거 수신 현황을 유지합니다.
+- data_versions 로 추적하여 조회 응답의 ETag 가 갱신을 반영하도록 합니다.
+
+Revision ID: 0008_weather_data_completeness
+Revises: 0007_qc_flags
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision = "0008_weather_data_completeness"
+down_revision = "0007_qc_flags"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "weather_data_completeness",
+        sa.Column("stn_cd", sa.String(20), primary_key=True),
+        sa.Column("date", sa.Date(), primary_key=True),
+        sa.Column("stn_name", sa.String(100)),
+        sa.Column("province", sa.String(50)),
+        sa.Column("received", sa.SmallInteger(), nullable=False),
+        sa.Column("slots", postgresql.BIT(144), nullable=False),
+        sa.Column("first_datetime", sa.TIMESTAMP(), nullable=False),
+        sa.Column("last_datetime", sa.TIMESTAMP(), nullable=False),
+        sa.Column("updated_at", sa.TIMESTAMP(), server_default=sa.func.now()),
+    )
+    # 날짜 범위로 전체 관측소를 조회하는 경우 (완결성 요약)
+    op.create_index("ix_weather_data_completeness_date", "weather_data_completeness", ["date"])
+    op.execute("""
+        CREATE TRIGGER trg_weather_data_completeness_data_version
+        AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON weather_data_completeness
+        FOR EACH STATEMENT EXECUTE FUNCTION bump_data_version()
+    """)
+    op.execute("INSERT INTO data_versions (table_name) VALUES ('weather_data_completeness')")
+
+
+def downgrade() -> None:
+    op.execute("DELETE FROM data_versions WHERE table_name = 'weather_data_completeness'")
+    op.drop_table("weather_data_completeness")
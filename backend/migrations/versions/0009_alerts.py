@@ -0,0 +1,63 @@
+"""이상기상 알림 테이블(alert_state, alert_events) 추가
+
+- alert_state: 규칙별 관측소 진행 상태 (마지막 처리 관측 시각 + 진행 중인 연속 구간)
+  app.alerts 가 새 관측만 읽어 연속 구간을 이어가므로 과거 자료를 다시 훑지 않습니다.
+- alert_events: 연속 수가 기준 이상인 구간(폭염/늦서리/호우) 이력, 진행 중인 알림은 active
+- alert_events 를 data_versions 로 추적하여 /api/alerts 응답의 ETag 가 갱신을 반영하도록 합니다.
+
+Revision ID: 0009_alerts
+Revises: 0008_weather_data_completeness
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0009_alerts"
+down_revision = "0008_weather_data_completeness"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "alert_state",
+        sa.Column("rule", sa.String(20), primary_key=True),
+        sa.Column("station", sa.String(100), primary_key=True),
+        sa.Column("station_name", sa.String(100)),
+        sa.Column("last_time", sa.TIMESTAMP(), nullable=False),
+        sa.Column("run_start", sa.TIMESTAMP()),
+        sa.Column("run_last", sa.TIMESTAMP()),
+        sa.Column("run_length", sa.Integer(), nullable=False),
+        sa.Column("peak", sa.Float()),
+        sa.Column("event_id", sa.Integer()),
+    )
+    op.create_table(
+        "alert_events",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("rule", sa.String(20), nullable=False),
+        sa.Column("station", sa.String(100), nullable=False),
+        sa.Column("station_name", sa.String(100)),
+        sa.Column("start_time", sa.TIMESTAMP(), nullable=False),
+        sa.Column("end_time", sa.TIMESTAMP(), nullable=False),
+        sa.Column("length", sa.Integer(), nullable=False),
+        sa.Column("peak", sa.Float()),
+        sa.Column("active", sa.Boolean(), nullable=False),
+        sa.Column("updated_at", sa.TIMESTAMP(), server_default=sa.func.now()),
+    )
+    op.create_index("ix_alert_events_rule_start_time", "alert_events", ["rule", sa.text("start_time DESC")])
+    # 진행 중인 알림 조회 (/api/alerts/active) - 진행 중인 행만 색인
+    op.create_index("ix_alert_events_active", "alert_events", ["rule"], postgresql_where=sa.text("active"))
+    op.execute("""
+        CREATE TRIGGER trg_alert_events_data_version
+        AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON alert_events
+        FOR EACH STATEMENT EXECUTE FUNCTION bump_data_version()
+    """)
+    op.execute("INSERT INTO data_versions (table_name) VALUES ('alert_events')")
+
+
+def downgrade() -> None:
+    op.execute("DELETE FROM data_versions WHERE table_name = 'alert_events'")
+    op.drop_table("alert_events")
+    op.drop_table("alert_state")
@@ -0,0 +1,208 @@
+"""
+인덱스 사용 회귀 검사 (EXPLAIN 기반)
+- 주요 엔드포인트를 TestClient로 호출하면서 실행된 SQL을 수집합니다.
+- 수집된 SELECT 문을 같은 파라미터로 EXPLAIN (FORMAT JSON) 하여
+  대용량 테이블에 Seq Scan 이 남아 있거나, 경로별로 기대한 인덱스(관측소/지역 + 시각 복합 인덱스)가
+  아닌 인덱스로 대용량 테이블을 읽으면 실패(exit 1)합니다.
+- 작은 테스트 DB에서는 플래너가 인덱스를 건너뛸 수 있으므로 enable_seqscan = off 상태에서 판정합니다.
+  (이 상태에서는 아무 인덱스나 선택될 수 있으므로 인덱스 이름까지 확인)
+
+사용법:
+    cd backend
+    alembic upgrade head
+    python -m scripts.check_index_usage
+"""
+
+import json
+import os
+import sys
+from contextlib import contextmanager
+from typing import Optional
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event, text
+from sqlalchemy.engine import Engine
+
+# 같은 클라이언트로 연속 호출하므로 요청 수용 제어(429)를 끄고 검사
+os.environ["ADMISSION_ENABLED"] = "false"
+
+from app.database import engine  # noqa: E402
+from app.main import app  # noqa: E402
+
+# Seq Scan 을 허용하지 않는 테이블
+LARGE_TABLES = {
+    "asos_daily_data",
+    "weather_data",
+    "weather_data_daily",
+    "weather_realtime",
+}
+
+# 핫 경로가 사용해야 하는 인덱스 (테이블 → 허용 인덱스, migrations/versions/ 와 일치)
+ASOS_KEY = {"asos_daily_data": ("uq_asos_daily_data_stn_id_tm",)}
+REALTIME_KEY = {"weather_realtime": ("ix_weather_realtime_region_latest", "uq_weather_realtime_region_slot_category")}
+RDA_KEY = {"weather_data": ("uq_weather_data_stn_cd_datetime",)}
+RDA_DAILY_KEY = {"weather_data_daily": ("uq_weather_data_daily_stn_cd_date",)}
+
+
+def load_samples() -> dict:
+    """검사에 사용할 실제 키 값(관측소, 지역, 날짜)을 DB에서 가져옵니다."""
+    with engine.connect() as conn:
+        asos = conn.execute(text(
+            "SELECT stn_id, max(tm) FROM asos_daily_data GROUP BY stn_id LIMIT 1"
+        )).first()
+        rda = conn.execute(text(
+            "SELECT stn_cd, max(datetime) FROM weather_data GROUP BY stn_cd LIMIT 1"
+        )).first()
+        daily = conn.execute(text(
+            "SELECT stn_cd, max(date) FROM weather_data_daily GROUP BY stn_cd LIMIT 1"
+        )).first()
+        region = conn.execute(text(
+            "SELECT region_name, max(base_date) FROM weather_realtime GROUP BY region_name LIMIT 1"
+        )).first()
+
+    if not (asos and rda and daily and region):
+        raise SystemExit("[FAIL] 검사용 데이터가 없습니다. 시드 데이터를 먼저 적재하세요.")
+
+    return {
+        "stn_id": asos[0], "asos_date": asos[1],
+        "stn_cd": rda[0], "rda_datetime": rda[1],
+        "daily_stn_cd": daily[0], "daily_date": daily[1],
+        "region_name": region[0], "region_date": region[1],
+    }
+
+
+def build_cases(s: dict) -> list[tuple[str, dict, dict]]:
+    """(경로, 쿼리 파라미터, 기대 인덱스) 목록 - 키 필터 + 시간 정렬을 사용하는 핫 경로"""
+    return [
+        ("/api/kma/asos/latest", {"stn_id": s["stn_id"]}, ASOS_KEY),
+        ("/api/kma/asos/range", {
+            "stn_id": s["stn_id"],
+            "start_date": s["asos_date"].replace(day=1).isoformat(),
+            "end_date": s["asos_date"].isoformat(),
+        }, ASOS_KEY),
+        (f"/api/stats/kma/asos/station/{s['stn_id']}", {}, ASOS_KEY),
+        ("/api/kma/realtime/latest", {"region_name": s["region_name"]}, REALTIME_KEY),
+        ("/api/kma/realtime/latest/pivot", {"region_name": s["region_name"], "limit": 1}, REALTIME_KEY),
+        (f"/api/kma/realtime/region/{s['region_name']}/range", {
+            "start_date": s["region_date"].isoformat(),
+            "end_date": s["region_date"].isoformat(),
+        }, REALTIME_KEY),
+        (f"/api/kma/realtime/region/{s['region_name']}", {"target_date": s["region_date"].isoformat()},
+         REALTIME_KEY),
+        ("/api/rda/weather/realtime/latest", {"stn_cd": s["stn_cd"], "limit": 1}, RDA_KEY),
+        (f"/api/rda/weather/realtime/station/{s['stn_cd']}", {
+            "end_datetime": s["rda_datetime"].isoformat(),
+        }, RDA_KEY),
+        ("/api/rda/weather/daily/latest", {"stn_cd": s["daily_stn_cd"]}, RDA_DAILY_KEY),
+        ("/api/rda/weather/daily/range", {
+            "stn_cd": s["daily_stn_cd"],
+            "start_date": s["daily_date"].replace(day=1).isoformat(),
+            "end_date": s["daily_date"].isoformat(),
+        }, RDA_DAILY_KEY),
+        (f"/api/stats/rda/station/{s['daily_stn_cd']}", {}, RDA_DAILY_KEY),
+    ]
+
+
+@contextmanager
+def capture_statements():
+    """요청 처리 중 실행된 (SQL, 파라미터) 를 수집합니다."""
+    captured = []
+
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            captured.append((statement, parameters))
+
+    # 읽기 복제본 / 대량 풀 엔진에서 실행된 문장도 함께 수집
+    event.listen(Engine, "before_cursor_execute", _before)
+    try:
+        yield captured
+    finally:
+        event.remove(Engine, "before_cursor_execute", _before)
+
+
+def find_scans(plan: dict) -> list[tuple[str, str, tuple[str, ...]]]:
+    """실행 계획 트리에서 대용량 테이블을 읽는 (테이블, 노드 종류, 인덱스명들) 을 찾습니다."""
+    found = []
+    relation = plan.get("Relation Name")
+    if plan.get("Node Type") == "Bitmap Heap Scan":
+        # 인덱스명은 하위 Bitmap Index Scan 노드에 있음 (BitmapAnd/Or 포함)
+        if relation in LARGE_TABLES:
+            found.append((relation, "Bitmap Heap Scan", tuple(_bitmap_indexes(plan))))
+        return found
+    if relation in LARGE_TABLES:
+        index_name = plan.get("Index Name")
+        found.append((relation, plan["Node Type"], (index_name,) if index_name else ()))
+    for child in plan.get("Plans", []):
+        found.extend(find_scans(child))
+    return found
+
+
+def _bitmap_indexes(plan: dict) -> list[str]:
+    names = [plan["Index Name"]] if plan.get("Node Type") == "Bitmap Index Scan" else []
+    for child in plan.get("Plans", []):
+        names.extend(_bitmap_indexes(child))
+    return names
+
+
+def check_scans(scans: list[tuple[str, str, tuple[str, ...]]], expected: dict) -> list[str]:
+    """Seq Scan 과 기대한 인덱스를 쓰지 않는 대용량 테이블 조회를 문제 목록으로 반환합니다."""
+    problems = []
+    for table, node_type, index_names in scans:
+        if node_type == "Seq Scan":
+            problems.append(f"Seq Scan: {table}")
+        elif table in expected and not set(index_names) & set(expected[table]):
+            used = ", ".join(index_names) or node_type
+            problems.append(f"{table} 인덱스 {used} (기대: {', '.join(expected[table])})")
+    return problems
+
+
+def explain(statement: str, parameters) -> dict:
+    """enable_seqscan = off 상태에서 JSON 실행 계획을 반환합니다."""
+    raw = engine.raw_connection()
+    try:
+        cursor = raw.cursor()
+        cursor.execute("SET enable_seqscan = off")
+        cursor.execute("EXPLAIN (FORMAT JSON) " + statement, parameters)
+        result = cursor.fetchone()[0]
+        cursor.close()
+        raw.rollback()
+    finally:
+        raw.close()
+
+    if isinstance(result, str):
+        result = json.loads(result)
+    return result[0]["Plan"]
+
+
+def main() -> int:
+    samples = load_samples()
+    client = TestClient(app)
+    failures = 0
+
+    for path, params, expected in build_cases(samples):
+        with capture_statements() as statements:
+            response = client.get(path, params=params)
+
+        if response.status_code >= 500:
+            print(f"[FAIL] {path} -> HTTP {response.status_code}")
+            failures += 1
+            continue
+
+        scans = []
+        for statement, parameters in statements:
+            scans.extend(find_scans(explain(statement, parameters)))
+
+        problems = check_scans(scans, expected)
+        if problems:
+            print(f"[FAIL] {path} - {'; '.join(sorted(set(problems)))}")
+            failures += 1
+        else:
+            used = sorted({name for _, _, index_names in scans for name in index_names})
+            print(f"[OK]   {path} ({len(statements)} queries, {', '.join(used) or '대용량 테이블 미조회'})")
+
+    print(f"\n{failures} failure(s)")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,93 @@
+"""
+워커 간 변경 알림 전파 검사 (LISTEN/NOTIFY)
+- 실행 중인 서버에 대해 primary 로 pg_notify('data_versions', 테이블) 를 보냅니다. (데이터는 바꾸지 않음)
+- /metrics 의 notify_last_event_timestamp_seconds 가 알림 시각 이후가 될 때까지의 시간을 잽니다.
+- --max-latency 가 지난 뒤 /metrics 를 --samples 번 더 조회하여, 응답한 모든 워커가 알림을 받았는지 확인합니다.
+  (요청마다 새 연결을 쓰므로 여러 워커에 분배됨 - 샘플 수는 워커 수의 2~3배 권장)
+- 서버와 같은 호스트(또는 시계가 동기화된 호스트)에서 실행합니다.
+- 다음 중 하나라도 해당하면 실패(exit 1)합니다.
+  * 알림을 수신 중이 아닌 워커 (notify_listening 0)
+  * --max-latency 안에 알림을 받지 못한 워커
+
+사용법:
+    cd backend
+    alembic upgrade head
+    uvicorn app.main:app --port 8001 --workers 4     # 별도 터미널
+    python -m scripts.check_notify --rounds 10 --samples 12
+"""
+
+import argparse
+import re
+import sys
+import time
+
+import httpx
+import psycopg
+
+from app.notify import CHANNEL, listen_conninfo
+
+
+def metric_value(text: str, name: str) -> float:
+    """Prometheus 텍스트에서 라벨 없는 값 하나를 읽음 (없으면 0)"""
+    match = re.search(rf"^{re.escape(name)} (\S+)$", text, re.MULTILINE)
+    return float(match.group(1)) if match else 0.0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="워커 간 변경 알림 전파 검사")
+    parser.add_argument("--base-url", default="http://localhost:8001")
+    parser.add_argument("--table", default="weather_realtime", help="알림 페이로드 (테이블 이름)")
+    parser.add_argument("--rounds", type=int, default=10, help="알림 횟수")
+    parser.add_argument("--samples", type=int, default=8, help="라운드마다 전체 워커 확인용 /metrics 조회 수")
+    parser.add_argument("--max-latency", type=float, default=1.0, help="허용 전파 시간 (초)")
+    args = parser.parse_args()
+
+    failures = 0
+    latencies = []
+
+    # keep-alive 없이 요청마다 새 연결 → 워커 분산
+    limits = httpx.Limits(max_keepalive_connections=0)
+    with httpx.Client(base_url=args.base_url, limits=limits, timeout=5) as client, \
+            psycopg.connect(listen_conninfo(), autocommit=True) as conn:
+
+        def worker_state() -> tuple[float, float]:
+            metrics = client.get("/metrics").text
+            return (metric_value(metrics, "notify_listening"),
+                    metric_value(metrics, "notify_last_event_timestamp_seconds"))
+
+        for i in range(args.rounds):
+            sent_at = time.time()
+            conn.execute("SELECT pg_notify(%s, %s)", (CHANNEL, args.table))
+
+            # 처음 응답한 워커가 알림을 받기까지
+            while True:
+                elapsed = time.time() - sent_at
+                listening, last_event = worker_state()
+                if not listening or last_event >= sent_at or elapsed > args.max_latency:
+                    break
+                time.sleep(0.01)
+            if not listening:
+                print(f"[FAIL] round {i + 1}: 알림을 수신하지 않는 워커가 있습니다. (notify_listening 0)")
+                failures += 1
+                continue
+            latencies.append(elapsed)
+
+            # 허용 시간이 지난 뒤에는 모든 워커가 받았어야 함
+            time.sleep(max(args.max_latency - (time.time() - sent_at), 0))
+            missed = sum(1 for _ in range(args.samples) if worker_state()[1] < sent_at)
+            if elapsed > args.max_latency or missed:
+                print(f"[FAIL] round {i + 1}: {elapsed * 1000:.0f}ms, "
+                      f"{args.max_latency:g}초 후 미수신 응답 {missed}/{args.samples}")
+                failures += 1
+            else:
+                print(f"[OK]   round {i + 1}: {elapsed * 1000:.0f}ms")
+
+    if latencies:
+        latencies.sort()
+        print(f"p50={latencies[len(latencies) // 2] * 1000:.0f}ms max={latencies[-1] * 1000:.0f}ms")
+    print(f"{failures} failure(s)")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
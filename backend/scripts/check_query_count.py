@@ -0,0 +1,283 @@
+"""
+쿼리 수 회귀 검사 (N+1 방지)
+- 모든 GET 엔드포인트를 TestClient로 호출하면서 실행된 SQL 문장 수를 셉니다.
+- 라우트(경로 템플릿)별 상한(QUERY_BUDGETS)을 넘으면 실패(exit 1)합니다.
+- 결과 행 수를 늘린 호출(limit 확대 등)을 한 번 더 실행하여 문장 수가 늘어나면
+  행마다 쿼리를 실행하는 패턴으로 보고 실패합니다.
+- 상한이 없는 새 GET 라우트가 추가되어도 실패하므로, 라우터를 추가할 때 여기에 함께 등록합니다.
+- data_versions 조회(조건부 GET 워터마크)는 라우터 쿼리가 아니므로 세지 않으며,
+  압축 캐시를 거치지 않도록 Accept-Encoding: identity 로 요청합니다.
+
+사용법:
+    cd backend
+    alembic upgrade head
+    python -m benchmarks.datagen --scale 0.01 --truncate
+    python -m scripts.check_query_count
+"""
+
+import os
+import sys
+from contextlib import contextmanager
+from datetime import timedelta
+from typing import Optional
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event, text
+from sqlalchemy.engine import Engine
+
+# 같은 클라이언트로 연속 호출하므로 요청 수용 제어(429)를 끄고 검사
+os.environ["ADMISSION_ENABLED"] = "false"
+
+from app.database import engine  # noqa: E402
+from app.main import app  # noqa: E402
+
+# 검사 대상에서 제외하는 경로 (SSE 스트림, 관리자 API, 문서/메트릭)
+EXCLUDED_PREFIXES = ("/api/stream", "/api/admin")
+EXCLUDED_PATHS = {"/", "/health", "/metrics", "/openapi.json", "/docs", "/docs/oauth2-redirect", "/redoc"}
+
+# 라우트별 SQL 문장 수 상한
+# 목록 조회 1, 페이지네이션(count + 데이터) 2, 관측소 통계(기간 통계 + 관측소명) 2
+QUERY_BUDGETS = {
+    "/api/kma/asos/latest": 1,
+    "/api/kma/asos/date/{target_date}": 1,
+    "/api/kma/asos/range": 2,
+    "/api/kma/asos/stations": 1,
+    "/api/kma/realtime/latest": 1,
+    "/api/kma/realtime/latest/pivot": 1,
+    "/api/kma/realtime/today/{region_name}": 1,
+    "/api/kma/realtime/region/{region_name}/range": 2,
+    "/api/kma/realtime/region/{region_name}": 2,
+    "/api/kma/realtime/regions": 1,
+    "/api/kma/realtime/sidos": 1,
+    "/api/kma/forecast/short/latest": 1,
+    "/api/kma/forecast/short/region/{region_name}": 2,
+    "/api/kma/forecast/short/regions": 1,
+    "/api/kma/forecast/mid/latest": 1,
+    "/api/kma/forecast/mid/region/{region_name}": 2,
+    "/api/kma/forecast/mid/regions": 1,
+    "/api/rda/weather/realtime/latest": 1,
+    "/api/rda/weather/realtime/station/{stn_cd}": 2,
+    "/api/rda/weather/hourly/station/{stn_cd}": 2,
+    "/api/rda/weather/daily/latest": 1,
+    "/api/rda/weather/daily/date/{target_date}": 1,
+    "/api/rda/weather/daily/range": 2,
+    "/api/rda/weather/monthly/latest": 1,
+    "/api/rda/weather/monthly/year/{year}": 1,
+    "/api/rda/weather/monthly/range": 2,
+    "/api/rda/weather/stations": 1,
+    "/api/rda/weather/realtime/stations": 1,
+    "/api/rda/weather/realtime/provinces": 1,
+    "/api/rda/weather/completeness": 2,
+    "/api/rda/weather/completeness/gaps": 2,
+    "/api/stats/summary": 2,
+    "/api/stats/kma/asos/station/{stn_id}": 1,
+    "/api/stats/rda/station/{stn_cd}": 1,
+    "/api/stats/comparison": 1,
+    "/api/stats/windrose": 1,
+    "/api/alerts/active": 1,
+    "/api/alerts/history": 2,
+}
+
+
+def load_samples() -> dict:
+    """검사에 사용할 실제 키 값(관측소, 지역, 날짜)을 DB에서 가져옵니다."""
+    with engine.connect() as conn:
+        asos = conn.execute(text(
+            "SELECT stn_id, max(tm) FROM asos_daily_data GROUP BY stn_id ORDER BY stn_id LIMIT 3"
+        )).all()
+        rda = conn.execute(text(
+            "SELECT stn_cd, max(datetime) FROM weather_data GROUP BY stn_cd LIMIT 1"
+        )).first()
+        daily = conn.execute(text(
+            "SELECT stn_cd, max(date) FROM weather_data_daily GROUP BY stn_cd LIMIT 1"
+        )).first()
+        monthly = conn.execute(text(
+            "SELECT stn_cd, max(date) FROM weather_data_monthly GROUP BY stn_cd LIMIT 1"
+        )).first()
+        region = conn.execute(text(
+            "SELECT region_name, max(base_date) FROM weather_realtime GROUP BY region_name LIMIT 1"
+        )).first()
+        short = conn.execute(text(
+            "SELECT region_name FROM weather_short_forecast LIMIT 1"
+        )).first()
+        mid = conn.execute(text(
+            "SELECT region_name FROM weather_mid_forecast LIMIT 1"
+        )).first()
+
+    if not (asos and rda and daily and monthly and region and short and mid):
+        raise SystemExit("[FAIL] 검사용 데이터가 없습니다. 시드 데이터를 먼저 적재하세요.")
+
+    return {
+        "stn_ids": [row[0] for row in asos], "asos_date": asos[0][1],
+        "stn_cd": rda[0], "rda_datetime": rda[1],
+        "daily_stn_cd": daily[0], "daily_date": daily[1],
+        "monthly_stn_cd": monthly[0], "monthly_year": int(monthly[1][:4]),
+        "region_name": region[0], "region_date": region[1],
+        "short_region": short[0], "mid_region": mid[0],
+    }
+
+
+def build_cases(s: dict) -> list[tuple[str, str, dict, Optional[dict]]]:
+    """(라우트 템플릿, 경로, 기본 파라미터, 행 수를 늘린 파라미터) 목록"""
+    stn_id = s["stn_ids"][0]
+    asos_start = (s["asos_date"] - timedelta(days=30)).isoformat()
+    daily_start = (s["daily_date"] - timedelta(days=30)).isoformat()
+    rda_end = s["rda_datetime"]
+    rda_date = rda_end.date().isoformat()
+    rda_start = (rda_end.date() - timedelta(days=30)).isoformat()
+    region = s["region_name"]
+    month = f"{s['monthly_year']}-12"
+
+    return [
+        ("/api/kma/asos/latest", "/api/kma/asos/latest", {"limit": 1}, {"limit": 100}),
+        ("/api/kma/asos/date/{target_date}", f"/api/kma/asos/date/{s['asos_date'].isoformat()}", {}, None),
+        ("/api/kma/asos/range", "/api/kma/asos/range",
+         {"start_date": asos_start, "end_date": s["asos_date"].isoformat(), "limit": 1},
+         {"start_date": asos_start, "end_date": s["asos_date"].isoformat(), "limit": 1000}),
+        ("/api/kma/asos/stations", "/api/kma/asos/stations", {}, None),
+        ("/api/kma/realtime/latest", "/api/kma/realtime/latest", {"limit": 1}, {"limit": 100}),
+        ("/api/kma/realtime/latest/pivot", "/api/kma/realtime/latest/pivot", {"limit": 1}, {"limit": 100}),
+        ("/api/kma/realtime/today/{region_name}", f"/api/kma/realtime/today/{region}", {}, None),
+        ("/api/kma/realtime/region/{region_name}/range", f"/api/kma/realtime/region/{region}/range",
+         {"start_date": s["region_date"].isoformat(), "end_date": s["region_date"].isoformat(), "limit": 1},
+         {"start_date": s["region_date"].isoformat(), "end_date": s["region_date"].isoformat(), "limit": 100}),
+        ("/api/kma/realtime/region/{region_name}", f"/api/kma/realtime/region/{region}",
+         {"target_date": s["region_date"].isoformat(), "limit": 1},
+         {"target_date": s["region_date"].isoformat(), "limit": 100}),
+        ("/api/kma/realtime/regions", "/api/kma/realtime/regions", {}, None),
+        ("/api/kma/realtime/sidos", "/api/kma/realtime/sidos", {}, None),
+        ("/api/kma/forecast/short/latest", "/api/kma/forecast/short/latest", {"limit": 1}, {"limit": 1000}),
+        ("/api/kma/forecast/short/region/{region_name}", f"/api/kma/forecast/short/region/{s['short_region']}",
+         {"limit": 1}, {"limit": 100}),
+        ("/api/kma/forecast/short/regions", "/api/kma/forecast/short/regions", {}, None),
+        ("/api/kma/forecast/mid/latest", "/api/kma/forecast/mid/latest", {"limit": 1}, {"limit": 100}),
+        ("/api/kma/forecast/mid/region/{region_name}", f"/api/kma/forecast/mid/region/{s['mid_region']}",
+         {"limit": 1}, {"limit": 100}),
+        ("/api/kma/forecast/mid/regions", "/api/kma/forecast/mid/regions", {}, None),
+        ("/api/rda/weather/realtime/latest", "/api/rda/weather/realtime/latest", {"limit": 1}, {"limit": 500}),
+        ("/api/rda/weather/realtime/station/{stn_cd}", f"/api/rda/weather/realtime/station/{s['stn_cd']}",
+         {"end_datetime": rda_end.isoformat(), "limit": 1},
+         {"end_datetime": rda_end.isoformat(), "limit": 100}),
+        ("/api/rda/weather/hourly/station/{stn_cd}", f"/api/rda/weather/hourly/station/{s['stn_cd']}",
+         {"end_datetime": rda_end.isoformat(), "limit": 1},
+         {"end_datetime": rda_end.isoformat(), "limit": 100}),
+        ("/api/rda/weather/daily/latest", "/api/rda/weather/daily/latest", {"limit": 1}, {"limit": 100}),
+        ("/api/rda/weather/daily/date/{target_date}", f"/api/rda/weather/daily/date/{s['daily_date'].isoformat()}",
+         {}, None),
+        ("/api/rda/weather/daily/range", "/api/rda/weather/daily/range",
+         {"start_date": daily_start, "end_date": s["daily_date"].isoformat(), "limit": 1},
+         {"start_date": daily_start, "end_date": s["daily_date"].isoformat(), "limit": 1000}),
+        ("/api/rda/weather/monthly/latest", "/api/rda/weather/monthly/latest", {"limit": 1}, {"limit": 100}),
+        ("/api/rda/weather/monthly/year/{year}", f"/api/rda/weather/monthly/year/{s['monthly_year']}", {}, None),
+        ("/api/rda/weather/monthly/range", "/api/rda/weather/monthly/range",
+         {"start_month": f"{s['monthly_year'] - 1}-01", "end_month": month, "limit": 1},
+         {"start_month": f"{s['monthly_year'] - 1}-01", "end_month": month, "limit": 100}),
+        ("/api/rda/weather/stations", "/api/rda/weather/stations", {}, None),
+        ("/api/rda/weather/realtime/stations", "/api/rda/weather/realtime/stations", {}, None),
+        ("/api/rda/weather/realtime/provinces", "/api/rda/weather/realtime/provinces", {}, None),
+        ("/api/rda/weather/completeness", "/api/rda/weather/completeness",
+         {"start_date": rda_date, "end_date": rda_date}, {"start_date": rda_start, "end_date": rda_date}),
+        ("/api/rda/weather/completeness/gaps", "/api/rda/weather/completeness/gaps",
+         {"start_date": rda_date, "end_date": rda_date}, {"start_date": rda_start, "end_date": rda_date}),
+        ("/api/stats/summary", "/api/stats/summary", {}, None),
+        ("/api/stats/kma/asos/station/{stn_id}", f"/api/stats/kma/asos/station/{stn_id}", {}, None),
+        ("/api/stats/rda/station/{stn_cd}", f"/api/stats/rda/station/{s['daily_stn_cd']}", {}, None),
+        ("/api/stats/comparison", "/api/stats/comparison",
+         {"stn_ids": str(stn_id), "start_date": asos_start, "end_date": s["asos_date"].isoformat()},
+         {"stn_ids": ",".join(str(i) for i in s["stn_ids"]), "start_date": asos_start,
+          "end_date": s["asos_date"].isoformat()}),
+        ("/api/stats/windrose", "/api/stats/windrose",
+         {"stations": s["stn_cd"], "start_date": rda_date, "end_date": rda_date},
+         {"stations": s["stn_cd"], "start_date": rda_start, "end_date": rda_date}),
+        ("/api/alerts/active", "/api/alerts/active", {}, None),
+        ("/api/alerts/history", "/api/alerts/history", {"limit": 1}, {"limit": 100}),
+    ]
+
+
+def get_routes() -> set[str]:
+    """검사 대상 GET 라우트 템플릿"""
+    routes = set()
+    for route in app.routes:
+        path = getattr(route, "path", "")
+        if "GET" not in (getattr(route, "methods", None) or ()):
+            continue
+        if path in EXCLUDED_PATHS or path.startswith(EXCLUDED_PREFIXES):
+            continue
+        routes.add(path)
+    return routes
+
+
+@contextmanager
+def count_statements():
+    """요청 처리 중 실행된 SQL 문장을 수집합니다. (워터마크 조회 제외)"""
+    captured = []
+
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        if "data_versions" not in statement:
+            captured.append(statement)
+
+    # 읽기 복제본 / 대량 풀 엔진에서 실행된 문장도 함께 수집
+    event.listen(Engine, "before_cursor_execute", _before)
+    try:
+        yield captured
+    finally:
+        event.remove(Engine, "before_cursor_execute", _before)
+
+
+def run(client: TestClient, path: str, params: dict) -> tuple[int, int]:
+    """(HTTP 상태, SQL 문장 수)"""
+    with count_statements() as statements:
+        response = client.get(path, params=params, headers={"Accept-Encoding": "identity"})
+    return response.status_code, len(statements)
+
+
+def main() -> int:
+    samples = load_samples()
+    cases = build_cases(samples)
+    client = TestClient(app)
+    failures = 0
+
+    # 상한 / 검사 케이스가 없는 라우트
+    routes = get_routes()
+    covered = {route for route, *_ in cases}
+    for route in sorted(routes - QUERY_BUDGETS.keys()):
+        print(f"[FAIL] {route} - QUERY_BUDGETS 에 상한이 없습니다.")
+        failures += 1
+    for route in sorted(routes - covered):
+        print(f"[FAIL] {route} - 검사 케이스가 없습니다.")
+        failures += 1
+
+    for route, path, params, scaled in cases:
+        budget = QUERY_BUDGETS.get(route)
+        if budget is None:
+            continue
+
+        status, count = run(client, path, params)
+        if status >= 400:
+            print(f"[FAIL] {route} -> HTTP {status}")
+            failures += 1
+            continue
+        if count > budget:
+            print(f"[FAIL] {route} - {count} queries (상한 {budget})")
+            failures += 1
+            continue
+
+        if scaled is not None:
+            status, scaled_count = run(client, path, scaled)
+            if status >= 400:
+                print(f"[FAIL] {route} (확대) -> HTTP {status}")
+                failures += 1
+                continue
+            if scaled_count != count:
+                print(f"[FAIL] {route} - 결과 행 수에 따라 쿼리 수 증가: {count} -> {scaled_count} (N+1)")
+                failures += 1
+                continue
+
+        print(f"[OK]   {route} ({count} queries, 상한 {budget})")
+
+    print(f"\n{failures} failure(s)")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -143,6 +143,37 @@ interface ChartDataPoint {
   humidity: number | null;
 }
 
+// ===== 실시간 변경분 스트림 (SSE) =====
+// KMA/RDA 섹션이 하나의 EventSource 연결을 공유합니다.
+let realtimeSource: EventSource | null = null;
+let realtimeSubscribers = 0;
+
+const subscribeRealtime = <T,>(source: 'kma' | 'rda', onRows: (rows: T[]) => void): (() => void) => {
+  if (!realtimeSource) {
+    realtimeSource = new EventSource(`${API_BASE_URL}/api/stream/realtime`);
+  }
+  realtimeSubscribers += 1;
+  const eventSource = realtimeSource;
+
+  // 변경된 행만 전달되는 이벤트
+  const handleRows = (e: Event) => onRows(JSON.parse((e as MessageEvent).data));
+  // 접속 직후 전체 최신값
+  const handleSnapshot = (e: Event) => onRows(JSON.parse((e as MessageEvent).data)[source] ?? []);
+
+  eventSource.addEventListener(source, handleRows);
+  eventSource.addEventListener('snapshot', handleSnapshot);
+
+  return () => {
+    eventSource.removeEventListener(source, handleRows);
+    eventSource.removeEventListener('snapshot', handleSnapshot);
+    realtimeSubscribers -= 1;
+    if (realtimeSubscribers === 0) {
+      eventSource.close();
+      realtimeSource = null;
+    }
+  };
+};
+
 // ===== 오늘의 기온/습도 차트 컴포넌트 =====
 interface TodayChartProps {
   data: ChartDataPoint[];
@@ -311,6 +342,28 @@ const RdaWeatherSection: React.FC = () => {
     fetchRealtimeData();
   }, []);
 
+  // 실시간 변경분 구독 - 변경된 관측소 데이터만 갱신
+  useEffect(() => {
+    return subscribeRealtime<RdaWeatherData>('rda', (rows) => {
+      if (rows.length === 0) return;
+      setInitialDataMap(prev => {
+        const next = new Map(prev);
+        rows.forEach(row => next.set(row.stn_cd, row));
+        return next;
+      });
+      setProvinceRepStations(prev => {
+        const next = new Map(prev);
+        rows.forEach(row => {
+          if (row.province && next.get(row.province)?.stn_cd === row.stn_cd) {
+            next.set(row.province, row);
+          }
+        });
+        return next;
+      });
+      setWeatherData(prev => rows.find(row => row.stn_cd === prev?.stn_cd) ?? prev);
+    });
+  }, []);
+
   // 지도에 표시할 카드 마커 생성
   const weatherCards: WeatherCardMarker[] = useMemo(() => {
     const cards: WeatherCardMarker[] = [];
@@ -613,6 +666,28 @@ const KmaWeatherSection: React.FC = () => {
     fetchRealtimeData();
   }, []);
 
+  // 실시간 변경분 구독 - 변경된 지역 데이터만 갱신
+  useEffect(() => {
+    return subscribeRealtime<KmaWeatherData>('kma', (rows) => {
+      if (rows.length === 0) return;
+      setInitialDataMap(prev => {
+        const next = new Map(prev);
+        rows.forEach(row => next.set(row.region_name, row));
+        return next;
+      });
+      setSidoRepRegions(prev => {
+        const next = new Map(prev);
+        rows.forEach(row => {
+          if (row.sido && next.get(row.sido)?.region_name === row.region_name) {
+            next.set(row.sido, row);
+          }
+        });
+        return next;
+      });
+      setWeatherData(prev => rows.find(row => row.region_name === prev?.region_name) ?? prev);
+    });
+  }, []);
+
   // 선택된 지역의 오늘 데이터 가져오기
   useEffect(() => {
     if (!selectedRegion) return;